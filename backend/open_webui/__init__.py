@@ -99,5 +99,14 @@ def dev(
     )
 
 
+@app.command()
+def backfill_chat_messages(batch_size: int = 100):
+    """Populate the chat_message table from the chat history JSON."""
+    from open_webui.models.chats import Chats
+
+    count = Chats.backfill_chat_messages(batch_size=batch_size)
+    typer.echo(f"Backfilled chat_message rows for {count} chats")
+
+
 if __name__ == "__main__":
     app()
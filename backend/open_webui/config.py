@@ -4,6 +4,9 @@ import os
 import shutil
 import socket
 import base64
+import threading
+import time
+import uuid
 from concurrent.futures import ThreadPoolExecutor
 import redis
 
@@ -25,6 +28,7 @@ from open_webui.env import (
     ENV,
     REDIS_URL,
     REDIS_KEY_PREFIX,
+    REDIS_RECONNECT_DELAY,
     REDIS_SENTINEL_HOSTS,
     REDIS_SENTINEL_PORT,
     FRONTEND_BUILD_DIR,
@@ -226,6 +230,17 @@ class PersistentConfig(Generic[T]):
 
 
 class AppConfig:
+    """
+    In-process config snapshot.
+
+    Reads are plain dictionary lookups. When Redis is configured, writes are
+    stored under `{prefix}:config:{key}` and announced on a pub/sub channel;
+    a background listener applies changes made by other instances to the
+    local snapshot. Each key is synced from Redis once on its first read (and
+    again after the listener reconnects) so values written while this
+    instance was not subscribed are not missed.
+    """
+
     _redis: Union[redis.Redis, redis.cluster.RedisCluster] = None
     _redis_key_prefix: str
 
@@ -238,6 +253,16 @@ class AppConfig:
         redis_cluster: Optional[bool] = False,
         redis_key_prefix: str = "open-webui",
     ):
+        super().__setattr__("_state", {})
+        super().__setattr__("_unsynced", set())
+        # Version and refresh counters are bumped from request threads and the
+        # listener thread; reads are counted without the lock (see __getattr__)
+        super().__setattr__("_stats_lock", threading.Lock())
+        super().__setattr__("_version", 0)
+        super().__setattr__("_reads", 0)
+        super().__setattr__("_refreshes", 0)
+        super().__setattr__("_instance_id", str(uuid.uuid4()))
+
         if redis_url:
             super().__setattr__("_redis_key_prefix", redis_key_prefix)
             super().__setattr__(
@@ -250,39 +275,112 @@ class AppConfig:
                 ),
             )
 
-        super().__setattr__("_state", {})
+            if ENABLE_PERSISTENT_CONFIG:
+                threading.Thread(
+                    target=self._listen, name="app-config-listener", daemon=True
+                ).start()
+
+    @property
+    def _channel(self) -> str:
+        return f"{self._redis_key_prefix}:config:updates"
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "version": self._version,
+            "reads": self._reads,
+            "refreshes": self._refreshes,
+        }
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            super().__setattr__(name, getattr(self, name) + 1)
+
+    def _apply(self, key, value):
+        if self._state[key].value != value:
+            self._state[key].value = value
+            self._count("_version")
+            log.info(f"Updated {key} from Redis: {value}")
+
+        self._count("_refreshes")
+
+    def _sync(self, key):
+        redis_value = self._redis.get(f"{self._redis_key_prefix}:config:{key}")
+        self._unsynced.discard(key)
+
+        if redis_value is not None:
+            try:
+                self._apply(key, json.loads(redis_value))
+            except json.JSONDecodeError:
+                log.error(f"Invalid JSON format in Redis for {key}: {redis_value}")
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self._redis.pubsub()
+                pubsub.subscribe(self._channel)
+
+                # Updates may have been published while we were not subscribed
+                self._unsynced.update(list(self._state.keys()))
+
+                for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+
+                    try:
+                        data = json.loads(message["data"])
+                        if (
+                            data.get("instance_id") != self._instance_id
+                            and data.get("key") in self._state
+                        ):
+                            self._unsynced.discard(data["key"])
+                            self._apply(data["key"], data.get("value"))
+                    except Exception as e:
+                        log.exception(f"Error handling config update: {e}")
+            except Exception as e:
+                log.warning(f"Config update listener disconnected: {e}")
+                time.sleep((REDIS_RECONNECT_DELAY or 1000) / 1000)
 
     def __setattr__(self, key, value):
         if isinstance(value, PersistentConfig):
             self._state[key] = value
+            if self._redis and ENABLE_PERSISTENT_CONFIG:
+                self._unsynced.add(key)
         else:
             self._state[key].value = value
             self._state[key].save()
+            self._count("_version")
 
             if self._redis and ENABLE_PERSISTENT_CONFIG:
+                self._unsynced.discard(key)
+
                 redis_key = f"{self._redis_key_prefix}:config:{key}"
                 self._redis.set(redis_key, json.dumps(self._state[key].value))
 
+                message = json.dumps(
+                    {
+                        "instance_id": self._instance_id,
+                        "key": key,
+                        "value": self._state[key].value,
+                    }
+                )
+                # RedisCluster doesn't expose publish() directly, but the
+                # PUBLISH command broadcasts across all cluster nodes server-side.
+                if hasattr(self._redis, "nodes_manager"):
+                    self._redis.execute_command("PUBLISH", self._channel, message)
+                else:
+                    self._redis.publish(self._channel, message)
+
     def __getattr__(self, key):
         if key not in self._state:
             raise AttributeError(f"Config key '{key}' not found")
 
-        # If Redis is available and persistent config is enabled, check for an updated value
-        if self._redis and ENABLE_PERSISTENT_CONFIG:
-            redis_key = f"{self._redis_key_prefix}:config:{key}"
-            redis_value = self._redis.get(redis_key)
-
-            if redis_value is not None:
-                try:
-                    decoded_value = json.loads(redis_value)
-
-                    # Update the in-memory value if different
-                    if self._state[key].value != decoded_value:
-                        self._state[key].value = decoded_value
-                        log.info(f"Updated {key} from Redis: {decoded_value}")
+        # Every config read passes through here, so the read counter stays
+        # unlocked: concurrent reads may lose an increment, stats are approximate
+        super().__setattr__("_reads", self._reads + 1)
 
-                except json.JSONDecodeError:
-                    log.error(f"Invalid JSON format in Redis for {key}: {redis_value}")
+        if key in self._unsynced:
+            self._sync(key)
 
         return self._state[key].value
 
@@ -926,6 +1024,11 @@ if CUSTOM_NAME:
 
 STORAGE_PROVIDER = os.environ.get("STORAGE_PROVIDER", "local")  # defaults to local, s3
 
+# Uploads and downloads are streamed in chunks of this size (multipart part /
+# resumable chunk / block size), so memory use stays bounded for large files
+STORAGE_CHUNK_SIZE = int(os.environ.get("STORAGE_CHUNK_SIZE", str(8 * 1024 * 1024)))
+STORAGE_MAX_CONCURRENCY = int(os.environ.get("STORAGE_MAX_CONCURRENCY", "4"))
+
 S3_ACCESS_KEY_ID = os.environ.get("S3_ACCESS_KEY_ID", None)
 S3_SECRET_ACCESS_KEY = os.environ.get("S3_SECRET_ACCESS_KEY", None)
 S3_REGION_NAME = os.environ.get("S3_REGION_NAME", None)
@@ -1924,6 +2027,21 @@ ENABLE_RETRIEVAL_QUERY_GENERATION = PersistentConfig(
     os.environ.get("ENABLE_RETRIEVAL_QUERY_GENERATION", "True").lower() == "true",
 )
 
+# Start retrieval with the last user message while retrieval queries are
+# generated; its results are used if generation fails or misses the deadline
+ENABLE_SPECULATIVE_RETRIEVAL = (
+    os.environ.get("ENABLE_SPECULATIVE_RETRIEVAL", "False").lower() == "true"
+)
+
+# Seconds to wait for retrieval query generation before falling back to the
+# last user message (empty = no deadline)
+try:
+    RETRIEVAL_QUERY_GENERATION_TIMEOUT = (
+        float(os.environ.get("RETRIEVAL_QUERY_GENERATION_TIMEOUT", "")) or None
+    )
+except ValueError:
+    RETRIEVAL_QUERY_GENERATION_TIMEOUT = None
+
 
 QUERY_GENERATION_PROMPT_TEMPLATE = PersistentConfig(
     "QUERY_GENERATION_PROMPT_TEMPLATE",
@@ -2237,6 +2355,12 @@ Ensure that the tools are effectively utilized to achieve the highest-quality an
 
 VECTOR_DB = os.environ.get("VECTOR_DB", "chroma")
 
+# Upper bound on threads running blocking vector DB calls for async callers
+try:
+    VECTOR_DB_MAX_WORKERS = int(os.environ.get("VECTOR_DB_MAX_WORKERS", "16"))
+except ValueError:
+    VECTOR_DB_MAX_WORKERS = 16
+
 # Chroma
 CHROMA_DATA_PATH = f"{DATA_DIR}/vector_db"
 
@@ -2428,6 +2552,22 @@ else:
     except Exception:
         PGVECTOR_IVFFLAT_LISTS = 100
 
+PGVECTOR_INSERT_BATCH_SIZE = os.environ.get("PGVECTOR_INSERT_BATCH_SIZE", 500)
+
+if PGVECTOR_INSERT_BATCH_SIZE == "":
+    PGVECTOR_INSERT_BATCH_SIZE = 500
+else:
+    try:
+        PGVECTOR_INSERT_BATCH_SIZE = max(int(PGVECTOR_INSERT_BATCH_SIZE), 1)
+    except Exception:
+        PGVECTOR_INSERT_BATCH_SIZE = 500
+
+# Drop the vector index during bulk loads (e.g. a knowledge reindex) and
+# rebuild it once at the end instead of updating it row by row
+PGVECTOR_DEFER_INDEX_ON_BULK_LOAD = (
+    os.getenv("PGVECTOR_DEFER_INDEX_ON_BULK_LOAD", "false").lower() == "true"
+)
+
 # openGauss
 OPENGAUSS_DB_URL = os.environ.get("OPENGAUSS_DB_URL", DATABASE_URL)
 
@@ -2791,6 +2931,45 @@ ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS = PersistentConfig(
     == "true",
 )
 
+# Persistent per-collection BM25 index used by hybrid search
+ENABLE_RAG_BM25_INDEX = (
+    os.environ.get("ENABLE_RAG_BM25_INDEX", "True").lower() == "true"
+)
+RAG_BM25_INDEX_DIR = os.environ.get("RAG_BM25_INDEX_DIR", f"{CACHE_DIR}/bm25")
+
+# Embeddings are cached by (engine, model, prefix, sha256(text)), so unchanged
+# chunks and repeated queries are not sent to the embedding model again
+ENABLE_RAG_EMBEDDING_CACHE = (
+    os.environ.get("ENABLE_RAG_EMBEDDING_CACHE", "True").lower() == "true"
+)
+
+try:
+    RAG_EMBEDDING_CACHE_SIZE = int(os.environ.get("RAG_EMBEDDING_CACHE_SIZE", "5000"))
+except ValueError:
+    RAG_EMBEDDING_CACHE_SIZE = 5000
+
+RAG_EMBEDDING_CACHE_DTYPE = os.environ.get(
+    "RAG_EMBEDDING_CACHE_DTYPE", "float32"
+).lower()
+if RAG_EMBEDDING_CACHE_DTYPE not in ("float32", "float16"):
+    RAG_EMBEDDING_CACHE_DTYPE = "float32"
+
+# Optional second tier shared across restarts: "redis" or "disk"
+RAG_EMBEDDING_CACHE_BACKEND = os.environ.get("RAG_EMBEDDING_CACHE_BACKEND", "").lower()
+if RAG_EMBEDDING_CACHE_BACKEND not in ("", "redis", "disk"):
+    RAG_EMBEDDING_CACHE_BACKEND = ""
+
+RAG_EMBEDDING_CACHE_DIR = os.environ.get(
+    "RAG_EMBEDDING_CACHE_DIR", f"{CACHE_DIR}/embeddings"
+)
+
+try:
+    RAG_EMBEDDING_CACHE_TTL = int(
+        os.environ.get("RAG_EMBEDDING_CACHE_TTL", str(30 * 24 * 60 * 60))
+    )
+except ValueError:
+    RAG_EMBEDDING_CACHE_TTL = 30 * 24 * 60 * 60
+
 RAG_FULL_CONTEXT = PersistentConfig(
     "RAG_FULL_CONTEXT",
     "rag.full_context",
@@ -2897,6 +3076,31 @@ ENABLE_ASYNC_EMBEDDING = PersistentConfig(
     os.environ.get("ENABLE_ASYNC_EMBEDDING", "True").lower() == "true",
 )
 
+# Embedding requests from all callers are coalesced into batches of
+# RAG_EMBEDDING_BATCH_SIZE, waiting at most this long for a batch to fill
+try:
+    RAG_EMBEDDING_BATCH_WINDOW = (
+        float(os.environ.get("RAG_EMBEDDING_BATCH_WINDOW_MS", "5")) / 1000
+    )
+except ValueError:
+    RAG_EMBEDDING_BATCH_WINDOW = 0.005
+
+# Maximum embedding batches in flight per engine (1 when async embedding is off)
+try:
+    RAG_EMBEDDING_CONCURRENCY = max(
+        int(os.environ.get("RAG_EMBEDDING_CONCURRENCY", "8")), 1
+    )
+except ValueError:
+    RAG_EMBEDDING_CONCURRENCY = 8
+
+# Estimated input tokens per minute sent to each embedding engine (0 = unlimited)
+try:
+    RAG_EMBEDDING_TOKENS_PER_MINUTE = int(
+        os.environ.get("RAG_EMBEDDING_TOKENS_PER_MINUTE", "0")
+    )
+except ValueError:
+    RAG_EMBEDDING_TOKENS_PER_MINUTE = 0
+
 RAG_EMBEDDING_QUERY_PREFIX = os.environ.get("RAG_EMBEDDING_QUERY_PREFIX", None)
 
 RAG_EMBEDDING_CONTENT_PREFIX = os.environ.get("RAG_EMBEDDING_CONTENT_PREFIX", None)
@@ -2929,6 +3133,35 @@ RAG_RERANKING_MODEL_TRUST_REMOTE_CODE = (
     os.environ.get("RAG_RERANKING_MODEL_TRUST_REMOTE_CODE", "True").lower() == "true"
 )
 
+# Threads running local CrossEncoder/ColBERT inference
+try:
+    RAG_RERANKING_MAX_WORKERS = max(
+        int(os.environ.get("RAG_RERANKING_MAX_WORKERS", "2")), 1
+    )
+except ValueError:
+    RAG_RERANKING_MAX_WORKERS = 2
+
+# Rerank requests arriving within this window are scored in one predict call
+try:
+    RAG_RERANKING_BATCH_WINDOW = (
+        float(os.environ.get("RAG_RERANKING_BATCH_WINDOW_MS", "5")) / 1000
+    )
+except ValueError:
+    RAG_RERANKING_BATCH_WINDOW = 0.005
+
+try:
+    RAG_RERANKING_BATCH_SIZE = max(
+        int(os.environ.get("RAG_RERANKING_BATCH_SIZE", "256")), 1
+    )
+except ValueError:
+    RAG_RERANKING_BATCH_SIZE = 256
+
+# (query, chunk) relevance scores kept in memory, 0 disables the cache
+try:
+    RAG_RERANKING_CACHE_SIZE = int(os.environ.get("RAG_RERANKING_CACHE_SIZE", "10000"))
+except ValueError:
+    RAG_RERANKING_CACHE_SIZE = 10000
+
 RAG_EXTERNAL_RERANKER_URL = PersistentConfig(
     "RAG_EXTERNAL_RERANKER_URL",
     "rag.external_reranker_url",
@@ -3149,6 +3382,73 @@ WEB_SEARCH_CONCURRENT_REQUESTS = PersistentConfig(
     int(os.getenv("WEB_SEARCH_CONCURRENT_REQUESTS", "0")),
 )
 
+# Search results per (engine, query) and extracted page text per URL are
+# cached for repeat queries across users
+ENABLE_WEB_SEARCH_CACHE = (
+    os.environ.get("ENABLE_WEB_SEARCH_CACHE", "True").lower() == "true"
+)
+
+try:
+    WEB_SEARCH_CACHE_SIZE = int(os.environ.get("WEB_SEARCH_CACHE_SIZE", "1000"))
+except ValueError:
+    WEB_SEARCH_CACHE_SIZE = 1000
+
+try:
+    WEB_PAGE_CACHE_SIZE = int(os.environ.get("WEB_PAGE_CACHE_SIZE", "500"))
+except ValueError:
+    WEB_PAGE_CACHE_SIZE = 500
+
+try:
+    WEB_SEARCH_CACHE_TTL = int(os.environ.get("WEB_SEARCH_CACHE_TTL", "3600"))
+except ValueError:
+    WEB_SEARCH_CACHE_TTL = 3600
+
+# Per-engine overrides, e.g. {"tavily": 600, "searxng": 0}; 0 disables the cache
+try:
+    WEB_SEARCH_CACHE_ENGINE_TTL = json.loads(
+        os.environ.get("WEB_SEARCH_CACHE_ENGINE_TTL", "{}")
+    )
+    if not isinstance(WEB_SEARCH_CACHE_ENGINE_TTL, dict):
+        WEB_SEARCH_CACHE_ENGINE_TTL = {}
+except json.JSONDecodeError:
+    WEB_SEARCH_CACHE_ENGINE_TTL = {}
+
+# Seconds a loaded page is served without contacting the site; after that it
+# is revalidated with If-None-Match/If-Modified-Since where the loader allows
+try:
+    WEB_PAGE_CACHE_TTL = int(os.environ.get("WEB_PAGE_CACHE_TTL", "3600"))
+except ValueError:
+    WEB_PAGE_CACHE_TTL = 3600
+
+# Optional second tier shared across restarts: "redis" or "disk"
+WEB_SEARCH_CACHE_BACKEND = os.environ.get("WEB_SEARCH_CACHE_BACKEND", "").lower()
+if WEB_SEARCH_CACHE_BACKEND not in ("", "redis", "disk"):
+    WEB_SEARCH_CACHE_BACKEND = ""
+
+WEB_SEARCH_CACHE_DIR = os.environ.get("WEB_SEARCH_CACHE_DIR", f"{CACHE_DIR}/web")
+
+# Requests per second sent to each search engine's API, e.g. {"brave": 1}
+try:
+    WEB_SEARCH_ENGINE_RATE_LIMITS = json.loads(
+        os.environ.get("WEB_SEARCH_ENGINE_RATE_LIMITS", "{}")
+    )
+    if not isinstance(WEB_SEARCH_ENGINE_RATE_LIMITS, dict):
+        WEB_SEARCH_ENGINE_RATE_LIMITS = {}
+except json.JSONDecodeError:
+    WEB_SEARCH_ENGINE_RATE_LIMITS = {}
+
+# Retries for search engine requests failing with 429, 5xx or a connection
+# error; waits follow Retry-After or double from WEB_SEARCH_RETRY_BACKOFF
+try:
+    WEB_SEARCH_MAX_RETRIES = int(os.environ.get("WEB_SEARCH_MAX_RETRIES", "2"))
+except ValueError:
+    WEB_SEARCH_MAX_RETRIES = 2
+
+try:
+    WEB_SEARCH_RETRY_BACKOFF = float(os.environ.get("WEB_SEARCH_RETRY_BACKOFF", "1"))
+except ValueError:
+    WEB_SEARCH_RETRY_BACKOFF = 1.0
+
 
 WEB_LOADER_ENGINE = PersistentConfig(
     "WEB_LOADER_ENGINE",
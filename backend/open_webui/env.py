@@ -383,6 +383,32 @@ ENABLE_REALTIME_CHAT_SAVE = (
     os.environ.get("ENABLE_REALTIME_CHAT_SAVE", "False").lower() == "true"
 )
 
+# Serve chat message reads from the normalized chat_message table
+# (run `open-webui backfill-chat-messages` once before enabling)
+ENABLE_CHAT_MESSAGE_TABLE_READS = (
+    os.environ.get("ENABLE_CHAT_MESSAGE_TABLE_READS", "False").lower() == "true"
+)
+
+# Cache each user's group memberships for permission/access checks,
+# invalidated on group writes (across workers via Redis when configured)
+ENABLE_GROUP_MEMBERSHIP_CACHE = (
+    os.environ.get("ENABLE_GROUP_MEMBERSHIP_CACHE", "True").lower() == "true"
+)
+
+try:
+    GROUP_MEMBERSHIP_CACHE_TTL = float(
+        os.environ.get("GROUP_MEMBERSHIP_CACHE_TTL", "60")
+    )
+except ValueError:
+    GROUP_MEMBERSHIP_CACHE_TTL = 60.0
+
+try:
+    GROUP_MEMBERSHIP_CACHE_SIZE = int(
+        os.environ.get("GROUP_MEMBERSHIP_CACHE_SIZE", "10000")
+    )
+except ValueError:
+    GROUP_MEMBERSHIP_CACHE_SIZE = 10000
+
 ENABLE_QUERIES_CACHE = os.environ.get("ENABLE_QUERIES_CACHE", "False").lower() == "true"
 
 RAG_SYSTEM_CONTEXT = os.environ.get("RAG_SYSTEM_CONTEXT", "False").lower() == "true"
@@ -646,6 +672,29 @@ else:
         CHAT_RESPONSE_STREAM_DELTA_CHUNK_SIZE = 1
 
 
+CHAT_EVENT_BUFFER_FLUSH_INTERVAL = os.environ.get(
+    "CHAT_EVENT_BUFFER_FLUSH_INTERVAL", "1"
+)
+
+if CHAT_EVENT_BUFFER_FLUSH_INTERVAL == "":
+    CHAT_EVENT_BUFFER_FLUSH_INTERVAL = 1.0
+else:
+    try:
+        CHAT_EVENT_BUFFER_FLUSH_INTERVAL = float(CHAT_EVENT_BUFFER_FLUSH_INTERVAL)
+    except Exception:
+        CHAT_EVENT_BUFFER_FLUSH_INTERVAL = 1.0
+
+CHAT_EVENT_BUFFER_MAX_EVENTS = os.environ.get("CHAT_EVENT_BUFFER_MAX_EVENTS", "50")
+
+if CHAT_EVENT_BUFFER_MAX_EVENTS == "":
+    CHAT_EVENT_BUFFER_MAX_EVENTS = 50
+else:
+    try:
+        CHAT_EVENT_BUFFER_MAX_EVENTS = int(CHAT_EVENT_BUFFER_MAX_EVENTS)
+    except Exception:
+        CHAT_EVENT_BUFFER_MAX_EVENTS = 50
+
+
 CHAT_RESPONSE_MAX_TOOL_CALL_RETRIES = os.environ.get(
     "CHAT_RESPONSE_MAX_TOOL_CALL_RETRIES", "30"
 )
@@ -785,11 +834,199 @@ else:
     except Exception:
         AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA = 10
 
+# Seconds OpenAPI tool server specs are used before being revalidated in the
+# background; requests keep using the previous specs in the meantime
+try:
+    TOOL_SERVER_SPEC_CACHE_TTL = float(
+        os.environ.get("TOOL_SERVER_SPEC_CACHE_TTL", "300")
+    )
+except ValueError:
+    TOOL_SERVER_SPEC_CACHE_TTL = 300.0
+
 
 AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL = (
     os.environ.get("AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL", "True").lower() == "true"
 )
 
+ENABLE_AIOHTTP_CLIENT_SESSION_POOL = (
+    os.environ.get("ENABLE_AIOHTTP_CLIENT_SESSION_POOL", "True").lower() == "true"
+)
+
+try:
+    AIOHTTP_CLIENT_POOL_LIMIT_PER_UPSTREAM = int(
+        os.environ.get("AIOHTTP_CLIENT_POOL_LIMIT_PER_UPSTREAM", "100")
+    )
+except ValueError:
+    AIOHTTP_CLIENT_POOL_LIMIT_PER_UPSTREAM = 100
+
+try:
+    AIOHTTP_CLIENT_POOL_MAX_UPSTREAMS = int(
+        os.environ.get("AIOHTTP_CLIENT_POOL_MAX_UPSTREAMS", "32")
+    )
+except ValueError:
+    AIOHTTP_CLIENT_POOL_MAX_UPSTREAMS = 32
+
+try:
+    AIOHTTP_CLIENT_KEEPALIVE_TIMEOUT = float(
+        os.environ.get("AIOHTTP_CLIENT_KEEPALIVE_TIMEOUT", "30")
+    )
+except ValueError:
+    AIOHTTP_CLIENT_KEEPALIVE_TIMEOUT = 30.0
+
+try:
+    AIOHTTP_CLIENT_DNS_CACHE_TTL = int(
+        os.environ.get("AIOHTTP_CLIENT_DNS_CACHE_TTL", "300")
+    )
+except ValueError:
+    AIOHTTP_CLIENT_DNS_CACHE_TTL = 300
+
+####################################
+# OLLAMA LOAD BALANCING
+####################################
+
+# How requests for a model are spread over the Ollama base URLs serving it:
+# random, least_outstanding, ewma (latency-weighted) or weighted (per-connection "weight")
+OLLAMA_LOAD_BALANCING_STRATEGY = (
+    os.environ.get("OLLAMA_LOAD_BALANCING_STRATEGY", "least_outstanding")
+    .strip()
+    .lower()
+)
+if OLLAMA_LOAD_BALANCING_STRATEGY not in (
+    "random",
+    "least_outstanding",
+    "ewma",
+    "weighted",
+):
+    OLLAMA_LOAD_BALANCING_STRATEGY = "least_outstanding"
+
+# Extra queued requests a node is charged when the model is not loaded on it
+# (0 disables model affinity)
+try:
+    OLLAMA_COLD_MODEL_PENALTY = float(os.environ.get("OLLAMA_COLD_MODEL_PENALTY", "2"))
+except ValueError:
+    OLLAMA_COLD_MODEL_PENALTY = 2.0
+
+# Consecutive connection errors or 5xx responses before a node is ejected
+try:
+    OLLAMA_NODE_MAX_FAILURES = int(os.environ.get("OLLAMA_NODE_MAX_FAILURES", "3"))
+except ValueError:
+    OLLAMA_NODE_MAX_FAILURES = 3
+
+try:
+    OLLAMA_NODE_EJECTION_TIME = float(os.environ.get("OLLAMA_NODE_EJECTION_TIME", "30"))
+except ValueError:
+    OLLAMA_NODE_EJECTION_TIME = 30.0
+
+####################################
+# IMAGE INLINING
+####################################
+
+# Image URLs in chat messages fetched concurrently per request when inlining
+try:
+    IMAGE_INLINE_CONCURRENCY = max(
+        int(os.environ.get("IMAGE_INLINE_CONCURRENCY", "4")), 1
+    )
+except ValueError:
+    IMAGE_INLINE_CONCURRENCY = 4
+
+# Memory held by already inlined images, so history is not refetched every turn
+try:
+    IMAGE_INLINE_CACHE_SIZE = int(
+        float(os.environ.get("IMAGE_INLINE_CACHE_SIZE_MB", "64")) * 1024 * 1024
+    )
+except ValueError:
+    IMAGE_INLINE_CACHE_SIZE = 64 * 1024 * 1024
+
+# Seconds a cached remote image is used before revalidating it with its ETag
+try:
+    IMAGE_INLINE_CACHE_TTL = int(os.environ.get("IMAGE_INLINE_CACHE_TTL", "300"))
+except ValueError:
+    IMAGE_INLINE_CACHE_TTL = 300
+
+# Downscale inlined images to fit this many pixels per side (0 = keep size);
+# models can override it with "image_max_dimension" in their meta
+try:
+    IMAGE_INLINE_MAX_DIMENSION = int(os.environ.get("IMAGE_INLINE_MAX_DIMENSION", "0"))
+except ValueError:
+    IMAGE_INLINE_MAX_DIMENSION = 0
+
+####################################
+# BACKGROUND TASKS
+####################################
+
+# Chats generating title, tags and follow-ups at the same time; the rest queue
+# so these tasks do not take upstream capacity from chat generations
+try:
+    BACKGROUND_TASKS_MAX_CONCURRENCY = max(
+        int(os.environ.get("BACKGROUND_TASKS_MAX_CONCURRENCY", "4")), 1
+    )
+except ValueError:
+    BACKGROUND_TASKS_MAX_CONCURRENCY = 4
+
+####################################
+# CODE INTERPRETER
+####################################
+
+# Idle Jupyter kernels kept started per server for code execution; 0 starts
+# and deletes a kernel for every code block
+try:
+    JUPYTER_KERNEL_POOL_SIZE = max(
+        int(os.environ.get("JUPYTER_KERNEL_POOL_SIZE", "2")), 0
+    )
+except ValueError:
+    JUPYTER_KERNEL_POOL_SIZE = 2
+
+# Seconds after which pooled kernels are shut down instead of reused
+try:
+    JUPYTER_KERNEL_MAX_LIFETIME = float(
+        os.environ.get("JUPYTER_KERNEL_MAX_LIFETIME", "3600")
+    )
+except ValueError:
+    JUPYTER_KERNEL_MAX_LIFETIME = 3600.0
+
+# Let each chat keep its kernel, and its variables, across turns
+ENABLE_JUPYTER_KERNEL_STICKY_SESSIONS = (
+    os.environ.get("ENABLE_JUPYTER_KERNEL_STICKY_SESSIONS", "False").lower() == "true"
+)
+
+# Seconds a chat's kernel is kept after its last code block
+try:
+    JUPYTER_KERNEL_STICKY_TIMEOUT = float(
+        os.environ.get("JUPYTER_KERNEL_STICKY_TIMEOUT", "600")
+    )
+except ValueError:
+    JUPYTER_KERNEL_STICKY_TIMEOUT = 600.0
+
+####################################
+# MCP SESSIONS
+####################################
+
+# Keep MCP sessions open between chat requests, one per server and credentials
+ENABLE_MCP_SESSION_POOL = (
+    os.environ.get("ENABLE_MCP_SESSION_POOL", "True").lower() == "true"
+)
+
+# Seconds an unused pooled session stays open
+try:
+    MCP_SESSION_IDLE_TIMEOUT = float(os.environ.get("MCP_SESSION_IDLE_TIMEOUT", "300"))
+except ValueError:
+    MCP_SESSION_IDLE_TIMEOUT = 300.0
+
+# Pooled sessions idle for longer than this are pinged before being reused
+try:
+    MCP_SESSION_HEALTH_CHECK_INTERVAL = float(
+        os.environ.get("MCP_SESSION_HEALTH_CHECK_INTERVAL", "30")
+    )
+except ValueError:
+    MCP_SESSION_HEALTH_CHECK_INTERVAL = 30.0
+
+# Seconds tools/list results are reused; servers announcing tools/list_changed
+# are re-listed on the next request
+try:
+    MCP_TOOL_SPECS_CACHE_TTL = float(os.environ.get("MCP_TOOL_SPECS_CACHE_TTL", "300"))
+except ValueError:
+    MCP_TOOL_SPECS_CACHE_TTL = 300.0
+
 
 RAG_EMBEDDING_TIMEOUT = os.environ.get("RAG_EMBEDDING_TIMEOUT", "")
 
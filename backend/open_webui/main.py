@@ -60,8 +60,13 @@ from starsessions.stores.redis import RedisStore
 from open_webui.utils import logger
 from open_webui.utils.audit import AuditLevel, AuditLoggingMiddleware
 from open_webui.utils.logger import start_logger
+from open_webui.utils.session_pool import CLIENT_SESSIONS
+from open_webui.utils.mcp.client import MCP_SESSION_POOL
+from open_webui.utils.code_interpreter import JUPYTER_KERNEL_POOL
+from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
 from open_webui.socket.main import (
     MODELS,
+    MESSAGE_EVENT_BUFFER,
     app as socket_app,
     periodic_usage_pool_cleanup,
     get_event_emitter,
@@ -141,6 +146,7 @@ from open_webui.models.functions import Functions
 from open_webui.models.models import Models
 from open_webui.models.users import UserModel, Users
 from open_webui.models.chats import Chats
+from open_webui.models.files import FILE_STATUS_BUS
 
 from open_webui.config import (
     # Ollama
@@ -624,6 +630,12 @@ async def lifespan(app: FastAPI):
     # This allows sync functions to schedule work on the main loop without blocking health checks
     app.state.main_loop = asyncio.get_running_loop()
 
+    # Pooled upstream HTTP sessions live for the lifetime of the app
+    CLIENT_SESSIONS.start()
+
+    # File processing status events are delivered on the main loop
+    FILE_STATUS_BUS.start()
+
     app.state.instance_id = INSTANCE_ID
     start_logger()
 
@@ -687,9 +699,17 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    # Persist any message events still waiting in the write-behind buffer
+    MESSAGE_EVENT_BUFFER.flush_all()
+
     if hasattr(app.state, "redis_task_command_listener"):
         app.state.redis_task_command_listener.cancel()
 
+    await CLIENT_SESSIONS.close()
+    await MCP_SESSION_POOL.close()
+    await JUPYTER_KERNEL_POOL.close()
+    await VECTOR_DB_CLIENT.aclose()
+
 
 app = FastAPI(
     title="Open WebUI",
@@ -766,6 +786,7 @@ app.state.OPENAI_MODELS = {}
 
 app.state.config.TOOL_SERVER_CONNECTIONS = TOOL_SERVER_CONNECTIONS
 app.state.TOOL_SERVERS = []
+app.state.TOOL_SERVERS_UPDATED_AT = None
 
 ########################################
 #
@@ -1590,7 +1611,9 @@ async def get_models(
             continue
 
         # Remove profile image URL to reduce payload size
+        # (copy info/meta so the cached model catalog is left intact)
         if model.get("info", {}).get("meta", {}).get("profile_image_url"):
+            model["info"] = {**model["info"], "meta": {**model["info"]["meta"]}}
             model["info"]["meta"].pop("profile_image_url", None)
 
         try:
@@ -1825,7 +1848,7 @@ async def chat_completion(
             if metadata.get("chat_id") and metadata.get("message_id"):
                 try:
                     if not metadata["chat_id"].startswith("local:"):
-                        Chats.upsert_message_to_chat_by_id_and_message_id(
+                        Chats.patch_message_by_id_and_message_id(
                             metadata["chat_id"],
                             metadata["message_id"],
                             {
@@ -1860,7 +1883,7 @@ async def chat_completion(
                 # Update the chat message with the error
                 try:
                     if not metadata["chat_id"].startswith("local:"):
-                        Chats.upsert_message_to_chat_by_id_and_message_id(
+                        Chats.patch_message_by_id_and_message_id(
                             metadata["chat_id"],
                             metadata["message_id"],
                             {
@@ -0,0 +1,27 @@
+"""Add data column to chat_message
+
+Revision ID: d4e5f6a7b8c9
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, None] = "b2c3d4e5f6a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Full message payload, populated by dual-writes and `open-webui backfill-chat-messages`
+    op.add_column("chat_message", sa.Column("data", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("chat_message", "data")
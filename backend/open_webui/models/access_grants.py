@@ -456,6 +456,22 @@ class AccessGrantsTable:
             )
             return [AccessGrantModel.model_validate(g) for g in grants]
 
+    def get_grants_by_resource_type(
+        self,
+        resource_type: str,
+        db: Optional[Session] = None,
+    ) -> dict[str, list[AccessGrantModel]]:
+        """Get all grants for a resource type, grouped by resource id."""
+        with get_db_context(db) as db:
+            grants = db.query(AccessGrant).filter_by(resource_type=resource_type).all()
+
+            grants_by_resource = {}
+            for grant in grants:
+                grants_by_resource.setdefault(grant.resource_id, []).append(
+                    AccessGrantModel.model_validate(grant)
+                )
+            return grants_by_resource
+
     def has_access(
         self,
         user_id: str,
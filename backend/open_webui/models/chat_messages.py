@@ -80,6 +80,9 @@ class ChatMessage(Base):
     # Usage (tokens, timing, etc.)
     usage = Column(JSON, nullable=True)
 
+    # Full message as stored in chat.history, used to rebuild the history tree
+    data = Column(JSON, nullable=True)
+
     # Timestamps
     created_at = Column(BigInteger, index=True)
     updated_at = Column(BigInteger)
@@ -114,6 +117,7 @@ class ChatMessageModel(BaseModel):
     status_history: Optional[list] = None
     error: Optional[dict | str] = None
     usage: Optional[dict] = None
+    data: Optional[dict] = None
     created_at: int
     updated_at: int
 
@@ -174,6 +178,7 @@ class ChatMessageTable:
                     usage = info.get("usage") if info else None
                 if usage:
                     existing.usage = usage
+                existing.data = data
                 existing.updated_at = now
                 db.commit()
                 db.refresh(existing)
@@ -202,6 +207,7 @@ class ChatMessageTable:
                     or data.get("statusHistory"),
                     error=data.get("error"),
                     usage=usage,
+                    data=data,
                     created_at=timestamp,
                     updated_at=now,
                 )
@@ -229,6 +235,113 @@ class ChatMessageTable:
             )
             return [ChatMessageModel.model_validate(message) for message in messages]
 
+    def get_messages_map_by_chat_id(
+        self, chat_id: str, db: Optional[Session] = None
+    ) -> Optional[dict]:
+        """
+        Rebuild history.messages for a chat from its rows.
+        Returns None when the chat has no rows or has not been backfilled yet.
+        """
+        with get_db_context(db) as db:
+            rows = (
+                db.query(ChatMessage.id, ChatMessage.data)
+                .filter(ChatMessage.chat_id == chat_id)
+                .all()
+            )
+
+            if not rows or any(data is None for _, data in rows):
+                return None
+
+            prefix_length = len(chat_id) + 1
+            return {id[prefix_length:]: data for id, data in rows}
+
+    def get_message_data_by_chat_id_and_message_id(
+        self, chat_id: str, message_id: str, db: Optional[Session] = None
+    ) -> Optional[dict]:
+        with get_db_context(db) as db:
+            data = (
+                db.query(ChatMessage.data)
+                .filter(ChatMessage.id == f"{chat_id}-{message_id}")
+                .scalar()
+            )
+            return data
+
+    def get_message_branch_by_chat_id(
+        self,
+        chat_id: str,
+        message_id: str,
+        skip: int = 0,
+        limit: int = 50,
+        db: Optional[Session] = None,
+    ) -> list[dict]:
+        """
+        Return the messages on the branch ending at message_id, ordered from
+        the root, paginated with skip/limit.
+        """
+        with get_db_context(db) as db:
+            rows = (
+                db.query(ChatMessage.id, ChatMessage.parent_id)
+                .filter(ChatMessage.chat_id == chat_id)
+                .all()
+            )
+            if not rows:
+                return []
+
+            prefix_length = len(chat_id) + 1
+            parents = {id[prefix_length:]: parent_id for id, parent_id in rows}
+
+            branch = []
+            while message_id in parents and message_id not in branch:
+                branch.append(message_id)
+                message_id = parents[message_id]
+            branch.reverse()
+
+            page = [f"{chat_id}-{id}" for id in branch[skip : skip + limit]]
+            if not page:
+                return []
+
+            data = dict(
+                db.query(ChatMessage.id, ChatMessage.data)
+                .filter(ChatMessage.id.in_(page))
+                .all()
+            )
+            return [data[id] for id in page if data.get(id) is not None]
+
+    def sync_messages(
+        self,
+        chat_id: str,
+        user_id: str,
+        messages: dict,
+        db: Optional[Session] = None,
+    ) -> None:
+        """Bring the rows of a chat in line with its history.messages."""
+        with get_db_context(db) as db:
+            existing = dict(
+                db.query(ChatMessage.id, ChatMessage.data)
+                .filter(ChatMessage.chat_id == chat_id)
+                .all()
+            )
+
+            for message_id, message in messages.items():
+                if not isinstance(message, dict):
+                    continue
+
+                if existing.pop(f"{chat_id}-{message_id}", None) != message:
+                    self.upsert_message(
+                        message_id=message_id,
+                        chat_id=chat_id,
+                        user_id=user_id,
+                        data=message,
+                        db=db,
+                    )
+
+            # Messages removed from the history
+            if existing:
+                db.query(ChatMessage).filter(
+                    ChatMessage.id.in_(list(existing.keys()))
+                ).delete(synchronize_session=False)
+                db.commit()
+
     def get_messages_by_user_id(
         self,
         user_id: str,
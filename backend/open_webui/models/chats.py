@@ -10,6 +10,7 @@ from open_webui.models.tags import TagModel, Tag, Tags
 from open_webui.models.folders import Folders
 from open_webui.models.chat_messages import ChatMessage, ChatMessages
 from open_webui.utils.misc import sanitize_data_for_db, sanitize_text_for_db
+from open_webui.env import ENABLE_CHAT_MESSAGE_TABLE_READS
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import (
@@ -23,7 +24,8 @@ from sqlalchemy import (
     Index,
     UniqueConstraint,
 )
-from sqlalchemy import or_, func, select, and_, text
+from sqlalchemy import or_, func, select, and_, text, cast, update
+from sqlalchemy.dialects.postgresql import JSONB, array
 from sqlalchemy.sql import exists
 from sqlalchemy.sql.expression import bindparam
 
@@ -321,7 +323,7 @@ class ChatTable:
                 history = form_data.chat.get("history", {})
                 messages = history.get("messages", {})
                 for message_id, message in messages.items():
-                    if isinstance(message, dict) and message.get("role"):
+                    if isinstance(message, dict):
                         ChatMessages.upsert_message(
                             message_id=message_id,
                             chat_id=id,
@@ -382,7 +384,7 @@ class ChatTable:
                     history = form_data.chat.get("history", {})
                     messages = history.get("messages", {})
                     for message_id, message in messages.items():
-                        if isinstance(message, dict) and message.get("role"):
+                        if isinstance(message, dict):
                             ChatMessages.upsert_message(
                                 message_id=message_id,
                                 chat_id=chat_obj.id,
@@ -414,6 +416,17 @@ class ChatTable:
                 db.commit()
                 db.refresh(chat_item)
 
+                if ENABLE_CHAT_MESSAGE_TABLE_READS:
+                    try:
+                        ChatMessages.sync_messages(
+                            chat_id=id,
+                            user_id=chat_item.user_id,
+                            messages=chat.get("history", {}).get("messages", {}),
+                            db=db,
+                        )
+                    except Exception as e:
+                        log.warning(f"Failed to sync chat_message table: {e}")
+
                 return ChatModel.model_validate(chat_item)
         except Exception:
             return None
@@ -428,6 +441,39 @@ class ChatTable:
 
         return self.update_chat_by_id(id, chat)
 
+    def update_chat_title_and_message_by_id(
+        self,
+        id: str,
+        message_id: str,
+        title: Optional[str] = None,
+        message: Optional[dict] = None,
+    ) -> Optional[ChatModel]:
+        """
+        Set the chat title and merge fields into one message with a single
+        write, for results of background tasks. history.currentId is kept.
+        """
+        if title is None:
+            if message:
+                self.patch_message_by_id_and_message_id(id, message_id, message)
+            return self.get_chat_by_id(id)
+
+        chat = self.get_chat_by_id(id)
+        if chat is None:
+            return None
+
+        user_id = chat.user_id
+        chat = chat.chat
+        chat["title"] = title
+
+        messages = chat.setdefault("history", {}).setdefault("messages", {})
+        if message:
+            messages[message_id] = {**messages.get(message_id, {}), **message}
+
+        result = self.update_chat_by_id(id, chat)
+        if result is not None and message:
+            self._dual_write_message(id, message_id, user_id, messages[message_id])
+        return result
+
     def update_chat_tags_by_id(
         self, id: str, tags: list[str], user
     ) -> Optional[ChatModel]:
@@ -448,6 +494,22 @@ class ChatTable:
             self.add_chat_tag_by_id_and_user_id_and_tag_name(id, user.id, tag_name)
         return self.get_chat_by_id(id)
 
+    def get_chat_user_id_by_id(
+        self, id: str, db: Optional[Session] = None
+    ) -> Optional[str]:
+        with get_db_context(db) as db:
+            return db.query(Chat.user_id).filter(Chat.id == id).scalar()
+
+    def get_current_message_id_by_id(
+        self, id: str, db: Optional[Session] = None
+    ) -> Optional[str]:
+        with get_db_context(db) as db:
+            return (
+                db.query(Chat.chat["history"]["currentId"].as_string())
+                .filter(Chat.id == id)
+                .scalar()
+            )
+
     def get_chat_title_by_id(self, id: str) -> Optional[str]:
         chat = self.get_chat_by_id(id)
         if chat is None:
@@ -456,59 +518,204 @@ class ChatTable:
         return chat.chat.get("title", "New Chat")
 
     def get_messages_map_by_chat_id(self, id: str) -> Optional[dict]:
+        if ENABLE_CHAT_MESSAGE_TABLE_READS:
+            messages = ChatMessages.get_messages_map_by_chat_id(id)
+            if messages is not None:
+                return messages
+
         chat = self.get_chat_by_id(id)
         if chat is None:
             return None
 
         return chat.chat.get("history", {}).get("messages", {}) or {}
 
+    def _get_message_path_expressions(self, dialect_name: str, message_id: str):
+        """
+        Build (messages type, message, updated chat) expressions that address
+        history.messages.<message_id> inside the chat JSON without loading it.
+        Returns None when the dialect has no partial JSON update support.
+        """
+        if dialect_name == "sqlite" and '"' not in message_id:
+            path = f'$.history.messages."{message_id}"'
+            return (
+                func.json_type(Chat.chat, "$.history.messages"),
+                func.json_extract(Chat.chat, path),
+                lambda message: func.json_set(
+                    Chat.chat,
+                    path,
+                    func.json(bindparam("message", json.dumps(message))),
+                    "$.history.currentId",
+                    message_id,
+                ),
+            )
+        elif dialect_name == "postgresql":
+            document = cast(Chat.chat, JSONB)
+            return (
+                func.jsonb_typeof(
+                    func.jsonb_extract_path(document, "history", "messages")
+                ),
+                func.jsonb_extract_path(
+                    document, "history", "messages", message_id, type_=JSONB
+                ),
+                lambda message: cast(
+                    func.jsonb_set(
+                        func.jsonb_set(
+                            document,
+                            array(["history", "messages", message_id], type_=Text),
+                            cast(
+                                bindparam("message", json.dumps(message), type_=Text),
+                                JSONB,
+                            ),
+                        ),
+                        array(["history", "currentId"], type_=Text),
+                        func.to_jsonb(cast(message_id, Text)),
+                    ),
+                    JSON,
+                ),
+            )
+        return None
+
     def get_message_by_id_and_message_id(
-        self, id: str, message_id: str
+        self, id: str, message_id: str, db: Optional[Session] = None
     ) -> Optional[dict]:
-        chat = self.get_chat_by_id(id)
-        if chat is None:
-            return None
+        with get_db_context(db) as db:
+            if ENABLE_CHAT_MESSAGE_TABLE_READS:
+                message = ChatMessages.get_message_data_by_chat_id_and_message_id(
+                    id, message_id, db=db
+                )
+                if message is not None:
+                    return message
 
-        return chat.chat.get("history", {}).get("messages", {}).get(message_id, {})
+            expressions = self._get_message_path_expressions(
+                db.bind.dialect.name, message_id
+            )
+            if expressions is None:
+                chat = self.get_chat_by_id(id, db=db)
+                if chat is None:
+                    return None
 
-    def upsert_message_to_chat_by_id_and_message_id(
-        self, id: str, message_id: str, message: dict
-    ) -> Optional[ChatModel]:
-        chat = self.get_chat_by_id(id)
-        if chat is None:
-            return None
+                return (
+                    chat.chat.get("history", {}).get("messages", {}).get(message_id, {})
+                )
 
+            _, message_expression, _ = expressions
+            row = db.query(Chat.id, message_expression).filter(Chat.id == id).first()
+            if row is None:
+                return None
+
+            message = row[1]
+            if isinstance(message, str):
+                message = json.loads(message)
+            return message if isinstance(message, dict) else {}
+
+    def patch_message_by_id_and_message_id(
+        self, id: str, message_id: str, message: dict, db: Optional[Session] = None
+    ) -> Optional[dict]:
+        """
+        Merge message into history.messages.<message_id> and set history.currentId,
+        rewriting only those JSON paths instead of the whole chat document.
+        Returns the merged message, or None if the chat does not exist.
+        """
         # Sanitize message content for null characters before upserting
         if isinstance(message.get("content"), str):
             message["content"] = sanitize_text_for_db(message["content"])
 
+        with get_db_context(db) as db:
+            expressions = self._get_message_path_expressions(
+                db.bind.dialect.name, message_id
+            )
+            if expressions is None:
+                return self._patch_message_in_chat_document(
+                    id, message_id, message, db=db
+                )
+
+            messages_type_expression, message_expression, set_message = expressions
+            row = (
+                db.query(Chat.user_id, messages_type_expression, message_expression)
+                .filter(Chat.id == id)
+                .first()
+            )
+            if row is None:
+                return None
+
+            user_id, messages_type, existing = row
+            if messages_type != "object":
+                # history.messages does not exist yet, create it with a full write
+                return self._patch_message_in_chat_document(
+                    id, message_id, message, db=db
+                )
+
+            if isinstance(existing, str):
+                existing = json.loads(existing)
+
+            merged = self._clean_null_bytes(
+                {**existing, **message} if isinstance(existing, dict) else message
+            )
+
+            db.execute(
+                update(Chat)
+                .where(Chat.id == id)
+                .values(chat=set_message(merged), updated_at=int(time.time()))
+            )
+            db.commit()
+
+        self._dual_write_message(id, message_id, user_id, merged)
+        return merged
+
+    def _patch_message_in_chat_document(
+        self, id: str, message_id: str, message: dict, db: Optional[Session] = None
+    ) -> Optional[dict]:
+        chat = self.get_chat_by_id(id, db=db)
+        if chat is None:
+            return None
+
+        user_id = chat.user_id
         chat = chat.chat
         history = chat.get("history", {})
+        messages = history.setdefault("messages", {})
 
-        if message_id in history.get("messages", {}):
-            history["messages"][message_id] = {
-                **history["messages"][message_id],
+        if message_id in messages:
+            messages[message_id] = {
+                **messages[message_id],
                 **message,
             }
         else:
-            history["messages"][message_id] = message
+            messages[message_id] = message
 
         history["currentId"] = message_id
 
         chat["history"] = history
 
+        self._dual_write_message(id, message_id, user_id, messages[message_id])
+
+        if self.update_chat_by_id(id, chat, db=db) is None:
+            return None
+        return messages[message_id]
+
+    def _dual_write_message(
+        self, chat_id: str, message_id: str, user_id: str, message: dict
+    ):
         # Dual-write to chat_message table
         try:
             ChatMessages.upsert_message(
                 message_id=message_id,
-                chat_id=id,
-                user_id=self.get_chat_by_id(id).user_id,
-                data=history["messages"][message_id],
+                chat_id=chat_id,
+                user_id=user_id,
+                data=message,
             )
         except Exception as e:
             log.warning(f"Failed to write to chat_message table: {e}")
 
-        return self.update_chat_by_id(id, chat)
+    def upsert_message_to_chat_by_id_and_message_id(
+        self, id: str, message_id: str, message: dict, db: Optional[Session] = None
+    ) -> Optional[ChatModel]:
+        if (
+            self.patch_message_by_id_and_message_id(id, message_id, message, db=db)
+            is None
+        ):
+            return None
+
+        return self.get_chat_by_id(id, db=db)
 
     def add_message_status_to_chat_by_id_and_message_id(
         self, id: str, message_id: str, status: dict
@@ -921,16 +1128,97 @@ class ChatTable:
         except Exception:
             return None
 
+    def _get_chat_from_message_table(
+        self, db: Session, *criteria
+    ) -> Optional[ChatModel]:
+        """
+        Load a chat without its history.messages blob and rebuild the messages
+        from the chat_message table. Returns None when that is not possible.
+        """
+        dialect_name = db.bind.dialect.name
+        if dialect_name == "sqlite":
+            document = func.json_remove(Chat.chat, "$.history.messages")
+        elif dialect_name == "postgresql":
+            document = cast(
+                cast(Chat.chat, JSONB).op("#-")(
+                    array(["history", "messages"], type_=Text)
+                ),
+                JSON,
+            )
+        else:
+            return None
+
+        columns = [column for column in Chat.__table__.columns if column.name != "chat"]
+        row = db.query(*columns, document.label("chat")).filter(*criteria).first()
+        if row is None:
+            return None
+
+        messages = ChatMessages.get_messages_map_by_chat_id(row.id, db=db)
+        if messages is None:
+            return None
+
+        chat = row.chat
+        if isinstance(chat, str):
+            chat = json.loads(chat)
+        chat.setdefault("history", {})["messages"] = messages
+
+        return ChatModel.model_validate({**row._mapping, "chat": chat})
+
     def get_chat_by_id_and_user_id(
         self, id: str, user_id: str, db: Optional[Session] = None
     ) -> Optional[ChatModel]:
         try:
             with get_db_context(db) as db:
+                if ENABLE_CHAT_MESSAGE_TABLE_READS:
+                    chat = self._get_chat_from_message_table(
+                        db, Chat.id == id, Chat.user_id == user_id
+                    )
+                    if chat is not None:
+                        return chat
+
                 chat = db.query(Chat).filter_by(id=id, user_id=user_id).first()
                 return ChatModel.model_validate(chat)
         except Exception:
             return None
 
+    def backfill_chat_messages(self, batch_size: int = 100) -> int:
+        """
+        Sync the chat_message table with every chat's history.messages,
+        batch by batch. Safe to re-run; unchanged messages are skipped.
+        """
+        count = 0
+        last_id = ""
+
+        while True:
+            with get_db_context() as db:
+                rows = (
+                    db.query(Chat.id, Chat.user_id, Chat.chat)
+                    .filter(Chat.id > last_id, ~Chat.user_id.like("shared-%"))
+                    .order_by(Chat.id.asc())
+                    .limit(batch_size)
+                    .all()
+                )
+                if not rows:
+                    break
+
+                for id, user_id, chat in rows:
+                    try:
+                        ChatMessages.sync_messages(
+                            chat_id=id,
+                            user_id=user_id,
+                            messages=(chat or {}).get("history", {}).get("messages", {})
+                            or {},
+                            db=db,
+                        )
+                        count += 1
+                    except Exception as e:
+                        log.warning(f"Failed to backfill messages for chat {id}: {e}")
+
+                last_id = rows[-1][0]
+                log.info(f"Backfilled chat_message rows for {count} chats")
+
+        return count
+
     def get_chats(
         self, skip: int = 0, limit: int = 50, db: Optional[Session] = None
     ) -> list[ChatModel]:
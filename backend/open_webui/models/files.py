@@ -1,9 +1,16 @@
+import asyncio
+import json
 import logging
+import threading
 import time
-from typing import Optional
+import uuid
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Optional
 
 from sqlalchemy.orm import Session
+from open_webui.env import REDIS_KEY_PREFIX, REDIS_RECONNECT_DELAY, REDIS_URL
 from open_webui.internal.db import Base, JSONField, get_db, get_db_context
+from open_webui.utils.redis import get_redis_client
 from pydantic import BaseModel, ConfigDict, model_validator
 from sqlalchemy import BigInteger, Column, String, Text, JSON
 
@@ -122,6 +129,147 @@ class FileListResponse(BaseModel):
     total: int
 
 
+####################
+# Processing Status
+####################
+
+
+class FileStatusBus:
+    """
+    Pushes file processing status transitions to whoever is waiting on them.
+
+    Files.update_file_data_by_id publishes every status change. Subscribers
+    (the status SSE endpoint) get an asyncio.Queue per file and wake up only
+    when the status changes; listeners (the socket.io layer) are called for
+    changes made by this instance. With Redis configured, changes are also
+    broadcast so subscribers on other workers are notified.
+
+    A None item in a subscriber queue means events may have been missed
+    (e.g. the Redis listener reconnected) and the status should be re-read.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._listeners: list[Callable[[dict], Awaitable[None]]] = []
+
+        self._instance_id = str(uuid.uuid4())
+        self._channel = f"{REDIS_KEY_PREFIX}:files:status"
+        self._redis = None
+        self._listener = None
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._get_redis()
+
+    def _get_redis(self):
+        if not REDIS_URL:
+            return None
+
+        if self._redis is None:
+            self._redis = get_redis_client()
+            if self._redis is not None and self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, name="file-status-listener", daemon=True
+                )
+                self._listener.start()
+        return self._redis
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self._redis.pubsub()
+                pubsub.subscribe(self._channel)
+
+                # Transitions may have been published while not subscribed
+                self._call_soon(self._resync)
+
+                for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        data = json.loads(message["data"])
+                        if data.pop("instance_id", None) != self._instance_id:
+                            self._call_soon(self._dispatch, data, False)
+                    except Exception as e:
+                        log.exception(f"Error handling file status event: {e}")
+            except Exception as e:
+                log.warning(f"File status listener disconnected: {e}")
+                time.sleep((REDIS_RECONNECT_DELAY or 1000) / 1000)
+
+    def _call_soon(self, callback, *args):
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # Event loop shut down between the check and the call
+            pass
+
+    def _dispatch(self, event: dict, local: bool):
+        for queue in self._subscribers.get(event["file_id"], ()):
+            queue.put_nowait(event)
+
+        if local:
+            for listener in self._listeners:
+                self._loop.create_task(listener(event))
+
+    def _resync(self):
+        for queues in self._subscribers.values():
+            for queue in queues:
+                queue.put_nowait(None)
+
+    def add_listener(self, listener: Callable[[dict], Awaitable[None]]):
+        self._listeners.append(listener)
+
+    @contextmanager
+    def subscribe(self, file_id: str):
+        """Must be entered on the event loop; yields a queue of status events."""
+        if self._loop is None:
+            self.start()
+
+        queue = asyncio.Queue()
+        self._subscribers.setdefault(file_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(file_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    self._subscribers.pop(file_id, None)
+
+    def publish(self, file_id: str, user_id: str, data: dict):
+        event = {
+            "file_id": file_id,
+            "user_id": user_id,
+            "status": data.get("status"),
+            "error": data.get("error"),
+        }
+
+        # Safe to call from worker threads; delivery happens on the loop
+        self._call_soon(self._dispatch, event, True)
+
+        try:
+            redis = self._get_redis()
+            if redis is None:
+                return
+
+            message = json.dumps({"instance_id": self._instance_id, **event})
+            # RedisCluster doesn't expose publish() directly, but the
+            # PUBLISH command broadcasts across all cluster nodes server-side.
+            if hasattr(redis, "nodes_manager"):
+                redis.execute_command("PUBLISH", self._channel, message)
+            else:
+                redis.publish(self._channel, message)
+        except Exception as e:
+            log.warning(f"Failed to publish file status: {e}")
+
+
+FILE_STATUS_BUS = FileStatusBus()
+
+
 class FilesTable:
     def insert_new_file(
         self, user_id: str, form_data: FileForm, db: Optional[Session] = None
@@ -355,6 +503,9 @@ class FilesTable:
                 file.data = {**(file.data if file.data else {}), **data}
                 file.updated_at = int(time.time())
                 db.commit()
+
+                if "status" in data:
+                    FILE_STATUS_BUS.publish(file.id, file.user_id, file.data)
                 return FileModel.model_validate(file)
             except Exception as e:
 
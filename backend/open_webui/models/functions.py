@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from open_webui.internal.db import Base, JSONField, get_db, get_db_context
 from open_webui.models.users import Users, UserModel
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Boolean, Column, String, Text, Index
+from sqlalchemy import BigInteger, Boolean, Column, String, Text, Index, func
 
 log = logging.getLogger(__name__)
 
@@ -297,6 +297,20 @@ class FunctionsTable:
                 .all()
             ]
 
+    def get_functions_version(self, db: Optional[Session] = None) -> tuple:
+        """
+        Cheap fingerprint of the function table.
+        Changes whenever a function is added, updated, toggled or removed.
+        """
+        with get_db_context(db) as db:
+            return tuple(
+                db.query(
+                    func.count(Function.id),
+                    func.max(Function.updated_at),
+                    func.sum(Function.updated_at),
+                ).one()
+            )
+
     def get_function_valves_by_id(
         self, id: str, db: Optional[Session] = None
     ) -> Optional[dict]:
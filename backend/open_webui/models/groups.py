@@ -1,13 +1,24 @@
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from typing import Optional
 import uuid
 
 from sqlalchemy.orm import Session
 from open_webui.internal.db import Base, JSONField, get_db, get_db_context
 
+from open_webui.env import (
+    ENABLE_GROUP_MEMBERSHIP_CACHE,
+    GROUP_MEMBERSHIP_CACHE_SIZE,
+    GROUP_MEMBERSHIP_CACHE_TTL,
+    REDIS_KEY_PREFIX,
+    REDIS_RECONNECT_DELAY,
+    REDIS_URL,
+)
 from open_webui.models.files import FileMetadataResponse
+from open_webui.utils.redis import get_redis_client
 
 
 from pydantic import BaseModel, ConfigDict
@@ -129,6 +140,163 @@ class GroupListResponse(BaseModel):
     total: int = 0
 
 
+class GroupMembershipCache:
+    """
+    Per-user cache of group memberships (and values derived from them, such
+    as merged permission trees) for permission and access checks.
+
+    Entries expire after GROUP_MEMBERSHIP_CACHE_TTL and are invalidated by
+    GroupTable writes. With Redis configured, invalidations are published so
+    every worker drops its copy; the TTL bounds staleness if a message is
+    missed.
+    """
+
+    def __init__(
+        self,
+        ttl: float = GROUP_MEMBERSHIP_CACHE_TTL,
+        maxsize: int = GROUP_MEMBERSHIP_CACHE_SIZE,
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self._instance_id = str(uuid.uuid4())
+        self._channel = f"{REDIS_KEY_PREFIX}:groups:invalidate"
+        self._redis = None
+        self._listener = None
+
+    def _get_redis(self):
+        if not REDIS_URL:
+            return None
+
+        if self._redis is None:
+            self._redis = get_redis_client()
+            if self._redis is not None and self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, name="group-cache-listener", daemon=True
+                )
+                self._listener.start()
+        return self._redis
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self._redis.pubsub()
+                pubsub.subscribe(self._channel)
+
+                # Invalidations may have been published while not subscribed
+                self._clear(None)
+
+                for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        data = json.loads(message["data"])
+                        if data.get("instance_id") != self._instance_id:
+                            self._clear(data.get("user_ids"))
+                    except Exception as e:
+                        log.exception(f"Error handling group cache invalidation: {e}")
+            except Exception as e:
+                log.warning(f"Group cache listener disconnected: {e}")
+                time.sleep((REDIS_RECONNECT_DELAY or 1000) / 1000)
+
+    def _clear(self, user_ids: Optional[list[str]]):
+        with self._lock:
+            self._generation += 1
+            if user_ids is None:
+                self._entries.clear()
+            else:
+                for user_id in user_ids:
+                    self._entries.pop(user_id, None)
+
+    def _get_entry(self, user_id: str) -> Optional[dict]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        if entry["expires"] < time.monotonic():
+            self._entries.pop(user_id, None)
+            return None
+        return entry
+
+    def get_groups(self, user_id: str, load) -> list["GroupModel"]:
+        if not ENABLE_GROUP_MEMBERSHIP_CACHE:
+            return load()
+
+        self._get_redis()
+
+        with self._lock:
+            entry = self._get_entry(user_id)
+            if entry is not None:
+                self._entries.move_to_end(user_id)
+                return list(entry["groups"])
+            generation = self._generation
+
+        groups = load()
+
+        with self._lock:
+            # Skip caching if the memberships changed while loading
+            if generation == self._generation:
+                self._entries[user_id] = {
+                    "groups": groups,
+                    "expires": time.monotonic() + self.ttl,
+                    "derived": {},
+                }
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        return list(groups)
+
+    def get_derived(self, user_id: str, key, source, compute):
+        """
+        Return a value computed from the user's groups and `source`, cached
+        until the user's memberships change or `source` is replaced.
+        """
+        if ENABLE_GROUP_MEMBERSHIP_CACHE:
+            with self._lock:
+                entry = self._get_entry(user_id)
+                cached = entry["derived"].get(key) if entry else None
+                if cached is not None and cached[0] is source:
+                    return cached[1]
+
+        value = compute()
+
+        if ENABLE_GROUP_MEMBERSHIP_CACHE:
+            with self._lock:
+                entry = self._get_entry(user_id)
+                if entry is not None:
+                    entry["derived"][key] = (source, value)
+
+        return value
+
+    def invalidate(self, user_ids: Optional[list[str]] = None):
+        """Drop cached memberships for `user_ids`, or for every user if None."""
+        self._clear(user_ids)
+
+        try:
+            redis = self._get_redis()
+            if redis is None:
+                return
+
+            message = json.dumps(
+                {"instance_id": self._instance_id, "user_ids": user_ids}
+            )
+            # RedisCluster doesn't expose publish() directly, but the
+            # PUBLISH command broadcasts across all cluster nodes server-side.
+            if hasattr(redis, "nodes_manager"):
+                redis.execute_command("PUBLISH", self._channel, message)
+            else:
+                redis.publish(self._channel, message)
+        except Exception as e:
+            log.warning(f"Failed to publish group cache invalidation: {e}")
+
+
+GROUP_MEMBERSHIPS = GroupMembershipCache()
+
+
 class GroupTable:
     def insert_new_group(
         self, user_id: str, form_data: GroupForm, db: Optional[Session] = None
@@ -274,15 +442,18 @@ class GroupTable:
     def get_groups_by_member_id(
         self, user_id: str, db: Optional[Session] = None
     ) -> list[GroupModel]:
-        with get_db_context(db) as db:
-            return [
-                GroupModel.model_validate(group)
-                for group in db.query(Group)
-                .join(GroupMember, GroupMember.group_id == Group.id)
-                .filter(GroupMember.user_id == user_id)
-                .order_by(Group.updated_at.desc())
-                .all()
-            ]
+        def load():
+            with get_db_context(db) as session:
+                return [
+                    GroupModel.model_validate(group)
+                    for group in session.query(Group)
+                    .join(GroupMember, GroupMember.group_id == Group.id)
+                    .filter(GroupMember.user_id == user_id)
+                    .order_by(Group.updated_at.desc())
+                    .all()
+                ]
+
+        return GROUP_MEMBERSHIPS.get_groups(user_id, load)
 
     def get_groups_by_member_ids(
         self, user_ids: list[str], db: Optional[Session] = None
@@ -370,6 +541,8 @@ class GroupTable:
             db.add_all(new_members)
             db.commit()
 
+        GROUP_MEMBERSHIPS.invalidate()
+
     def get_group_member_count_by_id(
         self, id: str, db: Optional[Session] = None
     ) -> int:
@@ -411,6 +584,7 @@ class GroupTable:
                     }
                 )
                 db.commit()
+                GROUP_MEMBERSHIPS.invalidate()
                 return self.get_group_by_id(id=id, db=db)
         except Exception as e:
             log.exception(e)
@@ -421,6 +595,7 @@ class GroupTable:
             with get_db_context(db) as db:
                 db.query(Group).filter_by(id=id).delete()
                 db.commit()
+                GROUP_MEMBERSHIPS.invalidate()
                 return True
         except Exception:
             return False
@@ -430,6 +605,7 @@ class GroupTable:
             try:
                 db.query(Group).delete()
                 db.commit()
+                GROUP_MEMBERSHIPS.invalidate()
 
                 return True
             except Exception:
@@ -459,6 +635,7 @@ class GroupTable:
                     )
 
                 db.commit()
+                GROUP_MEMBERSHIPS.invalidate([user_id])
                 return True
 
             except Exception:
@@ -552,6 +729,7 @@ class GroupTable:
                     )
 
                 db.commit()
+                GROUP_MEMBERSHIPS.invalidate([user_id])
                 return True
 
             except Exception as e:
@@ -593,6 +771,7 @@ class GroupTable:
                 group.updated_at = now
                 db.commit()
                 db.refresh(group)
+                GROUP_MEMBERSHIPS.invalidate(list(user_ids or []))
 
                 return GroupModel.model_validate(group)
 
@@ -625,6 +804,7 @@ class GroupTable:
 
                 db.commit()
                 db.refresh(group)
+                GROUP_MEMBERSHIPS.invalidate(list(user_ids))
                 return GroupModel.model_validate(group)
 
         except Exception as e:
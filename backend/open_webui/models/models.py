@@ -7,7 +7,11 @@ from open_webui.internal.db import Base, JSONField, get_db, get_db_context
 
 from open_webui.models.groups import Groups
 from open_webui.models.users import User, UserModel, Users, UserResponse
-from open_webui.models.access_grants import AccessGrantModel, AccessGrants
+from open_webui.models.access_grants import (
+    AccessGrant,
+    AccessGrantModel,
+    AccessGrants,
+)
 
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -181,9 +185,35 @@ class ModelsTable:
 
     def get_all_models(self, db: Optional[Session] = None) -> list[ModelModel]:
         with get_db_context(db) as db:
-            return [
-                self._to_model_model(model, db=db) for model in db.query(Model).all()
-            ]
+            # Load grants for every model in one query instead of one per model
+            grants_by_model = AccessGrants.get_grants_by_resource_type("model", db=db)
+
+            models = []
+            for model in db.query(Model).all():
+                model_data = ModelModel.model_validate(model).model_dump(
+                    exclude={"access_grants"}
+                )
+                model_data["access_grants"] = grants_by_model.get(model.id, [])
+                models.append(ModelModel.model_validate(model_data))
+            return models
+
+    def get_models_version(self, db: Optional[Session] = None) -> tuple:
+        """
+        Cheap fingerprint of the model table and model access grants.
+        Changes whenever a model or its grants are added, updated or removed.
+        """
+        with get_db_context(db) as db:
+            models = db.query(
+                func.count(Model.id),
+                func.max(Model.updated_at),
+                func.sum(Model.updated_at),
+            ).one()
+            grants = (
+                db.query(func.count(AccessGrant.id), func.max(AccessGrant.created_at))
+                .filter(AccessGrant.resource_type == "model")
+                .one()
+            )
+            return tuple(models) + tuple(grants)
 
     def get_models(self, db: Optional[Session] = None) -> list[ModelUserResponse]:
         with get_db_context(db) as db:
@@ -385,7 +415,11 @@ class ModelsTable:
             with get_db_context(db) as db:
                 # update only the fields that are present in the model
                 data = model.model_dump(exclude={"id", "access_grants"})
-                result = db.query(Model).filter_by(id=id).update(data)
+                result = (
+                    db.query(Model)
+                    .filter_by(id=id)
+                    .update({**data, "updated_at": int(time.time())})
+                )
 
                 db.commit()
                 if model.access_grants is not None:
@@ -0,0 +1,497 @@
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+from open_webui.config import ENABLE_RAG_BM25_INDEX, RAG_BM25_INDEX_DIR
+from open_webui.env import REDIS_KEY_PREFIX
+from open_webui.retrieval.vector.main import GetResult
+from open_webui.utils.redis import get_redis_client
+
+log = logging.getLogger(__name__)
+
+# Okapi BM25 parameters, same defaults as rank_bm25.BM25Okapi
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Let SQLite serve posting lists straight from the page cache
+BM25_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def tokenize(text: str) -> list[str]:
+    # Same preprocessing as langchain's BM25Retriever default
+    return text.split()
+
+
+def get_enriched_text(text: str, metadata: dict) -> str:
+    metadata_parts = [text]
+
+    # Add filename (repeat twice for extra weight in BM25 scoring)
+    if metadata.get("name"):
+        filename = metadata["name"]
+        filename_tokens = filename.replace("_", " ").replace("-", " ").replace(".", " ")
+        metadata_parts.append(
+            f"Filename: {filename} {filename_tokens} {filename_tokens}"
+        )
+
+    # Add title if available
+    if metadata.get("title"):
+        metadata_parts.append(f"Title: {metadata['title']}")
+
+    # Add document section headings if available (from markdown splitter)
+    if metadata.get("headings") and isinstance(metadata["headings"], list):
+        headings = " > ".join(str(h) for h in metadata["headings"])
+        metadata_parts.append(f"Section: {headings}")
+
+    # Add source URL/path if available
+    if metadata.get("source"):
+        metadata_parts.append(f"Source: {metadata['source']}")
+
+    # Add snippet for web search results
+    if metadata.get("snippet"):
+        metadata_parts.append(f"Snippet: {metadata['snippet']}")
+
+    return " ".join(metadata_parts)
+
+
+class BM25Index:
+    """
+    Inverted BM25 index over a single collection, persisted as an SQLite file.
+
+    Posting lists are keyed by term so a query only touches the lists of its
+    own terms; document counts and lengths are kept in a stats table so scoring
+    never scans the whole collection.
+    """
+
+    def __init__(self, path: Path, enriched: bool = False):
+        self.path = path
+        self.enriched = enriched
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute(f"PRAGMA mmap_size={BM25_MMAP_SIZE}")
+            yield conn
+        finally:
+            conn.close()
+
+    def create(self, version: int = 0, epoch: int = 0):
+        with self._connect() as conn:
+            conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS doc (
+                    id TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    metadata TEXT,
+                    length INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS posting (
+                    term TEXT NOT NULL,
+                    doc_id TEXT NOT NULL,
+                    tf INTEGER NOT NULL,
+                    PRIMARY KEY (term, doc_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS posting_doc_id_idx ON posting (doc_id);
+                CREATE TABLE IF NOT EXISTS stat (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO stat (key, value) VALUES ('doc_count', 0);
+                INSERT OR IGNORE INTO stat (key, value) VALUES ('total_length', 0);
+                INSERT OR IGNORE INTO stat (key, value) VALUES ('version', 0);
+                INSERT OR IGNORE INTO stat (key, value) VALUES ('epoch', 0);
+                """)
+            conn.execute("UPDATE stat SET value = ? WHERE key = 'version'", (version,))
+            conn.execute("UPDATE stat SET value = ? WHERE key = 'epoch'", (epoch,))
+            conn.commit()
+
+    def _get_stats(self, conn) -> tuple[int, int]:
+        stats = dict(conn.execute("SELECT key, value FROM stat").fetchall())
+        return stats.get("doc_count", 0), stats.get("total_length", 0)
+
+    def _update_stats(self, conn, doc_count: int, total_length: int):
+        conn.execute(
+            "UPDATE stat SET value = value + ? WHERE key = 'doc_count'", (doc_count,)
+        )
+        conn.execute(
+            "UPDATE stat SET value = value + ? WHERE key = 'total_length'",
+            (total_length,),
+        )
+
+    def _set_version(self, conn, version: Optional[int]):
+        # Only an index that saw every previous change moves to the new version,
+        # any other one stays behind and gets rebuilt on its next read
+        if version is not None:
+            conn.execute(
+                "UPDATE stat SET value = ? WHERE key = 'version' AND value = ?",
+                (version, version - 1),
+            )
+
+    def get_version(self) -> int:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM stat WHERE key = 'version'"
+            ).fetchone()
+            return row[0] if row else 0
+
+    def get_state(self) -> tuple[int, int]:
+        """Returns the (epoch, version) the index was built and updated to."""
+        with self._connect() as conn:
+            stats = dict(
+                conn.execute(
+                    "SELECT key, value FROM stat WHERE key IN ('epoch', 'version')"
+                ).fetchall()
+            )
+            return stats.get("epoch", 0), stats.get("version", 0)
+
+    def _delete_ids(self, conn, ids: list[str]):
+        for start in range(0, len(ids), 500):
+            batch = ids[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            count, length = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(length), 0) FROM doc WHERE id IN ({placeholders})",
+                batch,
+            ).fetchone()
+            if not count:
+                continue
+
+            conn.execute(f"DELETE FROM posting WHERE doc_id IN ({placeholders})", batch)
+            conn.execute(f"DELETE FROM doc WHERE id IN ({placeholders})", batch)
+            self._update_stats(conn, -count, -length)
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return self._get_stats(conn)[0]
+
+    def add(
+        self,
+        ids: list[str],
+        texts: list[str],
+        metadatas: list[Any],
+        version: Optional[int] = None,
+    ):
+        with self._connect() as conn:
+            with conn:
+                self._delete_ids(conn, list(ids))
+
+                total_length = 0
+                for id, text, metadata in zip(ids, texts, metadatas):
+                    metadata = metadata or {}
+                    tokens = tokenize(
+                        get_enriched_text(text, metadata) if self.enriched else text
+                    )
+                    total_length += len(tokens)
+
+                    conn.execute(
+                        "INSERT INTO doc (id, text, metadata, length) VALUES (?, ?, ?, ?)",
+                        (id, text, json.dumps(metadata, default=str), len(tokens)),
+                    )
+                    conn.executemany(
+                        "INSERT INTO posting (term, doc_id, tf) VALUES (?, ?, ?)",
+                        [(term, id, tf) for term, tf in Counter(tokens).items()],
+                    )
+
+                self._update_stats(conn, len(ids), total_length)
+                self._set_version(conn, version)
+
+    def delete(
+        self,
+        ids: Optional[list[str]] = None,
+        filter: Optional[dict] = None,
+        version: Optional[int] = None,
+    ):
+        with self._connect() as conn:
+            with conn:
+                if filter:
+                    conditions = " AND ".join(
+                        "json_extract(metadata, ?) = ?" for _ in filter
+                    )
+                    params = []
+                    for key, value in filter.items():
+                        params.extend([f'$."{key}"', value])
+
+                    rows = conn.execute(
+                        f"SELECT id FROM doc WHERE {conditions}", params
+                    ).fetchall()
+                    matched = [row[0] for row in rows]
+                    if ids:
+                        ids = set(ids)
+                        matched = [id for id in matched if id in ids]
+                    ids = matched
+
+                if ids:
+                    self._delete_ids(conn, list(ids))
+                self._set_version(conn, version)
+
+    def search(self, query: str, k: int) -> list[Document]:
+        query_terms = Counter(tokenize(query))
+        if not query_terms:
+            return []
+
+        with self._connect() as conn:
+            doc_count, total_length = self._get_stats(conn)
+            if doc_count == 0:
+                return []
+
+            avgdl = total_length / doc_count
+            scores = defaultdict(float)
+
+            for term, query_tf in query_terms.items():
+                postings = conn.execute(
+                    "SELECT posting.doc_id, posting.tf, doc.length FROM posting "
+                    "JOIN doc ON doc.id = posting.doc_id WHERE posting.term = ?",
+                    (term,),
+                ).fetchall()
+                if not postings:
+                    continue
+
+                df = len(postings)
+                idf = math.log((doc_count - df + 0.5) / (df + 0.5) + 1)
+
+                for doc_id, tf, length in postings:
+                    scores[doc_id] += (
+                        query_tf
+                        * idf
+                        * tf
+                        * (BM25_K1 + 1)
+                        / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avgdl))
+                    )
+
+            top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+            if not top:
+                return []
+
+            top_ids = [doc_id for doc_id, _ in top]
+            placeholders = ",".join("?" * len(top_ids))
+            rows = {
+                id: (text, metadata)
+                for id, text, metadata in conn.execute(
+                    f"SELECT id, text, metadata FROM doc WHERE id IN ({placeholders})",
+                    top_ids,
+                ).fetchall()
+            }
+
+        documents = []
+        for doc_id in top_ids:
+            text, metadata = rows[doc_id]
+            metadata = json.loads(metadata) if metadata else {}
+            documents.append(
+                Document(
+                    id=doc_id,
+                    page_content=(
+                        get_enriched_text(text, metadata) if self.enriched else text
+                    ),
+                    metadata=metadata,
+                )
+            )
+        return documents
+
+
+class BM25IndexStore:
+    """
+    Keeps one persistent BM25Index per (collection, enriched) on disk.
+
+    Indexes are built from the vector DB the first time a collection is
+    searched, then kept up to date through add/delete and dropped on
+    collection deletion or reset.
+
+    Every change bumps a per-collection version, kept in Redis when it is
+    configured and in a local SQLite file otherwise. An index records the
+    version it was built or updated to, and one that missed a change (made
+    by another node, or while it was being built) is rebuilt on its next read.
+    With Redis, a global epoch is part of every check, so a reset on one node
+    invalidates every node's indexes.
+    """
+
+    def __init__(self, directory: str, redis=None):
+        self.directory = Path(directory)
+        self.redis = redis
+        self._locks = defaultdict(threading.Lock)
+
+    def _get_path(self, collection_name: str, enriched: bool) -> Path:
+        name = re.sub(r"[^\w\-]", "_", collection_name)
+        return self.directory / f"{name}{'.enriched' if enriched else ''}.sqlite3"
+
+    def _get_existing_indexes(self, collection_name: str) -> list[BM25Index]:
+        return [
+            BM25Index(self._get_path(collection_name, enriched), enriched)
+            for enriched in (False, True)
+            if self._get_path(collection_name, enriched).exists()
+        ]
+
+    def _get_version_key(self, collection_name: str) -> str:
+        return f"{REDIS_KEY_PREFIX}:bm25:version:{collection_name}"
+
+    def _get_epoch_key(self) -> str:
+        return f"{REDIS_KEY_PREFIX}:bm25:epoch"
+
+    @contextmanager
+    def _connect_versions(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.directory / "versions.sqlite3", timeout=30)
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS version "
+                "(collection TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            yield conn
+        finally:
+            conn.close()
+
+    def get_version(self, collection_name: str) -> int:
+        if self.redis is not None:
+            return int(self.redis.get(self._get_version_key(collection_name)) or 0)
+
+        with self._connect_versions() as conn:
+            row = conn.execute(
+                "SELECT value FROM version WHERE collection = ?", (collection_name,)
+            ).fetchone()
+            return row[0] if row else 0
+
+    def get_state(self, collection_name: str) -> tuple[int, int]:
+        """Returns the current (epoch, version) of a collection."""
+        if self.redis is not None:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(self._get_epoch_key())
+            pipe.get(self._get_version_key(collection_name))
+            epoch, version = pipe.execute()
+            return int(epoch or 0), int(version or 0)
+
+        # Without Redis a reset removes every index, there is no epoch to track
+        return 0, self.get_version(collection_name)
+
+    def _bump_version(self, collection_name: str) -> int:
+        if self.redis is not None:
+            return self.redis.incr(self._get_version_key(collection_name))
+
+        with self._connect_versions() as conn:
+            with conn:
+                return conn.execute(
+                    "INSERT INTO version (collection, value) VALUES (?, 1) "
+                    "ON CONFLICT (collection) DO UPDATE SET value = value + 1 "
+                    "RETURNING value",
+                    (collection_name,),
+                ).fetchone()[0]
+
+    def get_index(
+        self,
+        collection_name: str,
+        loader: Callable[[], Optional[GetResult]],
+        enriched: bool = False,
+    ) -> Optional[BM25Index]:
+        path = self._get_path(collection_name, enriched)
+        state = self.get_state(collection_name)
+        if path.exists() and BM25Index(path, enriched).get_state() == state:
+            return BM25Index(path, enriched)
+
+        with self._locks[collection_name]:
+            state = self.get_state(collection_name)
+            if path.exists() and BM25Index(path, enriched).get_state() == state:
+                return BM25Index(path, enriched)
+
+            # The version was read before loading: a change that lands while the
+            # index is being built bumps it past this one, so the next read rebuilds
+            result = loader()
+            if result is None or not result.ids:
+                return None
+
+            log.info(f"Building BM25 index for collection {collection_name}")
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+            # Build under a temporary name so readers never see a partial index
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.unlink(missing_ok=True)
+
+            index = BM25Index(tmp_path, enriched)
+            epoch, version = state
+            index.create(version, epoch)
+            index.add(result.ids[0], result.documents[0], result.metadatas[0])
+
+            # The journal of a stale index must not be replayed onto the new one
+            for suffix in ("-wal", "-shm"):
+                Path(f"{path}{suffix}").unlink(missing_ok=True)
+            os.replace(tmp_path, path)
+
+            return BM25Index(path, enriched)
+
+    def add(self, collection_name: str, items: list[dict]):
+        version = self._bump_version(collection_name)
+        for index in self._get_existing_indexes(collection_name):
+            try:
+                index.add(
+                    [item["id"] for item in items],
+                    [item["text"] for item in items],
+                    [item["metadata"] for item in items],
+                    version=version,
+                )
+            except Exception as e:
+                log.warning(f"Dropping BM25 index for {collection_name}: {e}")
+                self._unlink(collection_name)
+
+    def delete(
+        self,
+        collection_name: str,
+        ids: Optional[list[str]] = None,
+        filter: Optional[dict] = None,
+    ):
+        if not ids and not filter:
+            return self.drop(collection_name)
+
+        version = self._bump_version(collection_name)
+        for index in self._get_existing_indexes(collection_name):
+            try:
+                index.delete(ids=ids, filter=filter, version=version)
+            except Exception as e:
+                log.warning(f"Dropping BM25 index for {collection_name}: {e}")
+                self._unlink(collection_name)
+
+    def _unlink(self, collection_name: str):
+        for enriched in (False, True):
+            path = self._get_path(collection_name, enriched)
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+    def drop(self, collection_name: str):
+        # Other nodes drop their copy on their next read
+        self._bump_version(collection_name)
+        self._unlink(collection_name)
+
+    def reset(self):
+        # Every node's indexes, including those of collections that never
+        # changed, are rebuilt on their next read
+        if self.redis is not None:
+            self.redis.incr(self._get_epoch_key())
+
+        if self.directory.exists():
+            for path in self.directory.iterdir():
+                path.unlink(missing_ok=True)
+
+
+class BM25IndexRetriever(BaseRetriever):
+    index: Any
+    k: int = 4
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        return self.index.search(query, self.k)
+
+
+BM25_INDEXES = (
+    BM25IndexStore(RAG_BM25_INDEX_DIR, redis=get_redis_client())
+    if ENABLE_RAG_BM25_INDEX
+    else None
+)
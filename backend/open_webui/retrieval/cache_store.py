@@ -0,0 +1,117 @@
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from open_webui.env import REDIS_KEY_PREFIX
+from open_webui.utils.redis import get_redis_client
+
+# Expired rows are purged from the disk store once every this many writes
+DISK_PURGE_INTERVAL = 1000
+DISK_LOOKUP_BATCH_SIZE = 500
+
+
+class RedisCacheStore:
+    """
+    Byte values under `{REDIS_KEY_PREFIX}:{namespace}:`, shared by every
+    worker. A ttl of None keeps values until Redis evicts them.
+    """
+
+    name = "redis"
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.redis = get_redis_client(decode_responses=False)
+        if self.redis is None:
+            raise ValueError("REDIS_URL is not configured")
+
+    def _get_key(self, key: str) -> str:
+        return f"{REDIS_KEY_PREFIX}:{self.namespace}:{key}"
+
+    def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        names = [self._get_key(key) for key in keys]
+        if hasattr(self.redis, "nodes_manager"):
+            # Keys hash to different slots on a cluster
+            return self.redis.mget_nonatomic(names)
+        return self.redis.mget(names)
+
+    def set_many(self, items: dict[str, bytes], ttl: Optional[float] = None):
+        ex = max(int(ttl), 1) if ttl is not None else None
+        pipe = self.redis.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self._get_key(key), value, ex=ex)
+        pipe.execute()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key])[0]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        self.set_many({key: value}, ttl)
+
+
+class DiskCacheStore:
+    """
+    Byte values in a local SQLite file that survives restarts. A ttl of
+    None keeps values until they are overwritten.
+    """
+
+    name = "disk"
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._writes = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at INTEGER)"
+            )
+            conn.commit()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        now = int(time.time())
+        rows = {}
+        with self._connect() as conn:
+            # Stay below SQLite's host parameter limit on large ingests
+            for i in range(0, len(keys), DISK_LOOKUP_BATCH_SIZE):
+                batch = keys[i : i + DISK_LOOKUP_BATCH_SIZE]
+                rows.update(
+                    conn.execute(
+                        f"SELECT key, value FROM cache "
+                        f"WHERE (expires_at IS NULL OR expires_at >= ?) "
+                        f"AND key IN ({','.join('?' * len(batch))})",
+                        [now, *batch],
+                    ).fetchall()
+                )
+        return [rows.get(key) for key in keys]
+
+    def set_many(self, items: dict[str, bytes], ttl: Optional[float] = None):
+        now = time.time()
+        expires_at = int(now + ttl) if ttl is not None else None
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                [(key, value, expires_at) for key, value in items.items()],
+            )
+            self._writes += len(items)
+            if self._writes >= DISK_PURGE_INTERVAL:
+                self._writes = 0
+                conn.execute("DELETE FROM cache WHERE expires_at < ?", (int(now),))
+            conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key])[0]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None):
+        self.set_many({key: value}, ttl)
@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from open_webui.config import (
+    ENABLE_RAG_EMBEDDING_CACHE,
+    RAG_EMBEDDING_CACHE_BACKEND,
+    RAG_EMBEDDING_CACHE_DIR,
+    RAG_EMBEDDING_CACHE_DTYPE,
+    RAG_EMBEDDING_CACHE_SIZE,
+    RAG_EMBEDDING_CACHE_TTL,
+)
+from open_webui.retrieval.cache_store import DiskCacheStore, RedisCacheStore
+
+log = logging.getLogger(__name__)
+
+
+def get_embedding_cache_key(
+    engine: str, model: str, prefix: Optional[str], text: str
+) -> str:
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return hashlib.sha256(
+        f"{engine}\x00{model}\x00{prefix or ''}\x00{text_hash}".encode("utf-8")
+    ).hexdigest()
+
+
+def is_embedding(value: Any) -> bool:
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) > 0
+        and all(isinstance(x, (int, float)) for x in value)
+    )
+
+
+class EmbeddingCache:
+    """
+    Content-addressed cache of embedding vectors.
+
+    Entries are keyed by (engine, model, prefix, sha256(text)), so ingestion
+    and query paths share them and re-embedding unchanged chunks costs a
+    lookup. Vectors are stored as packed float32 or float16 bytes in a local
+    LRU, with an optional Redis or disk tier behind it that survives restarts
+    and is shared between workers.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        dtype: str = "float32",
+        store: Optional[Any] = None,
+        ttl: int = 0,
+    ):
+        self.size = size
+        self.dtype = np.dtype(dtype)
+        self.store = store
+        self.ttl = ttl
+
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.stats = {"memory_hits": 0, "store_hits": 0, "misses": 0}
+
+    def encode(self, vector: list[float]) -> bytes:
+        return np.asarray(vector, dtype=self.dtype).tobytes()
+
+    def decode(self, value: bytes) -> list[float]:
+        return np.frombuffer(value, dtype=self.dtype).astype(np.float32).tolist()
+
+    def _get_local(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _set_local(self, items: dict[str, bytes]):
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    async def get_many(self, keys: list[str]) -> list[Optional[list[float]]]:
+        values = [self._get_local(key) for key in keys]
+        self.stats["memory_hits"] += sum(value is not None for value in values)
+
+        missing = [idx for idx, value in enumerate(values) if value is None]
+        if missing and self.store is not None:
+            try:
+                stored = await asyncio.to_thread(
+                    self.store.get_many, [keys[idx] for idx in missing]
+                )
+                found = {}
+                for idx, value in zip(missing, stored):
+                    if value:
+                        values[idx] = found[keys[idx]] = value
+                self._set_local(found)
+                self.stats["store_hits"] += len(found)
+            except Exception as e:
+                log.warning(f"Embedding cache {self.store.name} lookup failed: {e}")
+
+        self.stats["misses"] += sum(value is None for value in values)
+        return [self.decode(value) if value else None for value in values]
+
+    async def set_many(self, vectors: dict[str, list[float]]):
+        items = {key: self.encode(vector) for key, vector in vectors.items()}
+        self._set_local(items)
+        if items and self.store is not None:
+            try:
+                await asyncio.to_thread(self.store.set_many, items, self.ttl or None)
+            except Exception as e:
+                log.warning(f"Embedding cache {self.store.name} write failed: {e}")
+
+    def wrap(self, embedding_function: Callable, engine: str, model: str) -> Callable:
+        """
+        Wrap an async embedding function so only texts missing from the cache
+        are sent to the model. Falls back to the plain call when the model
+        returns something that does not line up with its input.
+        """
+
+        async def cached_embedding_function(query, prefix=None, user=None):
+            texts = query if isinstance(query, list) else [query]
+            if not texts or not all(isinstance(text, str) for text in texts):
+                return await embedding_function(query, prefix=prefix, user=user)
+
+            keys = [
+                get_embedding_cache_key(engine, model, prefix, text) for text in texts
+            ]
+            embeddings = await self.get_many(keys)
+
+            # Identical texts in one call are only embedded once
+            missing = {
+                key: text
+                for key, text, embedding in zip(keys, texts, embeddings)
+                if embedding is None
+            }
+            if missing:
+                result = await embedding_function(
+                    list(missing.values()), prefix=prefix, user=user
+                )
+                if (
+                    not isinstance(result, list)
+                    or len(result) != len(missing)
+                    or not all(is_embedding(embedding) for embedding in result)
+                ):
+                    return await embedding_function(query, prefix=prefix, user=user)
+
+                vectors = dict(zip(missing, result))
+                await self.set_many(vectors)
+                embeddings = [
+                    embedding if embedding is not None else vectors[key]
+                    for key, embedding in zip(keys, embeddings)
+                ]
+
+            return embeddings if isinstance(query, list) else embeddings[0]
+
+        return cached_embedding_function
+
+    def get_stats(self) -> dict[str, int]:
+        return {**self.stats, "entries": len(self._entries)}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def get_embedding_store() -> Optional[Any]:
+    try:
+        if RAG_EMBEDDING_CACHE_BACKEND == "redis":
+            return RedisCacheStore("embeddings")
+        if RAG_EMBEDDING_CACHE_BACKEND == "disk":
+            return DiskCacheStore(Path(RAG_EMBEDDING_CACHE_DIR) / "embeddings.sqlite3")
+    except Exception as e:
+        log.warning(
+            f"Embedding cache {RAG_EMBEDDING_CACHE_BACKEND} tier unavailable: {e}"
+        )
+    return None
+
+
+EMBEDDING_CACHE = (
+    EmbeddingCache(
+        RAG_EMBEDDING_CACHE_SIZE,
+        RAG_EMBEDDING_CACHE_DTYPE,
+        get_embedding_store(),
+        RAG_EMBEDDING_CACHE_TTL,
+    )
+    if ENABLE_RAG_EMBEDDING_CACHE
+    else None
+)
@@ -0,0 +1,338 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from open_webui.config import (
+    RAG_EMBEDDING_BATCH_WINDOW,
+    RAG_EMBEDDING_CONCURRENCY,
+    RAG_EMBEDDING_TOKENS_PER_MINUTE,
+)
+from open_webui.env import ENABLE_FORWARD_USER_INFO_HEADERS
+
+log = logging.getLogger(__name__)
+
+# Rough input token estimate used for rate limiting, ~4 characters per token
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return max(len(text) // CHARS_PER_TOKEN, 1)
+
+
+class TokenBucket:
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = tokens_per_minute
+        self.rate = tokens_per_minute / 60
+        self.tokens = float(tokens_per_minute)
+        self.updated = time.monotonic()
+
+    async def acquire(self, tokens: int):
+        # Batches larger than the whole budget wait for a full bucket
+        tokens = min(tokens, self.capacity)
+        while True:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return
+            await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+
+class EmbeddingSlots:
+    """Per-target concurrency limit that serves priority waiters first"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._waiters = {True: deque(), False: deque()}
+
+    async def acquire(self, priority: bool = False):
+        blocked = self._waiters[True] or (not priority and self._waiters[False])
+        if self.in_use < self.limit and not blocked:
+            self.in_use += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the cancellation
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        for priority in (True, False):
+            waiters = self._waiters[priority]
+            while waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    # The slot passes straight to the waiter
+                    future.set_result(None)
+                    return
+        self.in_use -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: bool = False):
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+@dataclass
+class PendingEmbedding:
+    text: str
+    future: asyncio.Future
+    tokens: int
+
+
+@dataclass
+class EmbeddingLane:
+    priority: bool
+    pending: deque[PendingEmbedding] = field(default_factory=deque)
+    workers: int = 0
+
+
+@dataclass
+class EmbeddingGroup:
+    """Texts waiting to be embedded with the same engine, prefix and user"""
+
+    target: str
+    embed_batch: Callable[..., Awaitable[Any]]
+    prefix: Optional[str]
+    user: Any
+    batch_size: int
+    concurrency: int
+    # Calls that fit in one batch (queries, small files) skip the ingest backlog
+    priority: EmbeddingLane = field(default_factory=lambda: EmbeddingLane(True))
+    bulk: EmbeddingLane = field(default_factory=lambda: EmbeddingLane(False))
+
+
+class EmbeddingDispatcher:
+    """
+    Process-wide queue that coalesces embedding requests from all callers.
+
+    Texts are grouped by target (engine, model and URL), prefix and, when
+    user info headers are forwarded, user. Workers wait RAG_EMBEDDING_BATCH_WINDOW
+    for a batch to fill, then send up to batch_size texts per upstream call.
+    At most `concurrency` batches run per target and, if
+    RAG_EMBEDDING_TOKENS_PER_MINUTE is set, batches wait for their estimated
+    tokens. Texts that queue up while the target is busy are sent together,
+    so batches grow with load and single queries still go out immediately
+    on an idle target.
+
+    Calls with at most batch_size texts, such as queries, are queued in a
+    separate priority lane from larger ingest calls, and get the next free
+    upstream slot ahead of queued ingest batches.
+
+    The queue is bound to the event loop that first uses it; calls made from
+    any other loop embed their own texts directly.
+    """
+
+    def __init__(
+        self,
+        batch_window: float = RAG_EMBEDDING_BATCH_WINDOW,
+        concurrency: int = RAG_EMBEDDING_CONCURRENCY,
+        tokens_per_minute: int = RAG_EMBEDDING_TOKENS_PER_MINUTE,
+    ):
+        self.batch_window = batch_window
+        self.concurrency = concurrency
+        self.tokens_per_minute = tokens_per_minute
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._groups: dict[tuple, EmbeddingGroup] = {}
+        self._slots: dict[str, EmbeddingSlots] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        self.stats = {"requests": 0, "batches": 0, "texts": 0}
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> bool:
+        if self._loop is None or self._loop.is_closed():
+            self._loop = loop
+            self._groups.clear()
+            self._slots.clear()
+            self._buckets.clear()
+            self._tasks.clear()
+        return self._loop is loop
+
+    def _get_slots(self, group: EmbeddingGroup) -> EmbeddingSlots:
+        slots = self._slots.get(group.target)
+        if slots is None or slots.limit != group.concurrency:
+            # Recreated when the limit changes with the embedding config
+            slots = EmbeddingSlots(group.concurrency)
+            self._slots[group.target] = slots
+        return slots
+
+    def _get_bucket(self, target: str) -> Optional[TokenBucket]:
+        if self.tokens_per_minute <= 0:
+            return None
+        if target not in self._buckets:
+            self._buckets[target] = TokenBucket(self.tokens_per_minute)
+        return self._buckets[target]
+
+    async def _run_batch(self, group: EmbeddingGroup, items: list[PendingEmbedding]):
+        self.stats["batches"] += 1
+        self.stats["texts"] += len(items)
+
+        try:
+            result = await group.embed_batch(
+                [item.text for item in items], group.prefix, group.user
+            )
+            if not isinstance(result, list) or len(result) != len(items):
+                raise ValueError(
+                    f"expected {len(items)} embeddings, got "
+                    f"{len(result) if isinstance(result, list) else result!r}"
+                )
+        except Exception as e:
+            log.error(f"Embedding batch of {len(items)} for {group.target} failed: {e}")
+            result = [None] * len(items)
+
+        for item, embedding in zip(items, result):
+            if not item.future.done():
+                item.future.set_result(embedding)
+
+    async def _worker(self, group: EmbeddingGroup, lane: EmbeddingLane):
+        try:
+            if self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+
+            while lane.pending:
+                async with self._get_slots(group).slot(lane.priority):
+                    # Skip texts whose callers were cancelled while queued
+                    items = []
+                    while lane.pending and len(items) < group.batch_size:
+                        item = lane.pending.popleft()
+                        if not item.future.done():
+                            items.append(item)
+                    if not items:
+                        continue
+
+                    bucket = self._get_bucket(group.target)
+                    if bucket is not None:
+                        await bucket.acquire(sum(item.tokens for item in items))
+
+                    await self._run_batch(group, items)
+        finally:
+            lane.workers -= 1
+            if lane.workers == 0:
+                # Texts are only left behind if the last worker was cancelled
+                for item in lane.pending:
+                    item.future.cancel()
+                lane.pending.clear()
+
+    def _start_worker(self, group: EmbeddingGroup, lane: EmbeddingLane):
+        lane.workers += 1
+        task = self._loop.create_task(self._worker(group, lane))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def embed(
+        self,
+        embed_batch: Callable[..., Awaitable[Any]],
+        target: str,
+        texts: list[str],
+        prefix: Optional[str] = None,
+        user: Any = None,
+        batch_size: int = 1,
+        concurrency: Optional[int] = None,
+    ) -> list[Optional[list[float]]]:
+        batch_size = max(int(batch_size or 1), 1)
+        concurrency = min(concurrency or self.concurrency, self.concurrency)
+
+        if not self._bind(asyncio.get_running_loop()):
+            embeddings = []
+            for i in range(0, len(texts), batch_size):
+                batch = texts[i : i + batch_size]
+                result = await embed_batch(batch, prefix, user)
+                if not isinstance(result, list) or len(result) != len(batch):
+                    result = [None] * len(batch)
+                embeddings.extend(result)
+            return embeddings
+
+        user_id = (
+            getattr(user, "id", None) if ENABLE_FORWARD_USER_INFO_HEADERS else None
+        )
+        key = (target, prefix, user_id)
+
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = EmbeddingGroup(
+                target=target,
+                embed_batch=embed_batch,
+                prefix=prefix,
+                user=user,
+                batch_size=batch_size,
+                concurrency=concurrency,
+            )
+        # Follow embedding config updates
+        group.embed_batch = embed_batch
+        group.batch_size = batch_size
+        group.concurrency = concurrency
+
+        lane = group.priority if len(texts) <= batch_size else group.bulk
+        futures = []
+        for text in texts:
+            future = self._loop.create_future()
+            lane.pending.append(PendingEmbedding(text, future, estimate_tokens(text)))
+            futures.append(future)
+
+        # Add workers only for what the running ones cannot take in one round
+        while lane.workers < concurrency and (
+            lane.workers == 0 or len(lane.pending) > lane.workers * batch_size
+        ):
+            self._start_worker(group, lane)
+
+        self.stats["requests"] += 1
+        return await asyncio.gather(*futures)
+
+    def wrap(
+        self,
+        embed_batch: Callable[..., Awaitable[Any]],
+        target: str,
+        batch_size: int,
+        concurrency: Optional[int] = None,
+    ) -> Callable:
+        """
+        Turn `embed_batch(texts, prefix, user) -> list[vector]` into an
+        embedding function taking a text or a list of texts.
+        """
+
+        async def embedding_function(query, prefix=None, user=None):
+            embeddings = await self.embed(
+                embed_batch,
+                target,
+                query if isinstance(query, list) else [query],
+                prefix=prefix,
+                user=user,
+                batch_size=batch_size,
+                concurrency=concurrency,
+            )
+            if isinstance(query, list):
+                # Failed batches are left out, as before
+                return [embedding for embedding in embeddings if embedding is not None]
+            return embeddings[0]
+
+        return embedding_function
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            **self.stats,
+            "pending": sum(
+                len(group.priority.pending) + len(group.bulk.pending)
+                for group in self._groups.values()
+            ),
+        }
+
+
+EMBEDDING_DISPATCHER = EmbeddingDispatcher()
@@ -3,6 +3,10 @@ from typing import Optional, List, Tuple
 
 
 class BaseReranker(ABC):
+    # Scores normalized over the candidate set cannot be cached per chunk or
+    # scored together with other requests
+    relative_scores: bool = False
+
     @abstractmethod
     def predict(self, sentences: List[Tuple[str, str]]) -> Optional[List[float]]:
         pass
@@ -12,6 +12,8 @@ log = logging.getLogger(__name__)
 
 
 class ColBERT(BaseReranker):
+    relative_scores = True
+
     def __init__(self, name, **kwargs) -> None:
         log.info("ColBERT: Loading model", name)
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
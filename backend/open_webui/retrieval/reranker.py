@@ -0,0 +1,245 @@
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+from langchain_core.documents import Document
+
+from open_webui.config import (
+    RAG_RERANKING_BATCH_SIZE,
+    RAG_RERANKING_BATCH_WINDOW,
+    RAG_RERANKING_CACHE_SIZE,
+    RAG_RERANKING_MAX_WORKERS,
+)
+
+log = logging.getLogger(__name__)
+
+
+def get_rerank_cache_key(model: str, query: str, text: str) -> str:
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return hashlib.sha256(
+        f"{model}\x00{query}\x00{text_hash}".encode("utf-8")
+    ).hexdigest()
+
+
+def to_score_list(scores: Any) -> Optional[list[float]]:
+    if scores is None:
+        return None
+    if hasattr(scores, "tolist"):
+        scores = scores.tolist()
+    return [float(score) for score in scores]
+
+
+@dataclass
+class PendingPairs:
+    pairs: list[tuple[str, str]]
+    future: asyncio.Future
+
+
+@dataclass
+class RerankGroup:
+    """(query, document) pairs waiting for the same local reranker"""
+
+    reranker: Any
+    pending: list[PendingPairs] = field(default_factory=list)
+    workers: int = 0
+
+
+class RerankerPool:
+    """
+    Runs local CrossEncoder/ColBERT inference on a bounded pool of
+    RAG_RERANKING_MAX_WORKERS threads instead of the default executor, so
+    reranking cannot starve other blocking work.
+
+    Requests to the same reranker that arrive within RAG_RERANKING_BATCH_WINDOW
+    are scored in one predict call of up to RAG_RERANKING_BATCH_SIZE pairs,
+    and scores are cached per (model, query, chunk text) so follow-up turns
+    only score new chunks. Rerankers with `relative_scores` (ColBERT) are
+    neither cached nor batched across requests; external rerankers are cached
+    but keep their own per-user requests.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = RAG_RERANKING_MAX_WORKERS,
+        batch_window: float = RAG_RERANKING_BATCH_WINDOW,
+        batch_size: int = RAG_RERANKING_BATCH_SIZE,
+        cache_size: int = RAG_RERANKING_CACHE_SIZE,
+    ):
+        self.max_workers = max_workers
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        self._cache: OrderedDict[str, float] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._groups: dict[int, RerankGroup] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        self.stats = {"hits": 0, "misses": 0, "batches": 0}
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="reranker",
+                    )
+        return self._executor
+
+    async def _predict(self, reranker: Any, pairs: list[tuple[str, str]]):
+        self.stats["batches"] += 1
+        return await asyncio.get_running_loop().run_in_executor(
+            self.get_executor(), reranker.predict, pairs
+        )
+
+    def _get_cached(self, key: str) -> Optional[float]:
+        with self._cache_lock:
+            score = self._cache.get(key)
+            if score is not None:
+                self._cache.move_to_end(key)
+            return score
+
+    def _set_cached(self, scores: dict[str, float]):
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache.update(scores)
+            for key in scores:
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+
+    async def _worker(self, group: RerankGroup):
+        try:
+            if self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+
+            while group.pending:
+                requests = []
+                while group.pending and (
+                    not requests
+                    or sum(len(r.pairs) for r in requests) + len(group.pending[0].pairs)
+                    <= self.batch_size
+                ):
+                    request = group.pending.pop(0)
+                    if not request.future.done():
+                        requests.append(request)
+                if not requests:
+                    continue
+
+                try:
+                    scores = to_score_list(
+                        await self._predict(
+                            group.reranker,
+                            [pair for request in requests for pair in request.pairs],
+                        )
+                    )
+                except Exception as e:
+                    log.exception(f"Reranking batch failed: {e}")
+                    scores = None
+
+                offset = 0
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_result(
+                            scores[offset : offset + len(request.pairs)]
+                            if scores is not None
+                            else None
+                        )
+                    offset += len(request.pairs)
+        finally:
+            group.workers -= 1
+            if group.workers == 0:
+                for request in group.pending:
+                    request.future.cancel()
+                group.pending.clear()
+
+    async def _predict_batched(
+        self, reranker: Any, pairs: list[tuple[str, str]]
+    ) -> Optional[list[float]]:
+        loop = asyncio.get_running_loop()
+        if self._loop is None or self._loop.is_closed():
+            self._loop = loop
+            self._groups.clear()
+            self._tasks.clear()
+        if self._loop is not loop:
+            return to_score_list(await self._predict(reranker, pairs))
+
+        group = self._groups.get(id(reranker))
+        if group is None or group.reranker is not reranker:
+            group = self._groups[id(reranker)] = RerankGroup(reranker=reranker)
+
+        future = loop.create_future()
+        group.pending.append(PendingPairs(pairs, future))
+        if group.workers < self.max_workers and (
+            group.workers == 0
+            or sum(len(r.pairs) for r in group.pending)
+            > group.workers * self.batch_size
+        ):
+            group.workers += 1
+            task = loop.create_task(self._worker(group))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return await future
+
+    async def score(
+        self,
+        reranker: Any,
+        model: str,
+        query: str,
+        documents: Sequence[Document],
+        user: Any = None,
+        external: bool = False,
+    ) -> Optional[list[float]]:
+        texts = [doc.page_content for doc in documents]
+        if getattr(reranker, "relative_scores", False):
+            return to_score_list(
+                await self._predict(reranker, [(query, text) for text in texts])
+            )
+
+        keys = [get_rerank_cache_key(model, query, text) for text in texts]
+        scores = [self._get_cached(key) for key in keys]
+        missing = [idx for idx, score in enumerate(scores) if score is None]
+        self.stats["hits"] += len(keys) - len(missing)
+        self.stats["misses"] += len(missing)
+        if not missing:
+            return scores
+
+        pairs = [(query, texts[idx]) for idx in missing]
+        if external:
+            # Remote API call with per-user headers, not CPU work
+            result = to_score_list(
+                await asyncio.to_thread(reranker.predict, pairs, user=user)
+            )
+        else:
+            result = await self._predict_batched(reranker, pairs)
+
+        if result is None or len(result) != len(pairs):
+            return None
+
+        self._set_cached({keys[idx]: score for idx, score in zip(missing, result)})
+        for idx, score in zip(missing, result):
+            scores[idx] = score
+        return scores
+
+    def get_stats(self) -> dict[str, int]:
+        return {**self.stats, "entries": len(self._cache)}
+
+
+RERANKER_POOL = RerankerPool()
@@ -1,15 +1,16 @@
 import logging
 import os
-from typing import Awaitable, Optional, Union
+from typing import Awaitable, Callable, Optional, Union
 
 import requests
 import aiohttp
 import asyncio
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
+import itertools
 import time
 import re
 
+import numpy as np
 from urllib.parse import quote
 from huggingface_hub import snapshot_download
 from langchain_classic.retrievers import (
@@ -31,7 +32,15 @@ from open_webui.models.chats import Chats
 from open_webui.models.notes import Notes
 from open_webui.models.access_grants import AccessGrants
 
-from open_webui.retrieval.vector.main import GetResult
+from open_webui.retrieval.vector.main import GetResult, run_in_vector_db_executor
+from open_webui.retrieval.bm25 import (
+    BM25_INDEXES,
+    BM25IndexRetriever,
+    get_enriched_text,
+)
+from open_webui.retrieval.embedding_cache import EMBEDDING_CACHE
+from open_webui.retrieval.embedding_dispatcher import EMBEDDING_DISPATCHER
+from open_webui.retrieval.reranker import RERANKER_POOL
 from open_webui.utils.headers import include_user_info_headers
 from open_webui.utils.misc import get_message_list
 
@@ -53,6 +62,9 @@ from open_webui.config import (
 
 log = logging.getLogger(__name__)
 
+# Texts handed to one SentenceTransformer encode() call by the dispatcher
+SENTENCE_TRANSFORMERS_DISPATCH_SIZE = 512
+
 
 from typing import Any
 
@@ -114,7 +126,7 @@ class VectorSearchRetriever(BaseRetriever):
         run_manager: CallbackManagerForRetrieverRun,
     ) -> list[Document]:
         embedding = await self.embedding_function(query, RAG_EMBEDDING_QUERY_PREFIX)
-        result = VECTOR_DB_CLIENT.search(
+        result = await VECTOR_DB_CLIENT.asearch(
             collection_name=self.collection_name,
             vectors=[embedding],
             limit=self.top_k,
@@ -128,6 +140,7 @@ class VectorSearchRetriever(BaseRetriever):
         for idx in range(len(ids)):
             results.append(
                 Document(
+                    id=ids[idx],
                     metadata=metadatas[idx],
                     page_content=documents[idx],
                 )
@@ -155,6 +168,26 @@ def query_doc(
         raise e
 
 
+async def aquery_doc(
+    collection_name: str, query_embedding: list[float], k: int, user: UserModel = None
+):
+    try:
+        log.debug(f"aquery_doc:doc {collection_name}")
+        result = await VECTOR_DB_CLIENT.asearch(
+            collection_name=collection_name,
+            vectors=[query_embedding],
+            limit=k,
+        )
+
+        if result:
+            log.info(f"aquery_doc:result {result.ids} {result.metadatas}")
+
+        return result
+    except Exception as e:
+        log.exception(f"Error querying doc {collection_name} with limit {k}: {e}")
+        raise e
+
+
 def get_doc(collection_name: str, user: UserModel = None):
     try:
         log.debug(f"get_doc:doc {collection_name}")
@@ -170,41 +203,10 @@ def get_doc(collection_name: str, user: UserModel = None):
 
 
 def get_enriched_texts(collection_result: GetResult) -> list[str]:
-    enriched_texts = []
-    for idx, text in enumerate(collection_result.documents[0]):
-        metadata = collection_result.metadatas[0][idx]
-        metadata_parts = [text]
-
-        # Add filename (repeat twice for extra weight in BM25 scoring)
-        if metadata.get("name"):
-            filename = metadata["name"]
-            filename_tokens = (
-                filename.replace("_", " ").replace("-", " ").replace(".", " ")
-            )
-            metadata_parts.append(
-                f"Filename: {filename} {filename_tokens} {filename_tokens}"
-            )
-
-        # Add title if available
-        if metadata.get("title"):
-            metadata_parts.append(f"Title: {metadata['title']}")
-
-        # Add document section headings if available (from markdown splitter)
-        if metadata.get("headings") and isinstance(metadata["headings"], list):
-            headings = " > ".join(str(h) for h in metadata["headings"])
-            metadata_parts.append(f"Section: {headings}")
-
-        # Add source URL/path if available
-        if metadata.get("source"):
-            metadata_parts.append(f"Source: {metadata['source']}")
-
-        # Add snippet for web search results
-        if metadata.get("snippet"):
-            metadata_parts.append(f"Snippet: {metadata['snippet']}")
-
-        enriched_texts.append(" ".join(metadata_parts))
-
-    return enriched_texts
+    return [
+        get_enriched_text(text, collection_result.metadatas[0][idx])
+        for idx, text in enumerate(collection_result.documents[0])
+    ]
 
 
 async def query_doc_with_hybrid_search(
@@ -218,10 +220,15 @@ async def query_doc_with_hybrid_search(
     r: float,
     hybrid_bm25_weight: float,
     enable_enriched_texts: bool = False,
+    bm25_index=None,
 ) -> dict:
     try:
+        if bm25_index is not None:
+            if bm25_index.count() == 0:
+                log.warning(f"query_doc_with_hybrid_search:no_docs {collection_name}")
+                return {"documents": [], "metadatas": [], "distances": []}
         # First check if collection_result has the required attributes
-        if (
+        elif (
             not collection_result
             or not hasattr(collection_result, "documents")
             or not hasattr(collection_result, "metadatas")
@@ -240,17 +247,21 @@ async def query_doc_with_hybrid_search(
 
         log.debug(f"query_doc_with_hybrid_search:doc {collection_name}")
 
-        bm25_texts = (
-            get_enriched_texts(collection_result)
-            if enable_enriched_texts
-            else collection_result.documents[0]
-        )
+        if bm25_index is not None:
+            bm25_retriever = BM25IndexRetriever(index=bm25_index, k=k)
+        else:
+            bm25_texts = (
+                get_enriched_texts(collection_result)
+                if enable_enriched_texts
+                else collection_result.documents[0]
+            )
 
-        bm25_retriever = BM25Retriever.from_texts(
-            texts=bm25_texts,
-            metadatas=collection_result.metadatas[0],
-        )
-        bm25_retriever.k = k
+            bm25_retriever = BM25Retriever.from_texts(
+                texts=bm25_texts,
+                metadatas=collection_result.metadatas[0],
+                ids=collection_result.ids[0] if collection_result.ids else None,
+            )
+            bm25_retriever.k = k
 
         vector_search_retriever = VectorSearchRetriever(
             collection_name=collection_name,
@@ -277,6 +288,7 @@ async def query_doc_with_hybrid_search(
             top_n=k_reranker,
             reranking_function=reranking_function,
             r_score=r,
+            collection_name=collection_name,
         )
 
         compression_retriever = ContextualCompressionRetriever(
@@ -350,11 +362,14 @@ def merge_and_sort_query_results(query_results: list[dict], k: int) -> dict:
         ):
             continue
 
-        distances = data["distances"][0]
-        documents = data["documents"][0]
-        metadatas = data["metadatas"][0]
+        # Batched searches return one row per query vector
+        rows = zip(
+            itertools.chain.from_iterable(data["distances"]),
+            itertools.chain.from_iterable(data["documents"]),
+            itertools.chain.from_iterable(data["metadatas"]),
+        )
 
-        for distance, document, metadata in zip(distances, documents, metadatas):
+        for distance, document, metadata in rows:
             if isinstance(document, str):
                 doc_hash = hashlib.sha256(
                     document.encode()
@@ -402,56 +417,131 @@ def get_all_items_from_collections(collection_names: list[str]) -> dict:
     return merge_get_results(results)
 
 
+def get_bm25_index(collection_name: str, enable_enriched_texts: bool = False):
+    return BM25_INDEXES.get_index(
+        collection_name,
+        loader=lambda: VECTOR_DB_CLIENT.get(collection_name=collection_name),
+        enriched=enable_enriched_texts,
+    )
+
+
+class RetrievalCache:
+    """
+    Request-scoped memo of retrieval work: collection data fetched for hybrid
+    search and the results of each query against a set of collections.
+
+    Retrieval passes over different query lists within one request share it,
+    so a pass awaits work another pass already started instead of redoing it,
+    and only runs the queries it has not seen yet.
+    """
+
+    def __init__(self):
+        self._tasks: dict[tuple, asyncio.Task] = {}
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._tasks
+
+    def start(self, key: tuple, factory: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            # Results nobody awaits any more must not log as unretrieved errors
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._tasks[key] = task
+        return task
+
+    async def get(self, key: tuple, factory: Callable[[], Awaitable[Any]]):
+        # A pass that is cancelled leaves shared work running for the others
+        return await asyncio.shield(self.start(key, factory))
+
+    def close(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+
 async def query_collection(
     collection_names: list[str],
     queries: list[str],
     embedding_function,
     k: int,
+    cache: Optional[RetrievalCache] = None,
 ) -> dict:
-    results = []
-    error = False
+    cache = cache or RetrievalCache()
+    names = tuple(sorted(collection_names))
 
-    def process_query_collection(collection_name, query_embedding):
-        try:
-            if collection_name:
-                result = query_doc(
-                    collection_name=collection_name,
-                    k=k,
-                    query_embedding=query_embedding,
-                )
-                if result is not None:
-                    return result.model_dump(), None
-            return None, None
-        except Exception as e:
-            log.exception(f"Error when querying the collection: {e}")
-            return None, e
+    def get_key(query: str) -> tuple:
+        return ("query_collection", names, k, query)
 
-    # Generate all query embeddings (in one call)
-    query_embeddings = await embedding_function(
-        queries, prefix=RAG_EMBEDDING_QUERY_PREFIX
-    )
-    log.debug(
-        f"query_collection: processing {len(queries)} queries across {len(collection_names)} collections"
-    )
+    async def search(pending: list[str]) -> dict[str, list[dict]]:
+        # Generate all query embeddings (in one call)
+        query_embeddings = await embedding_function(
+            pending, prefix=RAG_EMBEDDING_QUERY_PREFIX
+        )
+        log.debug(
+            f"query_collection: processing {len(pending)} queries across {len(collection_names)} collections"
+        )
 
-    with ThreadPoolExecutor() as executor:
-        future_results = []
-        for query_embedding in query_embeddings:
-            for collection_name in collection_names:
-                result = executor.submit(
-                    process_query_collection, collection_name, query_embedding
-                )
-                future_results.append(result)
-        task_results = [future.result() for future in future_results]
+        # All query vectors go to the vector DB together, in one request per
+        # collection or a single one for backends that search across
+        # collections. Backends without multi-vector search take one vector
+        # per request, so each of their results only holds that query's row.
+        if VECTOR_DB_CLIENT.MULTI_VECTOR_SEARCH:
+            batches = [(0, query_embeddings)]
+        else:
+            batches = [(idx, [vector]) for idx, vector in enumerate(query_embeddings)]
 
-    for result, err in task_results:
-        if err is not None:
-            error = True
-        elif result is not None:
-            results.append(result)
+        async def search_batch(offset: int, vectors: list) -> Optional[list]:
+            try:
+                return [
+                    (offset, result.model_dump())
+                    for result in await VECTOR_DB_CLIENT.asearch_collections(
+                        collection_names=collection_names,
+                        vectors=vectors,
+                        limit=k,
+                    )
+                ]
+            except Exception as e:
+                log.exception(f"Error when querying the collection: {e}")
+                return None
 
-    if error and not results:
-        log.warning("All collection queries failed. No results returned.")
+        batch_results = await asyncio.gather(
+            *[search_batch(offset, vectors) for offset, vectors in batches]
+        )
+        if all(results is None for results in batch_results):
+            log.warning("All collection queries failed. No results returned.")
+
+        # Each result has one row per query vector of its batch
+        results = {query: [] for query in pending}
+        for items in batch_results:
+            for offset, result in items or []:
+                rows = len(result.get("distances") or [])
+                for row, query in enumerate(pending[offset : offset + rows]):
+                    results[query].append(
+                        {
+                            field: [result[field][row]] if result.get(field) else []
+                            for field in ("distances", "documents", "metadatas")
+                        }
+                    )
+        return results
+
+    async def get_results(batch_key: tuple, pending: list[str], query: str):
+        return (await cache.get(batch_key, lambda: search(pending)))[query]
+
+    queries = list(dict.fromkeys(queries))
+    pending = [query for query in queries if get_key(query) not in cache]
+    if pending:
+        # Queries not seen yet in this request share one embedding and search call
+        batch_key = ("query_collection", names, k, tuple(pending))
+        for query in pending:
+            cache.start(
+                get_key(query),
+                lambda query=query: get_results(batch_key, pending, query),
+            )
+
+    results = []
+    for query in queries:
+        results.extend(await cache.get(get_key(query), None))
 
     return merge_and_sort_query_results(results, k=k)
 
@@ -466,23 +556,40 @@ async def query_collection_with_hybrid_search(
     r: float,
     hybrid_bm25_weight: float,
     enable_enriched_texts: bool = False,
+    cache: Optional[RetrievalCache] = None,
 ) -> dict:
+    cache = cache or RetrievalCache()
     results = []
     error = False
-    # Fetch collection data once per collection sequentially
-    # Avoid fetching the same data multiple times later
-    collection_results = {}
-    for collection_name in collection_names:
+
+    async def fetch_collection(collection_name):
         try:
+            if BM25_INDEXES is not None:
+                # Only fetches the collection when its index has not been built yet
+                bm25_index = await run_in_vector_db_executor(
+                    get_bm25_index, collection_name, enable_enriched_texts
+                )
+                return bm25_index, bm25_index
+
             log.debug(
                 f"query_collection_with_hybrid_search:VECTOR_DB_CLIENT.get:collection {collection_name}"
             )
-            collection_results[collection_name] = VECTOR_DB_CLIENT.get(
-                collection_name=collection_name
-            )
+            return None, await VECTOR_DB_CLIENT.aget(collection_name=collection_name)
         except Exception as e:
             log.exception(f"Failed to fetch collection {collection_name}: {e}")
-            collection_results[collection_name] = None
+            return None, None
+
+    # Fetch collection data once per collection sequentially
+    # Avoid fetching the same data multiple times later
+    collection_results = {}
+    bm25_indexes = {}
+    for collection_name in collection_names:
+        bm25_indexes[collection_name], collection_results[collection_name] = (
+            await cache.get(
+                ("hybrid_collection", collection_name, enable_enriched_texts),
+                lambda: fetch_collection(collection_name),
+            )
+        )
 
     log.info(
         f"Starting hybrid search for {len(queries)} queries in {len(collection_names)} collections..."
@@ -490,9 +597,12 @@ async def query_collection_with_hybrid_search(
 
     async def process_query(collection_name, query):
         try:
+            bm25_index = bm25_indexes.get(collection_name)
             result = await query_doc_with_hybrid_search(
                 collection_name=collection_name,
-                collection_result=collection_results[collection_name],
+                collection_result=(
+                    None if bm25_index else collection_results[collection_name]
+                ),
                 query=query,
                 embedding_function=embedding_function,
                 k=k,
@@ -501,6 +611,7 @@ async def query_collection_with_hybrid_search(
                 r=r,
                 hybrid_bm25_weight=hybrid_bm25_weight,
                 enable_enriched_texts=enable_enriched_texts,
+                bm25_index=bm25_index,
             )
             return result, None
         except Exception as e:
@@ -516,9 +627,18 @@ async def query_collection_with_hybrid_search(
         for query in queries
     ]
 
-    # Run all queries in parallel using asyncio.gather
+    # Run all queries in parallel using asyncio.gather, reusing the ones an
+    # earlier pass of this request already ran
     task_results = await asyncio.gather(
-        *[process_query(collection_name, query) for collection_name, query in tasks]
+        *[
+            cache.get(
+                ("hybrid_query", collection_name, enable_enriched_texts, query),
+                lambda collection_name=collection_name, query=query: process_query(
+                    collection_name, query
+                ),
+            )
+            for collection_name, query in tasks
+        ]
     )
 
     for result, err in task_results:
@@ -806,77 +926,52 @@ def get_embedding_function(
 ) -> Awaitable:
     if embedding_engine == "":
         # Sentence transformers: CPU-bound sync operation
-        async def async_embedding_function(query, prefix=None, user=None):
+        async def embed_batch(texts, prefix=None, user=None):
             return await asyncio.to_thread(
-                (
-                    lambda query, prefix=None: embedding_function.encode(
-                        query,
-                        batch_size=int(embedding_batch_size),
-                        **({"prompt": prefix} if prefix else {}),
-                    ).tolist()
-                ),
-                query,
-                prefix,
+                lambda: embedding_function.encode(
+                    texts,
+                    batch_size=int(embedding_batch_size),
+                    **({"prompt": prefix} if prefix else {}),
+                ).tolist()
             )
 
-        return async_embedding_function
-    elif embedding_engine in ["ollama", "openai", "azure_openai"]:
-        embedding_function = lambda query, prefix=None, user=None: generate_embeddings(
-            engine=embedding_engine,
-            model=embedding_model,
-            text=query,
-            prefix=prefix,
-            url=url,
-            key=key,
-            user=user,
-            azure_api_version=azure_api_version,
+        # encode() batches internally, so hand it everything that queued up
+        async_embedding_function = EMBEDDING_DISPATCHER.wrap(
+            embed_batch,
+            target=f"sentence-transformers:{embedding_model}",
+            batch_size=SENTENCE_TRANSFORMERS_DISPATCH_SIZE,
+            concurrency=1,
         )
+    elif embedding_engine in ["ollama", "openai", "azure_openai"]:
 
-        async def async_embedding_function(query, prefix=None, user=None):
-            if isinstance(query, list):
-                # Create batches
-                batches = [
-                    query[i : i + embedding_batch_size]
-                    for i in range(0, len(query), embedding_batch_size)
-                ]
-
-                if enable_async:
-                    log.debug(
-                        f"generate_multiple_async: Processing {len(batches)} batches in parallel"
-                    )
-                    # Execute all batches in parallel
-                    tasks = [
-                        embedding_function(batch, prefix=prefix, user=user)
-                        for batch in batches
-                    ]
-                    batch_results = await asyncio.gather(*tasks)
-                else:
-                    log.debug(
-                        f"generate_multiple_async: Processing {len(batches)} batches sequentially"
-                    )
-                    batch_results = []
-                    for batch in batches:
-                        batch_results.append(
-                            await embedding_function(batch, prefix=prefix, user=user)
-                        )
-
-                # Flatten results
-                embeddings = []
-                for batch_embeddings in batch_results:
-                    if isinstance(batch_embeddings, list):
-                        embeddings.extend(batch_embeddings)
-
-                log.debug(
-                    f"generate_multiple_async: Generated {len(embeddings)} embeddings from {len(batches)} parallel batches"
-                )
-                return embeddings
-            else:
-                return await embedding_function(query, prefix, user)
+        async def embed_batch(texts, prefix=None, user=None):
+            return await generate_embeddings(
+                engine=embedding_engine,
+                model=embedding_model,
+                text=texts,
+                prefix=prefix,
+                url=url,
+                key=key,
+                user=user,
+                azure_api_version=azure_api_version,
+            )
 
-        return async_embedding_function
+        # Batches from all callers share the engine's concurrency and rate limits
+        async_embedding_function = EMBEDDING_DISPATCHER.wrap(
+            embed_batch,
+            target=f"{embedding_engine}:{embedding_model}@{url}",
+            batch_size=embedding_batch_size,
+            concurrency=None if enable_async else 1,
+        )
     else:
         raise ValueError(f"Unknown embedding engine: {embedding_engine}")
 
+    if EMBEDDING_CACHE is not None:
+        return EMBEDDING_CACHE.wrap(
+            async_embedding_function, embedding_engine, embedding_model
+        )
+    return async_embedding_function
+
 
 async def generate_embeddings(
     engine: str,
@@ -929,14 +1024,18 @@ async def generate_embeddings(
 def get_reranking_function(reranking_engine, reranking_model, reranking_function):
     if reranking_function is None:
         return None
-    if reranking_engine == "external":
-        return lambda query, documents, user=None: reranking_function.predict(
-            [(query, doc.page_content) for doc in documents], user=user
-        )
-    else:
-        return lambda query, documents, user=None: reranking_function.predict(
-            [(query, doc.page_content) for doc in documents]
-        )
+
+    # Scores from a previously loaded model no longer apply
+    RERANKER_POOL.clear_cache()
+
+    return lambda query, documents, user=None: RERANKER_POOL.score(
+        reranking_function,
+        f"{reranking_engine}:{reranking_model}",
+        query,
+        documents,
+        user=user,
+        external=reranking_engine == "external",
+    )
 
 
 async def get_sources_from_items(
@@ -952,6 +1051,7 @@ async def get_sources_from_items(
     hybrid_search,
     full_context=False,
     user: Optional[UserModel] = None,
+    cache: Optional[RetrievalCache] = None,
 ):
     log.debug(
         f"items: {items} {queries} {embedding_function} {reranking_function} {full_context}"
@@ -1188,6 +1288,7 @@ async def get_sources_from_items(
                                 r=r,
                                 hybrid_bm25_weight=hybrid_bm25_weight,
                                 enable_enriched_texts=request.app.state.config.ENABLE_RAG_HYBRID_SEARCH_ENRICHED_TEXTS,
+                                cache=cache,
                             )
                         except Exception as e:
                             log.debug(
@@ -1201,6 +1302,7 @@ async def get_sources_from_items(
                             queries=queries,
                             embedding_function=embedding_function,
                             k=k,
+                            cache=cache,
                         )
             except Exception as e:
                 log.exception(e)
@@ -1273,6 +1375,17 @@ def get_model_path(model: str, update_model: bool = False):
 
 
 import operator
+
+
+def get_cosine_similarities(
+    query_embedding: list[float], document_embeddings: list[list[float]]
+) -> list[float]:
+    query = np.asarray(query_embedding, dtype=np.float32)
+    documents = np.asarray(document_embeddings, dtype=np.float32)
+    norms = np.linalg.norm(documents, axis=1) * np.linalg.norm(query)
+    return (documents @ query / np.maximum(norms, 1e-8)).tolist()
+
+
 from typing import Optional, Sequence
 
 from langchain_core.callbacks import Callbacks
@@ -1284,6 +1397,8 @@ class RerankCompressor(BaseDocumentCompressor):
     top_n: int
     reranking_function: Any
     r_score: float
+    # Where the documents' stored vectors are read from for the cosine fallback
+    collection_name: Optional[str] = None
 
     class Config:
         extra = "forbid"
@@ -1308,6 +1423,45 @@ class RerankCompressor(BaseDocumentCompressor):
         """
         return []
 
+    async def _get_document_embeddings(
+        self, documents: Sequence[Document], dimensions: int
+    ) -> Optional[list[list[float]]]:
+        embeddings = [None] * len(documents)
+
+        # Chunks were embedded at ingestion, read their vectors back by id
+        ids = [doc.id for doc in documents if doc.id]
+        if self.collection_name and ids:
+            try:
+                stored = await VECTOR_DB_CLIENT.aget_vectors(self.collection_name, ids)
+            except Exception as e:
+                log.debug(f"Error getting stored vectors: {e}")
+                stored = {}
+
+            for idx, doc in enumerate(documents):
+                vector = stored.get(doc.id) if doc.id else None
+                # Backends with a fixed column size pad vectors with zeros
+                if (
+                    vector is not None
+                    and len(vector) >= dimensions
+                    and not any(vector[dimensions:])
+                ):
+                    embeddings[idx] = vector[:dimensions]
+
+        missing = [idx for idx, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            # Same texts and prefix as ingestion, so usually served from the
+            # embedding cache
+            result = await self.embedding_function(
+                [documents[idx].page_content.replace("\n", " ") for idx in missing],
+                RAG_EMBEDDING_CONTENT_PREFIX,
+            )
+            if len(result or []) != len(missing):
+                return None
+            for idx, embedding in zip(missing, result):
+                embeddings[idx] = embedding
+
+        return embeddings
+
     async def acompress_documents(
         self,
         documents: Sequence[Document],
@@ -1318,17 +1472,21 @@ class RerankCompressor(BaseDocumentCompressor):
 
         scores = None
         if reranking:
-            scores = await asyncio.to_thread(self.reranking_function, query, documents)
+            scores = await self.reranking_function(query, documents)
         else:
-            from sentence_transformers import util
-
+            # Same text and prefix as retrieval, usually served from the
+            # embedding cache
             query_embedding = await self.embedding_function(
                 query, RAG_EMBEDDING_QUERY_PREFIX
             )
-            document_embedding = await self.embedding_function(
-                [doc.page_content for doc in documents], RAG_EMBEDDING_CONTENT_PREFIX
-            )
-            scores = util.cos_sim(query_embedding, document_embedding)[0]
+            if query_embedding is not None:
+                document_embeddings = await self._get_document_embeddings(
+                    documents, len(query_embedding)
+                )
+                if document_embeddings is not None:
+                    scores = get_cosine_similarities(
+                        query_embedding, document_embeddings
+                    )
 
         if scores is not None:
             docs_with_scores = list(
@@ -6,6 +6,7 @@ from chromadb.utils.batch_utils import create_batches
 from typing import Optional
 
 from open_webui.retrieval.vector.main import (
+    AsyncClientHandle,
     VectorDBBase,
     VectorItem,
     SearchResult,
@@ -42,7 +43,7 @@ class ChromaClient(VectorDBBase):
             )
 
         if CHROMA_HTTP_HOST != "":
-            self.client = chromadb.HttpClient(
+            client_kwargs = dict(
                 host=CHROMA_HTTP_HOST,
                 port=CHROMA_HTTP_PORT,
                 headers=CHROMA_HTTP_HEADERS,
@@ -51,6 +52,10 @@ class ChromaClient(VectorDBBase):
                 database=CHROMA_DATABASE,
                 settings=Settings(**settings_dict),
             )
+            self.client = chromadb.HttpClient(**client_kwargs)
+            self.async_client = AsyncClientHandle(
+                lambda: chromadb.AsyncHttpClient(**client_kwargs)
+            )
         else:
             self.client = chromadb.PersistentClient(
                 path=CHROMA_DATA_PATH,
@@ -58,6 +63,31 @@ class ChromaClient(VectorDBBase):
                 tenant=CHROMA_TENANT,
                 database=CHROMA_DATABASE,
             )
+            # The embedded client is in-process only
+            self.async_client = AsyncClientHandle(None)
+
+    def _query_result_to_search_result(self, result) -> SearchResult:
+        # chromadb has cosine distance, 2 (worst) -> 0 (best). Re-odering to 0 -> 1
+        # https://docs.trychroma.com/docs/collections/configure cosine equation
+        distances = [[(2 - dist) / 2 for dist in row] for row in result["distances"]]
+
+        return SearchResult(
+            **{
+                "ids": result["ids"],
+                "distances": distances,
+                "documents": result["documents"],
+                "metadatas": result["metadatas"],
+            }
+        )
+
+    def _get_result_to_get_result(self, result) -> GetResult:
+        return GetResult(
+            **{
+                "ids": [result["ids"]],
+                "documents": [result["documents"]],
+                "metadatas": [result["metadatas"]],
+            }
+        )
 
     def has_collection(self, collection_name: str) -> bool:
         # Check if the collection exists based on the collection name.
@@ -84,21 +114,7 @@ class ChromaClient(VectorDBBase):
                     n_results=limit,
                     where=filter,
                 )
-
-                # chromadb has cosine distance, 2 (worst) -> 0 (best). Re-odering to 0 -> 1
-                # https://docs.trychroma.com/docs/collections/configure cosine equation
-                distances: list = result["distances"][0]
-                distances = [2 - dist for dist in distances]
-                distances = [[dist / 2 for dist in distances]]
-
-                return SearchResult(
-                    **{
-                        "ids": result["ids"],
-                        "distances": distances,
-                        "documents": result["documents"],
-                        "metadatas": result["metadatas"],
-                    }
-                )
+                return self._query_result_to_search_result(result)
             return None
         except Exception as e:
             return None
@@ -114,30 +130,32 @@ class ChromaClient(VectorDBBase):
                     where=filter,
                     limit=limit,
                 )
-
-                return GetResult(
-                    **{
-                        "ids": [result["ids"]],
-                        "documents": [result["documents"]],
-                        "metadatas": [result["metadatas"]],
-                    }
-                )
+                return self._get_result_to_get_result(result)
             return None
         except:
             return None
 
+    def _get_result_to_vectors(self, result) -> dict[str, list[float]]:
+        return {
+            id: [float(value) for value in embedding]
+            for id, embedding in zip(result["ids"], result["embeddings"])
+        }
+
+    def get_vectors(self, collection_name: str, ids: list[str]) -> dict:
+        try:
+            collection = self.client.get_collection(name=collection_name)
+            result = collection.get(ids=ids, include=["embeddings"])
+            return self._get_result_to_vectors(result)
+        except Exception as e:
+            log.debug(f"Error getting vectors from {collection_name}: {e}")
+            return {}
+
     def get(self, collection_name: str) -> Optional[GetResult]:
         # Get all the items in the collection.
         collection = self.client.get_collection(name=collection_name)
         if collection:
             result = collection.get()
-            return GetResult(
-                **{
-                    "ids": [result["ids"]],
-                    "documents": [result["documents"]],
-                    "metadatas": [result["metadatas"]],
-                }
-            )
+            return self._get_result_to_get_result(result)
         return None
 
     def insert(self, collection_name: str, items: list[VectorItem]):
@@ -199,3 +217,78 @@ class ChromaClient(VectorDBBase):
     def reset(self):
         # Resets the database. This will delete all collections and item entries.
         return self.client.reset()
+
+    async def ahas_collection(self, collection_name: str) -> bool:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().ahas_collection(collection_name)
+
+        collection_names = await client.list_collections()
+        return collection_name in collection_names
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().asearch(collection_name, vectors, filter, limit)
+
+        try:
+            collection = await client.get_collection(name=collection_name)
+            if collection:
+                result = await collection.query(
+                    query_embeddings=vectors,
+                    n_results=limit,
+                    where=filter,
+                )
+                return self._query_result_to_search_result(result)
+            return None
+        except Exception as e:
+            return None
+
+    async def aquery(
+        self, collection_name: str, filter: dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().aquery(collection_name, filter, limit)
+
+        try:
+            collection = await client.get_collection(name=collection_name)
+            if collection:
+                result = await collection.get(where=filter, limit=limit)
+                return self._get_result_to_get_result(result)
+            return None
+        except:
+            return None
+
+    async def aget_vectors(self, collection_name: str, ids: list[str]) -> dict:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().aget_vectors(collection_name, ids)
+
+        try:
+            collection = await client.get_collection(name=collection_name)
+            result = await collection.get(ids=ids, include=["embeddings"])
+            return self._get_result_to_vectors(result)
+        except Exception as e:
+            log.debug(f"Error getting vectors from {collection_name}: {e}")
+            return {}
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().aget(collection_name)
+
+        collection = await client.get_collection(name=collection_name)
+        if collection:
+            result = await collection.get()
+            return self._get_result_to_get_result(result)
+        return None
+
+    async def aclose(self):
+        await self.async_client.close()
@@ -1,10 +1,11 @@
-from elasticsearch import Elasticsearch, BadRequestError
+from elasticsearch import AsyncElasticsearch, Elasticsearch, BadRequestError
 from typing import Optional
 import ssl
-from elasticsearch.helpers import bulk, scan
+from elasticsearch.helpers import async_scan, bulk, scan
 
 from open_webui.retrieval.vector.utils import process_metadata
 from open_webui.retrieval.vector.main import (
+    AsyncClientHandle,
     VectorDBBase,
     VectorItem,
     SearchResult,
@@ -30,9 +31,12 @@ class ElasticsearchClient(VectorDBBase):
     baesd on the embedding length.
     """
 
+    # search() only uses the first query vector
+    MULTI_VECTOR_SEARCH = False
+
     def __init__(self):
         self.index_prefix = ELASTICSEARCH_INDEX_PREFIX
-        self.client = Elasticsearch(
+        client_kwargs = dict(
             hosts=[ELASTICSEARCH_URL],
             ca_certs=ELASTICSEARCH_CA_CERTS,
             api_key=ELASTICSEARCH_API_KEY,
@@ -44,6 +48,10 @@ class ElasticsearchClient(VectorDBBase):
             ),
             ssl_assert_fingerprint=SSL_ASSERT_FINGERPRINT,
         )
+        self.client = Elasticsearch(**client_kwargs)
+        self.async_client = AsyncClientHandle(
+            lambda: AsyncElasticsearch(**client_kwargs)
+        )
 
     # Status: works
     def _get_index_name(self, dimension: int) -> str:
@@ -133,12 +141,46 @@ class ElasticsearchClient(VectorDBBase):
         for i in range(0, len(items), batch_size):
             yield items[i : min(i + batch_size, len(items))]
 
-    # Status: works
-    def has_collection(self, collection_name) -> bool:
-        query_body = {"query": {"bool": {"filter": []}}}
+    def _get_collection_query(self, collection_name: str) -> dict:
+        return {
+            "query": {"bool": {"filter": [{"term": {"collection": collection_name}}]}}
+        }
+
+    def _get_search_query(self, collection_name: str, vectors, limit: int) -> dict:
+        return {
+            "size": limit,
+            "_source": ["text", "metadata"],
+            "query": {
+                "script_score": {
+                    "query": {
+                        "bool": {"filter": [{"term": {"collection": collection_name}}]}
+                    },
+                    "script": {
+                        "source": "cosineSimilarity(params.vector, 'vector') + 1.0",
+                        "params": {
+                            "vector": vectors[0]
+                        },  # Assuming single query vector
+                    },
+                }
+            },
+        }
+
+    def _get_filter_query(self, collection_name: str, filter: dict) -> dict:
+        query_body = {
+            "query": {"bool": {"filter": []}},
+            "_source": ["text", "metadata"],
+        }
+
+        for field, value in filter.items():
+            query_body["query"]["bool"]["filter"].append({"term": {field: value}})
         query_body["query"]["bool"]["filter"].append(
             {"term": {"collection": collection_name}}
         )
+        return query_body
+
+    # Status: works
+    def has_collection(self, collection_name) -> bool:
+        query_body = self._get_collection_query(collection_name)
 
         try:
             result = self.client.count(index=f"{self.index_prefix}*", body=query_body)
@@ -159,23 +201,7 @@ class ElasticsearchClient(VectorDBBase):
         filter: Optional[dict] = None,
         limit: int = 10,
     ) -> Optional[SearchResult]:
-        query = {
-            "size": limit,
-            "_source": ["text", "metadata"],
-            "query": {
-                "script_score": {
-                    "query": {
-                        "bool": {"filter": [{"term": {"collection": collection_name}}]}
-                    },
-                    "script": {
-                        "source": "cosineSimilarity(params.vector, 'vector') + 1.0",
-                        "params": {
-                            "vector": vectors[0]
-                        },  # Assuming single query vector
-                    },
-                }
-            },
-        }
+        query = self._get_search_query(collection_name, vectors, limit)
 
         result = self.client.search(
             index=self._get_index_name(len(vectors[0])), body=query
@@ -190,16 +216,7 @@ class ElasticsearchClient(VectorDBBase):
         if not self.has_collection(collection_name):
             return None
 
-        query_body = {
-            "query": {"bool": {"filter": []}},
-            "_source": ["text", "metadata"],
-        }
-
-        for field, value in filter.items():
-            query_body["query"]["bool"]["filter"].append({"term": {field: value}})
-        query_body["query"]["bool"]["filter"].append(
-            {"term": {"collection": collection_name}}
-        )
+        query_body = self._get_filter_query(collection_name, filter)
         size = limit if limit else 10
 
         try:
@@ -228,7 +245,7 @@ class ElasticsearchClient(VectorDBBase):
     def get(self, collection_name: str) -> Optional[GetResult]:
         # Get all the items in the collection.
         query = {
-            "query": {"bool": {"filter": [{"term": {"collection": collection_name}}]}},
+            **self._get_collection_query(collection_name),
             "_source": ["text", "metadata"],
         }
         results = list(scan(self.client, index=f"{self.index_prefix}*", query=query))
@@ -304,3 +321,74 @@ class ElasticsearchClient(VectorDBBase):
         indices = self.client.indices.get(index=f"{self.index_prefix}*")
         for index in indices:
             self.client.indices.delete(index=index)
+
+    async def ahas_collection(self, collection_name) -> bool:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().ahas_collection(collection_name)
+
+        try:
+            result = await client.count(
+                index=f"{self.index_prefix}*",
+                body=self._get_collection_query(collection_name),
+            )
+            return result.body["count"] > 0
+        except Exception as e:
+            return None
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().asearch(collection_name, vectors, filter, limit)
+
+        result = await client.search(
+            index=self._get_index_name(len(vectors[0])),
+            body=self._get_search_query(collection_name, vectors, limit),
+        )
+        return self._result_to_search_result(result)
+
+    async def aquery(
+        self, collection_name: str, filter: dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().aquery(collection_name, filter, limit)
+
+        if not await self.ahas_collection(collection_name):
+            return None
+
+        try:
+            result = await client.search(
+                index=f"{self.index_prefix}*",
+                body=self._get_filter_query(collection_name, filter),
+                size=limit if limit else 10,
+            )
+            return self._result_to_get_result(result)
+        except Exception as e:
+            return None
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().aget(collection_name)
+
+        query = {
+            **self._get_collection_query(collection_name),
+            "_source": ["text", "metadata"],
+        }
+        results = [
+            hit
+            async for hit in async_scan(
+                client, index=f"{self.index_prefix}*", query=query
+            )
+        ]
+        return self._scan_result_to_get_result(results)
+
+    async def aclose(self):
+        await self.async_client.close()
@@ -1,4 +1,4 @@
-from pymilvus import MilvusClient as Client
+from pymilvus import AsyncMilvusClient, MilvusClient as Client
 from pymilvus import FieldSchema, DataType
 from pymilvus import connections, Collection
 
@@ -8,6 +8,7 @@ from typing import Optional
 
 from open_webui.retrieval.vector.utils import process_metadata
 from open_webui.retrieval.vector.main import (
+    AsyncClientHandle,
     VectorDBBase,
     VectorItem,
     SearchResult,
@@ -33,9 +34,17 @@ class MilvusClient(VectorDBBase):
     def __init__(self):
         self.collection_prefix = "open_webui"
         if MILVUS_TOKEN is None:
-            self.client = Client(uri=MILVUS_URI, db_name=MILVUS_DB)
+            client_kwargs = dict(uri=MILVUS_URI, db_name=MILVUS_DB)
         else:
-            self.client = Client(uri=MILVUS_URI, db_name=MILVUS_DB, token=MILVUS_TOKEN)
+            client_kwargs = dict(uri=MILVUS_URI, db_name=MILVUS_DB, token=MILVUS_TOKEN)
+
+        self.client = Client(**client_kwargs)
+        # Milvus Lite (a local .db file) has no async client
+        self.async_client = AsyncClientHandle(
+            None
+            if MILVUS_URI.endswith(".db")
+            else lambda: AsyncMilvusClient(**client_kwargs)
+        )
 
     def _result_to_get_result(self, result) -> GetResult:
         ids = []
@@ -393,3 +402,36 @@ class MilvusClient(VectorDBBase):
                 except Exception as e:
                     log.error(f"Error deleting collection {collection_name_full}: {e}")
         log.info(f"Milvus reset complete. Deleted collections: {deleted_collections}")
+
+    async def ahas_collection(self, collection_name: str) -> bool:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().ahas_collection(collection_name)
+
+        collection_name = collection_name.replace("-", "_")
+        return await client.has_collection(
+            collection_name=f"{self.collection_prefix}_{collection_name}"
+        )
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().asearch(collection_name, vectors, filter, limit)
+
+        collection_name = collection_name.replace("-", "_")
+        result = await client.search(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            data=vectors,
+            limit=limit,
+            output_fields=["data", "metadata"],
+        )
+        return self._result_to_search_result(result)
+
+    async def aclose(self):
+        await self.async_client.close()
@@ -17,6 +17,7 @@ from open_webui.retrieval.vector.main import (
     SearchResult,
     VectorDBBase,
     VectorItem,
+    run_in_vector_db_executor,
 )
 from pymilvus import (
     connections,
@@ -172,6 +173,13 @@ class MilvusClient(VectorDBBase):
         if not utility.has_collection(mt_collection):
             return None
 
+        return self._search_resources(
+            mt_collection, f"{RESOURCE_ID_FIELD} == '{resource_id}'", vectors, limit
+        )
+
+    def _search_resources(
+        self, mt_collection: str, expr: str, vectors: List[List[float]], limit: int
+    ) -> SearchResult:
         collection = Collection(mt_collection)
         collection.load()
 
@@ -181,7 +189,7 @@ class MilvusClient(VectorDBBase):
             anns_field="vector",
             param=search_params,
             limit=limit,
-            expr=f"{RESOURCE_ID_FIELD} == '{resource_id}'",
+            expr=expr,
             output_fields=["id", "text", "metadata"],
         )
 
@@ -202,6 +210,49 @@ class MilvusClient(VectorDBBase):
             ids=ids, documents=documents, metadatas=metadatas, distances=distances
         )
 
+    def search_collections(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        limit: int = 10,
+    ) -> List[SearchResult]:
+        # One search per shared collection, matching any of its resource IDs
+        if not vectors:
+            return []
+
+        resources = {}
+        for collection_name in dict.fromkeys(collection_names):
+            if collection_name:
+                mt_collection, resource_id = self._get_collection_and_resource_id(
+                    collection_name
+                )
+                resources.setdefault(mt_collection, []).append(resource_id)
+
+        results = []
+        for mt_collection, resource_ids in resources.items():
+            if not utility.has_collection(mt_collection):
+                continue
+            resource_id_list = ", ".join(f"'{id}'" for id in resource_ids)
+            results.append(
+                self._search_resources(
+                    mt_collection,
+                    f"{RESOURCE_ID_FIELD} in [{resource_id_list}]",
+                    vectors,
+                    limit,
+                )
+            )
+        return results
+
+    async def asearch_collections(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        limit: int = 10,
+    ) -> List[SearchResult]:
+        return await run_in_vector_db_executor(
+            self.search_collections, collection_names, vectors, limit=limit
+        )
+
     def delete(
         self,
         collection_name: str,
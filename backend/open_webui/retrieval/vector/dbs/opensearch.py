@@ -1,9 +1,10 @@
-from opensearchpy import OpenSearch
+from opensearchpy import AsyncOpenSearch, OpenSearch
 from opensearchpy.helpers import bulk
 from typing import Optional
 
 from open_webui.retrieval.vector.utils import process_metadata
 from open_webui.retrieval.vector.main import (
+    AsyncClientHandle,
     VectorDBBase,
     VectorItem,
     SearchResult,
@@ -19,14 +20,19 @@ from open_webui.config import (
 
 
 class OpenSearchClient(VectorDBBase):
+    # search() only uses the first query vector
+    MULTI_VECTOR_SEARCH = False
+
     def __init__(self):
         self.index_prefix = "open_webui"
-        self.client = OpenSearch(
+        client_kwargs = dict(
             hosts=[OPENSEARCH_URI],
             use_ssl=OPENSEARCH_SSL,
             verify_certs=OPENSEARCH_CERT_VERIFY,
             http_auth=(OPENSEARCH_USERNAME, OPENSEARCH_PASSWORD),
         )
+        self.client = OpenSearch(**client_kwargs)
+        self.async_client = AsyncClientHandle(lambda: AsyncOpenSearch(**client_kwargs))
 
     def _get_index_name(self, collection_name: str) -> str:
         return f"{self.index_prefix}_{collection_name}"
@@ -102,6 +108,36 @@ class OpenSearchClient(VectorDBBase):
         for i in range(0, len(items), batch_size):
             yield items[i : i + batch_size]
 
+    def _get_search_query(self, vectors: list[list[float | int]], limit: int) -> dict:
+        return {
+            "size": limit,
+            "_source": ["text", "metadata"],
+            "query": {
+                "script_score": {
+                    "query": {"match_all": {}},
+                    "script": {
+                        "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
+                        "params": {
+                            "field": "vector",
+                            "query_value": vectors[0],
+                        },  # Assuming single query vector
+                    },
+                }
+            },
+        }
+
+    def _get_filter_query(self, filter: dict) -> dict:
+        query_body = {
+            "query": {"bool": {"filter": []}},
+            "_source": ["text", "metadata"],
+        }
+
+        for field, value in filter.items():
+            query_body["query"]["bool"]["filter"].append(
+                {"term": {"metadata." + str(field) + ".keyword": value}}
+            )
+        return query_body
+
     def has_collection(self, collection_name: str) -> bool:
         # has_collection here means has index.
         # We are simply adapting to the norms of the other DBs.
@@ -123,25 +159,9 @@ class OpenSearchClient(VectorDBBase):
             if not self.has_collection(collection_name):
                 return None
 
-            query = {
-                "size": limit,
-                "_source": ["text", "metadata"],
-                "query": {
-                    "script_score": {
-                        "query": {"match_all": {}},
-                        "script": {
-                            "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
-                            "params": {
-                                "field": "vector",
-                                "query_value": vectors[0],
-                            },  # Assuming single query vector
-                        },
-                    }
-                },
-            }
-
             result = self.client.search(
-                index=self._get_index_name(collection_name), body=query
+                index=self._get_index_name(collection_name),
+                body=self._get_search_query(vectors, limit),
             )
 
             return self._result_to_search_result(result)
@@ -155,16 +175,7 @@ class OpenSearchClient(VectorDBBase):
         if not self.has_collection(collection_name):
             return None
 
-        query_body = {
-            "query": {"bool": {"filter": []}},
-            "_source": ["text", "metadata"],
-        }
-
-        for field, value in filter.items():
-            query_body["query"]["bool"]["filter"].append(
-                {"term": {"metadata." + str(field) + ".keyword": value}}
-            )
-
+        query_body = self._get_filter_query(filter)
         size = limit if limit else 10000
 
         try:
@@ -269,3 +280,67 @@ class OpenSearchClient(VectorDBBase):
         indices = self.client.indices.get(index=f"{self.index_prefix}_*")
         for index in indices:
             self.client.indices.delete(index=index)
+
+    async def ahas_collection(self, collection_name: str) -> bool:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().ahas_collection(collection_name)
+
+        return await client.indices.exists(index=self._get_index_name(collection_name))
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().asearch(collection_name, vectors, filter, limit)
+
+        try:
+            if not await self.ahas_collection(collection_name):
+                return None
+
+            result = await client.search(
+                index=self._get_index_name(collection_name),
+                body=self._get_search_query(vectors, limit),
+            )
+            return self._result_to_search_result(result)
+        except Exception as e:
+            return None
+
+    async def aquery(
+        self, collection_name: str, filter: dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().aquery(collection_name, filter, limit)
+
+        if not await self.ahas_collection(collection_name):
+            return None
+
+        try:
+            result = await client.search(
+                index=self._get_index_name(collection_name),
+                body=self._get_filter_query(filter),
+                size=limit if limit else 10000,
+            )
+            return self._result_to_get_result(result)
+        except Exception as e:
+            return None
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().aget(collection_name)
+
+        query = {"query": {"match_all": {}}, "_source": ["text", "metadata"]}
+        result = await client.search(
+            index=self._get_index_name(collection_name), body=query
+        )
+        return self._result_to_get_result(result)
+
+    async def aclose(self):
+        await self.async_client.close()
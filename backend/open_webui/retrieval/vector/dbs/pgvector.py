@@ -1,12 +1,15 @@
 from typing import Optional, List, Dict, Any, Tuple
 import logging
 import json
+import threading
 from sqlalchemy import (
     func,
     literal,
     cast,
     column,
     create_engine,
+    event,
+    make_url,
     Column,
     Integer,
     MetaData,
@@ -26,13 +29,23 @@ from pgvector.sqlalchemy import Vector, HALFVEC
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.exc import NoSuchTableError
 
+try:
+    # Optional async driver; without it async callers use the shared executor
+    from pgvector.asyncpg import register_vector
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    import asyncpg  # noqa: F401
+except ImportError:
+    create_async_engine = None
 
 from open_webui.retrieval.vector.utils import process_metadata
 from open_webui.retrieval.vector.main import (
+    AsyncClientHandle,
     VectorDBBase,
     VectorItem,
     SearchResult,
     GetResult,
+    run_in_vector_db_executor,
 )
 from open_webui.config import (
     PGVECTOR_DB_URL,
@@ -49,6 +62,8 @@ from open_webui.config import (
     PGVECTOR_HNSW_EF_CONSTRUCTION,
     PGVECTOR_IVFFLAT_LISTS,
     PGVECTOR_USE_HALFVEC,
+    PGVECTOR_INSERT_BATCH_SIZE,
+    PGVECTOR_DEFER_INDEX_ON_BULK_LOAD,
 )
 
 VECTOR_LENGTH = PGVECTOR_INITIALIZE_MAX_VECTOR_LENGTH
@@ -56,6 +71,8 @@ USE_HALFVEC = PGVECTOR_USE_HALFVEC
 
 VECTOR_TYPE_FACTORY = HALFVEC if USE_HALFVEC else Vector
 VECTOR_OPCLASS = "halfvec_cosine_ops" if USE_HALFVEC else "vector_cosine_ops"
+VECTOR_SQL_TYPE = f"{'halfvec' if USE_HALFVEC else 'vector'}({VECTOR_LENGTH})"
+VECTOR_INDEX_NAME = "idx_document_chunk_vector"
 Base = declarative_base()
 
 log = logging.getLogger(__name__)
@@ -86,12 +103,15 @@ class DocumentChunk(Base):
 
 class PgvectorClient(VectorDBBase):
     def __init__(self) -> None:
+        self._bulk_loads = 0
+        self._bulk_load_lock = threading.Lock()
 
         # if no pgvector uri, use the existing database connection
         if not PGVECTOR_DB_URL:
             from open_webui.internal.db import ScopedSession
 
             self.session = ScopedSession
+            self.async_engine = AsyncClientHandle(None)
         else:
             if isinstance(PGVECTOR_POOL_SIZE, int):
                 if PGVECTOR_POOL_SIZE > 0:
@@ -115,6 +135,9 @@ class PgvectorClient(VectorDBBase):
                 autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
             )
             self.session = scoped_session(SessionLocal)
+            self.async_engine = AsyncClientHandle(
+                self._create_async_engine if create_async_engine else None
+            )
 
         try:
             # Ensure the pgvector extension is available
@@ -171,6 +194,35 @@ class PgvectorClient(VectorDBBase):
             log.exception(f"Error during initialization: {e}")
             raise
 
+    @staticmethod
+    def _create_async_engine():
+        url = make_url(PGVECTOR_DB_URL)
+        query = dict(url.query)
+        # asyncpg takes `ssl` where libpq takes `sslmode`
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+
+        if isinstance(PGVECTOR_POOL_SIZE, int) and PGVECTOR_POOL_SIZE <= 0:
+            engine = create_async_engine(url, pool_pre_ping=True, poolclass=NullPool)
+        elif isinstance(PGVECTOR_POOL_SIZE, int):
+            engine = create_async_engine(
+                url,
+                pool_size=PGVECTOR_POOL_SIZE,
+                max_overflow=PGVECTOR_POOL_MAX_OVERFLOW,
+                pool_timeout=PGVECTOR_POOL_TIMEOUT,
+                pool_recycle=PGVECTOR_POOL_RECYCLE,
+                pool_pre_ping=True,
+            )
+        else:
+            engine = create_async_engine(url, pool_pre_ping=True)
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            dbapi_connection.run_async(register_vector)
+
+        return engine
+
     @staticmethod
     def _extract_index_method(index_def: Optional[str]) -> Optional[str]:
         if not index_def:
@@ -205,7 +257,7 @@ class PgvectorClient(VectorDBBase):
         return index_method, index_options
 
     def _ensure_vector_index(self, index_method: str, index_options: str) -> None:
-        index_name = "idx_document_chunk_vector"
+        index_name = VECTOR_INDEX_NAME
         existing_index_def = self.session.execute(
             text("""
                 SELECT indexdef
@@ -290,54 +342,79 @@ class PgvectorClient(VectorDBBase):
             vector = vector[:VECTOR_LENGTH]
         return vector
 
-    def insert(self, collection_name: str, items: List[VectorItem]) -> None:
-        try:
-            if PGVECTOR_PGCRYPTO:
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    # Use raw SQL for BYTEA/pgcrypto
-                    # Ensure metadata is converted to its JSON text representation
-                    json_metadata = json.dumps(item["metadata"])
-                    self.session.execute(
-                        text("""
-                            INSERT INTO document_chunk
-                            (id, vector, collection_name, text, vmetadata)
-                            VALUES (
-                                :id, :vector, :collection_name,
-                                pgp_sym_encrypt(:text, :key),
-                                pgp_sym_encrypt(:metadata_text, :key)
-                            )
-                            ON CONFLICT (id) DO NOTHING
-                        """),
-                        {
-                            "id": item["id"],
-                            "vector": vector,
-                            "collection_name": collection_name,
-                            "text": item["text"],
-                            "metadata_text": json_metadata,
-                            "key": PGVECTOR_PGCRYPTO_KEY,
-                        },
-                    )
-                self.session.commit()
-                log.info(f"Encrypted & inserted {len(items)} into '{collection_name}'")
+    def _format_vector(self, vector: List[float]) -> str:
+        # pgvector text input, padded or truncated to VECTOR_LENGTH like
+        # adjust_vector_length
+        values = [str(float(value)) for value in vector[:VECTOR_LENGTH]]
+        values.extend(["0"] * (VECTOR_LENGTH - len(values)))
+        return f"[{','.join(values)}]"
 
-            else:
-                new_items = []
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    new_chunk = DocumentChunk(
-                        id=item["id"],
-                        vector=vector,
-                        collection_name=collection_name,
-                        text=item["text"],
-                        vmetadata=process_metadata(item["metadata"]),
+    def _bulk_insert(
+        self, collection_name: str, items: List[VectorItem], on_conflict: str
+    ) -> None:
+        """
+        Write items in multi-row batches: each batch is a single
+        INSERT ... SELECT FROM unnest(...) statement with four array
+        parameters, so pgcrypto encryption and the vector cast run server-side
+        over the whole batch.
+        """
+        if PGVECTOR_PGCRYPTO:
+            text_value = "pgp_sym_encrypt(item.text, :key)"
+            metadata_value = "pgp_sym_encrypt(item.metadata, :key)"
+        else:
+            text_value = "item.text"
+            metadata_value = "CAST(item.metadata AS jsonb)"
+
+        stmt = text(f"""
+            INSERT INTO document_chunk
+            (id, vector, collection_name, text, vmetadata)
+            SELECT
+                item.id,
+                CAST(item.vector AS {VECTOR_SQL_TYPE}),
+                :collection_name,
+                {text_value},
+                {metadata_value}
+            FROM unnest(
+                CAST(:ids AS text[]),
+                CAST(:vectors AS text[]),
+                CAST(:texts AS text[]),
+                CAST(:metadatas AS text[])
+            ) AS item(id, vector, text, metadata)
+            {on_conflict}
+        """)
+
+        for start in range(0, len(items), PGVECTOR_INSERT_BATCH_SIZE):
+            batch = items[start : start + PGVECTOR_INSERT_BATCH_SIZE]
+            params = {
+                "collection_name": collection_name,
+                "ids": [item["id"] for item in batch],
+                "vectors": [self._format_vector(item["vector"]) for item in batch],
+                "texts": [item["text"] for item in batch],
+                "metadatas": [
+                    json.dumps(
+                        item["metadata"]
+                        if PGVECTOR_PGCRYPTO
+                        else process_metadata(item["metadata"])
                     )
-                    new_items.append(new_chunk)
-                self.session.bulk_save_objects(new_items)
-                self.session.commit()
-                log.info(
-                    f"Inserted {len(new_items)} items into collection '{collection_name}'."
-                )
+                    for item in batch
+                ],
+            }
+            if PGVECTOR_PGCRYPTO:
+                params["key"] = PGVECTOR_PGCRYPTO_KEY
+
+            self.session.execute(stmt, params)
+        self.session.commit()
+
+    def insert(self, collection_name: str, items: List[VectorItem]) -> None:
+        try:
+            self._bulk_insert(
+                collection_name,
+                items,
+                "ON CONFLICT (id) DO NOTHING" if PGVECTOR_PGCRYPTO else "",
+            )
+            log.info(
+                f"Inserted {len(items)} items into collection '{collection_name}'."
+            )
         except Exception as e:
             self.session.rollback()
             log.exception(f"Error during insert: {e}")
@@ -345,274 +422,308 @@ class PgvectorClient(VectorDBBase):
 
     def upsert(self, collection_name: str, items: List[VectorItem]) -> None:
         try:
-            if PGVECTOR_PGCRYPTO:
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    json_metadata = json.dumps(item["metadata"])
-                    self.session.execute(
-                        text("""
-                            INSERT INTO document_chunk
-                            (id, vector, collection_name, text, vmetadata)
-                            VALUES (
-                                :id, :vector, :collection_name,
-                                pgp_sym_encrypt(:text, :key),
-                                pgp_sym_encrypt(:metadata_text, :key)
-                            )
-                            ON CONFLICT (id) DO UPDATE SET
-                              vector = EXCLUDED.vector,
-                              collection_name = EXCLUDED.collection_name,
-                              text = EXCLUDED.text,
-                              vmetadata = EXCLUDED.vmetadata
-                        """),
-                        {
-                            "id": item["id"],
-                            "vector": vector,
-                            "collection_name": collection_name,
-                            "text": item["text"],
-                            "metadata_text": json_metadata,
-                            "key": PGVECTOR_PGCRYPTO_KEY,
-                        },
-                    )
-                self.session.commit()
-                log.info(f"Encrypted & upserted {len(items)} into '{collection_name}'")
-            else:
-                for item in items:
-                    vector = self.adjust_vector_length(item["vector"])
-                    existing = (
-                        self.session.query(DocumentChunk)
-                        .filter(DocumentChunk.id == item["id"])
-                        .first()
-                    )
-                    if existing:
-                        existing.vector = vector
-                        existing.text = item["text"]
-                        existing.vmetadata = process_metadata(item["metadata"])
-                        existing.collection_name = (
-                            collection_name  # Update collection_name if necessary
-                        )
-                    else:
-                        new_chunk = DocumentChunk(
-                            id=item["id"],
-                            vector=vector,
-                            collection_name=collection_name,
-                            text=item["text"],
-                            vmetadata=process_metadata(item["metadata"]),
-                        )
-                        self.session.add(new_chunk)
-                self.session.commit()
-                log.info(
-                    f"Upserted {len(items)} items into collection '{collection_name}'."
-                )
+            # A statement can only update each row once, keep the last item per id
+            items = list({item["id"]: item for item in items}.values())
+            self._bulk_insert(
+                collection_name,
+                items,
+                """
+                ON CONFLICT (id) DO UPDATE SET
+                  vector = EXCLUDED.vector,
+                  collection_name = EXCLUDED.collection_name,
+                  text = EXCLUDED.text,
+                  vmetadata = EXCLUDED.vmetadata
+                """,
+            )
+            log.info(
+                f"Upserted {len(items)} items into collection '{collection_name}'."
+            )
         except Exception as e:
             self.session.rollback()
             log.exception(f"Error during upsert: {e}")
             raise
 
-    def search(
+    def begin_bulk_load(self) -> None:
+        if not PGVECTOR_DEFER_INDEX_ON_BULK_LOAD:
+            return
+
+        with self._bulk_load_lock:
+            self._bulk_loads += 1
+            if self._bulk_loads > 1:
+                return
+
+            try:
+                self.session.execute(text(f"DROP INDEX IF EXISTS {VECTOR_INDEX_NAME}"))
+                self.session.commit()
+                log.info(f"Dropped vector index '{VECTOR_INDEX_NAME}' for bulk load.")
+            except Exception as e:
+                self.session.rollback()
+                log.exception(f"Error dropping vector index: {e}")
+
+    def end_bulk_load(self) -> None:
+        if not PGVECTOR_DEFER_INDEX_ON_BULK_LOAD:
+            return
+
+        with self._bulk_load_lock:
+            self._bulk_loads = max(self._bulk_loads - 1, 0)
+            if self._bulk_loads > 0:
+                return
+
+            try:
+                self._ensure_vector_index(*self._vector_index_configuration())
+                self.session.commit()
+            except Exception as e:
+                self.session.rollback()
+                log.exception(f"Error rebuilding vector index: {e}")
+
+    def _build_search_stmt(
         self,
-        collection_name: str,
+        collection_names: List[str],
         vectors: List[List[float]],
-        filter: Optional[Dict[str, Any]] = None,
-        limit: int = 10,
-    ) -> Optional[SearchResult]:
-        try:
-            if not vectors:
-                return None
-
-            # Adjust query vectors to VECTOR_LENGTH
-            vectors = [self.adjust_vector_length(vector) for vector in vectors]
-            num_queries = len(vectors)
-
-            def vector_expr(vector):
-                return cast(array(vector), VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
-
-            # Create the values for query vectors
-            qid_col = column("qid", Integer)
-            q_vector_col = column("q_vector", VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
-            query_vectors = (
-                values(qid_col, q_vector_col)
-                .data(
-                    [(idx, vector_expr(vector)) for idx, vector in enumerate(vectors)]
+        filter: Optional[Dict[str, Any]],
+        limit: Optional[int],
+    ):
+        def vector_expr(vector):
+            return cast(array(vector), VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
+
+        # Create the values for query vectors
+        qid_col = column("qid", Integer)
+        q_vector_col = column("q_vector", VECTOR_TYPE_FACTORY(VECTOR_LENGTH))
+        query_vectors = (
+            values(qid_col, q_vector_col)
+            .data([(idx, vector_expr(vector)) for idx, vector in enumerate(vectors)])
+            .alias("query_vectors")
+        )
+
+        result_fields = [
+            DocumentChunk.id,
+        ]
+        if PGVECTOR_PGCRYPTO:
+            result_fields.append(
+                pgcrypto_decrypt(DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text).label(
+                    "text"
                 )
-                .alias("query_vectors")
             )
-
-            result_fields = [
-                DocumentChunk.id,
-            ]
-            if PGVECTOR_PGCRYPTO:
-                result_fields.append(
-                    pgcrypto_decrypt(
-                        DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text
-                    ).label("text")
-                )
-                result_fields.append(
-                    pgcrypto_decrypt(
-                        DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
-                    ).label("vmetadata")
-                )
-            else:
-                result_fields.append(DocumentChunk.text)
-                result_fields.append(DocumentChunk.vmetadata)
             result_fields.append(
-                (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector)).label(
-                    "distance"
-                )
+                pgcrypto_decrypt(
+                    DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
+                ).label("vmetadata")
             )
+        else:
+            result_fields.append(DocumentChunk.text)
+            result_fields.append(DocumentChunk.vmetadata)
+        result_fields.append(
+            (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector)).label(
+                "distance"
+            )
+        )
 
-            # Build the lateral subquery for each query vector
-            where_clauses = [DocumentChunk.collection_name == collection_name]
-
-            # Apply metadata filter if provided
-            if filter:
-                for key, value in filter.items():
-                    if isinstance(value, dict) and "$in" in value:
-                        # Handle $in operator: {"field": {"$in": [values]}}
-                        in_values = value["$in"]
-                        if PGVECTOR_PGCRYPTO:
-                            where_clauses.append(
-                                pgcrypto_decrypt(
-                                    DocumentChunk.vmetadata,
-                                    PGVECTOR_PGCRYPTO_KEY,
-                                    JSONB,
-                                )[key].astext.in_([str(v) for v in in_values])
-                            )
-                        else:
-                            where_clauses.append(
-                                DocumentChunk.vmetadata[key].astext.in_(
-                                    [str(v) for v in in_values]
-                                )
-                            )
+        # Build the lateral subquery for each query vector
+        if len(collection_names) == 1:
+            where_clauses = [DocumentChunk.collection_name == collection_names[0]]
+        else:
+            where_clauses = [DocumentChunk.collection_name.in_(collection_names)]
+
+        # Apply metadata filter if provided
+        if filter:
+            for key, value in filter.items():
+                if isinstance(value, dict) and "$in" in value:
+                    # Handle $in operator: {"field": {"$in": [values]}}
+                    in_values = value["$in"]
+                    if PGVECTOR_PGCRYPTO:
+                        where_clauses.append(
+                            pgcrypto_decrypt(
+                                DocumentChunk.vmetadata,
+                                PGVECTOR_PGCRYPTO_KEY,
+                                JSONB,
+                            )[key].astext.in_([str(v) for v in in_values])
+                        )
                     else:
-                        # Handle simple equality: {"field": "value"}
-                        if PGVECTOR_PGCRYPTO:
-                            where_clauses.append(
-                                pgcrypto_decrypt(
-                                    DocumentChunk.vmetadata,
-                                    PGVECTOR_PGCRYPTO_KEY,
-                                    JSONB,
-                                )[key].astext
-                                == str(value)
-                            )
-                        else:
-                            where_clauses.append(
-                                DocumentChunk.vmetadata[key].astext == str(value)
+                        where_clauses.append(
+                            DocumentChunk.vmetadata[key].astext.in_(
+                                [str(v) for v in in_values]
                             )
+                        )
+                else:
+                    # Handle simple equality: {"field": "value"}
+                    if PGVECTOR_PGCRYPTO:
+                        where_clauses.append(
+                            pgcrypto_decrypt(
+                                DocumentChunk.vmetadata,
+                                PGVECTOR_PGCRYPTO_KEY,
+                                JSONB,
+                            )[key].astext
+                            == str(value)
+                        )
+                    else:
+                        where_clauses.append(
+                            DocumentChunk.vmetadata[key].astext == str(value)
+                        )
 
-            subq = (
-                select(*result_fields)
-                .where(*where_clauses)
-                .order_by(
-                    (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector))
-                )
-            )
-            if limit is not None:
-                subq = subq.limit(limit)
-            subq = subq.lateral("result")
-
-            # Build the main query by joining query_vectors and the lateral subquery
-            stmt = (
-                select(
-                    query_vectors.c.qid,
-                    subq.c.id,
-                    subq.c.text,
-                    subq.c.vmetadata,
-                    subq.c.distance,
-                )
-                .select_from(query_vectors)
-                .join(subq, true())
-                .order_by(query_vectors.c.qid, subq.c.distance)
+        subq = (
+            select(*result_fields)
+            .where(*where_clauses)
+            .order_by((DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector)))
+        )
+        if limit is not None:
+            subq = subq.limit(limit)
+        subq = subq.lateral("result")
+
+        # Build the main query by joining query_vectors and the lateral subquery
+        stmt = (
+            select(
+                query_vectors.c.qid,
+                subq.c.id,
+                subq.c.text,
+                subq.c.vmetadata,
+                subq.c.distance,
             )
+            .select_from(query_vectors)
+            .join(subq, true())
+            .order_by(query_vectors.c.qid, subq.c.distance)
+        )
+        return stmt
+
+    def _search_rows_to_result(self, results, num_queries: int) -> SearchResult:
+        ids = [[] for _ in range(num_queries)]
+        distances = [[] for _ in range(num_queries)]
+        documents = [[] for _ in range(num_queries)]
+        metadatas = [[] for _ in range(num_queries)]
+
+        for row in results:
+            qid = int(row.qid)
+            ids[qid].append(row.id)
+            # normalize and re-orders pgvec distance from [2, 0] to [0, 1] score range
+            # https://github.com/pgvector/pgvector?tab=readme-ov-file#querying
+            distances[qid].append((2.0 - row.distance) / 2.0)
+            documents[qid].append(row.text)
+            metadatas[qid].append(row.vmetadata)
+        return SearchResult(
+            ids=ids, distances=distances, documents=documents, metadatas=metadatas
+        )
 
-            result_proxy = self.session.execute(stmt)
-            results = result_proxy.all()
+    def search(
+        self,
+        collection_name: str,
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        return self._search([collection_name], vectors, filter, limit)
 
-            ids = [[] for _ in range(num_queries)]
-            distances = [[] for _ in range(num_queries)]
-            documents = [[] for _ in range(num_queries)]
-            metadatas = [[] for _ in range(num_queries)]
+    def search_collections(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        limit: int = 10,
+    ) -> List[SearchResult]:
+        # A single statement over all collections: every query vector gets its
+        # top `limit` chunks across the given collections
+        collection_names = [name for name in dict.fromkeys(collection_names) if name]
+        if not collection_names:
+            return []
 
-            if not results:
-                return SearchResult(
-                    ids=ids,
-                    distances=distances,
-                    documents=documents,
-                    metadatas=metadatas,
-                )
+        result = self._search(collection_names, vectors, None, limit)
+        return [result] if result is not None else []
+
+    def _search(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]],
+        limit: Optional[int],
+    ) -> Optional[SearchResult]:
+        try:
+            if not vectors:
+                return None
 
-            for row in results:
-                qid = int(row.qid)
-                ids[qid].append(row.id)
-                # normalize and re-orders pgvec distance from [2, 0] to [0, 1] score range
-                # https://github.com/pgvector/pgvector?tab=readme-ov-file#querying
-                distances[qid].append((2.0 - row.distance) / 2.0)
-                documents[qid].append(row.text)
-                metadatas[qid].append(row.vmetadata)
+            # Adjust query vectors to VECTOR_LENGTH
+            vectors = [self.adjust_vector_length(vector) for vector in vectors]
+
+            stmt = self._build_search_stmt(collection_names, vectors, filter, limit)
+            results = self.session.execute(stmt).all()
 
             self.session.rollback()  # read-only transaction
-            return SearchResult(
-                ids=ids, distances=distances, documents=documents, metadatas=metadatas
-            )
+            return self._search_rows_to_result(results, len(vectors))
         except Exception as e:
             self.session.rollback()
             log.exception(f"Error during search: {e}")
             return None
 
+    def _build_query_stmt(
+        self,
+        collection_name: str,
+        filter: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ):
+        if PGVECTOR_PGCRYPTO:
+            metadata_column = pgcrypto_decrypt(
+                DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
+            )
+            stmt = select(
+                DocumentChunk.id,
+                pgcrypto_decrypt(DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text).label(
+                    "text"
+                ),
+                metadata_column.label("vmetadata"),
+            )
+        else:
+            metadata_column = DocumentChunk.vmetadata
+            stmt = select(DocumentChunk.id, DocumentChunk.text, DocumentChunk.vmetadata)
+
+        # decrypt then check key: JSON filter after decryption
+        where_clauses = [DocumentChunk.collection_name == collection_name]
+        for key, value in (filter or {}).items():
+            where_clauses.append(metadata_column[key].astext == str(value))
+
+        stmt = stmt.where(*where_clauses)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    def _rows_to_get_result(self, results) -> GetResult:
+        return GetResult(
+            ids=[[result.id for result in results]],
+            documents=[[result.text for result in results]],
+            metadatas=[[result.vmetadata for result in results]],
+        )
+
+    def _build_vectors_stmt(self, collection_name: str, ids: List[str]):
+        return select(DocumentChunk.id, DocumentChunk.vector).where(
+            DocumentChunk.collection_name == collection_name,
+            DocumentChunk.id.in_(ids),
+        )
+
+    def _rows_to_vectors(self, results) -> Dict[str, List[float]]:
+        # Vectors come back padded to VECTOR_LENGTH, as they were stored
+        return {
+            result.id: (
+                [float(value) for value in result.vector.to_list()]
+                if hasattr(result.vector, "to_list")
+                else [float(value) for value in result.vector]
+            )
+            for result in results
+            if result.vector is not None
+        }
+
+    def _build_has_collection_stmt(self, collection_name: str):
+        return (
+            select(DocumentChunk.id)
+            .where(DocumentChunk.collection_name == collection_name)
+            .limit(1)
+        )
+
     def query(
         self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
     ) -> Optional[GetResult]:
         try:
-            if PGVECTOR_PGCRYPTO:
-                # Build where clause for vmetadata filter
-                where_clauses = [DocumentChunk.collection_name == collection_name]
-                for key, value in filter.items():
-                    # decrypt then check key: JSON filter after decryption
-                    where_clauses.append(
-                        pgcrypto_decrypt(
-                            DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
-                        )[key].astext
-                        == str(value)
-                    )
-                stmt = select(
-                    DocumentChunk.id,
-                    pgcrypto_decrypt(
-                        DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text
-                    ).label("text"),
-                    pgcrypto_decrypt(
-                        DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
-                    ).label("vmetadata"),
-                ).where(*where_clauses)
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-                results = self.session.execute(stmt).all()
-            else:
-                query = self.session.query(DocumentChunk).filter(
-                    DocumentChunk.collection_name == collection_name
-                )
-
-                for key, value in filter.items():
-                    query = query.filter(
-                        DocumentChunk.vmetadata[key].astext == str(value)
-                    )
-
-                if limit is not None:
-                    query = query.limit(limit)
-
-                results = query.all()
+            stmt = self._build_query_stmt(collection_name, filter, limit)
+            results = self.session.execute(stmt).all()
 
+            self.session.rollback()  # read-only transaction
             if not results:
                 return None
-
-            ids = [[result.id for result in results]]
-            documents = [[result.text for result in results]]
-            metadatas = [[result.vmetadata for result in results]]
-
-            self.session.rollback()  # read-only transaction
-            return GetResult(
-                ids=ids,
-                documents=documents,
-                metadatas=metadatas,
-            )
+            return self._rows_to_get_result(results)
         except Exception as e:
             self.session.rollback()
             log.exception(f"Error during query: {e}")
@@ -622,46 +733,32 @@ class PgvectorClient(VectorDBBase):
         self, collection_name: str, limit: Optional[int] = None
     ) -> Optional[GetResult]:
         try:
-            if PGVECTOR_PGCRYPTO:
-                stmt = select(
-                    DocumentChunk.id,
-                    pgcrypto_decrypt(
-                        DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text
-                    ).label("text"),
-                    pgcrypto_decrypt(
-                        DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
-                    ).label("vmetadata"),
-                ).where(DocumentChunk.collection_name == collection_name)
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-                results = self.session.execute(stmt).all()
-                ids = [[row.id for row in results]]
-                documents = [[row.text for row in results]]
-                metadatas = [[row.vmetadata for row in results]]
-            else:
-
-                query = self.session.query(DocumentChunk).filter(
-                    DocumentChunk.collection_name == collection_name
-                )
-                if limit is not None:
-                    query = query.limit(limit)
-
-                results = query.all()
-
-                if not results:
-                    return None
-
-                ids = [[result.id for result in results]]
-                documents = [[result.text for result in results]]
-                metadatas = [[result.vmetadata for result in results]]
+            stmt = self._build_query_stmt(collection_name, limit=limit)
+            results = self.session.execute(stmt).all()
 
             self.session.rollback()  # read-only transaction
-            return GetResult(ids=ids, documents=documents, metadatas=metadatas)
+            if not results and not PGVECTOR_PGCRYPTO:
+                return None
+            return self._rows_to_get_result(results)
         except Exception as e:
             self.session.rollback()
             log.exception(f"Error during get: {e}")
             return None
 
+    def get_vectors(
+        self, collection_name: str, ids: List[str]
+    ) -> Dict[str, List[float]]:
+        try:
+            stmt = self._build_vectors_stmt(collection_name, ids)
+            results = self.session.execute(stmt).all()
+
+            self.session.rollback()  # read-only transaction
+            return self._rows_to_vectors(results)
+        except Exception as e:
+            self.session.rollback()
+            log.exception(f"Error getting vectors: {e}")
+            return {}
+
     def delete(
         self,
         collection_name: str,
@@ -720,12 +817,8 @@ class PgvectorClient(VectorDBBase):
 
     def has_collection(self, collection_name: str) -> bool:
         try:
-            exists = (
-                self.session.query(DocumentChunk)
-                .filter(DocumentChunk.collection_name == collection_name)
-                .first()
-                is not None
-            )
+            stmt = self._build_has_collection_stmt(collection_name)
+            exists = self.session.execute(stmt).first() is not None
             self.session.rollback()  # read-only transaction
             return exists
         except Exception as e:
@@ -736,3 +829,129 @@ class PgvectorClient(VectorDBBase):
     def delete_collection(self, collection_name: str) -> None:
         self.delete(collection_name)
         log.info(f"Collection '{collection_name}' deleted.")
+
+    async def ahas_collection(self, collection_name: str) -> bool:
+        engine = await self.async_engine.get()
+        if engine is None:
+            return await super().ahas_collection(collection_name)
+
+        try:
+            async with engine.connect() as conn:
+                result = await conn.execute(
+                    self._build_has_collection_stmt(collection_name)
+                )
+                return result.first() is not None
+        except Exception as e:
+            log.exception(f"Error checking collection existence: {e}")
+            return False
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        engine = await self.async_engine.get()
+        if engine is None:
+            return await super().asearch(collection_name, vectors, filter, limit)
+
+        return await self._asearch(engine, [collection_name], vectors, filter, limit)
+
+    async def asearch_collections(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        limit: int = 10,
+    ) -> List[SearchResult]:
+        engine = await self.async_engine.get()
+        if engine is None:
+            return await run_in_vector_db_executor(
+                self.search_collections, collection_names, vectors, limit=limit
+            )
+
+        collection_names = [name for name in dict.fromkeys(collection_names) if name]
+        if not collection_names:
+            return []
+
+        result = await self._asearch(engine, collection_names, vectors, None, limit)
+        return [result] if result is not None else []
+
+    async def _asearch(
+        self,
+        engine,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        filter: Optional[Dict[str, Any]],
+        limit: Optional[int],
+    ) -> Optional[SearchResult]:
+        try:
+            if not vectors:
+                return None
+
+            # Adjust query vectors to VECTOR_LENGTH
+            vectors = [self.adjust_vector_length(vector) for vector in vectors]
+
+            stmt = self._build_search_stmt(collection_names, vectors, filter, limit)
+            async with engine.connect() as conn:
+                results = (await conn.execute(stmt)).all()
+
+            return self._search_rows_to_result(results, len(vectors))
+        except Exception as e:
+            log.exception(f"Error during search: {e}")
+            return None
+
+    async def aquery(
+        self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        engine = await self.async_engine.get()
+        if engine is None:
+            return await super().aquery(collection_name, filter, limit)
+
+        try:
+            stmt = self._build_query_stmt(collection_name, filter, limit)
+            async with engine.connect() as conn:
+                results = (await conn.execute(stmt)).all()
+
+            if not results:
+                return None
+            return self._rows_to_get_result(results)
+        except Exception as e:
+            log.exception(f"Error during query: {e}")
+            return None
+
+    async def aget_vectors(
+        self, collection_name: str, ids: List[str]
+    ) -> Dict[str, List[float]]:
+        engine = await self.async_engine.get()
+        if engine is None:
+            return await super().aget_vectors(collection_name, ids)
+
+        try:
+            stmt = self._build_vectors_stmt(collection_name, ids)
+            async with engine.connect() as conn:
+                results = (await conn.execute(stmt)).all()
+            return self._rows_to_vectors(results)
+        except Exception as e:
+            log.exception(f"Error getting vectors: {e}")
+            return {}
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        engine = await self.async_engine.get()
+        if engine is None:
+            return await super().aget(collection_name)
+
+        try:
+            stmt = self._build_query_stmt(collection_name)
+            async with engine.connect() as conn:
+                results = (await conn.execute(stmt)).all()
+
+            if not results and not PGVECTOR_PGCRYPTO:
+                return None
+            return self._rows_to_get_result(results)
+        except Exception as e:
+            log.exception(f"Error during get: {e}")
+            return None
+
+    async def aclose(self):
+        await self.async_engine.close()
@@ -40,6 +40,9 @@ log = logging.getLogger(__name__)
 
 
 class PineconeClient(VectorDBBase):
+    # search() only uses the first query vector
+    MULTI_VECTOR_SEARCH = False
+
     def __init__(self):
         self.collection_prefix = "open-webui"
 
@@ -2,11 +2,12 @@ from typing import Optional
 import logging
 from urllib.parse import urlparse
 
-from qdrant_client import QdrantClient as Qclient
+from qdrant_client import AsyncQdrantClient, QdrantClient as Qclient
 from qdrant_client.http.models import PointStruct
 from qdrant_client.models import models
 
 from open_webui.retrieval.vector.main import (
+    AsyncClientHandle,
     VectorDBBase,
     VectorItem,
     SearchResult,
@@ -41,6 +42,7 @@ class QdrantClient(VectorDBBase):
 
         if not self.QDRANT_URI:
             self.client = None
+            self.async_client = AsyncClientHandle(None)
             return
 
         # Unified handling for either scheme
@@ -49,7 +51,7 @@ class QdrantClient(VectorDBBase):
         http_port = parsed.port or 6333  # default REST port
 
         if self.PREFER_GRPC:
-            self.client = Qclient(
+            client_kwargs = dict(
                 host=host,
                 port=http_port,
                 grpc_port=self.GRPC_PORT,
@@ -58,12 +60,17 @@ class QdrantClient(VectorDBBase):
                 timeout=self.QDRANT_TIMEOUT,
             )
         else:
-            self.client = Qclient(
+            client_kwargs = dict(
                 url=self.QDRANT_URI,
                 api_key=self.QDRANT_API_KEY,
                 timeout=QDRANT_TIMEOUT,
             )
 
+        self.client = Qclient(**client_kwargs)
+        self.async_client = AsyncClientHandle(
+            lambda: AsyncQdrantClient(**client_kwargs)
+        )
+
     def _result_to_get_result(self, points) -> GetResult:
         ids = []
         documents = []
@@ -83,6 +90,39 @@ class QdrantClient(VectorDBBase):
             }
         )
 
+    def _get_scroll_filter(self, filter: dict) -> models.Filter:
+        return models.Filter(
+            should=[
+                models.FieldCondition(
+                    key=f"metadata.{key}", match=models.MatchValue(value=value)
+                )
+                for key, value in filter.items()
+            ]
+        )
+
+    def _get_query_requests(self, vectors, limit: int) -> list[models.QueryRequest]:
+        # One request per query vector, sent together in a single batch call
+        return [
+            models.QueryRequest(query=vector, limit=limit, with_payload=True)
+            for vector in vectors
+        ]
+
+    def _query_responses_to_search_result(self, query_responses) -> SearchResult:
+        ids, documents, metadatas, distances = [], [], [], []
+        for query_response in query_responses:
+            get_result = self._result_to_get_result(query_response.points)
+            ids.extend(get_result.ids)
+            documents.extend(get_result.documents)
+            metadatas.extend(get_result.metadatas)
+            # qdrant distance is [-1, 1], normalize to [0, 1]
+            distances.append(
+                [(point.score + 1.0) / 2.0 for point in query_response.points]
+            )
+
+        return SearchResult(
+            ids=ids, documents=documents, metadatas=metadatas, distances=distances
+        )
+
     def _create_collection(self, collection_name: str, dimension: int):
         collection_name_with_prefix = f"{self.collection_prefix}_{collection_name}"
         self.client.create_collection(
@@ -155,19 +195,11 @@ class QdrantClient(VectorDBBase):
         if limit is None:
             limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
 
-        query_response = self.client.query_points(
+        query_responses = self.client.query_batch_points(
             collection_name=f"{self.collection_prefix}_{collection_name}",
-            query=vectors[0],
-            limit=limit,
-        )
-        get_result = self._result_to_get_result(query_response.points)
-        return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
-            # qdrant distance is [-1, 1], normalize to [0, 1]
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+            requests=self._get_query_requests(vectors, limit),
         )
+        return self._query_responses_to_search_result(query_responses)
 
     def query(self, collection_name: str, filter: dict, limit: Optional[int] = None):
         # Construct the filter string for querying
@@ -177,17 +209,9 @@ class QdrantClient(VectorDBBase):
             if limit is None:
                 limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
 
-            field_conditions = []
-            for key, value in filter.items():
-                field_conditions.append(
-                    models.FieldCondition(
-                        key=f"metadata.{key}", match=models.MatchValue(value=value)
-                    )
-                )
-
             points = self.client.scroll(
                 collection_name=f"{self.collection_prefix}_{collection_name}",
-                scroll_filter=models.Filter(should=field_conditions),
+                scroll_filter=self._get_scroll_filter(filter),
                 limit=limit,
             )
             return self._result_to_get_result(points[0])
@@ -254,3 +278,69 @@ class QdrantClient(VectorDBBase):
         for collection_name in collection_names:
             if collection_name.name.startswith(self.collection_prefix):
                 self.client.delete_collection(collection_name=collection_name.name)
+
+    async def ahas_collection(self, collection_name: str) -> bool:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().ahas_collection(collection_name)
+
+        return await client.collection_exists(
+            f"{self.collection_prefix}_{collection_name}"
+        )
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        filter: Optional[dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().asearch(collection_name, vectors, filter, limit)
+
+        if limit is None:
+            limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
+
+        query_responses = await client.query_batch_points(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            requests=self._get_query_requests(vectors, limit),
+        )
+        return self._query_responses_to_search_result(query_responses)
+
+    async def aquery(
+        self, collection_name: str, filter: dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().aquery(collection_name, filter, limit)
+
+        if not await self.ahas_collection(collection_name):
+            return None
+        try:
+            if limit is None:
+                limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
+
+            points = await client.scroll(
+                collection_name=f"{self.collection_prefix}_{collection_name}",
+                scroll_filter=self._get_scroll_filter(filter),
+                limit=limit,
+            )
+            return self._result_to_get_result(points[0])
+        except Exception as e:
+            log.exception(f"Error querying a collection '{collection_name}': {e}")
+            return None
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        client = await self.async_client.get()
+        if client is None:
+            return await super().aget(collection_name)
+
+        points = await client.scroll(
+            collection_name=f"{self.collection_prefix}_{collection_name}",
+            limit=NO_LIMIT,  # otherwise qdrant would set limit to 10!
+        )
+        return self._result_to_get_result(points[0])
+
+    async def aclose(self):
+        await self.async_client.close()
@@ -18,6 +18,7 @@ from open_webui.retrieval.vector.main import (
     SearchResult,
     VectorDBBase,
     VectorItem,
+    run_in_vector_db_executor,
 )
 from qdrant_client import QdrantClient as Qclient
 from qdrant_client.http.exceptions import UnexpectedResponse
@@ -37,6 +38,12 @@ def _tenant_filter(tenant_id: str) -> models.FieldCondition:
     )
 
 
+def _tenants_filter(tenant_ids: List[str]) -> models.FieldCondition:
+    return models.FieldCondition(
+        key=TENANT_ID_FIELD, match=models.MatchAny(any=tenant_ids)
+    )
+
+
 def _metadata_filter(key: str, value: Any) -> models.FieldCondition:
     return models.FieldCondition(
         key=f"metadata.{key}", match=models.MatchValue(value=value)
@@ -270,19 +277,84 @@ class QdrantClient(VectorDBBase):
             log.debug(f"Collection {mt_collection} doesn't exist, search returns None")
             return None
 
-        tenant_filter = _tenant_filter(tenant_id)
-        query_response = self.client.query_points(
+        return self._search_tenants(
+            mt_collection, _tenant_filter(tenant_id), vectors, limit
+        )
+
+    def _search_tenants(
+        self,
+        mt_collection: str,
+        tenant_filter: models.FieldCondition,
+        vectors: List[List[float | int]],
+        limit: int,
+    ) -> SearchResult:
+        # One request per query vector, sent together in a single batch call
+        query_responses = self.client.query_batch_points(
             collection_name=mt_collection,
-            query=vectors[0],
-            limit=limit,
-            query_filter=models.Filter(must=[tenant_filter]),
+            requests=[
+                models.QueryRequest(
+                    query=vector,
+                    limit=limit,
+                    filter=models.Filter(must=[tenant_filter]),
+                    with_payload=True,
+                )
+                for vector in vectors
+            ],
         )
-        get_result = self._result_to_get_result(query_response.points)
+
+        ids, documents, metadatas, distances = [], [], [], []
+        for query_response in query_responses:
+            get_result = self._result_to_get_result(query_response.points)
+            ids.extend(get_result.ids)
+            documents.extend(get_result.documents)
+            metadatas.extend(get_result.metadatas)
+            distances.append(
+                [(point.score + 1.0) / 2.0 for point in query_response.points]
+            )
         return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+            ids=ids, documents=documents, metadatas=metadatas, distances=distances
+        )
+
+    def search_collections(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float | int]],
+        limit: int = 10,
+    ) -> List[SearchResult]:
+        """
+        Search many logical collections with one batch call per shared
+        collection, matching any of their tenant IDs.
+        """
+        if not self.client or not vectors:
+            return []
+
+        tenants = {}
+        for collection_name in dict.fromkeys(collection_names):
+            if collection_name:
+                mt_collection, tenant_id = self._get_collection_and_tenant_id(
+                    collection_name
+                )
+                tenants.setdefault(mt_collection, []).append(tenant_id)
+
+        results = []
+        for mt_collection, tenant_ids in tenants.items():
+            if not self.client.collection_exists(collection_name=mt_collection):
+                continue
+            results.append(
+                self._search_tenants(
+                    mt_collection, _tenants_filter(tenant_ids), vectors, limit
+                )
+            )
+        return results
+
+    async def asearch_collections(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float | int]],
+        limit: int = 10,
+    ) -> List[SearchResult]:
+        return await run_in_vector_db_executor(
+            self.search_collections, collection_names, vectors, limit=limit
         )
 
     def query(
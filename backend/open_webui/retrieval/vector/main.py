@@ -1,6 +1,40 @@
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from open_webui.config import VECTOR_DB_MAX_WORKERS
+
+log = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_vector_db_executor() -> ThreadPoolExecutor:
+    """Shared, bounded pool that runs blocking vector DB calls for async callers."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=VECTOR_DB_MAX_WORKERS,
+                    thread_name_prefix="vector-db",
+                )
+    return _executor
+
+
+async def run_in_vector_db_executor(func: Callable, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_vector_db_executor(), functools.partial(func, *args, **kwargs)
+    )
 
 
 class VectorItem(BaseModel):
@@ -20,6 +54,63 @@ class SearchResult(GetResult):
     distances: Optional[List[List[float | int]]]
 
 
+class AsyncClientHandle:
+    """
+    Lazily created async client bound to the event loop that created it.
+
+    Async clients pool their connections per event loop, so callers running
+    on any other loop (e.g. asyncio.run in a worker thread) get None and
+    should fall back to the sync client. A handle without a factory always
+    returns None, for configurations the async client does not support.
+    """
+
+    def __init__(self, factory: Optional[Callable[[], Any]]):
+        self._factory = factory
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get(self) -> Any:
+        if self._factory is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._client is None:
+            # asyncio locks are bound to one loop
+            if self._lock_loop is not loop:
+                self._lock, self._lock_loop = asyncio.Lock(), loop
+
+            async with self._lock:
+                if self._client is None:
+                    client = self._factory()
+                    if inspect.isawaitable(client):
+                        client = await client
+
+                    if self._client is None:
+                        self._client, self._loop = client, loop
+                    else:
+                        # Another loop created its client in the meantime
+                        await self._close_client(client)
+
+        return self._client if self._loop is loop else None
+
+    @staticmethod
+    async def _close_client(client: Any):
+        for name in ("aclose", "close", "dispose"):
+            close = getattr(client, name, None)
+            if close is not None:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+                return
+
+    async def close(self):
+        client, self._client, self._loop = self._client, None, None
+        if client is not None:
+            await self._close_client(client)
+
+
 class VectorDBBase(ABC):
     """
     Abstract base class for all vector database backends.
@@ -29,8 +120,16 @@ class VectorDBBase(ABC):
 
     Any custom vector database integration must inherit from this class and
     implement all abstract methods.
+
+    The async variants (`asearch`, `aget`, `ainsert`, ...) run the sync
+    methods on a shared, bounded executor by default; backends with an async
+    client override them with native implementations.
     """
 
+    # Whether search() returns one result row per query vector. Backends that
+    # only search with the first vector are called once per vector instead.
+    MULTI_VECTOR_SEARCH = True
+
     @abstractmethod
     def has_collection(self, collection_name: str) -> bool:
         """Check if the collection exists in the vector DB."""
@@ -88,3 +187,143 @@ class VectorDBBase(ABC):
     def reset(self) -> None:
         """Reset the vector database by removing all collections or those matching a condition."""
         pass
+
+    def get_vectors(
+        self, collection_name: str, ids: List[str]
+    ) -> Dict[str, List[float]]:
+        """
+        Return the stored vectors of the given ids. Backends that cannot read
+        their vectors back return an empty dict and callers re-embed the text.
+        """
+        return {}
+
+    def begin_bulk_load(self) -> None:
+        """Called before writing many items; backends may pause index maintenance."""
+        pass
+
+    def end_bulk_load(self) -> None:
+        """Called after a bulk load; rebuilds whatever begin_bulk_load paused."""
+        pass
+
+    def _get_search_batches(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+    ) -> List[tuple[str, List[List[Union[float, int]]]]]:
+        batches = [vectors] if self.MULTI_VECTOR_SEARCH else [[v] for v in vectors]
+        return [
+            (collection_name, batch)
+            for collection_name in dict.fromkeys(collection_names)
+            if collection_name
+            for batch in batches
+            if batch
+        ]
+
+    def search_collections(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+        limit: int = 10,
+    ) -> List[SearchResult]:
+        """
+        Search several collections with several query vectors at once.
+
+        Returns partial results, each with one row per query vector, for the
+        caller to merge. By default every collection is searched with all
+        vectors in one call; backends that can filter on many collections in
+        one request override this with a single round-trip.
+        """
+        results = []
+        for collection_name, batch in self._get_search_batches(
+            collection_names, vectors
+        ):
+            result = self.search(collection_name, batch, limit=limit)
+            if result is not None:
+                results.append(result)
+        return results
+
+    async def ahas_collection(self, collection_name: str) -> bool:
+        return await run_in_vector_db_executor(self.has_collection, collection_name)
+
+    async def adelete_collection(self, collection_name: str) -> None:
+        return await run_in_vector_db_executor(self.delete_collection, collection_name)
+
+    async def ainsert(self, collection_name: str, items: List[VectorItem]) -> None:
+        return await run_in_vector_db_executor(self.insert, collection_name, items)
+
+    async def aupsert(self, collection_name: str, items: List[VectorItem]) -> None:
+        return await run_in_vector_db_executor(self.upsert, collection_name, items)
+
+    async def aget_vectors(
+        self, collection_name: str, ids: List[str]
+    ) -> Dict[str, List[float]]:
+        return await run_in_vector_db_executor(self.get_vectors, collection_name, ids)
+
+    async def asearch(
+        self,
+        collection_name: str,
+        vectors: List[List[Union[float, int]]],
+        filter: Optional[Dict] = None,
+        limit: int = 10,
+    ) -> Optional[SearchResult]:
+        return await run_in_vector_db_executor(
+            self.search, collection_name, vectors, filter=filter, limit=limit
+        )
+
+    async def asearch_collections(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+        limit: int = 10,
+    ) -> List[SearchResult]:
+        batches = self._get_search_batches(collection_names, vectors)
+        results = await asyncio.gather(
+            *[
+                self.asearch(collection_name, batch, limit=limit)
+                for collection_name, batch in batches
+            ],
+            return_exceptions=True,
+        )
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+
+        for (collection_name, _), result in zip(batches, results):
+            if isinstance(result, BaseException):
+                log.warning(f"Error searching collection {collection_name}: {result}")
+
+        return [
+            result
+            for result in results
+            if result is not None and not isinstance(result, BaseException)
+        ]
+
+    async def aquery(
+        self, collection_name: str, filter: Dict, limit: Optional[int] = None
+    ) -> Optional[GetResult]:
+        # Leave the backend's own default limit in place when none is given
+        kwargs = {} if limit is None else {"limit": limit}
+        return await run_in_vector_db_executor(
+            self.query, collection_name, filter, **kwargs
+        )
+
+    async def aget(self, collection_name: str) -> Optional[GetResult]:
+        return await run_in_vector_db_executor(self.get, collection_name)
+
+    async def adelete(
+        self,
+        collection_name: str,
+        ids: Optional[List[str]] = None,
+        filter: Optional[Dict] = None,
+    ) -> None:
+        return await run_in_vector_db_executor(
+            self.delete, collection_name, ids=ids, filter=filter
+        )
+
+    async def areset(self) -> None:
+        return await run_in_vector_db_executor(self.reset)
+
+    async def aclose(self) -> None:
+        """Release async clients and pooled connections on shutdown."""
+        pass
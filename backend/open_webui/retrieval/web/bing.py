@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import os
 from pprint import pprint
 from typing import Optional
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 import argparse
 
 log = logging.getLogger(__name__)
@@ -12,7 +13,7 @@ Documentation: https://docs.microsoft.com/en-us/bing/search-apis/bing-web-search
 """
 
 
-def search_bing(
+async def search_bing(
     subscription_key: str,
     endpoint: str,
     locale: str,
@@ -25,12 +26,14 @@ def search_bing(
     headers = {"Ocp-Apim-Subscription-Key": subscription_key}
 
     try:
-        response = requests.get(endpoint, headers=headers, params=params)
+        response = await WEB_SEARCH_CLIENT.get(
+            "bing", endpoint, headers=headers, params=params
+        )
         response.raise_for_status()
         json_response = response.json()
         results = json_response.get("webPages", {}).get("value", [])
         if filter_list:
-            results = get_filtered_results(results, filter_list)
+            results = await aget_filtered_results(results, filter_list)
         return [
             SearchResult(
                 link=result["url"],
@@ -67,5 +70,5 @@ def main():
 
     args = parser.parse_args()
 
-    results = search_bing(args.locale, args.query, args.count, args.filter)
+    results = asyncio.run(search_bing(args.locale, args.query, args.count, args.filter))
     pprint(results)
@@ -0,0 +1,210 @@
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from open_webui.config import (
+    ENABLE_WEB_SEARCH_CACHE,
+    WEB_PAGE_CACHE_SIZE,
+    WEB_PAGE_CACHE_TTL,
+    WEB_SEARCH_CACHE_BACKEND,
+    WEB_SEARCH_CACHE_DIR,
+    WEB_SEARCH_CACHE_ENGINE_TTL,
+    WEB_SEARCH_CACHE_SIZE,
+    WEB_SEARCH_CACHE_TTL,
+)
+from open_webui.retrieval.cache_store import DiskCacheStore, RedisCacheStore
+
+log = logging.getLogger(__name__)
+
+# Pages past their TTL are kept this long so they can still be revalidated
+PAGE_REVALIDATE_WINDOW = 24 * 60 * 60
+
+
+def get_cache_key(*parts: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def get_search_cache_ttl(engine: str) -> int:
+    try:
+        return int(WEB_SEARCH_CACHE_ENGINE_TTL.get(engine, WEB_SEARCH_CACHE_TTL))
+    except (TypeError, ValueError):
+        return WEB_SEARCH_CACHE_TTL
+
+
+class WebCache:
+    """
+    Two-level cache for web search.
+
+    Search results are keyed by engine, query and search settings and kept
+    for the engine's TTL (WEB_SEARCH_CACHE_TTL, or its entry in
+    WEB_SEARCH_CACHE_ENGINE_TTL). Loaded pages are keyed by loader engine and
+    URL and served as is for WEB_PAGE_CACHE_TTL, then kept with their
+    ETag/Last-Modified validators so loaders that support it can revalidate
+    them with a conditional request. Page embeddings are not stored here:
+    the embedding cache already serves unchanged chunks.
+
+    Each level is a size-bounded LRU, with an optional Redis or disk tier
+    behind it that is shared between workers and survives restarts.
+    """
+
+    def __init__(
+        self,
+        search_size: int,
+        page_size: int,
+        page_ttl: int = WEB_PAGE_CACHE_TTL,
+        store: Optional[Any] = None,
+    ):
+        self.search_size = search_size
+        self.page_size = page_size
+        self.page_ttl = page_ttl
+        self.store = store
+
+        self._search: OrderedDict[str, dict] = OrderedDict()
+        self._pages: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "search_hits": 0,
+            "search_misses": 0,
+            "page_hits": 0,
+            "page_revalidated": 0,
+            "page_misses": 0,
+        }
+
+    def _get_local(self, entries: OrderedDict, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if entry["expires_at"] < time.time():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return entry
+
+    def _set_local(self, entries: OrderedDict, size: int, key: str, entry: dict):
+        with self._lock:
+            entries[key] = entry
+            entries.move_to_end(key)
+            while len(entries) > size:
+                entries.popitem(last=False)
+
+    async def _get(self, entries: OrderedDict, size: int, key: str) -> Optional[dict]:
+        entry = self._get_local(entries, key)
+        if entry is None and self.store is not None:
+            try:
+                value = await asyncio.to_thread(self.store.get, key)
+                if value:
+                    entry = json.loads(zlib.decompress(value))
+                    if entry["expires_at"] >= time.time():
+                        self._set_local(entries, size, key, entry)
+                    else:
+                        entry = None
+            except Exception as e:
+                log.warning(f"Web cache {self.store.name} lookup failed: {e}")
+                entry = None
+        return entry
+
+    async def _set(self, entries: OrderedDict, size: int, key: str, entry: dict):
+        self._set_local(entries, size, key, entry)
+        if self.store is not None:
+            try:
+                await asyncio.to_thread(
+                    self.store.set,
+                    key,
+                    zlib.compress(json.dumps(entry).encode("utf-8")),
+                    entry["expires_at"] - time.time(),
+                )
+            except Exception as e:
+                log.warning(f"Web cache {self.store.name} write failed: {e}")
+
+    async def get_search_results(self, key: str) -> Optional[list[dict]]:
+        entry = await self._get(self._search, self.search_size, key)
+        self.stats["search_hits" if entry else "search_misses"] += 1
+        return entry["results"] if entry else None
+
+    async def set_search_results(self, key: str, results: list[dict], ttl: int):
+        await self._set(
+            self._search,
+            self.search_size,
+            key,
+            {"results": results, "expires_at": time.time() + ttl},
+        )
+
+    async def get_page(self, engine: str, url: str) -> Optional[dict]:
+        """
+        Returns the cached page, with `fresh` telling whether it can be used
+        without revalidation, or None.
+        """
+        entry = await self._get(self._pages, self.page_size, get_cache_key(engine, url))
+        if entry is None:
+            return None
+        return {**entry, "fresh": entry["fresh_until"] >= time.time()}
+
+    async def set_page(
+        self,
+        engine: str,
+        url: str,
+        document: dict,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        fresh_until = time.time() + self.page_ttl
+        await self._set(
+            self._pages,
+            self.page_size,
+            get_cache_key(engine, url),
+            {
+                "document": document,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fresh_until": fresh_until,
+                # Only pages that can be revalidated are worth keeping stale
+                "expires_at": fresh_until
+                + (PAGE_REVALIDATE_WINDOW if etag or last_modified else 0),
+            },
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            **self.stats,
+            "search_entries": len(self._search),
+            "page_entries": len(self._pages),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._search.clear()
+            self._pages.clear()
+
+
+def get_web_cache_store() -> Optional[Any]:
+    try:
+        if WEB_SEARCH_CACHE_BACKEND == "redis":
+            return RedisCacheStore("web")
+        if WEB_SEARCH_CACHE_BACKEND == "disk":
+            return DiskCacheStore(Path(WEB_SEARCH_CACHE_DIR) / "web.sqlite3")
+    except Exception as e:
+        log.warning(f"Web cache {WEB_SEARCH_CACHE_BACKEND} tier unavailable: {e}")
+    return None
+
+
+WEB_CACHE = (
+    WebCache(
+        WEB_SEARCH_CACHE_SIZE,
+        WEB_PAGE_CACHE_SIZE,
+        WEB_PAGE_CACHE_TTL,
+        get_web_cache_store(),
+    )
+    if ENABLE_WEB_SEARCH_CACHE
+    else None
+)
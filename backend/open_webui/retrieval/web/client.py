@@ -0,0 +1,204 @@
+import asyncio
+import email.utils
+import json
+import logging
+import random
+import time
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from open_webui.config import (
+    WEB_SEARCH_ENGINE_RATE_LIMITS,
+    WEB_SEARCH_MAX_RETRIES,
+    WEB_SEARCH_RETRY_BACKOFF,
+)
+from open_webui.utils.session_pool import get_client_session
+
+log = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Longest Retry-After honored before giving up on a request
+MAX_RETRY_DELAY = 30.0
+
+
+class SearchEngineHTTPError(Exception):
+    def __init__(self, status_code: int, reason: str, url: str):
+        # Query strings often carry API keys, keep them out of error messages
+        url = urlsplit(url)._replace(query="").geturl()
+        super().__init__(f"{status_code} {reason} for url: {url}")
+        self.status_code = status_code
+
+
+class SearchEngineResponse:
+    def __init__(self, url: str, status_code: int, reason: str, headers, body: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = body
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise SearchEngineHTTPError(self.status_code, self.reason, self.url)
+
+
+class EngineRateLimiter:
+    """Spaces out request starts for one engine and holds them after a 429"""
+
+    def __init__(self, requests_per_second: Optional[float] = None):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next = 0.0
+
+    async def wait(self):
+        now = time.monotonic()
+        start = max(now, self._next)
+        self._next = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def defer(self, delay: float):
+        self._next = max(self._next, time.monotonic() + delay)
+
+
+def get_retry_after(response: SearchEngineResponse) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(
+            email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0.0
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+class WebSearchClient:
+    """
+    Async HTTP client shared by the search engine adapters.
+
+    Requests go through the app-wide aiohttp connection pools, so repeat
+    searches reuse connections to the engine's API. Each engine gets its own
+    rate limiter (WEB_SEARCH_ENGINE_RATE_LIMITS); 429s, 5xx responses and
+    connection errors are retried up to WEB_SEARCH_MAX_RETRIES times,
+    waiting for Retry-After when the engine sends one and backing off
+    exponentially otherwise. A 429 also holds back the engine's other
+    in-flight searches until the wait is over.
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[dict] = None,
+        max_retries: int = WEB_SEARCH_MAX_RETRIES,
+        retry_backoff: float = WEB_SEARCH_RETRY_BACKOFF,
+    ):
+        self.rate_limits = rate_limits or {}
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._limiters: dict[str, EngineRateLimiter] = {}
+        self.stats: dict[str, dict[str, int]] = {}
+
+    def _get_limiter(self, engine: str) -> EngineRateLimiter:
+        limiter = self._limiters.get(engine)
+        if limiter is None:
+            try:
+                requests_per_second = float(self.rate_limits.get(engine) or 0)
+            except (TypeError, ValueError):
+                requests_per_second = 0
+            limiter = EngineRateLimiter(requests_per_second)
+            self._limiters[engine] = limiter
+        return limiter
+
+    def _count(self, engine: str, name: str):
+        stats = self.stats.setdefault(
+            engine, {"requests": 0, "retries": 0, "rate_limited": 0, "errors": 0}
+        )
+        stats[name] += 1
+
+    def _get_backoff(self, attempt: int) -> float:
+        delay = self.retry_backoff * 2**attempt
+        return delay + random.uniform(0, delay / 4)
+
+    async def request(
+        self,
+        engine: str,
+        method: str,
+        url: str,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> SearchEngineResponse:
+        limiter = self._get_limiter(engine)
+        client_timeout = aiohttp.ClientTimeout(total=timeout) if timeout else None
+
+        attempt = 0
+        while True:
+            await limiter.wait()
+            self._count(engine, "requests")
+
+            try:
+                async with get_client_session(url, timeout=client_timeout) as session:
+                    async with session.request(method, url, **kwargs) as response:
+                        result = SearchEngineResponse(
+                            str(response.url),
+                            response.status,
+                            response.reason or "",
+                            response.headers,
+                            await response.read(),
+                        )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    self._count(engine, "errors")
+                    raise
+                delay = self._get_backoff(attempt)
+                log.info(
+                    f"{engine} search request failed ({e}), retrying in {delay:.1f}s"
+                )
+            else:
+                if result.status_code not in RETRY_STATUSES:
+                    return result
+
+                retry_after = get_retry_after(result)
+                if result.status_code == 429:
+                    self._count(engine, "rate_limited")
+                if attempt >= self.max_retries or (retry_after or 0) > MAX_RETRY_DELAY:
+                    self._count(engine, "errors")
+                    return result
+
+                delay = max(retry_after or 0, self._get_backoff(attempt))
+                log.info(
+                    f"{engine} search returned {result.status_code}, retrying in {delay:.1f}s"
+                )
+                if result.status_code == 429:
+                    # The limiter holds this retry and the engine's other searches
+                    limiter.defer(delay)
+                    delay = 0
+
+            self._count(engine, "retries")
+            attempt += 1
+            if delay:
+                await asyncio.sleep(delay)
+
+    async def get(self, engine: str, url: str, **kwargs) -> SearchEngineResponse:
+        return await self.request(engine, "GET", url, **kwargs)
+
+    async def post(self, engine: str, url: str, **kwargs) -> SearchEngineResponse:
+        return await self.request(engine, "POST", url, **kwargs)
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        return {engine: dict(stats) for engine, stats in self.stats.items()}
+
+
+WEB_SEARCH_CLIENT = WebSearchClient(WEB_SEARCH_ENGINE_RATE_LIMITS)
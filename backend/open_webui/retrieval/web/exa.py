@@ -2,7 +2,7 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
-import requests
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
 from open_webui.retrieval.web.main import SearchResult
 
 log = logging.getLogger(__name__)
@@ -17,7 +17,7 @@ class ExaResult:
     text: str
 
 
-def search_exa(
+async def search_exa(
     api_key: str,
     query: str,
     count: int,
@@ -44,8 +44,8 @@ def search_exa(
     }
 
     try:
-        response = requests.post(
-            f"{EXA_API_BASE}/search", headers=headers, json=payload
+        response = await WEB_SEARCH_CLIENT.post(
+            "exa", f"{EXA_API_BASE}/search", headers=headers, json=payload
         )
         response.raise_for_status()
         data = response.json()
@@ -1,19 +1,19 @@
 import logging
 from typing import Optional, List
 
-import requests
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
 
 from fastapi import Request
 
 
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 from open_webui.utils.headers import include_user_info_headers
 from open_webui.env import FORWARD_SESSION_INFO_HEADER_CHAT_ID
 
 log = logging.getLogger(__name__)
 
 
-def search_external(
+async def search_external(
     request: Request,
     external_url: str,
     external_api_key: str,
@@ -33,7 +33,8 @@ def search_external(
         if chat_id:
             headers[FORWARD_SESSION_INFO_HEADER_CHAT_ID] = str(chat_id)
 
-        response = requests.post(
+        response = await WEB_SEARCH_CLIENT.post(
+            "external",
             external_url,
             headers=headers,
             json={
@@ -44,7 +45,7 @@ def search_external(
         response.raise_for_status()
         results = response.json()
         if filter_list:
-            results = get_filtered_results(results, filter_list)
+            results = await aget_filtered_results(results, filter_list)
         results = [
             SearchResult(
                 link=result.get("link"),
@@ -1,13 +1,13 @@
 import logging
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_google_pse(
+async def search_google_pse(
     api_key: str,
     search_engine_id: str,
     query: str,
@@ -46,7 +46,9 @@ def search_google_pse(
             "num": num_results_this_page,
             "start": start_index,
         }
-        response = requests.request("GET", url, headers=headers, params=params)
+        response = await WEB_SEARCH_CLIENT.get(
+            "google_pse", url, headers=headers, params=params
+        )
         response.raise_for_status()
         json_response = response.json()
         results = json_response.get("items", [])
@@ -60,7 +62,7 @@ def search_google_pse(
             break  # No more results from Google PSE, break the loop
 
     if filter_list:
-        all_results = get_filtered_results(all_results, filter_list)
+        all_results = await aget_filtered_results(all_results, filter_list)
 
     return [
         SearchResult(
@@ -1,13 +1,13 @@
 import logging
 
-import requests
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
 from open_webui.retrieval.web.main import SearchResult
 from yarl import URL
 
 log = logging.getLogger(__name__)
 
 
-def search_jina(
+async def search_jina(
     api_key: str, query: str, count: int, base_url: str = ""
 ) -> list[SearchResult]:
     """
@@ -33,7 +33,7 @@ def search_jina(
     payload = {"q": query, "count": count if count <= 10 else 10}
 
     url = str(URL(jina_search_endpoint))
-    response = requests.post(url, headers=headers, json=payload)
+    response = await WEB_SEARCH_CLIENT.post("jina", url, headers=headers, json=payload)
     response.raise_for_status()
     data = response.json()
 
@@ -1,3 +1,5 @@
+import asyncio
+
 import validators
 
 from typing import Optional
@@ -9,6 +11,14 @@ from open_webui.retrieval.web.utils import resolve_hostname
 from open_webui.utils.misc import is_string_allowed
 
 
+def get_result_domain(result) -> Optional[str]:
+    url = result.get("url") or result.get("link", "") or result.get("href", "")
+    if not validators.url(url):
+        return None
+
+    return urlparse(url).netloc or None
+
+
 def get_filtered_results(results, filter_list):
     if not filter_list:
         return results
@@ -16,11 +26,7 @@ def get_filtered_results(results, filter_list):
     filtered_results = []
 
     for result in results:
-        url = result.get("url") or result.get("link", "") or result.get("href", "")
-        if not validators.url(url):
-            continue
-
-        domain = urlparse(url).netloc
+        domain = get_result_domain(result)
         if not domain:
             continue
 
@@ -40,6 +46,38 @@ def get_filtered_results(results, filter_list):
     return filtered_results
 
 
+async def aget_filtered_results(results, filter_list):
+    """
+    get_filtered_results for async engines: every domain is resolved once,
+    concurrently, without blocking the event loop.
+    """
+    if not filter_list:
+        return results
+
+    loop = asyncio.get_running_loop()
+
+    async def resolve(domain: str) -> list[str]:
+        try:
+            return [info[4][0] for info in await loop.getaddrinfo(domain, None)]
+        except Exception:
+            return []
+
+    domains = [get_result_domain(result) for result in results]
+    unique_domains = list(dict.fromkeys(domain for domain in domains if domain))
+    addresses = dict(
+        zip(
+            unique_domains,
+            await asyncio.gather(*(resolve(domain) for domain in unique_domains)),
+        )
+    )
+
+    return [
+        result
+        for result, domain in zip(results, domains)
+        if domain and is_string_allowed([domain, *addresses[domain]], filter_list)
+    ]
+
+
 class SearchResult(BaseModel):
     link: str
     title: Optional[str]
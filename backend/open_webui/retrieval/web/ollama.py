@@ -2,13 +2,13 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_ollama_cloud(
+async def search_ollama_cloud(
     url: str,
     api_key: str,
     query: str,
@@ -29,7 +29,9 @@ def search_ollama_cloud(
     payload = {"query": query, "max_results": count}
 
     try:
-        response = requests.post(f"{url}/api/web_search", headers=headers, json=payload)
+        response = await WEB_SEARCH_CLIENT.post(
+            "ollama_cloud", f"{url}/api/web_search", headers=headers, json=payload
+        )
         response.raise_for_status()
         data = response.json()
 
@@ -37,7 +39,7 @@ def search_ollama_cloud(
         log.info(f"Found {len(results)} results")
 
         if filter_list:
-            results = get_filtered_results(results, filter_list)
+            results = await aget_filtered_results(results, filter_list)
 
         return [
             SearchResult(
@@ -1,8 +1,8 @@
 import logging
 from typing import Optional, Literal
-import requests
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
 
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 MODELS = Literal[
     "sonar",
@@ -17,7 +17,7 @@ SEARCH_CONTEXT_USAGE_LEVELS = Literal["low", "medium", "high"]
 log = logging.getLogger(__name__)
 
 
-def search_perplexity(
+async def search_perplexity(
     api_key: str,
     query: str,
     count: int,
@@ -67,7 +67,9 @@ def search_perplexity(
         }
 
         # Make the API request
-        response = requests.request("POST", url, json=payload, headers=headers)
+        response = await WEB_SEARCH_CLIENT.post(
+            "perplexity", url, json=payload, headers=headers
+        )
 
         # Parse the JSON response
         json_response = response.json()
@@ -89,7 +91,7 @@ def search_perplexity(
 
         if filter_list:
 
-            results = get_filtered_results(results, filter_list)
+            results = await aget_filtered_results(results, filter_list)
 
         return [
             SearchResult(
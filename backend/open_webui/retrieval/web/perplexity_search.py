@@ -1,14 +1,14 @@
 import logging
 from typing import Optional, Literal
-import requests
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
 
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 from open_webui.utils.headers import include_user_info_headers
 
 log = logging.getLogger(__name__)
 
 
-def search_perplexity_search(
+async def search_perplexity_search(
     api_key: str,
     query: str,
     count: int,
@@ -54,7 +54,9 @@ def search_perplexity_search(
             headers = include_user_info_headers(headers, user)
 
         # Make the API request
-        response = requests.request("POST", url, json=payload, headers=headers)
+        response = await WEB_SEARCH_CLIENT.post(
+            "perplexity_search", url, json=payload, headers=headers
+        )
         # Parse the JSON response
         json_response = response.json()
 
@@ -1,14 +1,13 @@
 import logging
 from typing import Optional
-from urllib.parse import urlencode
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_searchapi(
+async def search_searchapi(
     api_key: str,
     engine: str,
     query: str,
@@ -27,8 +26,7 @@ def search_searchapi(
 
     payload = {"engine": engine, "q": query, "api_key": api_key}
 
-    url = f"{url}?{urlencode(payload)}"
-    response = requests.request("GET", url)
+    response = await WEB_SEARCH_CLIENT.get("searchapi", url, params=payload)
 
     json_response = response.json()
     log.info(f"results from searchapi search: {json_response}")
@@ -37,7 +35,7 @@ def search_searchapi(
         json_response.get("organic_results", []), key=lambda x: x.get("position", 0)
     )
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
     return [
         SearchResult(
             link=result["link"],
@@ -1,13 +1,13 @@
 import logging
 from typing import Optional
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_searxng(
+async def search_searxng(
     query_url: str,
     query: str,
     count: int,
@@ -34,7 +34,7 @@ def search_searxng(
         list[SearchResult]: A list of SearchResults sorted by relevance score in descending order.
 
     Raise:
-        requests.exceptions.RequestException: If a request error occurs during the search process.
+        SearchEngineHTTPError: If the SearXNG server responds with an HTTP error.
     """
 
     # Default values for optional parameters are provided as empty strings or None when not specified.
@@ -62,7 +62,8 @@ def search_searxng(
 
     log.debug(f"searching {query_url}")
 
-    response = requests.get(
+    response = await WEB_SEARCH_CLIENT.get(
+        "searxng",
         query_url,
         headers={
             "User-Agent": "Open WebUI (https://github.com/open-webui/open-webui) RAG Bot",
@@ -80,7 +81,7 @@ def search_searxng(
     results = json_response.get("results", [])
     sorted_results = sorted(results, key=lambda x: x.get("score", 0), reverse=True)
     if filter_list:
-        sorted_results = get_filtered_results(sorted_results, filter_list)
+        sorted_results = await aget_filtered_results(sorted_results, filter_list)
     return [
         SearchResult(
             link=result["url"], title=result.get("title"), snippet=result.get("content")
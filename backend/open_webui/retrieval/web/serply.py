@@ -2,13 +2,13 @@ import logging
 from typing import Optional
 from urllib.parse import urlencode
 
-import requests
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_serply(
+async def search_serply(
     api_key: str,
     query: str,
     count: int,
@@ -46,7 +46,7 @@ def search_serply(
         "X-Proxy-Location": proxy_location,
     }
 
-    response = requests.request("GET", url, headers=headers)
+    response = await WEB_SEARCH_CLIENT.get("serply", url, headers=headers)
     response.raise_for_status()
 
     json_response = response.json()
@@ -56,7 +56,7 @@ def search_serply(
         json_response.get("results", []), key=lambda x: x.get("realPosition", 0)
     )
     if filter_list:
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
     return [
         SearchResult(
             link=result["link"],
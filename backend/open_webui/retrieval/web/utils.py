@@ -27,6 +27,7 @@ from langchain_core.documents import Document
 
 from open_webui.retrieval.loaders.tavily import TavilyLoader
 from open_webui.retrieval.loaders.external_web import ExternalWebLoader
+from open_webui.retrieval.web.cache import WebCache
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.config import (
     ENABLE_RAG_LOCAL_WEB_FETCH,
@@ -44,6 +45,7 @@ from open_webui.config import (
     WEB_FETCH_FILTER_LIST,
 )
 from open_webui.utils.misc import is_string_allowed
+from open_webui.utils.session_pool import get_client_session
 
 log = logging.getLogger(__name__)
 
@@ -551,23 +553,42 @@ class SafePlaywrightURLLoader(PlaywrightURLLoader, RateLimitMixin, URLProcessing
 class SafeWebBaseLoader(WebBaseLoader):
     """WebBaseLoader with enhanced error handling for URLs."""
 
-    def __init__(self, trust_env: bool = False, *args, **kwargs):
+    def __init__(
+        self,
+        trust_env: bool = False,
+        *args,
+        cache: Optional[WebCache] = None,
+        **kwargs,
+    ):
         """Initialize SafeWebBaseLoader
         Args:
             trust_env (bool, optional): set to True if using proxy to make web requests, for example
                 using http(s)_proxy environment variables. Defaults to False.
+            cache (WebCache, optional): serve and revalidate pages from this cache.
         """
         super().__init__(*args, **kwargs)
         self.trust_env = trust_env
+        self.cache = cache
+        # Validators of cached pages, and the ones each fetched page came with
+        self._cached_validators: Dict[str, dict] = {}
+        self._fetched_validators: Dict[str, dict] = {}
 
     async def _fetch(
         self, url: str, retries: int = 3, cooldown: int = 2, backoff: float = 1.5
-    ) -> str:
-        async with aiohttp.ClientSession(trust_env=self.trust_env) as session:
+    ) -> Optional[str]:
+        """Returns the page text, or None if the cached copy is still current."""
+        async with get_client_session(trust_env=self.trust_env) as session:
             for i in range(retries):
                 try:
+                    headers = dict(self.session.headers)
+                    if cached := self._cached_validators.get(url):
+                        if cached.get("etag"):
+                            headers["If-None-Match"] = cached["etag"]
+                        if cached.get("last_modified"):
+                            headers["If-Modified-Since"] = cached["last_modified"]
+
                     kwargs: Dict = dict(
-                        headers=self.session.headers,
+                        headers=headers,
                         cookies=self.session.cookies.get_dict(),
                     )
                     if not self.session.verify:
@@ -578,8 +599,15 @@ class SafeWebBaseLoader(WebBaseLoader):
                         **(self.requests_kwargs | kwargs),
                         allow_redirects=False,
                     ) as response:
+                        if response.status == 304 and cached:
+                            return None
                         if self.raise_for_status:
                             response.raise_for_status()
+                        if response.status == 200:
+                            self._fetched_validators[url] = {
+                                "etag": response.headers.get("ETag"),
+                                "last_modified": response.headers.get("Last-Modified"),
+                            }
                         return await response.text()
                 except aiohttp.ClientConnectionError as e:
                     if i == retries - 1:
@@ -634,8 +662,55 @@ class SafeWebBaseLoader(WebBaseLoader):
 
     async def alazy_load(self) -> AsyncIterator[Document]:
         """Async lazy load text from the url(s) in web_path."""
-        results = await self.ascrape_all(self.web_paths)
-        for path, soup in zip(self.web_paths, results):
+        cached = {}
+        if self.cache is not None:
+            entries = await asyncio.gather(
+                *(self.cache.get_page("safe_web", path) for path in self.web_paths)
+            )
+            cached = {
+                path: entry for path, entry in zip(self.web_paths, entries) if entry
+            }
+
+        # Fresh pages are not fetched, stale ones are revalidated
+        paths = [
+            path for path in self.web_paths if not cached.get(path, {}).get("fresh")
+        ]
+        self._cached_validators = {
+            path: cached[path] for path in paths if path in cached
+        }
+        results = await self.fetch_all(paths)
+
+        loaded = [
+            (path, text) for path, text in zip(paths, results) if text is not None
+        ]
+        soups = dict(
+            zip(
+                [path for path, _ in loaded],
+                self._unpack_fetch_results(
+                    [text for _, text in loaded], [path for path, _ in loaded]
+                ),
+            )
+        )
+
+        for path in self.web_paths:
+            if path not in soups:
+                document = cached[path]["document"]
+                if self.cache is not None:
+                    if cached[path].get("fresh"):
+                        self.cache.stats["page_hits"] += 1
+                    else:
+                        self.cache.stats["page_revalidated"] += 1
+                        await self.cache.set_page(
+                            "safe_web",
+                            path,
+                            document,
+                            cached[path].get("etag"),
+                            cached[path].get("last_modified"),
+                        )
+                yield Document(**document)
+                continue
+
+            soup = soups[path]
             text = soup.get_text(**self.bs_get_text_kwargs)
             metadata = {"source": path}
             if title := soup.find("title"):
@@ -646,6 +721,17 @@ class SafeWebBaseLoader(WebBaseLoader):
                 )
             if html := soup.find("html"):
                 metadata["language"] = html.get("lang", "No language found.")
+
+            if self.cache is not None:
+                self.cache.stats["page_misses"] += 1
+                # Failed fetches and error pages are not cached
+                if path in self._fetched_validators and text.strip():
+                    await self.cache.set_page(
+                        "safe_web",
+                        path,
+                        {"page_content": text, "metadata": metadata},
+                        **self._fetched_validators[path],
+                    )
             yield Document(page_content=text, metadata=metadata)
 
     async def aload(self) -> list[Document]:
@@ -653,11 +739,60 @@ class SafeWebBaseLoader(WebBaseLoader):
         return [document async for document in self.alazy_load()]
 
 
+class CachedWebLoader(BaseLoader):
+    """Serves fresh pages from a WebCache and loads the rest with another loader."""
+
+    def __init__(
+        self,
+        cache: WebCache,
+        engine: str,
+        loader_class: type,
+        web_loader_args: Dict[str, Any],
+    ):
+        self.cache = cache
+        self.engine = engine
+        self.loader_class = loader_class
+        self.web_loader_args = web_loader_args
+        self.web_paths = web_loader_args["web_paths"]
+
+    def lazy_load(self) -> Iterator[Document]:
+        yield from self.loader_class(**self.web_loader_args).lazy_load()
+
+    async def aload(self) -> list[Document]:
+        entries = await asyncio.gather(
+            *(self.cache.get_page(self.engine, path) for path in self.web_paths)
+        )
+        docs = []
+        missing = []
+        for path, entry in zip(self.web_paths, entries):
+            if entry and entry["fresh"]:
+                self.cache.stats["page_hits"] += 1
+                docs.append(Document(**entry["document"]))
+            else:
+                self.cache.stats["page_misses"] += 1
+                missing.append(path)
+
+        if missing:
+            loader = self.loader_class(**{**self.web_loader_args, "web_paths": missing})
+            loaded = await loader.aload()
+            for doc in loaded:
+                source = doc.metadata.get("source")
+                if source in missing and doc.page_content.strip():
+                    await self.cache.set_page(
+                        self.engine,
+                        source,
+                        {"page_content": doc.page_content, "metadata": doc.metadata},
+                    )
+            docs.extend(loaded)
+        return docs
+
+
 def get_web_loader(
     urls: Union[str, Sequence[str]],
     verify_ssl: bool = True,
     requests_per_second: int = 2,
     trust_env: bool = False,
+    cache: Optional[WebCache] = None,
 ):
     # Check if the URLs are valid
     safe_urls = safe_validate_urls([urls] if isinstance(urls, str) else urls)
@@ -717,6 +852,13 @@ def get_web_loader(
         web_loader_args["external_api_key"] = EXTERNAL_WEB_LOADER_API_KEY.value
 
     if WebLoaderClass:
+        if cache is not None and WebLoaderClass is SafeWebBaseLoader:
+            web_loader_args["cache"] = cache
+        elif cache is not None:
+            return CachedWebLoader(
+                cache, WEB_LOADER_ENGINE.value, WebLoaderClass, web_loader_args
+            )
+
         web_loader = WebLoaderClass(**web_loader_args)
 
         log.debug(
@@ -1,14 +1,14 @@
 import logging
 from typing import Optional
 
-import requests
-from requests.auth import HTTPDigestAuth
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from aiohttp import DigestAuthMiddleware
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 
 log = logging.getLogger(__name__)
 
 
-def search_yacy(
+async def search_yacy(
     query_url: str,
     username: Optional[str],
     password: Optional[str],
@@ -32,13 +32,13 @@ def search_yacy(
         list[SearchResult]: A list of SearchResults sorted by relevance score in descending order.
 
     Raise:
-        requests.exceptions.RequestException: If a request error occurs during the search process.
+        SearchEngineHTTPError: If the Yacy server responds with an HTTP error.
     """
 
     # Use authentication if either username or password is set
-    yacy_auth = None
+    yacy_auth = ()
     if username or password:
-        yacy_auth = HTTPDigestAuth(username, password)
+        yacy_auth = (DigestAuthMiddleware(username or "", password or ""),)
 
     params = {
         "query": query,
@@ -55,9 +55,10 @@ def search_yacy(
 
     log.debug(f"searching {query_url}")
 
-    response = requests.get(
+    response = await WEB_SEARCH_CLIENT.get(
+        "yacy",
         query_url,
-        auth=yacy_auth,
+        middlewares=yacy_auth,
         headers={
             "User-Agent": "Open WebUI (https://github.com/open-webui/open-webui) RAG Bot",
             "Accept": "text/html",
@@ -74,7 +75,7 @@ def search_yacy(
     results = json_response.get("channels", [{}])[0].get("items", [])
     sorted_results = sorted(results, key=lambda x: x.get("ranking", 0), reverse=True)
     if filter_list:
-        sorted_results = get_filtered_results(sorted_results, filter_list)
+        sorted_results = await aget_filtered_results(sorted_results, filter_list)
     return [
         SearchResult(
             link=result["link"],
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import io
 import json
@@ -5,11 +6,11 @@ import logging
 import os
 from typing import Optional, List
 
-import requests
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
 
 from fastapi import Request
 
-from open_webui.retrieval.web.main import SearchResult, get_filtered_results
+from open_webui.retrieval.web.main import SearchResult, aget_filtered_results
 from open_webui.utils.headers import include_user_info_headers
 from open_webui.env import FORWARD_SESSION_INFO_HEADER_CHAT_ID
 
@@ -30,7 +31,7 @@ def xml_element_contents_to_string(element: Element) -> str:
     return "".join(buffer)
 
 
-def search_yandex(
+async def search_yandex(
     request: Request,
     yandex_search_url: str,
     yandex_search_api_key: str,
@@ -72,7 +73,8 @@ def search_yandex(
         payload["groupSpec"]["groupsOnPage"] = count
         payload["groupSpec"]["docsInGroup"] = 1
 
-        response = requests.post(
+        response = await WEB_SEARCH_CLIENT.post(
+            "yandex",
             (
                 "https://searchapi.api.cloud.yandex.net/v2/web/search"
                 if yandex_search_url == ""
@@ -111,7 +113,7 @@ def search_yandex(
                 }
             )
 
-        results = get_filtered_results(results, filter_list)
+        results = await aget_filtered_results(results, filter_list)
 
         results = [
             SearchResult(
@@ -135,30 +137,33 @@ if __name__ == "__main__":
     from starlette.datastructures import Headers
     from fastapi import FastAPI
 
-    result = search_yandex(
-        Request(
-            {
-                "type": "http",
-                "asgi.version": "3.0",
-                "asgi.spec_version": "2.0",
-                "method": "GET",
-                "path": "/internal",
-                "query_string": b"",
-                "headers": Headers({}).raw,
-                "client": ("127.0.0.1", 12345),
-                "server": ("127.0.0.1", 80),
-                "scheme": "http",
-                "app": FastAPI(),
-            },
-            None,
-        ),
-        os.environ.get("YANDEX_WEB_SEARCH_URL", ""),
-        os.environ.get("YANDEX_WEB_SEARCH_API_KEY", ""),
-        os.environ.get(
-            "YANDEX_WEB_SEARCH_CONFIG", '{"query": {"searchType": "SEARCH_TYPE_COM"}}'
-        ),
-        "TOP movies of the past year",
-        3,
+    result = asyncio.run(
+        search_yandex(
+            Request(
+                {
+                    "type": "http",
+                    "asgi.version": "3.0",
+                    "asgi.spec_version": "2.0",
+                    "method": "GET",
+                    "path": "/internal",
+                    "query_string": b"",
+                    "headers": Headers({}).raw,
+                    "client": ("127.0.0.1", 12345),
+                    "server": ("127.0.0.1", 80),
+                    "scheme": "http",
+                    "app": FastAPI(),
+                },
+                None,
+            ),
+            os.environ.get("YANDEX_WEB_SEARCH_URL", ""),
+            os.environ.get("YANDEX_WEB_SEARCH_API_KEY", ""),
+            os.environ.get(
+                "YANDEX_WEB_SEARCH_CONFIG",
+                '{"query": {"searchType": "SEARCH_TYPE_COM"}}',
+            ),
+            "TOP movies of the past year",
+            3,
+        )
     )
 
     print(result)
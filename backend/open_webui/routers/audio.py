@@ -37,6 +37,7 @@ from open_webui.utils.misc import strict_match_mime_type
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_permission
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.session_pool import get_client_session
 from open_webui.config import (
     WHISPER_MODEL_AUTO_UPDATE,
     WHISPER_COMPUTE_TYPE,
@@ -373,8 +374,8 @@ async def speech(request: Request, user=Depends(get_verified_user)):
 
         try:
             timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
-            async with aiohttp.ClientSession(
-                timeout=timeout, trust_env=True
+            async with get_client_session(
+                request.app.state.config.TTS_OPENAI_API_BASE_URL, timeout=timeout
             ) as session:
                 payload = {
                     **payload,
@@ -438,8 +439,8 @@ async def speech(request: Request, user=Depends(get_verified_user)):
 
         try:
             timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
-            async with aiohttp.ClientSession(
-                timeout=timeout, trust_env=True
+            async with get_client_session(
+                ELEVENLABS_API_BASE_URL, timeout=timeout
             ) as session:
                 async with session.post(
                     f"{ELEVENLABS_API_BASE_URL}/v1/text-to-speech/{voice_id}",
@@ -500,8 +501,9 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                 <voice name="{language}">{html.escape(payload["input"])}</voice>
             </speak>"""
             timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
-            async with aiohttp.ClientSession(
-                timeout=timeout, trust_env=True
+            async with get_client_session(
+                base_url or f"https://{region}.tts.speech.microsoft.com",
+                timeout=timeout,
             ) as session:
                 async with session.post(
                     (base_url or f"https://{region}.tts.speech.microsoft.com")
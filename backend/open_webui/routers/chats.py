@@ -23,6 +23,7 @@ from open_webui.models.chats import (
     ChatHistoryStats,
     MessageStats,
 )
+from open_webui.models.chat_messages import ChatMessages
 from open_webui.models.tags import TagModel, Tags
 from open_webui.models.folders import Folders
 from open_webui.internal.db import get_session
@@ -978,6 +979,36 @@ async def get_chat_by_id(
         )
 
 
+############################
+# GetChatMessagesById
+############################
+
+
+@router.get("/{id}/messages", response_model=list[dict])
+async def get_chat_messages_by_id(
+    id: str,
+    message_id: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 50,
+    user=Depends(get_verified_user),
+    db: Session = Depends(get_session),
+):
+    if Chats.get_chat_user_id_by_id(id, db=db) != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail=ERROR_MESSAGES.NOT_FOUND
+        )
+
+    # Defaults to the branch the user is looking at
+    if message_id is None:
+        message_id = Chats.get_current_message_id_by_id(id, db=db)
+        if message_id is None:
+            return []
+
+    return ChatMessages.get_message_branch_by_chat_id(
+        id, message_id=message_id, skip=skip, limit=limit, db=db
+    )
+
+
 ############################
 # UpdateChatById
 ############################
@@ -1,5 +1,7 @@
 import logging
+import mimetypes
 import os
+import time
 import uuid
 import json
 from pathlib import Path
@@ -26,10 +28,12 @@ from open_webui.internal.db import get_session, SessionLocal
 
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.bm25 import BM25_INDEXES
 
 from open_webui.models.channels import Channels
 from open_webui.models.users import Users
 from open_webui.models.files import (
+    FILE_STATUS_BUS,
     FileForm,
     FileModel,
     FileModelResponse,
@@ -264,7 +268,7 @@ def upload_file_handler(
         id = str(uuid.uuid4())
         name = filename
         filename = f"{id}_{filename}"
-        contents, file_path = Storage.upload_file(
+        size, file_path = Storage.upload_file(
             file.file,
             filename,
             {
@@ -292,7 +296,7 @@ def upload_file_handler(
                             if isinstance(file.content_type, str)
                             else None
                         ),
-                        "size": len(contents),
+                        "size": size,
                         "data": file_metadata,
                     },
                 }
@@ -438,6 +442,8 @@ async def delete_all_files(
         try:
             Storage.delete_all_files()
             VECTOR_DB_CLIENT.reset()
+            if BM25_INDEXES is not None:
+                BM25_INDEXES.reset()
         except Exception as e:
             log.exception(e)
             log.error("Error deleting files")
@@ -505,33 +511,56 @@ async def get_file_process_status(
     ):
         if stream:
             MAX_FILE_PROCESSING_DURATION = 3600 * 2
+            FILE_STATUS_RECHECK_INTERVAL = 300
 
             async def event_stream(file_id):
                 # NOTE: We intentionally do NOT capture the request's db session here.
-                # Each poll creates its own short-lived session to avoid holding a
-                # connection for hours. A WebSocket push would be more efficient.
-                for _ in range(MAX_FILE_PROCESSING_DURATION):
-                    file_item = Files.get_file_by_id(file_id)  # Creates own session
-                    if file_item:
-                        data = file_item.model_dump().get("data", {})
+                # The status is read once (with its own short-lived session) and
+                # again only if pushed events may have been missed; otherwise the
+                # stream sleeps until FILE_STATUS_BUS delivers a transition.
+                deadline = time.monotonic() + MAX_FILE_PROCESSING_DURATION
+                last_status = None
+                event = None
+
+                # Subscribe before reading so no transition can slip in between
+                with FILE_STATUS_BUS.subscribe(file_id) as queue:
+                    while True:
+                        if event is None:
+                            file_item = Files.get_file_by_id(file_id)
+                            if not file_item:
+                                yield f"data: {json.dumps({'status': 'not_found'})}\n\n"
+                                break
+                            data = file_item.model_dump().get("data") or {}
+                        else:
+                            data = event
+
                         status = data.get("status")
+                        if not status:
+                            # Legacy
+                            break
 
-                        if status:
-                            event = {"status": status}
+                        if status != last_status:
+                            last_status = status
+                            payload = {"status": status}
                             if status == "failed":
-                                event["error"] = data.get("error")
+                                payload["error"] = data.get("error")
+                            yield f"data: {json.dumps(payload)}\n\n"
 
-                            yield f"data: {json.dumps(event)}\n\n"
-                            if status in ("completed", "failed"):
-                                break
-                        else:
-                            # Legacy
+                        if status in ("completed", "failed"):
+                            break
+
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
                             break
-                    else:
-                        yield f"data: {json.dumps({'status': 'not_found'})}\n\n"
-                        break
 
-                    await asyncio.sleep(1)
+                        try:
+                            # Re-read now and then in case a pushed event was lost
+                            event = await asyncio.wait_for(
+                                queue.get(),
+                                timeout=min(remaining, FILE_STATUS_RECHECK_INTERVAL),
+                            )
+                        except asyncio.TimeoutError:
+                            event = None
 
             return StreamingResponse(
                 event_stream(file.id),
@@ -630,6 +659,31 @@ def update_file_data_content_by_id(
 ############################
 
 
+async def get_file_response(
+    path: str, headers: Optional[dict] = None, media_type: Optional[str] = None
+):
+    """
+    Streams files from remote storage through without a local copy; files on
+    disk are served with FileResponse and its range support.
+    """
+    stream = await asyncio.to_thread(Storage.stream_file, path)
+    if stream is not None:
+        chunks, size = stream
+        if size is not None:
+            headers = {**(headers or {}), "Content-Length": str(size)}
+        # Same default as FileResponse, guessed from the file name
+        media_type = media_type or mimetypes.guess_type(path)[0]
+        return StreamingResponse(chunks, headers=headers, media_type=media_type)
+
+    file_path = Path(Storage.get_file(path))
+    if not file_path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ERROR_MESSAGES.NOT_FOUND,
+        )
+    return FileResponse(file_path, headers=headers, media_type=media_type)
+
+
 @router.get("/{id}/content")
 async def get_file_content_by_id(
     id: str,
@@ -651,44 +705,32 @@ async def get_file_content_by_id(
         or has_access_to_file(id, "read", user, db=db)
     ):
         try:
-            file_path = Storage.get_file(file.path)
-            file_path = Path(file_path)
-
-            # Check if the file already exists in the cache
-            if file_path.is_file():
-                # Handle Unicode filenames
-                filename = file.meta.get("name", file.filename)
-                encoded_filename = quote(filename)  # RFC5987 encoding
-
-                content_type = file.meta.get("content_type")
-                filename = file.meta.get("name", file.filename)
-                encoded_filename = quote(filename)
-                headers = {}
-
-                if attachment:
+            # Handle Unicode filenames
+            content_type = file.meta.get("content_type")
+            filename = file.meta.get("name", file.filename)
+            encoded_filename = quote(filename)  # RFC5987 encoding
+            headers = {}
+
+            if attachment:
+                headers["Content-Disposition"] = (
+                    f"attachment; filename*=UTF-8''{encoded_filename}"
+                )
+            else:
+                if content_type == "application/pdf" or filename.lower().endswith(
+                    ".pdf"
+                ):
+                    headers["Content-Disposition"] = (
+                        f"inline; filename*=UTF-8''{encoded_filename}"
+                    )
+                    content_type = "application/pdf"
+                elif content_type != "text/plain":
                     headers["Content-Disposition"] = (
                         f"attachment; filename*=UTF-8''{encoded_filename}"
                     )
-                else:
-                    if content_type == "application/pdf" or filename.lower().endswith(
-                        ".pdf"
-                    ):
-                        headers["Content-Disposition"] = (
-                            f"inline; filename*=UTF-8''{encoded_filename}"
-                        )
-                        content_type = "application/pdf"
-                    elif content_type != "text/plain":
-                        headers["Content-Disposition"] = (
-                            f"attachment; filename*=UTF-8''{encoded_filename}"
-                        )
-
-                return FileResponse(file_path, headers=headers, media_type=content_type)
 
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=ERROR_MESSAGES.NOT_FOUND,
-                )
+            return await get_file_response(
+                file.path, headers=headers, media_type=content_type
+            )
         except Exception as e:
             log.exception(e)
             log.error("Error getting file content")
@@ -728,18 +770,7 @@ async def get_html_file_content_by_id(
         or has_access_to_file(id, "read", user, db=db)
     ):
         try:
-            file_path = Storage.get_file(file.path)
-            file_path = Path(file_path)
-
-            # Check if the file already exists in the cache
-            if file_path.is_file():
-                log.info(f"file_path: {file_path}")
-                return FileResponse(file_path)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=ERROR_MESSAGES.NOT_FOUND,
-                )
+            return await get_file_response(file.path)
         except Exception as e:
             log.exception(e)
             log.error("Error getting file content")
@@ -781,17 +812,7 @@ async def get_file_content_by_id(
         }
 
         if file_path:
-            file_path = Storage.get_file(file_path)
-            file_path = Path(file_path)
-
-            # Check if the file already exists in the cache
-            if file_path.is_file():
-                return FileResponse(file_path, headers=headers)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=ERROR_MESSAGES.NOT_FOUND,
-                )
+            return await get_file_response(file_path, headers=headers)
         else:
             # File path doesn’t exist, return the content as .txt if possible
             file_content = file.content.get("content", "")
@@ -850,6 +871,10 @@ async def delete_file_by_id(
                     VECTOR_DB_CLIENT.delete(
                         collection_name=knowledge.id, filter={"hash": file.hash}
                     )
+                if BM25_INDEXES is not None:
+                    BM25_INDEXES.delete(knowledge.id, filter={"file_id": id})
+                    if file.hash:
+                        BM25_INDEXES.delete(knowledge.id, filter={"hash": file.hash})
             except Exception as e:
                 log.debug(f"KB embedding cleanup for {knowledge.id}: {e}")
 
@@ -858,6 +883,8 @@ async def delete_file_by_id(
             try:
                 Storage.delete_file(file.path)
                 VECTOR_DB_CLIENT.delete(collection_name=f"file-{id}")
+                if BM25_INDEXES is not None:
+                    BM25_INDEXES.drop(f"file-{id}")
             except Exception as e:
                 log.exception(e)
                 log.error("Error deleting files")
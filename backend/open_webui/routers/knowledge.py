@@ -19,6 +19,7 @@ from open_webui.models.knowledge import (
 )
 from open_webui.models.files import Files, FileModel, FileMetadataResponse
 from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.bm25 import BM25_INDEXES
 from open_webui.routers.retrieval import (
     process_file,
     ProcessFileForm,
@@ -313,48 +314,63 @@ async def reindex_knowledge_files(
 
     log.info(f"Starting reindexing for {len(knowledge_bases)} knowledge bases")
 
-    for knowledge_base in knowledge_bases:
-        try:
-            files = Knowledges.get_files_by_id(knowledge_base.id, db=db)
+    # Lets the vector DB defer index maintenance until every file is loaded
+    await run_in_threadpool(VECTOR_DB_CLIENT.begin_bulk_load)
+    try:
+        for knowledge_base in knowledge_bases:
             try:
-                if VECTOR_DB_CLIENT.has_collection(collection_name=knowledge_base.id):
-                    VECTOR_DB_CLIENT.delete_collection(
-                        collection_name=knowledge_base.id
-                    )
-            except Exception as e:
-                log.error(f"Error deleting collection {knowledge_base.id}: {str(e)}")
-                continue  # Skip, don't raise
-
-            failed_files = []
-            for file in files:
+                files = Knowledges.get_files_by_id(knowledge_base.id, db=db)
                 try:
-                    await run_in_threadpool(
-                        process_file,
-                        request,
-                        ProcessFileForm(
-                            file_id=file.id, collection_name=knowledge_base.id
-                        ),
-                        user=user,
-                        db=db,
-                    )
+                    if VECTOR_DB_CLIENT.has_collection(
+                        collection_name=knowledge_base.id
+                    ):
+                        VECTOR_DB_CLIENT.delete_collection(
+                            collection_name=knowledge_base.id
+                        )
+                    if BM25_INDEXES is not None:
+                        BM25_INDEXES.drop(knowledge_base.id)
                 except Exception as e:
                     log.error(
-                        f"Error processing file {file.filename} (ID: {file.id}): {str(e)}"
+                        f"Error deleting collection {knowledge_base.id}: {str(e)}"
                     )
-                    failed_files.append({"file_id": file.id, "error": str(e)})
-                    continue
+                    continue  # Skip, don't raise
+
+                failed_files = []
+                for file in files:
+                    try:
+                        await run_in_threadpool(
+                            process_file,
+                            request,
+                            ProcessFileForm(
+                                file_id=file.id, collection_name=knowledge_base.id
+                            ),
+                            user=user,
+                            db=db,
+                        )
+                    except Exception as e:
+                        log.error(
+                            f"Error processing file {file.filename} (ID: {file.id}): {str(e)}"
+                        )
+                        failed_files.append({"file_id": file.id, "error": str(e)})
+                        continue
 
-        except Exception as e:
-            log.error(f"Error processing knowledge base {knowledge_base.id}: {str(e)}")
-            # Don't raise, just continue
-            continue
+            except Exception as e:
+                log.error(
+                    f"Error processing knowledge base {knowledge_base.id}: {str(e)}"
+                )
+                # Don't raise, just continue
+                continue
 
-        if failed_files:
-            log.warning(
-                f"Failed to process {len(failed_files)} files in knowledge base {knowledge_base.id}"
-            )
-            for failed in failed_files:
-                log.warning(f"File ID: {failed['file_id']}, Error: {failed['error']}")
+            if failed_files:
+                log.warning(
+                    f"Failed to process {len(failed_files)} files in knowledge base {knowledge_base.id}"
+                )
+                for failed in failed_files:
+                    log.warning(
+                        f"File ID: {failed['file_id']}, Error: {failed['error']}"
+                    )
+    finally:
+        await run_in_threadpool(VECTOR_DB_CLIENT.end_bulk_load)
 
     log.info(f"Reindexing completed.")
     return True
@@ -768,6 +784,8 @@ def update_file_from_knowledge_by_id(
     VECTOR_DB_CLIENT.delete(
         collection_name=knowledge.id, filter={"file_id": form_data.file_id}
     )
+    if BM25_INDEXES is not None:
+        BM25_INDEXES.delete(knowledge.id, filter={"file_id": form_data.file_id})
 
     # Add content to the vector database
     try:
@@ -851,6 +869,10 @@ def remove_file_from_knowledge_by_id(
         VECTOR_DB_CLIENT.delete(
             collection_name=knowledge.id, filter={"hash": file.hash}
         )  # Remove by hash as well in case of duplicates
+
+        if BM25_INDEXES is not None:
+            BM25_INDEXES.delete(knowledge.id, filter={"file_id": form_data.file_id})
+            BM25_INDEXES.delete(knowledge.id, filter={"hash": file.hash})
     except Exception as e:
         log.debug("This was most likely caused by bypassing embedding processing")
         log.debug(e)
@@ -862,6 +884,8 @@ def remove_file_from_knowledge_by_id(
             file_collection = f"file-{form_data.file_id}"
             if VECTOR_DB_CLIENT.has_collection(collection_name=file_collection):
                 VECTOR_DB_CLIENT.delete_collection(collection_name=file_collection)
+            if BM25_INDEXES is not None:
+                BM25_INDEXES.drop(file_collection)
         except Exception as e:
             log.debug("This was most likely caused by bypassing embedding processing")
             log.debug(e)
@@ -950,6 +974,9 @@ async def delete_knowledge_by_id(
         log.debug(e)
         pass
 
+    if BM25_INDEXES is not None:
+        BM25_INDEXES.drop(id)
+
     # Remove knowledge base embedding
     remove_knowledge_base_metadata_embedding(id)
 
@@ -995,6 +1022,9 @@ async def reset_knowledge_by_id(
         log.debug(e)
         pass
 
+    if BM25_INDEXES is not None:
+        BM25_INDEXES.drop(id)
+
     knowledge = Knowledges.reset_knowledge_by_id(id=id, db=db)
     return knowledge
 
@@ -1,12 +1,7 @@
-# TODO: Implement a more intelligent load balancing mechanism for distributing requests among multiple backend instances.
-# Current implementation uses a simple round-robin approach (random.choice). Consider incorporating algorithms like weighted round-robin,
-# least connections, or least response time for better resource utilization and performance optimization.
-
 import asyncio
 import json
 import logging
 import os
-import random
 import re
 import time
 from datetime import datetime
@@ -17,7 +12,9 @@ import aiohttp
 from aiocache import cached
 import requests
 
+from open_webui.utils.balancer import OLLAMA_BALANCER, UpstreamRequest
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.session_pool import get_client_session
 from open_webui.models.chats import Chats
 from open_webui.models.users import UserModel
 
@@ -84,7 +81,7 @@ log = logging.getLogger(__name__)
 async def send_get_request(url, key=None, user: UserModel = None):
     timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST)
     try:
-        async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
+        async with get_client_session(url, timeout=timeout) as session:
             headers = {
                 "Content-Type": "application/json",
                 **({"Authorization": f"Bearer {key}"} if key else {}),
@@ -113,13 +110,14 @@ async def send_post_request(
     content_type: Optional[str] = None,
     user: UserModel = None,
     metadata: Optional[dict] = None,
+    node: Optional[UpstreamRequest] = None,
 ):
 
     r = None
     streaming = False
     try:
-        session = aiohttp.ClientSession(
-            trust_env=True, timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
+        session = get_client_session(
+            url, timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
         )
 
         headers = {
@@ -138,6 +136,8 @@ async def send_post_request(
             headers=headers,
             ssl=AIOHTTP_CLIENT_SESSION_SSL,
         )
+        if node:
+            node.respond(r.status < 500)
 
         if r.ok is False:
             try:
@@ -163,7 +163,7 @@ async def send_post_request(
 
             streaming = True
             return StreamingResponse(
-                stream_wrapper(r, session),
+                stream_node_wrapper(stream_wrapper(r, session), node),
                 status_code=r.status,
                 headers=response_headers,
             )
@@ -174,6 +174,8 @@ async def send_post_request(
     except HTTPException as e:
         raise e  # Re-raise HTTPException to be handled by FastAPI
     except Exception as e:
+        if node and r is None:
+            node.respond(False)
         detail = f"Ollama: {e}"
 
         raise HTTPException(
@@ -182,9 +184,21 @@ async def send_post_request(
         )
     finally:
         if not streaming:
+            if node:
+                node.done()
             await cleanup_response(r, session)
 
 
+async def stream_node_wrapper(stream, node: Optional[UpstreamRequest]):
+    # Keep the request counted as outstanding on its node until the stream ends
+    try:
+        async for chunk in stream:
+            yield chunk
+    finally:
+        if node:
+            node.done()
+
+
 def get_api_key(idx, url, configs):
     parsed_url = urlparse(url)
     base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
@@ -193,6 +207,26 @@ def get_api_key(idx, url, configs):
     )  # Legacy support
 
 
+def choose_ollama_url_idx(request: Request, model: str, url_idxs: list[int]) -> int:
+    base_urls = request.app.state.config.OLLAMA_BASE_URLS
+    configs = request.app.state.config.OLLAMA_API_CONFIGS
+
+    nodes = {idx: base_urls[idx] for idx in url_idxs if idx < len(base_urls)}
+    if not nodes:
+        raise HTTPException(
+            status_code=400,
+            detail=ERROR_MESSAGES.MODEL_NOT_FOUND(model),
+        )
+
+    weights = {
+        idx: configs.get(str(idx), configs.get(url, {})).get(  # Legacy support
+            "weight", 1
+        )
+        for idx, url in nodes.items()
+    }
+    return OLLAMA_BALANCER.choose(nodes, model=model, weights=weights)
+
+
 ##########################################
 #
 # API routes
@@ -220,8 +254,8 @@ async def verify_connection(
     url = form_data.url
     key = form_data.key
 
-    async with aiohttp.ClientSession(
-        trust_env=True,
+    async with get_client_session(
+        url,
         timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_MODEL_LIST),
     ) as session:
         try:
@@ -403,6 +437,15 @@ async def get_all_models(request: Request, user: UserModel = None):
                     # Parse ISO8601 datetime with offset, get unix timestamp as int
                     dt = datetime.fromisoformat(expires_map[m["model"]])
                     m["expires_at"] = int(dt.timestamp())
+
+            # Let the balancer prefer nodes that already have the model loaded
+            base_urls = request.app.state.config.OLLAMA_BASE_URLS
+            loaded_by_url = {url: set() for url in base_urls}
+            for m in loaded_models["models"]:
+                for idx in m.get("urls", []):
+                    loaded_by_url[base_urls[idx]].add(m["model"])
+            for url, loaded in loaded_by_url.items():
+                OLLAMA_BALANCER.set_loaded_models(url, loaded)
         except Exception as e:
             log.debug(f"Failed to get loaded models: {e}")
 
@@ -961,7 +1004,7 @@ async def show_model_info(
             detail=ERROR_MESSAGES.MODEL_NOT_FOUND(model),
         )
 
-    url_idx = random.choice(models[model]["urls"])
+    url_idx = choose_ollama_url_idx(request, model, models[model]["urls"])
 
     url = request.app.state.config.OLLAMA_BASE_URLS[url_idx]
     key = get_api_key(url_idx, url, request.app.state.config.OLLAMA_API_CONFIGS)
@@ -1034,7 +1077,7 @@ async def embed(
             models = request.app.state.OLLAMA_MODELS
 
         if model in models:
-            url_idx = random.choice(models[model]["urls"])
+            url_idx = choose_ollama_url_idx(request, model, models[model]["urls"])
         else:
             raise HTTPException(
                 status_code=400,
@@ -1048,10 +1091,12 @@ async def embed(
     )
     key = get_api_key(url_idx, url, request.app.state.config.OLLAMA_API_CONFIGS)
 
+    node = OLLAMA_BALANCER.track(url, form_data.model)
     prefix_id = api_config.get("prefix_id", None)
     if prefix_id:
         form_data.model = form_data.model.replace(f"{prefix_id}.", "")
 
+    r = None
     try:
         headers = {
             "Content-Type": "application/json",
@@ -1067,12 +1112,15 @@ async def embed(
             headers=headers,
             data=form_data.model_dump_json(exclude_none=True).encode(),
         )
+        node.respond(r.status_code < 500)
         r.raise_for_status()
 
         data = r.json()
         return data
     except Exception as e:
         log.exception(e)
+        if r is None:
+            node.respond(False)
 
         detail = None
         if r is not None:
@@ -1087,6 +1135,8 @@ async def embed(
             status_code=r.status_code if r else 500,
             detail=detail if detail else "Open WebUI: Server Connection Error",
         )
+    finally:
+        node.done()
 
 
 class GenerateEmbeddingsForm(BaseModel):
@@ -1119,7 +1169,7 @@ async def embeddings(
             models = request.app.state.OLLAMA_MODELS
 
         if model in models:
-            url_idx = random.choice(models[model]["urls"])
+            url_idx = choose_ollama_url_idx(request, model, models[model]["urls"])
         else:
             raise HTTPException(
                 status_code=400,
@@ -1133,10 +1183,12 @@ async def embeddings(
     )
     key = get_api_key(url_idx, url, request.app.state.config.OLLAMA_API_CONFIGS)
 
+    node = OLLAMA_BALANCER.track(url, form_data.model)
     prefix_id = api_config.get("prefix_id", None)
     if prefix_id:
         form_data.model = form_data.model.replace(f"{prefix_id}.", "")
 
+    r = None
     try:
         headers = {
             "Content-Type": "application/json",
@@ -1152,12 +1204,15 @@ async def embeddings(
             headers=headers,
             data=form_data.model_dump_json(exclude_none=True).encode(),
         )
+        node.respond(r.status_code < 500)
         r.raise_for_status()
 
         data = r.json()
         return data
     except Exception as e:
         log.exception(e)
+        if r is None:
+            node.respond(False)
 
         detail = None
         if r is not None:
@@ -1172,6 +1227,8 @@ async def embeddings(
             status_code=r.status_code if r else 500,
             detail=detail if detail else "Open WebUI: Server Connection Error",
         )
+    finally:
+        node.done()
 
 
 class GenerateCompletionForm(BaseModel):
@@ -1206,7 +1263,7 @@ async def generate_completion(
 
         model = form_data.model
         if model in models:
-            url_idx = random.choice(models[model]["urls"])
+            url_idx = choose_ollama_url_idx(request, model, models[model]["urls"])
         else:
             raise HTTPException(
                 status_code=400,
@@ -1219,6 +1276,7 @@ async def generate_completion(
         request.app.state.config.OLLAMA_API_CONFIGS.get(url, {}),  # Legacy support
     )
 
+    model = form_data.model
     prefix_id = api_config.get("prefix_id", None)
     if prefix_id:
         form_data.model = form_data.model.replace(f"{prefix_id}.", "")
@@ -1228,6 +1286,7 @@ async def generate_completion(
         payload=form_data.model_dump_json(exclude_none=True).encode(),
         key=get_api_key(url_idx, url, request.app.state.config.OLLAMA_API_CONFIGS),
         user=user,
+        node=OLLAMA_BALANCER.track(url, model),
     )
 
 
@@ -1273,7 +1332,7 @@ async def get_ollama_url(request: Request, model: str, url_idx: Optional[int] =
                 status_code=400,
                 detail=ERROR_MESSAGES.MODEL_NOT_FOUND(model),
             )
-        url_idx = random.choice(models[model].get("urls", []))
+        url_idx = choose_ollama_url_idx(request, model, models[model].get("urls", []))
     url = request.app.state.config.OLLAMA_BASE_URLS[url_idx]
     return url, url_idx
 
@@ -1361,7 +1420,8 @@ async def generate_chat_completion(
                 detail="Model not found",
             )
 
-    url, url_idx = await get_ollama_url(request, payload["model"], url_idx)
+    model = payload["model"]
+    url, url_idx = await get_ollama_url(request, model, url_idx)
     api_config = request.app.state.config.OLLAMA_API_CONFIGS.get(
         str(url_idx),
         request.app.state.config.OLLAMA_API_CONFIGS.get(url, {}),  # Legacy support
@@ -1379,6 +1439,7 @@ async def generate_chat_completion(
         content_type="application/x-ndjson",
         user=user,
         metadata=metadata,
+        node=OLLAMA_BALANCER.track(url, model),
     )
 
 
@@ -1472,7 +1533,8 @@ async def generate_openai_completion(
                 detail="Model not found",
             )
 
-    url, url_idx = await get_ollama_url(request, payload["model"], url_idx)
+    model = payload["model"]
+    url, url_idx = await get_ollama_url(request, model, url_idx)
     api_config = request.app.state.config.OLLAMA_API_CONFIGS.get(
         str(url_idx),
         request.app.state.config.OLLAMA_API_CONFIGS.get(url, {}),  # Legacy support
@@ -1490,6 +1552,7 @@ async def generate_openai_completion(
         key=get_api_key(url_idx, url, request.app.state.config.OLLAMA_API_CONFIGS),
         user=user,
         metadata=metadata,
+        node=OLLAMA_BALANCER.track(url, model),
     )
 
 
@@ -1560,7 +1623,8 @@ async def generate_openai_chat_completion(
                 detail="Model not found",
             )
 
-    url, url_idx = await get_ollama_url(request, payload["model"], url_idx)
+    model = payload["model"]
+    url, url_idx = await get_ollama_url(request, model, url_idx)
     api_config = request.app.state.config.OLLAMA_API_CONFIGS.get(
         str(url_idx),
         request.app.state.config.OLLAMA_API_CONFIGS.get(url, {}),  # Legacy support
@@ -1577,6 +1641,7 @@ async def generate_openai_chat_completion(
         key=get_api_key(url_idx, url, request.app.state.config.OLLAMA_API_CONFIGS),
         user=user,
         metadata=metadata,
+        node=OLLAMA_BALANCER.track(url, model),
     )
 
 
@@ -1711,7 +1776,7 @@ async def download_file_stream(
 
     timeout = aiohttp.ClientTimeout(total=600)  # Set the timeout
 
-    async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
+    async with get_client_session(file_url, timeout=timeout) as session:
         async with session.get(
             file_url, headers=headers, ssl=AIOHTTP_CLIENT_SESSION_SSL
         ) as response:
@@ -25,6 +25,7 @@ from open_webui.constants import ERROR_MESSAGES
 from open_webui.routers.openai import get_all_models_responses
 
 from open_webui.utils.auth import get_admin_user
+from open_webui.utils.session_pool import get_client_session
 
 log = logging.getLogger(__name__)
 
@@ -64,7 +65,7 @@ async def process_pipeline_inlet_filter(request, payload, user, models):
     if "pipeline" in model:
         sorted_filters.append(model)
 
-    async with aiohttp.ClientSession(trust_env=True) as session:
+    async with get_client_session() as session:
         for filter in sorted_filters:
             urlIdx = filter.get("urlIdx")
 
@@ -117,7 +118,7 @@ async def process_pipeline_outlet_filter(request, payload, user, models):
     if "pipeline" in model:
         sorted_filters = [model] + sorted_filters
 
-    async with aiohttp.ClientSession(trust_env=True) as session:
+    async with get_client_session() as session:
         for filter in sorted_filters:
             urlIdx = filter.get("urlIdx")
 
@@ -227,7 +228,7 @@ async def upload_pipeline(
 
         headers = {"Authorization": f"Bearer {key}"}
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
+        async with get_client_session(url) as session:
             form_data = aiohttp.FormData()
             form_data.add_field(
                 "file",
@@ -287,7 +288,7 @@ async def add_pipeline(
         url = request.app.state.config.OPENAI_API_BASE_URLS[urlIdx]
         key = request.app.state.config.OPENAI_API_KEYS[urlIdx]
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
+        async with get_client_session(url) as session:
             async with session.post(
                 f"{url}/pipelines/add",
                 headers={"Authorization": f"Bearer {key}"},
@@ -335,7 +336,7 @@ async def delete_pipeline(
         url = request.app.state.config.OPENAI_API_BASE_URLS[urlIdx]
         key = request.app.state.config.OPENAI_API_KEYS[urlIdx]
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
+        async with get_client_session(url) as session:
             async with session.delete(
                 f"{url}/pipelines/delete",
                 headers={"Authorization": f"Bearer {key}"},
@@ -376,7 +377,7 @@ async def get_pipelines(
         url = request.app.state.config.OPENAI_API_BASE_URLS[urlIdx]
         key = request.app.state.config.OPENAI_API_KEYS[urlIdx]
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
+        async with get_client_session(url) as session:
             async with session.get(
                 f"{url}/pipelines",
                 headers={"Authorization": f"Bearer {key}"},
@@ -419,7 +420,7 @@ async def get_pipeline_valves(
         url = request.app.state.config.OPENAI_API_BASE_URLS[urlIdx]
         key = request.app.state.config.OPENAI_API_KEYS[urlIdx]
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
+        async with get_client_session(url) as session:
             async with session.get(
                 f"{url}/{pipeline_id}/valves",
                 headers={"Authorization": f"Bearer {key}"},
@@ -462,7 +463,7 @@ async def get_pipeline_valves_spec(
         url = request.app.state.config.OPENAI_API_BASE_URLS[urlIdx]
         key = request.app.state.config.OPENAI_API_KEYS[urlIdx]
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
+        async with get_client_session(url) as session:
             async with session.get(
                 f"{url}/{pipeline_id}/valves/spec",
                 headers={"Authorization": f"Bearer {key}"},
@@ -506,7 +507,7 @@ async def update_pipeline_valves(
         url = request.app.state.config.OPENAI_API_BASE_URLS[urlIdx]
         key = request.app.state.config.OPENAI_API_KEYS[urlIdx]
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
+        async with get_client_session(url) as session:
             async with session.post(
                 f"{url}/{pipeline_id}/valves/update",
                 headers={"Authorization": f"Bearer {key}"},
@@ -44,6 +44,8 @@ from sqlalchemy.orm import Session
 
 
 from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
+from open_webui.retrieval.vector.main import run_in_vector_db_executor
+from open_webui.retrieval.bm25 import BM25_INDEXES
 
 # Document loaders
 from open_webui.retrieval.loaders.main import Loader
@@ -52,6 +54,11 @@ from open_webui.retrieval.loaders.youtube import YoutubeLoader
 # Web search engines
 from open_webui.retrieval.web.main import SearchResult
 from open_webui.retrieval.web.utils import get_web_loader
+from open_webui.retrieval.web.cache import (
+    WEB_CACHE,
+    get_cache_key,
+    get_search_cache_ttl,
+)
 from open_webui.retrieval.web.ollama import search_ollama_cloud
 from open_webui.retrieval.web.perplexity_search import search_perplexity_search
 from open_webui.retrieval.web.brave import search_brave
@@ -83,9 +90,10 @@ from open_webui.retrieval.utils import (
     get_embedding_function,
     get_reranking_function,
     get_model_path,
+    get_bm25_index,
     query_collection,
     query_collection_with_hybrid_search,
-    query_doc,
+    aquery_doc,
     query_doc_with_hybrid_search,
 )
 from open_webui.retrieval.vector.utils import filter_metadata
@@ -116,6 +124,7 @@ from open_webui.env import (
     SENTENCE_TRANSFORMERS_CROSS_ENCODER_BACKEND,
     SENTENCE_TRANSFORMERS_CROSS_ENCODER_MODEL_KWARGS,
     SENTENCE_TRANSFORMERS_CROSS_ENCODER_SIGMOID_ACTIVATION_FUNCTION,
+    ENABLE_FORWARD_USER_INFO_HEADERS,
 )
 
 from open_webui.constants import ERROR_MESSAGES
@@ -1552,6 +1561,8 @@ def save_docs_to_vector_db(
 
             if overwrite:
                 VECTOR_DB_CLIENT.delete_collection(collection_name=collection_name)
+                if BM25_INDEXES is not None:
+                    BM25_INDEXES.drop(collection_name)
                 log.info(f"deleting existing collection {collection_name}")
             elif add is False:
                 log.info(
@@ -1621,6 +1632,8 @@ def save_docs_to_vector_db(
             collection_name=collection_name,
             items=items,
         )
+        if BM25_INDEXES is not None:
+            BM25_INDEXES.add(collection_name, items)
 
         log.info(f"added {len(items)} items to collection {collection_name}")
         return True
@@ -1670,6 +1683,8 @@ def process_file(
                     VECTOR_DB_CLIENT.delete_collection(
                         collection_name=f"file-{file.id}"
                     )
+                    if BM25_INDEXES is not None:
+                        BM25_INDEXES.drop(f"file-{file.id}")
                 except:
                     # Audio file upload pipeline
                     pass
@@ -1985,10 +2000,12 @@ async def process_web(
         )
 
 
-def search_web(
+async def search_web(
     request: Request, engine: str, query: str, user=None
 ) -> list[SearchResult]:
     """Search the web using a search engine and return the results as a list of SearchResult objects.
+    HTTP API engines run on the event loop through the shared web search client,
+    engines backed by blocking SDKs (DuckDuckGo, Azure, Sougou, Firecrawl) in the threadpool.
     Will look for a search engine API key in environment variables in the following order:
     - SEARXNG_QUERY_URL
     - YACY_QUERY_URL + YACY_USERNAME + YACY_PASSWORD
@@ -2012,7 +2029,7 @@ def search_web(
 
     # TODO: add playwright to search the web
     if engine == "ollama_cloud":
-        return search_ollama_cloud(
+        return await search_ollama_cloud(
             "https://ollama.com",
             request.app.state.config.OLLAMA_CLOUD_WEB_SEARCH_API_KEY,
             query,
@@ -2021,7 +2038,7 @@ def search_web(
         )
     elif engine == "perplexity_search":
         if request.app.state.config.PERPLEXITY_API_KEY:
-            return search_perplexity_search(
+            return await search_perplexity_search(
                 request.app.state.config.PERPLEXITY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2034,7 +2051,7 @@ def search_web(
     elif engine == "searxng":
         if request.app.state.config.SEARXNG_QUERY_URL:
             searxng_kwargs = {"language": request.app.state.config.SEARXNG_LANGUAGE}
-            return search_searxng(
+            return await search_searxng(
                 request.app.state.config.SEARXNG_QUERY_URL,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2045,7 +2062,7 @@ def search_web(
             raise Exception("No SEARXNG_QUERY_URL found in environment variables")
     elif engine == "yacy":
         if request.app.state.config.YACY_QUERY_URL:
-            return search_yacy(
+            return await search_yacy(
                 request.app.state.config.YACY_QUERY_URL,
                 request.app.state.config.YACY_USERNAME,
                 request.app.state.config.YACY_PASSWORD,
@@ -2060,7 +2077,7 @@ def search_web(
             request.app.state.config.GOOGLE_PSE_API_KEY
             and request.app.state.config.GOOGLE_PSE_ENGINE_ID
         ):
-            return search_google_pse(
+            return await search_google_pse(
                 request.app.state.config.GOOGLE_PSE_API_KEY,
                 request.app.state.config.GOOGLE_PSE_ENGINE_ID,
                 query,
@@ -2074,7 +2091,7 @@ def search_web(
             )
     elif engine == "brave":
         if request.app.state.config.BRAVE_SEARCH_API_KEY:
-            return search_brave(
+            return await search_brave(
                 request.app.state.config.BRAVE_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2084,7 +2101,7 @@ def search_web(
             raise Exception("No BRAVE_SEARCH_API_KEY found in environment variables")
     elif engine == "kagi":
         if request.app.state.config.KAGI_SEARCH_API_KEY:
-            return search_kagi(
+            return await search_kagi(
                 request.app.state.config.KAGI_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2094,7 +2111,7 @@ def search_web(
             raise Exception("No KAGI_SEARCH_API_KEY found in environment variables")
     elif engine == "mojeek":
         if request.app.state.config.MOJEEK_SEARCH_API_KEY:
-            return search_mojeek(
+            return await search_mojeek(
                 request.app.state.config.MOJEEK_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2104,7 +2121,7 @@ def search_web(
             raise Exception("No MOJEEK_SEARCH_API_KEY found in environment variables")
     elif engine == "bocha":
         if request.app.state.config.BOCHA_SEARCH_API_KEY:
-            return search_bocha(
+            return await search_bocha(
                 request.app.state.config.BOCHA_SEARCH_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2114,7 +2131,7 @@ def search_web(
             raise Exception("No BOCHA_SEARCH_API_KEY found in environment variables")
     elif engine == "serpstack":
         if request.app.state.config.SERPSTACK_API_KEY:
-            return search_serpstack(
+            return await search_serpstack(
                 request.app.state.config.SERPSTACK_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2125,7 +2142,7 @@ def search_web(
             raise Exception("No SERPSTACK_API_KEY found in environment variables")
     elif engine == "serper":
         if request.app.state.config.SERPER_API_KEY:
-            return search_serper(
+            return await search_serper(
                 request.app.state.config.SERPER_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2135,7 +2152,7 @@ def search_web(
             raise Exception("No SERPER_API_KEY found in environment variables")
     elif engine == "serply":
         if request.app.state.config.SERPLY_API_KEY:
-            return search_serply(
+            return await search_serply(
                 request.app.state.config.SERPLY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2144,7 +2161,8 @@ def search_web(
         else:
             raise Exception("No SERPLY_API_KEY found in environment variables")
     elif engine == "duckduckgo":
-        return search_duckduckgo(
+        return await run_in_threadpool(
+            search_duckduckgo,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
@@ -2153,7 +2171,7 @@ def search_web(
         )
     elif engine == "tavily":
         if request.app.state.config.TAVILY_API_KEY:
-            return search_tavily(
+            return await search_tavily(
                 request.app.state.config.TAVILY_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2163,7 +2181,7 @@ def search_web(
             raise Exception("No TAVILY_API_KEY found in environment variables")
     elif engine == "exa":
         if request.app.state.config.EXA_API_KEY:
-            return search_exa(
+            return await search_exa(
                 request.app.state.config.EXA_API_KEY,
                 query,
                 request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2173,7 +2191,7 @@ def search_web(
             raise Exception("No EXA_API_KEY found in environment variables")
     elif engine == "searchapi":
         if request.app.state.config.SEARCHAPI_API_KEY:
-            return search_searchapi(
+            return await search_searchapi(
                 request.app.state.config.SEARCHAPI_API_KEY,
                 request.app.state.config.SEARCHAPI_ENGINE,
                 query,
@@ -2184,7 +2202,7 @@ def search_web(
             raise Exception("No SEARCHAPI_API_KEY found in environment variables")
     elif engine == "serpapi":
         if request.app.state.config.SERPAPI_API_KEY:
-            return search_serpapi(
+            return await search_serpapi(
                 request.app.state.config.SERPAPI_API_KEY,
                 request.app.state.config.SERPAPI_ENGINE,
                 query,
@@ -2194,14 +2212,14 @@ def search_web(
         else:
             raise Exception("No SERPAPI_API_KEY found in environment variables")
     elif engine == "jina":
-        return search_jina(
+        return await search_jina(
             request.app.state.config.JINA_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
             request.app.state.config.JINA_API_BASE_URL,
         )
     elif engine == "bing":
-        return search_bing(
+        return await search_bing(
             request.app.state.config.BING_SEARCH_V7_SUBSCRIPTION_KEY,
             request.app.state.config.BING_SEARCH_V7_ENDPOINT,
             str(DEFAULT_LOCALE),
@@ -2215,7 +2233,8 @@ def search_web(
             and request.app.state.config.AZURE_AI_SEARCH_ENDPOINT
             and request.app.state.config.AZURE_AI_SEARCH_INDEX_NAME
         ):
-            return search_azure(
+            return await run_in_threadpool(
+                search_azure,
                 request.app.state.config.AZURE_AI_SEARCH_API_KEY,
                 request.app.state.config.AZURE_AI_SEARCH_ENDPOINT,
                 request.app.state.config.AZURE_AI_SEARCH_INDEX_NAME,
@@ -2228,14 +2247,14 @@ def search_web(
                 "AZURE_AI_SEARCH_API_KEY, AZURE_AI_SEARCH_ENDPOINT, and AZURE_AI_SEARCH_INDEX_NAME are required for Azure AI Search"
             )
     elif engine == "exa":
-        return search_exa(
+        return await search_exa(
             request.app.state.config.EXA_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
         )
     elif engine == "perplexity":
-        return search_perplexity(
+        return await search_perplexity(
             request.app.state.config.PERPLEXITY_API_KEY,
             query,
             request.app.state.config.WEB_SEARCH_RESULT_COUNT,
@@ -2248,7 +2267,8 @@ def search_web(
             request.app.state.config.SOUGOU_API_SID
             and request.app.state.config.SOUGOU_API_SK
         ):
-            return search_sougou(
+            return await run_in_threadpool(
+                search_sougou,
                 request.app.state.config.SOUGOU_API_SID,
                 request.app.state.config.SOUGOU_API_SK,
                 query,
@@ -2260,7 +2280,8 @@ def search_web(
                 "No SOUGOU_API_SID or SOUGOU_API_SK found in environment variables"
             )
     elif engine == "firecrawl":
-        return search_firecrawl(
+        return await run_in_threadpool(
+            search_firecrawl,
             request.app.state.config.FIRECRAWL_API_BASE_URL,
             request.app.state.config.FIRECRAWL_API_KEY,
             query,
@@ -2268,7 +2289,7 @@ def search_web(
             request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
         )
     elif engine == "external":
-        return search_external(
+        return await search_external(
             request,
             request.app.state.config.EXTERNAL_WEB_SEARCH_URL,
             request.app.state.config.EXTERNAL_WEB_SEARCH_API_KEY,
@@ -2278,7 +2299,7 @@ def search_web(
             user=user,
         )
     elif engine == "yandex":
-        return search_yandex(
+        return await search_yandex(
             request,
             request.app.state.config.YANDEX_WEB_SEARCH_URL,
             request.app.state.config.YANDEX_WEB_SEARCH_API_KEY,
@@ -2292,6 +2313,33 @@ def search_web(
         raise Exception("No search engine API key found in environment variables")
 
 
+async def search_web_with_cache(
+    request: Request, engine: str, query: str, user=None
+) -> list[SearchResult]:
+    ttl = get_search_cache_ttl(engine)
+    if WEB_CACHE is None or ttl <= 0:
+        return await search_web(request, engine, query, user)
+
+    key = get_cache_key(
+        engine,
+        query,
+        request.app.state.config.WEB_SEARCH_RESULT_COUNT,
+        request.app.state.config.WEB_SEARCH_DOMAIN_FILTER_LIST,
+        # Engines may tailor results to forwarded user info
+        user.id if ENABLE_FORWARD_USER_INFO_HEADERS and user else None,
+    )
+    cached = await WEB_CACHE.get_search_results(key)
+    if cached is not None:
+        return [SearchResult(**item) for item in cached]
+
+    results = await search_web(request, engine, query, user)
+    if results:
+        await WEB_CACHE.set_search_results(
+            key, [dict(item) for item in results if item], ttl
+        )
+    return results
+
+
 @router.post("/process/web/search")
 async def process_web_search(
     request: Request, form_data: SearchForm, user=Depends(get_verified_user)
@@ -2310,60 +2358,81 @@ async def process_web_search(
             detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
         )
 
-    urls = []
-    result_items = []
-
-    try:
-        logging.debug(
-            f"trying to web search with {request.app.state.config.WEB_SEARCH_ENGINE, form_data.queries}"
-        )
+    engine = request.app.state.config.WEB_SEARCH_ENGINE
 
-        # Use semaphore to limit concurrent requests based on WEB_SEARCH_CONCURRENT_REQUESTS
-        # 0 or None = unlimited (previous behavior), positive number = limited concurrency
-        # Set to 1 for sequential execution (rate-limited APIs like Brave free tier)
-        concurrent_limit = request.app.state.config.WEB_SEARCH_CONCURRENT_REQUESTS
+    # Use semaphore to limit concurrent requests based on WEB_SEARCH_CONCURRENT_REQUESTS
+    # 0 or None = unlimited (previous behavior), positive number = limited concurrency
+    # Set to 1 for sequential execution (rate-limited APIs like Brave free tier)
+    concurrent_limit = request.app.state.config.WEB_SEARCH_CONCURRENT_REQUESTS
+    semaphore = asyncio.Semaphore(concurrent_limit) if concurrent_limit else None
 
-        if concurrent_limit:
-            # Limited concurrency with semaphore
-            semaphore = asyncio.Semaphore(concurrent_limit)
+    async def search(index: int, query: str):
+        if semaphore is None:
+            return index, await search_web_with_cache(request, engine, query, user)
 
-            async def search_with_limit(query):
-                async with semaphore:
-                    return await run_in_threadpool(
-                        search_web,
-                        request,
-                        request.app.state.config.WEB_SEARCH_ENGINE,
-                        query,
-                        user,
-                    )
+        async with semaphore:
+            return index, await search_web_with_cache(request, engine, query, user)
 
-            search_tasks = [search_with_limit(query) for query in form_data.queries]
-        else:
-            # Unlimited parallel execution (previous behavior)
-            search_tasks = [
-                run_in_threadpool(
-                    search_web,
-                    request,
-                    request.app.state.config.WEB_SEARCH_ENGINE,
-                    query,
-                    user,
+    async def load(items: list[SearchResult]) -> list[Document]:
+        if request.app.state.config.BYPASS_WEB_SEARCH_WEB_LOADER:
+            return [
+                Document(
+                    page_content=item.snippet,
+                    metadata={
+                        "source": item.link,
+                        "title": item.title,
+                        "snippet": item.snippet,
+                        "link": item.link,
+                    },
                 )
-                for query in form_data.queries
+                for item in items
+                if item.snippet is not None
             ]
 
-        search_results = await asyncio.gather(*search_tasks)
+        loader = get_web_loader(
+            [item.link for item in items],
+            verify_ssl=request.app.state.config.ENABLE_WEB_LOADER_SSL_VERIFICATION,
+            requests_per_second=request.app.state.config.WEB_LOADER_CONCURRENT_REQUESTS,
+            trust_env=request.app.state.config.WEB_SEARCH_TRUST_ENV,
+            cache=WEB_CACHE,
+        )
+        return await loader.aload()
 
-        for result in search_results:
-            if result:
-                for item in result:
-                    if item and item.link:
-                        result_items.append(item)
-                        urls.append(item.link)
+    # Pages of each query start loading as soon as its search returns, while
+    # slower searches are still running
+    search_tasks = [
+        asyncio.create_task(search(index, query))
+        for index, query in enumerate(form_data.queries)
+    ]
+    load_tasks = []
+    seen_urls = set()
 
-        urls = list(dict.fromkeys(urls))
-        log.debug(f"urls: {urls}")
+    def cancel_tasks():
+        for task in search_tasks + [task for _, _, task in load_tasks]:
+            task.cancel()
 
+    try:
+        logging.debug(f"trying to web search with {engine, form_data.queries}")
+
+        for next_search in asyncio.as_completed(search_tasks):
+            index, results = await next_search
+
+            items = []
+            for item in results or []:
+                if item and item.link and item.link not in seen_urls:
+                    seen_urls.add(item.link)
+                    items.append(item)
+
+            if items:
+                load_tasks.append((index, items, asyncio.create_task(load(items))))
+
+        log.debug(f"urls: {list(seen_urls)}")
+
+    except asyncio.CancelledError:
+        cancel_tasks()
+        raise
     except Exception as e:
+        cancel_tasks()
         log.exception(e)
 
         raise HTTPException(
@@ -2371,45 +2440,26 @@ async def process_web_search(
             detail=ERROR_MESSAGES.WEB_SEARCH_ERROR(e),
         )
 
-    if len(urls) == 0:
+    if len(load_tasks) == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=ERROR_MESSAGES.DEFAULT("No results found from web search"),
         )
 
     try:
-        if request.app.state.config.BYPASS_WEB_SEARCH_WEB_LOADER:
-            search_results = [
-                item for result in search_results for item in result if result
-            ]
-
-            docs = [
-                Document(
-                    page_content=result.snippet,
-                    metadata={
-                        "source": result.link,
-                        "title": result.title,
-                        "snippet": result.snippet,
-                        "link": result.link,
-                    },
-                )
-                for result in search_results
-                if hasattr(result, "snippet") and result.snippet is not None
-            ]
-        else:
-            loader = get_web_loader(
-                urls,
-                verify_ssl=request.app.state.config.ENABLE_WEB_LOADER_SSL_VERIFICATION,
-                requests_per_second=request.app.state.config.WEB_LOADER_CONCURRENT_REQUESTS,
-                trust_env=request.app.state.config.WEB_SEARCH_TRUST_ENV,
-            )
-            docs = await loader.aload()
+        # Keep documents and items in query order, whichever search finished first
+        load_tasks.sort(key=lambda load_task: load_task[0])
+        loaded = await asyncio.gather(*(task for _, _, task in load_tasks))
+        docs = [doc for batch in loaded for doc in batch]
 
         urls = [
             doc.metadata.get("source") for doc in docs if doc.metadata.get("source")
         ]  # only keep the urls returned by the loader
         result_items = [
-            dict(item) for item in result_items if item.link in urls
+            dict(item)
+            for _, items, _ in load_tasks
+            for item in items
+            if item.link in urls
         ]  # only keep the search results that have been loaded
 
         if request.app.state.config.BYPASS_WEB_SEARCH_EMBEDDING_AND_RETRIEVAL:
@@ -2455,6 +2505,7 @@ async def process_web_search(
                 "loaded_count": len(docs),
             }
     except Exception as e:
+        cancel_tasks()
         log.exception(e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -2482,12 +2533,21 @@ async def query_doc_handler(
             form_data.hybrid is None or form_data.hybrid
         ):
             collection_results = {}
-            collection_results[form_data.collection_name] = VECTOR_DB_CLIENT.get(
-                collection_name=form_data.collection_name
-            )
+            bm25_index = None
+            if BM25_INDEXES is not None:
+                bm25_index = await run_in_vector_db_executor(
+                    get_bm25_index, form_data.collection_name
+                )
+            else:
+                collection_results[form_data.collection_name] = (
+                    await VECTOR_DB_CLIENT.aget(
+                        collection_name=form_data.collection_name
+                    )
+                )
             return await query_doc_with_hybrid_search(
                 collection_name=form_data.collection_name,
-                collection_result=collection_results[form_data.collection_name],
+                collection_result=collection_results.get(form_data.collection_name),
+                bm25_index=bm25_index,
                 query=form_data.query,
                 embedding_function=lambda query, prefix: request.app.state.EMBEDDING_FUNCTION(
                     query, prefix=prefix, user=user
@@ -2514,13 +2574,12 @@ async def query_doc_handler(
                     if form_data.hybrid_bm25_weight
                     else request.app.state.config.HYBRID_BM25_WEIGHT
                 ),
-                user=user,
             )
         else:
             query_embedding = await request.app.state.EMBEDDING_FUNCTION(
                 form_data.query, prefix=RAG_EMBEDDING_QUERY_PREFIX, user=user
             )
-            return query_doc(
+            return await aquery_doc(
                 collection_name=form_data.collection_name,
                 query_embedding=query_embedding,
                 k=form_data.k if form_data.k else request.app.state.config.TOP_K,
@@ -2637,8 +2696,10 @@ def delete_entries_from_collection(
 
             VECTOR_DB_CLIENT.delete(
                 collection_name=form_data.collection_name,
-                metadata={"hash": hash},
+                filter={"hash": hash},
             )
+            if BM25_INDEXES is not None:
+                BM25_INDEXES.delete(form_data.collection_name, filter={"hash": hash})
             return {"status": True}
         else:
             return {"status": False}
@@ -2650,6 +2711,8 @@ def delete_entries_from_collection(
 @router.post("/reset/db")
 def reset_vector_db(user=Depends(get_admin_user), db: Session = Depends(get_session)):
     VECTOR_DB_CLIENT.reset()
+    if BM25_INDEXES is not None:
+        BM25_INDEXES.reset()
     Knowledges.delete_all_knowledge(db=db)
 
 
@@ -12,6 +12,7 @@ import pycrdt as Y
 from open_webui.models.users import Users, UserNameResponse
 from open_webui.models.channels import Channels
 from open_webui.models.chats import Chats
+from open_webui.models.files import FILE_STATUS_BUS
 from open_webui.models.notes import Notes, NoteUpdateForm
 from open_webui.utils.redis import (
     get_sentinels_from_env,
@@ -37,9 +38,16 @@ from open_webui.env import (
     WEBSOCKET_SERVER_PING_INTERVAL,
     WEBSOCKET_SERVER_LOGGING,
     WEBSOCKET_SERVER_ENGINEIO_LOGGING,
+    CHAT_EVENT_BUFFER_FLUSH_INTERVAL,
+    CHAT_EVENT_BUFFER_MAX_EVENTS,
 )
 from open_webui.utils.auth import decode_token
-from open_webui.socket.utils import RedisDict, RedisLock, YdocManager
+from open_webui.socket.utils import (
+    MessageEventBuffer,
+    RedisDict,
+    RedisLock,
+    YdocManager,
+)
 from open_webui.tasks import create_task, stop_item_tasks
 from open_webui.utils.redis import get_redis_connection
 from open_webui.utils.access_control import has_permission
@@ -161,6 +169,15 @@ YDOC_MANAGER = YdocManager(
     redis_key_prefix=f"{REDIS_KEY_PREFIX}:ydoc:documents",
 )
 
+# Message events are produced by the worker that owns the response stream,
+# so coalescing them in-process is sufficient across multiple workers.
+MESSAGE_EVENT_BUFFER = MessageEventBuffer(
+    get_message=Chats.get_message_by_id_and_message_id,
+    upsert_message=Chats.patch_message_by_id_and_message_id,
+    flush_interval=CHAT_EVENT_BUFFER_FLUSH_INTERVAL,
+    max_events=CHAT_EVENT_BUFFER_MAX_EVENTS,
+)
+
 
 async def periodic_usage_pool_cleanup():
     max_retries = 2
@@ -273,6 +290,17 @@ async def emit_to_users(event: str, data: dict, user_ids: list[str]):
         log.debug(f"Failed to emit event {event} to users {user_ids}: {e}")
 
 
+async def emit_file_status(event: dict):
+    """Push file processing status transitions to the file owner's sessions."""
+    data = {"file_id": event["file_id"], "status": event["status"]}
+    if event["status"] == "failed":
+        data["error"] = event.get("error")
+    await emit_to_users("events:file", data, [event["user_id"]])
+
+
+FILE_STATUS_BUS.add_listener(emit_file_status)
+
+
 async def enter_room_for_users(room: str, user_ids: list[str]):
     """
     Make all sessions of a user join a specific room.
@@ -715,6 +743,11 @@ async def disconnect(sid):
         # print(f"Unknown session ID {sid} disconnected")
 
 
+def flush_message_events(chat_id: str, message_id: str):
+    """Persist any buffered events for a message before it is written elsewhere."""
+    MESSAGE_EVENT_BUFFER.flush(chat_id, message_id)
+
+
 def get_event_emitter(request_info, update_db=True):
     async def __event_emitter__(event_data):
         user_id = request_info["user_id"]
@@ -735,95 +768,35 @@ def get_event_emitter(request_info, update_db=True):
             and message_id
             and not request_info.get("chat_id", "").startswith("local:")
         ):
+            event_type = event_data.get("type")
+            data = event_data.get("data", {})
 
-            if "type" in event_data and event_data["type"] == "status":
-                Chats.add_message_status_to_chat_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                    event_data.get("data", {}),
-                )
-
-            if "type" in event_data and event_data["type"] == "message":
-                message = Chats.get_message_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                )
-
-                if message:
-                    content = message.get("content", "")
-                    content += event_data.get("data", {}).get("content", "")
-
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
-                        request_info["chat_id"],
-                        request_info["message_id"],
-                        {
-                            "content": content,
-                        },
-                    )
-
-            if "type" in event_data and event_data["type"] == "replace":
-                content = event_data.get("data", {}).get("content", "")
-
-                Chats.upsert_message_to_chat_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                    {
-                        "content": content,
-                    },
-                )
+            if event_type == "status":
+                MESSAGE_EVENT_BUFFER.add(chat_id, message_id, "status", data)
 
-            if "type" in event_data and event_data["type"] == "embeds":
-                message = Chats.get_message_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
+            if event_type == "message":
+                MESSAGE_EVENT_BUFFER.add(
+                    chat_id, message_id, "content", data.get("content", "")
                 )
 
-                embeds = event_data.get("data", {}).get("embeds", [])
-                embeds.extend(message.get("embeds", []))
-
-                Chats.upsert_message_to_chat_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                    {
-                        "embeds": embeds,
-                    },
+            if event_type == "replace":
+                MESSAGE_EVENT_BUFFER.add(
+                    chat_id, message_id, "replace", data.get("content", "")
                 )
 
-            if "type" in event_data and event_data["type"] == "files":
-                message = Chats.get_message_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
+            if event_type == "embeds":
+                MESSAGE_EVENT_BUFFER.add(
+                    chat_id, message_id, "embeds", data.get("embeds", [])
                 )
 
-                files = event_data.get("data", {}).get("files", [])
-                files.extend(message.get("files", []))
-
-                Chats.upsert_message_to_chat_by_id_and_message_id(
-                    request_info["chat_id"],
-                    request_info["message_id"],
-                    {
-                        "files": files,
-                    },
+            if event_type == "files":
+                MESSAGE_EVENT_BUFFER.add(
+                    chat_id, message_id, "files", data.get("files", [])
                 )
 
-            if event_data.get("type") in ["source", "citation"]:
-                data = event_data.get("data", {})
+            if event_type in ["source", "citation"]:
                 if data.get("type") == None:
-                    message = Chats.get_message_by_id_and_message_id(
-                        request_info["chat_id"],
-                        request_info["message_id"],
-                    )
-
-                    sources = message.get("sources", [])
-                    sources.append(data)
-
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
-                        request_info["chat_id"],
-                        request_info["message_id"],
-                        {
-                            "sources": sources,
-                        },
-                    )
+                    MESSAGE_EVENT_BUFFER.add(chat_id, message_id, "sources", data)
 
     if (
         "user_id" in request_info
@@ -1,10 +1,14 @@
+import asyncio
 import json
+import logging
 import uuid
 from open_webui.utils.redis import get_redis_connection
 from open_webui.env import REDIS_KEY_PREFIX
 from typing import Optional, List, Tuple
 import pycrdt as Y
 
+log = logging.getLogger(__name__)
+
 
 class RedisLock:
     def __init__(
@@ -225,3 +229,109 @@ class YdocManager:
                 del self._updates[document_id]
             if document_id in self._users:
                 del self._users[document_id]
+
+
+class MessageEventBuffer:
+    """
+    Write-behind buffer for message events emitted while a response is streaming.
+
+    Events are queued per (chat_id, message_id) and applied to the stored message
+    in a single read + upsert when the flush interval elapses, when max_events
+    are pending, or when flush() is called explicitly on completion.
+    """
+
+    def __init__(
+        self,
+        get_message,
+        upsert_message,
+        flush_interval: float = 1.0,
+        max_events: int = 50,
+    ):
+        self._get_message = get_message
+        self._upsert_message = upsert_message
+        self._flush_interval = flush_interval
+        self._max_events = max_events
+        self._entries = {}
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._entries
+
+    def add(self, chat_id: str, message_id: str, kind: str, value):
+        key = (chat_id, message_id)
+        entry = self._entries.setdefault(key, {"ops": [], "count": 0, "task": None})
+
+        # Coalesce consecutive content deltas into a single append
+        if kind == "content" and entry["ops"] and entry["ops"][-1][0] == "content":
+            entry["ops"][-1] = ("content", entry["ops"][-1][1] + value)
+        else:
+            entry["ops"].append((kind, value))
+        entry["count"] += 1
+
+        if self._flush_interval <= 0 or entry["count"] >= self._max_events:
+            self.flush(chat_id, message_id)
+        elif entry["task"] is None:
+            entry["task"] = asyncio.create_task(self._delayed_flush(key))
+
+    async def _delayed_flush(self, key: Tuple[str, str]):
+        await asyncio.sleep(self._flush_interval)
+        entry = self._entries.get(key)
+        if entry is not None:
+            # Detach ourselves so flush() does not cancel the running task
+            entry["task"] = None
+            self.flush(*key)
+
+    def flush(self, chat_id: str, message_id: str):
+        entry = self._entries.pop((chat_id, message_id), None)
+        if entry is None:
+            return
+
+        if entry["task"] is not None:
+            entry["task"].cancel()
+
+        try:
+            message = self._get_message(chat_id, message_id)
+            if message is None:
+                return
+
+            updates = self.apply_ops(message, entry["ops"])
+            if updates:
+                self._upsert_message(chat_id, message_id, updates)
+        except Exception as e:
+            log.error(f"Error flushing message events for {chat_id}/{message_id}: {e}")
+
+    def flush_all(self):
+        for chat_id, message_id in list(self._entries.keys()):
+            self.flush(chat_id, message_id)
+
+    @staticmethod
+    def apply_ops(message: dict, ops: list) -> dict:
+        exists = bool(message)
+        current = dict(message)
+        updates = {}
+
+        for kind, value in ops:
+            if kind == "status":
+                if exists:
+                    current["statusHistory"] = [
+                        *current.get("statusHistory", []),
+                        value,
+                    ]
+                    updates["statusHistory"] = current["statusHistory"]
+            elif kind == "content":
+                if exists:
+                    current["content"] = current.get("content", "") + value
+                    updates["content"] = current["content"]
+            elif kind == "replace":
+                current["content"] = value
+                updates["content"] = value
+                exists = True
+            elif kind in ("embeds", "files"):
+                current[kind] = [*value, *current.get(kind, [])]
+                updates[kind] = current[kind]
+                exists = True
+            elif kind == "sources":
+                current["sources"] = [*current.get("sources", []), value]
+                updates["sources"] = current["sources"]
+                exists = True
+
+        return updates
@@ -3,10 +3,12 @@ import shutil
 import json
 import logging
 import re
+import uuid
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Tuple, Dict
+from typing import BinaryIO, Callable, Iterator, Optional, Tuple, Dict
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from open_webui.config import (
@@ -24,6 +26,8 @@ from open_webui.config import (
     AZURE_STORAGE_ENDPOINT,
     AZURE_STORAGE_CONTAINER_NAME,
     AZURE_STORAGE_KEY,
+    STORAGE_CHUNK_SIZE,
+    STORAGE_MAX_CONCURRENCY,
     STORAGE_PROVIDER,
     UPLOAD_DIR,
 )
@@ -36,16 +40,68 @@ from azure.core.exceptions import ResourceNotFoundError
 
 log = logging.getLogger(__name__)
 
+# GCS resumable uploads require a chunk size that is a multiple of 256 KiB
+GCS_CHUNK_SIZE = max(1, STORAGE_CHUNK_SIZE // (256 * 1024)) * 256 * 1024
+
+
+def download_to_local_file(
+    local_file_path: str,
+    size: Optional[int],
+    download: Callable[[BinaryIO], None],
+) -> str:
+    """
+    Streams a remote object into the local upload dir.
+
+    A local copy of the same size is reused as-is (objects are never rewritten
+    under the same name), otherwise the object is downloaded into a temporary
+    file and moved into place so readers never see a partial file.
+    """
+    if (
+        size is not None
+        and os.path.isfile(local_file_path)
+        and os.path.getsize(local_file_path) == size
+    ):
+        return local_file_path
+
+    tmp_file_path = f"{local_file_path}.{uuid.uuid4().hex}.part"
+    try:
+        with open(tmp_file_path, "wb") as f:
+            download(f)
+        os.replace(tmp_file_path, local_file_path)
+    finally:
+        if os.path.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+    return local_file_path
+
+
+def iter_chunks(read: Callable[[int], bytes], close: Callable[[], None]):
+    """Yields STORAGE_CHUNK_SIZE chunks from a remote stream, then closes it."""
+    try:
+        while chunk := read(STORAGE_CHUNK_SIZE):
+            yield chunk
+    finally:
+        close()
+
 
 class StorageProvider(ABC):
     @abstractmethod
     def get_file(self, file_path: str) -> str:
         pass
 
+    def stream_file(
+        self, file_path: str
+    ) -> Optional[Tuple[Iterator[bytes], Optional[int]]]:
+        """
+        Streams a remote object in bounded chunks without a local copy,
+        returning the chunks and the object size. Returns None when the file
+        is available locally, to be served from get_file's path instead.
+        """
+        return None
+
     @abstractmethod
     def upload_file(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
-    ) -> Tuple[bytes, str]:
+    ) -> Tuple[int, str]:
         pass
 
     @abstractmethod
@@ -61,14 +117,19 @@ class LocalStorageProvider(StorageProvider):
     @staticmethod
     def upload_file(
         file: BinaryIO, filename: str, tags: Dict[str, str]
-    ) -> Tuple[bytes, str]:
-        contents = file.read()
-        if not contents:
-            raise ValueError(ERROR_MESSAGES.EMPTY_CONTENT)
+    ) -> Tuple[int, str]:
+        """Streams the upload to local storage, returns its size and path."""
         file_path = f"{UPLOAD_DIR}/{filename}"
+        size = 0
         with open(file_path, "wb") as f:
-            f.write(contents)
-        return contents, file_path
+            while chunk := file.read(STORAGE_CHUNK_SIZE):
+                f.write(chunk)
+                size += len(chunk)
+
+        if not size:
+            os.remove(file_path)
+            raise ValueError(ERROR_MESSAGES.EMPTY_CONTENT)
+        return size, file_path
 
     @staticmethod
     def get_file(file_path: str) -> str:
@@ -137,6 +198,14 @@ class S3StorageProvider(StorageProvider):
         self.bucket_name = S3_BUCKET_NAME
         self.key_prefix = S3_KEY_PREFIX if S3_KEY_PREFIX else ""
 
+        # Large objects go up and down as multipart transfers, streamed part by part
+        self.transfer_config = TransferConfig(
+            multipart_threshold=STORAGE_CHUNK_SIZE,
+            multipart_chunksize=STORAGE_CHUNK_SIZE,
+            io_chunksize=min(STORAGE_CHUNK_SIZE, 1024 * 1024),
+            max_concurrency=STORAGE_MAX_CONCURRENCY,
+        )
+
     @staticmethod
     def sanitize_tag_value(s: str) -> str:
         """Only include S3 allowed characters."""
@@ -144,12 +213,14 @@ class S3StorageProvider(StorageProvider):
 
     def upload_file(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
-    ) -> Tuple[bytes, str]:
+    ) -> Tuple[int, str]:
         """Handles uploading of the file to S3 storage."""
-        _, file_path = LocalStorageProvider.upload_file(file, filename, tags)
+        size, file_path = LocalStorageProvider.upload_file(file, filename, tags)
         s3_key = os.path.join(self.key_prefix, filename)
         try:
-            self.s3_client.upload_file(file_path, self.bucket_name, s3_key)
+            self.s3_client.upload_file(
+                file_path, self.bucket_name, s3_key, Config=self.transfer_config
+            )
             if S3_ENABLE_TAGGING and tags:
                 sanitized_tags = {
                     self.sanitize_tag_value(k): self.sanitize_tag_value(v)
@@ -165,10 +236,7 @@ class S3StorageProvider(StorageProvider):
                     Key=s3_key,
                     Tagging=tagging,
                 )
-            return (
-                open(file_path, "rb").read(),
-                f"s3://{self.bucket_name}/{s3_key}",
-            )
+            return size, f"s3://{self.bucket_name}/{s3_key}"
         except ClientError as e:
             raise RuntimeError(f"Error uploading file to S3: {e}")
 
@@ -177,8 +245,29 @@ class S3StorageProvider(StorageProvider):
         try:
             s3_key = self._extract_s3_key(file_path)
             local_file_path = self._get_local_file_path(s3_key)
-            self.s3_client.download_file(self.bucket_name, s3_key, local_file_path)
-            return local_file_path
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            return download_to_local_file(
+                local_file_path,
+                response.get("ContentLength"),
+                lambda f: self.s3_client.download_fileobj(
+                    self.bucket_name, s3_key, f, Config=self.transfer_config
+                ),
+            )
+        except ClientError as e:
+            raise RuntimeError(f"Error downloading file from S3: {e}")
+
+    def stream_file(
+        self, file_path: str
+    ) -> Optional[Tuple[Iterator[bytes], Optional[int]]]:
+        """Streams the object from S3 unless a local copy exists."""
+        try:
+            s3_key = self._extract_s3_key(file_path)
+            if os.path.isfile(self._get_local_file_path(s3_key)):
+                return None
+
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+            body = response["Body"]
+            return iter_chunks(body.read, body.close), response.get("ContentLength")
         except ClientError as e:
             raise RuntimeError(f"Error downloading file from S3: {e}")
 
@@ -237,13 +326,14 @@ class GCSStorageProvider(StorageProvider):
 
     def upload_file(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
-    ) -> Tuple[bytes, str]:
+    ) -> Tuple[int, str]:
         """Handles uploading of the file to GCS storage."""
-        contents, file_path = LocalStorageProvider.upload_file(file, filename, tags)
+        size, file_path = LocalStorageProvider.upload_file(file, filename, tags)
         try:
-            blob = self.bucket.blob(filename)
+            # Setting a chunk size makes this a chunked resumable upload
+            blob = self.bucket.blob(filename, chunk_size=GCS_CHUNK_SIZE)
             blob.upload_from_filename(file_path)
-            return contents, "gs://" + self.bucket_name + "/" + filename
+            return size, "gs://" + self.bucket_name + "/" + filename
         except GoogleCloudError as e:
             raise RuntimeError(f"Error uploading file to GCS: {e}")
 
@@ -253,9 +343,31 @@ class GCSStorageProvider(StorageProvider):
             filename = file_path.removeprefix("gs://").split("/")[1]
             local_file_path = f"{UPLOAD_DIR}/{filename}"
             blob = self.bucket.get_blob(filename)
-            blob.download_to_filename(local_file_path)
+            if blob is None:
+                raise NotFound(f"{filename} not found")
 
-            return local_file_path
+            blob.chunk_size = GCS_CHUNK_SIZE
+            return download_to_local_file(
+                local_file_path, blob.size, blob.download_to_file
+            )
+        except NotFound as e:
+            raise RuntimeError(f"Error downloading file from GCS: {e}")
+
+    def stream_file(
+        self, file_path: str
+    ) -> Optional[Tuple[Iterator[bytes], Optional[int]]]:
+        """Streams the blob from GCS unless a local copy exists."""
+        try:
+            filename = file_path.removeprefix("gs://").split("/")[1]
+            if os.path.isfile(f"{UPLOAD_DIR}/{filename}"):
+                return None
+
+            blob = self.bucket.get_blob(filename)
+            if blob is None:
+                raise NotFound(f"{filename} not found")
+
+            reader = blob.open("rb", chunk_size=GCS_CHUNK_SIZE)
+            return iter_chunks(reader.read, reader.close), blob.size
         except NotFound as e:
             raise RuntimeError(f"Error downloading file from GCS: {e}")
 
@@ -295,27 +407,47 @@ class AzureStorageProvider(StorageProvider):
         if storage_key:
             # Configure using the Azure Storage Account Endpoint and Key
             self.blob_service_client = BlobServiceClient(
-                account_url=self.endpoint, credential=storage_key
+                account_url=self.endpoint,
+                credential=storage_key,
+                **self._get_transfer_options(),
             )
         else:
             # Configure using the Azure Storage Account Endpoint and DefaultAzureCredential
             # If the key is not configured, then the DefaultAzureCredential will be used to support Managed Identity authentication
             self.blob_service_client = BlobServiceClient(
-                account_url=self.endpoint, credential=DefaultAzureCredential()
+                account_url=self.endpoint,
+                credential=DefaultAzureCredential(),
+                **self._get_transfer_options(),
             )
         self.container_client = self.blob_service_client.get_container_client(
             self.container_name
         )
 
+    @staticmethod
+    def _get_transfer_options() -> dict:
+        return {
+            "max_block_size": STORAGE_CHUNK_SIZE,
+            "max_single_put_size": STORAGE_CHUNK_SIZE,
+            "max_single_get_size": STORAGE_CHUNK_SIZE,
+            "max_chunk_get_size": STORAGE_CHUNK_SIZE,
+        }
+
     def upload_file(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
-    ) -> Tuple[bytes, str]:
+    ) -> Tuple[int, str]:
         """Handles uploading of the file to Azure Blob Storage."""
-        contents, file_path = LocalStorageProvider.upload_file(file, filename, tags)
+        size, file_path = LocalStorageProvider.upload_file(file, filename, tags)
         try:
             blob_client = self.container_client.get_blob_client(filename)
-            blob_client.upload_blob(contents, overwrite=True)
-            return contents, f"{self.endpoint}/{self.container_name}/{filename}"
+            # Larger files are staged as blocks and committed as one block list
+            with open(file_path, "rb") as data:
+                blob_client.upload_blob(
+                    data,
+                    length=size,
+                    overwrite=True,
+                    max_concurrency=STORAGE_MAX_CONCURRENCY,
+                )
+            return size, f"{self.endpoint}/{self.container_name}/{filename}"
         except Exception as e:
             raise RuntimeError(f"Error uploading file to Azure Blob Storage: {e}")
 
@@ -325,9 +457,30 @@ class AzureStorageProvider(StorageProvider):
             filename = file_path.split("/")[-1]
             local_file_path = f"{UPLOAD_DIR}/{filename}"
             blob_client = self.container_client.get_blob_client(filename)
-            with open(local_file_path, "wb") as download_file:
-                download_file.write(blob_client.download_blob().readall())
-            return local_file_path
+            properties = blob_client.get_blob_properties()
+            return download_to_local_file(
+                local_file_path,
+                properties.size,
+                lambda f: blob_client.download_blob(
+                    max_concurrency=STORAGE_MAX_CONCURRENCY
+                ).readinto(f),
+            )
+        except ResourceNotFoundError as e:
+            raise RuntimeError(f"Error downloading file from Azure Blob Storage: {e}")
+
+    def stream_file(
+        self, file_path: str
+    ) -> Optional[Tuple[Iterator[bytes], Optional[int]]]:
+        """Streams the blob from Azure Blob Storage unless a local copy exists."""
+        try:
+            filename = file_path.split("/")[-1]
+            if os.path.isfile(f"{UPLOAD_DIR}/{filename}"):
+                return None
+
+            blob_client = self.container_client.get_blob_client(filename)
+            # Chunks are fetched one at a time as the response is sent
+            downloader = blob_client.download_blob()
+            return downloader.chunks(), downloader.size
         except ResourceNotFoundError as e:
             raise RuntimeError(f"Error downloading file from Azure Blob Storage: {e}")
 
@@ -8,7 +8,7 @@ from redis.asyncio import Redis
 from fastapi import Request
 from typing import Dict, List, Optional
 
-from open_webui.env import REDIS_KEY_PREFIX
+from open_webui.env import BACKGROUND_TASKS_MAX_CONCURRENCY, REDIS_KEY_PREFIX
 
 log = logging.getLogger(__name__)
 
@@ -123,6 +123,41 @@ async def create_task(redis, coroutine, id=None):
     return task_id, task
 
 
+# Slots for post-response work (title, tags, follow-ups) across all chats
+background_task_slots = asyncio.Semaphore(BACKGROUND_TASKS_MAX_CONCURRENCY)
+
+
+async def run_background_task(coroutine):
+    """
+    Run a background coroutine once one of BACKGROUND_TASKS_MAX_CONCURRENCY
+    slots is free, queueing it otherwise.
+    """
+    async with background_task_slots:
+        return await coroutine
+
+
+# Keep references to enqueued work so it is not garbage collected mid-run
+background_tasks: set[asyncio.Task] = set()
+
+
+def enqueue_background_task(coroutine) -> asyncio.Task:
+    """
+    Schedule post-response work without waiting for it. The coroutine gates
+    its own model calls with run_background_task, so the caller never waits
+    for a slot.
+    """
+
+    def done(task: asyncio.Task):
+        background_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            log.error(f"Background task failed: {task.exception()}")
+
+    task = asyncio.create_task(coroutine)
+    background_tasks.add(task)
+    task.add_done_callback(done)
+    return task
+
+
 async def list_tasks(redis):
     """
     List all currently active task IDs.
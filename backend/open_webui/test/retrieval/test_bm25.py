@@ -0,0 +1,173 @@
+from langchain_community.retrievers import BM25Retriever
+
+from open_webui.retrieval.bm25 import BM25Index, BM25IndexStore
+from open_webui.retrieval.vector.main import GetResult
+
+TEXTS = [
+    "the quick brown fox jumps over the lazy dog",
+    "open webui supports hybrid search with bm25 and vectors",
+    "bm25 is a bag of words ranking function",
+    "vectors capture semantic similarity between texts",
+    "the lazy cat sleeps all day",
+]
+IDS = [f"doc-{idx}" for idx in range(len(TEXTS))]
+METADATAS = [
+    {"file_id": f"file-{idx % 2}", "name": f"doc{idx}.txt"} for idx in range(len(TEXTS))
+]
+
+
+def build_index(tmp_path, enriched=False):
+    index = BM25Index(tmp_path / "index.sqlite3", enriched)
+    index.create()
+    index.add(IDS, TEXTS, METADATAS)
+    return index
+
+
+def test_search_matches_in_memory_retriever(tmp_path):
+    index = build_index(tmp_path)
+    retriever = BM25Retriever.from_texts(texts=TEXTS, metadatas=METADATAS)
+
+    for query in ["bm25 ranking", "lazy dog", "semantic vectors"]:
+        retriever.k = 1
+        expected = retriever.invoke(query)[0].page_content
+        assert index.search(query, 1)[0].page_content == expected
+
+
+def test_incremental_add_and_delete(tmp_path):
+    index = build_index(tmp_path)
+    assert index.count() == len(TEXTS)
+
+    index.add(["doc-new"], ["zebra stripes"], [{"file_id": "file-9"}])
+    assert index.search("zebra", 3)[0].metadata == {"file_id": "file-9"}
+
+    # Re-adding an id replaces it instead of duplicating it
+    index.add(["doc-new"], ["giraffe neck"], [{"file_id": "file-9"}])
+    assert index.count() == len(TEXTS) + 1
+    assert index.search("zebra", 3) == []
+
+    index.delete(filter={"file_id": "file-9"})
+    assert index.search("giraffe", 3) == []
+
+    index.delete(ids=["doc-0"])
+    assert index.count() == len(TEXTS) - 1
+    assert all("fox" not in doc.page_content for doc in index.search("fox", 5))
+
+
+def test_enriched_index_matches_metadata(tmp_path):
+    index = build_index(tmp_path, enriched=True)
+    results = index.search("doc3.txt", 1)
+
+    assert results[0].metadata["name"] == "doc3.txt"
+    assert "Filename: doc3.txt" in results[0].page_content
+
+
+def test_store_builds_once_and_tracks_updates(tmp_path):
+    store = BM25IndexStore(tmp_path / "bm25")
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return GetResult(ids=[IDS], documents=[TEXTS], metadatas=[METADATAS])
+
+    assert store.get_index("collection", loader).count() == len(TEXTS)
+    assert store.get_index("collection", loader).count() == len(TEXTS)
+    assert len(loads) == 1
+
+    store.add(
+        "collection",
+        [{"id": "doc-new", "text": "zebra", "metadata": {"file_id": "file-9"}}],
+    )
+    assert store.get_index("collection", loader).search("zebra", 1)
+
+    store.delete("collection", filter={"file_id": "file-9"})
+    assert store.get_index("collection", loader).search("zebra", 1) == []
+
+    store.drop("collection")
+    store.get_index("collection", loader)
+    assert len(loads) == 2
+
+    store.reset()
+    assert not any((tmp_path / "bm25").iterdir())
+
+
+def test_store_rebuilds_after_changes_it_missed(tmp_path):
+    store = BM25IndexStore(tmp_path / "bm25")
+    added = []
+
+    def loader():
+        # A document lands in the collection while the index is being built
+        if not added:
+            added.append(1)
+            store.add(
+                "collection",
+                [{"id": "doc-new", "text": "zebra", "metadata": {}}],
+            )
+            return GetResult(ids=[IDS], documents=[TEXTS], metadatas=[METADATAS])
+        return GetResult(
+            ids=[IDS + ["doc-new"]],
+            documents=[TEXTS + ["zebra"]],
+            metadatas=[METADATAS + [{}]],
+        )
+
+    assert store.get_index("collection", loader).search("zebra", 1) == []
+    index = store.get_index("collection", loader)
+    assert index.search("zebra", 1)[0].page_content == "zebra"
+    assert index.get_version() == store.get_version("collection")
+
+    # Changes applied on top of an up to date index keep it current
+    store.delete("collection", ids=["doc-new", "doc-0"], filter={"file_id": "file-0"})
+    assert index.count() == len(TEXTS)
+    assert index.search("zebra", 1)
+    assert index.get_version() == store.get_version("collection")
+
+
+class FakeRedis:
+    """Just the Redis calls BM25IndexStore makes, shared by its instances"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def get(self, key):
+        self.commands.append(key)
+
+    def execute(self):
+        return [self.redis.get(key) for key in self.commands]
+
+
+def test_reset_invalidates_every_node(tmp_path):
+    redis = FakeRedis()
+    # Two nodes, each with its own index directory
+    node_a = BM25IndexStore(tmp_path / "a", redis=redis)
+    node_b = BM25IndexStore(tmp_path / "b", redis=redis)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return GetResult(ids=[IDS], documents=[TEXTS], metadatas=[METADATAS])
+
+    # The collection never changed, so it has no version key
+    node_a.get_index("collection", loader)
+    node_a.get_index("collection", loader)
+    assert len(loads) == 1
+
+    node_b.reset()
+    node_a.get_index("collection", loader)
+    assert len(loads) == 2
+    node_a.get_index("collection", loader)
+    assert len(loads) == 2
@@ -0,0 +1,60 @@
+import pytest
+
+from open_webui.retrieval.cache_store import DiskCacheStore
+from open_webui.retrieval.embedding_cache import EmbeddingCache
+
+
+def make_embedding_function(calls: list):
+    async def embedding_function(query, prefix=None, user=None):
+        calls.append(query)
+        if isinstance(query, list):
+            return [[float(len(text)), 0.5] for text in query]
+        return [float(len(query)), 0.5]
+
+    return embedding_function
+
+
+@pytest.mark.asyncio
+async def test_only_missing_texts_are_embedded(tmp_path):
+    calls = []
+    cache = EmbeddingCache(size=2, dtype="float16")
+    embed = cache.wrap(make_embedding_function(calls), "openai", "model-a")
+
+    assert await embed(["a", "bb", "a"]) == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+    assert calls == [["a", "bb"]]
+
+    # Single queries share entries with ingestion, prefixes do not
+    assert await embed("bb") == [2.0, 0.5]
+    assert await embed("bb", prefix="query: ") == [2.0, 0.5]
+    assert calls[1:] == [["bb"]]
+    assert cache.get_stats()["misses"] == 4
+
+    # Other models never see cached vectors
+    await cache.wrap(make_embedding_function(calls), "openai", "model-b")("bb")
+    assert calls[-1] == ["bb"]
+
+    # Evicted entries come back from the disk tier
+    store = DiskCacheStore(tmp_path / "embeddings.sqlite3")
+    cache = EmbeddingCache(size=1, store=store, ttl=60)
+    embed = cache.wrap(make_embedding_function(calls), "openai", "model-a")
+    await embed(["a", "bb"])
+    calls.clear()
+    assert await embed(["a", "bb"]) == [[1.0, 0.5], [2.0, 0.5]]
+    assert calls == []
+    assert cache.get_stats()["store_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unaligned_results_fall_back_to_plain_call():
+    calls = []
+
+    async def flaky_embedding_function(query, prefix=None, user=None):
+        calls.append(query)
+        return None if len(calls) == 1 else [[0.1]] * len(query)
+
+    cache = EmbeddingCache(size=10)
+    embed = cache.wrap(flaky_embedding_function, "ollama", "model")
+
+    assert await embed(["a", "b"]) == [[0.1], [0.1]]
+    assert calls == [["a", "b"], ["a", "b"]]
+    assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from open_webui.retrieval.embedding_dispatcher import EmbeddingDispatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_batches():
+    batches = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def embed_batch(texts, prefix=None, user=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        batches.append(list(texts))
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[float(text)] for text in texts]
+
+    dispatcher = EmbeddingDispatcher(batch_window=0.005, concurrency=2)
+    embed = dispatcher.wrap(embed_batch, target="openai:model", batch_size=8)
+
+    results = await asyncio.gather(*[embed(str(idx)) for idx in range(40)])
+
+    assert results == [[float(idx)] for idx in range(40)]
+    assert len(batches) == 5
+    assert all(len(batch) <= 8 for batch in batches)
+    assert max_in_flight == 2
+
+    # Prefixes are never mixed within a batch
+    batches.clear()
+    await asyncio.gather(embed(["1", "2"]), embed(["3"], prefix="query: "))
+    assert sorted(batches) == [["1", "2"], ["3"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_and_rate_limit():
+    async def failing_embed_batch(texts, prefix=None, user=None):
+        return None
+
+    dispatcher = EmbeddingDispatcher(batch_window=0, tokens_per_minute=60)
+    embed = dispatcher.wrap(failing_embed_batch, target="ollama:model", batch_size=4)
+
+    assert await embed("text") is None
+    assert await embed(["a", "b"]) == []
+
+    # Estimated tokens beyond the per-minute budget wait for it to refill
+    bucket = dispatcher._get_bucket("ollama:model")
+    bucket.tokens = 0
+    start = asyncio.get_running_loop().time()
+    await bucket.acquire(1)
+    assert asyncio.get_running_loop().time() - start >= 0.9
+
+
+@pytest.mark.asyncio
+async def test_queries_skip_the_ingest_backlog():
+    batches = []
+
+    async def embed_batch(texts, prefix=None, user=None):
+        batches.append(list(texts))
+        await asyncio.sleep(0.01)
+        return [[0.0] for _ in texts]
+
+    dispatcher = EmbeddingDispatcher(batch_window=0, concurrency=1)
+    embed = dispatcher.wrap(embed_batch, target="openai:model", batch_size=2)
+
+    ingest = asyncio.create_task(embed([f"chunk {idx}" for idx in range(10)]))
+    while not batches:
+        await asyncio.sleep(0)
+    assert dispatcher.get_stats()["pending"] == 8
+
+    # The query takes the next free slot, ahead of the four queued batches
+    assert await embed("query") == [0.0]
+    assert batches.index(["query"]) == 1
+    assert len(await ingest) == 10
@@ -0,0 +1,128 @@
+"""
+Bulk ingestion into a scratch collection of the configured pgvector database
+(VECTOR_DB=pgvector), once with the vector index kept live and once with it
+deferred until the end of the load.
+"""
+
+import math
+import random
+import uuid
+
+import pytest
+from sqlalchemy import event, text
+
+from open_webui.config import VECTOR_DB
+
+pytestmark = pytest.mark.skipif(
+    VECTOR_DB != "pgvector", reason="requires VECTOR_DB=pgvector"
+)
+
+N = 1000
+CHUNKS_PER_FILE = 100
+BATCH_SIZE = 40
+
+COLLECTION = "test-pgvector-bulk"
+
+
+@pytest.fixture(scope="module")
+def client():
+    from open_webui.retrieval.vector.dbs.pgvector import PgvectorClient
+
+    client = PgvectorClient()
+    yield client
+    client.delete_collection(COLLECTION)
+
+
+def make_items(count: int, dimension: int) -> list[dict]:
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "text": f"chunk {idx}\twith\nspecial 'characters' \\ \"quoted\"",
+            "vector": [random.random() for _ in range(dimension)],
+            "metadata": {"file_id": f"file-{idx // CHUNKS_PER_FILE}", "index": idx},
+        }
+        for idx in range(count)
+    ]
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, *args):
+        self.statements.append(" ".join(statement.split()))
+
+    def count(self, prefix: str) -> int:
+        return sum(statement.startswith(prefix) for statement in self.statements)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(self.engine, "before_cursor_execute", self)
+
+
+def has_vector_index(client, name: str) -> bool:
+    result = client.session.execute(
+        text("SELECT 1 FROM pg_indexes WHERE indexname = :name"), {"name": name}
+    ).first()
+    client.session.rollback()
+    return result is not None
+
+
+@pytest.mark.parametrize("defer_index", [False, True])
+def test_bulk_load(client, monkeypatch, defer_index):
+    from open_webui.retrieval.vector.dbs import pgvector
+
+    monkeypatch.setattr(pgvector, "PGVECTOR_DEFER_INDEX_ON_BULK_LOAD", defer_index)
+    monkeypatch.setattr(pgvector, "PGVECTOR_INSERT_BATCH_SIZE", BATCH_SIZE)
+    client.delete_collection(COLLECTION)
+    indexed = has_vector_index(client, pgvector.VECTOR_INDEX_NAME)
+
+    items = make_items(N, pgvector.VECTOR_LENGTH)
+    with StatementCounter(client.session.get_bind()) as counter:
+        client.begin_bulk_load()
+        try:
+            for offset in range(0, len(items), CHUNKS_PER_FILE):
+                client.insert(COLLECTION, items[offset : offset + CHUNKS_PER_FILE])
+            # Deferred, the index stays dropped until the whole load is done
+            assert has_vector_index(client, pgvector.VECTOR_INDEX_NAME) == (
+                indexed and not defer_index
+            )
+        finally:
+            client.end_bulk_load()
+
+    # One multi-row INSERT per batch, never one per chunk
+    files = N // CHUNKS_PER_FILE
+    batches = files * math.ceil(CHUNKS_PER_FILE / BATCH_SIZE)
+    assert counter.count("INSERT INTO document_chunk") == batches
+    assert counter.count("DROP INDEX") == (1 if defer_index else 0)
+    assert has_vector_index(client, pgvector.VECTOR_INDEX_NAME) == indexed
+
+    result = client.query(COLLECTION, {"file_id": "file-0"})
+    assert sorted(result.ids[0]) == sorted(
+        item["id"] for item in items[:CHUNKS_PER_FILE]
+    )
+    assert items[0]["text"] in result.documents[0]
+
+    search = client.search(COLLECTION, [items[0]["vector"]], limit=1)
+    assert search.ids == [[items[0]["id"]]]
+
+
+def test_upsert_updates_in_place(client):
+    client.delete_collection(COLLECTION)
+    items = make_items(10, 8)
+    client.insert(COLLECTION, items)
+
+    # Duplicate ids in one batch keep the last item
+    client.upsert(
+        COLLECTION,
+        [{**items[0], "text": "first"}, {**items[0], "text": "updated"}],
+    )
+
+    result = client.query(COLLECTION, {"file_id": "file-0"})
+    documents = dict(zip(result.ids[0], result.documents[0]))
+    assert len(documents) == 10
+    assert documents[items[0]["id"]] == "updated"
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+import pytest
+from langchain_core.documents import Document
+
+from open_webui.retrieval import utils as retrieval_utils
+from open_webui.retrieval.reranker import RerankerPool
+from open_webui.retrieval.utils import RerankCompressor, get_cosine_similarities
+from open_webui.retrieval.vector.main import VectorDBBase
+
+
+class FakeCrossEncoder:
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+
+    def predict(self, pairs):
+        self.calls.append(list(pairs))
+        self.threads.add(threading.current_thread().name)
+        return [float(len(text)) for _, text in pairs]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_batches_and_cache():
+    reranker = FakeCrossEncoder()
+    pool = RerankerPool(max_workers=2, batch_window=0.005, batch_size=64)
+    documents = [Document(page_content="x" * idx) for idx in range(1, 6)]
+
+    results = await asyncio.gather(
+        *[pool.score(reranker, "model", f"query {idx}", documents) for idx in range(4)]
+    )
+
+    assert results == [[1.0, 2.0, 3.0, 4.0, 5.0]] * 4
+    assert len(reranker.calls) == 1 and len(reranker.calls[0]) == 20
+    assert all(name.startswith("reranker") for name in reranker.threads)
+
+    # Follow-up turns only score new chunks
+    more = documents + [Document(page_content="y" * 7)]
+    assert await pool.score(reranker, "model", "query 0", more) == [
+        1.0,
+        2.0,
+        3.0,
+        4.0,
+        5.0,
+        7.0,
+    ]
+    assert reranker.calls[-1] == [("query 0", "y" * 7)]
+
+
+@pytest.mark.asyncio
+async def test_cosine_fallback_uses_embedding_function():
+    calls = []
+
+    async def embedding_function(query, prefix=None):
+        calls.append(query)
+        if isinstance(query, list):
+            return [[1.0, 0.0] if "a" in text else [0.0, 1.0] for text in query]
+        return [1.0, 0.0]
+
+    compressor = RerankCompressor(
+        embedding_function=embedding_function,
+        top_n=1,
+        reranking_function=None,
+        r_score=0,
+    )
+    result = await compressor.acompress_documents(
+        [Document(page_content="b\nb"), Document(page_content="a\na")], "query"
+    )
+
+    assert [doc.page_content for doc in result] == ["a\na"]
+    assert result[0].metadata["score"] == pytest.approx(1.0)
+    # Texts are normalized the way they were at ingestion
+    assert calls[1] == ["b b", "a a"]
+    assert get_cosine_similarities([1.0, 0.0], [[0.0, 0.0]]) == [0.0]
+
+
+class StoredVectors(VectorDBBase):
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = []
+
+    def get_vectors(self, collection_name, ids):
+        self.calls.append((collection_name, list(ids)))
+        return {id: self.vectors[id] for id in ids if id in self.vectors}
+
+    has_collection = delete_collection = insert = upsert = search = None
+    query = get = delete = reset = None
+
+
+@pytest.mark.asyncio
+async def test_cosine_fallback_uses_stored_vectors(monkeypatch):
+    # "padded" comes back zero-padded to a fixed column size, "other" was
+    # stored by a model with more dimensions and is embedded again
+    vector_db = StoredVectors(
+        {
+            "stored": [0.0, 1.0],
+            "padded": [1.0, 0.0, 0.0, 0.0],
+            "other": [1.0, 0.0, 1.0],
+        }
+    )
+    monkeypatch.setattr(retrieval_utils, "VECTOR_DB_CLIENT", vector_db)
+    calls = []
+
+    async def embedding_function(query, prefix=None):
+        calls.append(query)
+        if isinstance(query, list):
+            return [[0.6, 0.8] for _ in query]
+        return [1.0, 0.0]
+
+    compressor = RerankCompressor(
+        embedding_function=embedding_function,
+        top_n=4,
+        reranking_function=None,
+        r_score=0,
+        collection_name="collection",
+    )
+    result = await compressor.acompress_documents(
+        [
+            Document(id="stored", page_content="stored"),
+            Document(id="padded", page_content="padded"),
+            Document(id="other", page_content="other"),
+            Document(page_content="no id"),
+        ],
+        "query",
+    )
+
+    assert vector_db.calls == [("collection", ["stored", "padded", "other"])]
+    assert calls == ["query", ["other", "no id"]]
+    assert [(doc.page_content, doc.metadata["score"]) for doc in result] == [
+        ("padded", pytest.approx(1.0)),
+        ("other", pytest.approx(0.6)),
+        ("no id", pytest.approx(0.6)),
+        ("stored", pytest.approx(0.0)),
+    ]
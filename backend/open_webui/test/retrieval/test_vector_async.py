@@ -0,0 +1,129 @@
+import asyncio
+import threading
+
+import pytest
+
+from open_webui.retrieval.vector.main import (
+    AsyncClientHandle,
+    SearchResult,
+    VectorDBBase,
+)
+from open_webui.retrieval.utils import merge_and_sort_query_results
+
+
+class SyncVectorDB(VectorDBBase):
+    """Sync-only backend that records which threads serve its calls"""
+
+    def __init__(self):
+        self.threads = set()
+
+    def search(self, collection_name, vectors, filter=None, limit=10):
+        self.threads.add(threading.current_thread().name)
+        return SearchResult(
+            ids=[[collection_name]],
+            documents=[["text"]],
+            metadatas=[[{"limit": limit}]],
+            distances=[[1.0]],
+        )
+
+    def query(self, collection_name, filter, limit=-1):
+        return limit
+
+    has_collection = delete_collection = insert = upsert = get = None
+    delete = reset = None
+
+
+@pytest.mark.asyncio
+async def test_sync_backend_runs_on_shared_executor():
+    db = SyncVectorDB()
+
+    results = await asyncio.gather(
+        *[db.asearch(f"collection-{idx}", [[0.1]], limit=3) for idx in range(50)]
+    )
+
+    assert [result.ids[0][0] for result in results] == [
+        f"collection-{idx}" for idx in range(50)
+    ]
+    assert results[0].metadatas[0][0] == {"limit": 3}
+    assert all(name.startswith("vector-db") for name in db.threads)
+
+    # The backend's own default applies when no limit is given
+    assert await db.aquery("collection", {}) == -1
+
+
+@pytest.mark.asyncio
+async def test_async_client_handle_is_bound_to_its_loop():
+    created = []
+
+    async def factory():
+        created.append(asyncio.get_running_loop())
+        return object()
+
+    handle = AsyncClientHandle(factory)
+    client = await handle.get()
+    assert client is not None
+    assert await handle.get() is client
+
+    # Other event loops (e.g. asyncio.run in a worker thread) fall back
+    assert await asyncio.to_thread(asyncio.run, handle.get()) is None
+    assert len(created) == 1
+
+    assert await AsyncClientHandle(None).get() is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_handle_creates_one_client_under_concurrency():
+    created = []
+
+    async def factory():
+        await asyncio.sleep(0.01)
+        created.append(object())
+        return created[-1]
+
+    handle = AsyncClientHandle(factory)
+    clients = await asyncio.gather(*[handle.get() for _ in range(10)])
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+
+
+class BatchVectorDB(SyncVectorDB):
+    def __init__(self, multi_vector=True):
+        super().__init__()
+        self.MULTI_VECTOR_SEARCH = multi_vector
+        self.calls = []
+
+    def search(self, collection_name, vectors, filter=None, limit=10):
+        self.calls.append((collection_name, len(vectors)))
+        if collection_name == "broken":
+            raise RuntimeError("unavailable")
+
+        return SearchResult(
+            ids=[[f"{collection_name}-{idx}"] for idx in range(len(vectors))],
+            documents=[[f"{collection_name} {vector[0]}"] for vector in vectors],
+            metadatas=[[{}] for _ in vectors],
+            distances=[[vector[0]] for vector in vectors],
+        )
+
+
+@pytest.mark.asyncio
+async def test_search_collections_batches_query_vectors():
+    vectors = [[0.1], [0.9], [0.5]]
+    collections = [f"collection-{idx}" for idx in range(10)]
+
+    db = BatchVectorDB()
+    results = await db.asearch_collections(collections + ["", "broken"], vectors, 5)
+    # One call per collection carrying every query vector
+    assert len(db.calls) == 11
+    assert all(count == 3 for _, count in db.calls)
+    assert len(results) == 10
+
+    merged = merge_and_sort_query_results([r.model_dump() for r in results], k=2)
+    assert merged["distances"] == [[0.9, 0.9]]
+
+    db = BatchVectorDB(multi_vector=False)
+    await db.asearch_collections(collections, vectors, 5)
+    assert len(db.calls) == 30
+
+    with pytest.raises(RuntimeError):
+        await db.asearch_collections(["broken"], vectors, 5)
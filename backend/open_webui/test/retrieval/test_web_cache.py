@@ -0,0 +1,73 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from open_webui.retrieval.cache_store import DiskCacheStore
+from open_webui.retrieval.web.cache import WebCache
+from open_webui.retrieval.web.utils import SafeWebBaseLoader
+
+PAGE = "<html lang='en'><title>Cats</title><body>Cats sleep a lot.</body></html>"
+
+
+@pytest.mark.asyncio
+async def test_pages_are_served_fresh_then_revalidated():
+    requests_seen = []
+
+    async def page(request):
+        requests_seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(
+            text=PAGE, content_type="text/html", headers={"ETag": '"v1"'}
+        )
+
+    app = web.Application()
+    app.router.add_get("/cats", page)
+    cache = WebCache(search_size=10, page_size=10, page_ttl=60)
+
+    async with TestServer(app) as server:
+        url = str(server.make_url("/cats"))
+
+        async def load():
+            loader = SafeWebBaseLoader(
+                web_paths=[url], continue_on_failure=True, cache=cache
+            )
+            return await loader.aload()
+
+        first = await load()
+        second = await load()
+        assert requests_seen == [None]
+        assert second[0].page_content == first[0].page_content
+        assert second[0].metadata["title"] == "Cats"
+
+        # Past the TTL the page is revalidated instead of downloaded again
+        cache.page_ttl = 0
+        for entry in cache._pages.values():
+            entry["fresh_until"] = 0
+        third = await load()
+        assert requests_seen == [None, '"v1"']
+        assert third[0].page_content == first[0].page_content
+
+    stats = cache.get_stats()
+    assert (stats["page_misses"], stats["page_hits"], stats["page_revalidated"]) == (
+        1,
+        1,
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_results_survive_in_disk_tier(tmp_path):
+    store = DiskCacheStore(tmp_path / "web.sqlite3")
+    results = [{"link": "https://example.com", "title": "Example", "snippet": "Hi"}]
+
+    cache = WebCache(search_size=1, page_size=1, store=store)
+    await cache.set_search_results("query", results, ttl=60)
+    await cache.set_search_results("expired", results, ttl=0)
+
+    # A new process starts with an empty LRU
+    cache = WebCache(search_size=1, page_size=1, store=store)
+    assert await cache.get_search_results("query") == results
+    assert await cache.get_search_results("expired") is None
+    assert cache.get_stats()["search_hits"] == 1
+    assert cache.get_stats()["search_misses"] == 1
@@ -0,0 +1,63 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from open_webui.retrieval.web import searxng
+from open_webui.retrieval.web.client import WebSearchClient
+from open_webui.retrieval.web.main import aget_filtered_results
+
+
+@pytest.mark.asyncio
+async def test_engines_retry_rate_limited_searches(monkeypatch):
+    statuses = [429, 503]
+
+    async def search(request):
+        if statuses:
+            return web.Response(status=statuses.pop(0), headers={"Retry-After": "0"})
+        return web.json_response(
+            {
+                "results": [
+                    {"url": "https://a.example", "title": "A", "score": 1},
+                    {"url": "https://b.example", "title": "B", "score": 2},
+                ]
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/search", search)
+
+    client = WebSearchClient(max_retries=2, retry_backoff=0)
+    monkeypatch.setattr(searxng, "WEB_SEARCH_CLIENT", client)
+
+    async with TestServer(app) as server:
+        url = str(server.make_url("/search"))
+        results = await searxng.search_searxng(url, "cats", 2)
+        assert [result.link for result in results] == [
+            "https://b.example",
+            "https://a.example",
+        ]
+
+        # Out of retries, the engine's HTTP error is raised
+        client.max_retries = 0
+        statuses.append(503)
+        with pytest.raises(Exception, match="503"):
+            await searxng.search_searxng(url, "cats", 2)
+
+    assert client.get_stats()["searxng"] == {
+        "requests": 4,
+        "retries": 2,
+        "rate_limited": 1,
+        "errors": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_filtered_results_match_sync_filter():
+    results = [
+        {"url": "https://example.invalid/a"},
+        {"link": "https://blocked.invalid/b"},
+        {"url": "not a url"},
+    ]
+
+    filtered = await aget_filtered_results(results, ["!blocked.invalid"])
+    assert filtered == [{"url": "https://example.invalid/a"}]
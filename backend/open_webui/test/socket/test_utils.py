@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from open_webui.socket.utils import MessageEventBuffer
+
+
+class FakeChatStore:
+    """In-memory stand-in for Chats that counts reads and writes"""
+
+    def __init__(self, message):
+        self.message = dict(message)
+        self.reads = 0
+        self.writes = 0
+
+    def get_message(self, chat_id, message_id):
+        self.reads += 1
+        return dict(self.message)
+
+    def upsert_message(self, chat_id, message_id, message):
+        self.writes += 1
+        self.message = {**self.message, **message}
+
+
+def stream_events(buffer, count):
+    for i in range(count):
+        buffer.add("chat", "message", "content", f"{i} ")
+    buffer.add("chat", "message", "status", {"action": "web_search", "done": True})
+    buffer.add("chat", "message", "sources", {"source": {"name": "doc"}})
+
+
+class TestMessageEventBuffer:
+    @pytest.mark.asyncio
+    async def test_streamed_response_is_written_once(self):
+        events = 200
+
+        unbuffered = FakeChatStore({"content": ""})
+        stream_events(
+            MessageEventBuffer(
+                unbuffered.get_message,
+                unbuffered.upsert_message,
+                flush_interval=0,
+            ),
+            events,
+        )
+
+        buffered = FakeChatStore({"content": ""})
+        buffer = MessageEventBuffer(
+            buffered.get_message,
+            buffered.upsert_message,
+            flush_interval=60,
+            max_events=1000,
+        )
+        stream_events(buffer, events)
+        buffer.flush("chat", "message")
+
+        # Unbuffered, every event is a read-modify-write of the message
+        assert unbuffered.writes == unbuffered.reads == events + 2
+        assert buffered.writes == 1
+        assert buffered.reads == 1
+        assert buffered.message == unbuffered.message
+
+    @pytest.mark.asyncio
+    async def test_flush_on_max_events(self):
+        store = FakeChatStore({"content": ""})
+        buffer = MessageEventBuffer(
+            store.get_message,
+            store.upsert_message,
+            flush_interval=60,
+            max_events=10,
+        )
+        stream_events(buffer, 28)
+        buffer.flush("chat", "message")
+
+        assert store.writes == 3
+        assert store.message["content"].endswith("27 ")
+
+    @pytest.mark.asyncio
+    async def test_flush_on_interval(self):
+        store = FakeChatStore({"content": "Hello"})
+        buffer = MessageEventBuffer(
+            store.get_message,
+            store.upsert_message,
+            flush_interval=0.01,
+        )
+        buffer.add("chat", "message", "content", " world")
+
+        await asyncio.sleep(0.05)
+
+        assert ("chat", "message") not in buffer
+        assert store.writes == 1
+        assert store.message["content"] == "Hello world"
+
+    def test_apply_ops_preserves_event_semantics(self):
+        message = {
+            "content": "a",
+            "embeds": ["old"],
+            "files": [{"id": "1"}],
+            "sources": [],
+        }
+        updates = MessageEventBuffer.apply_ops(
+            message,
+            [
+                ("content", "b"),
+                ("replace", "c"),
+                ("content", "d"),
+                ("embeds", ["new"]),
+                ("files", [{"id": "2"}]),
+                ("status", {"done": True}),
+            ],
+        )
+
+        assert updates["content"] == "cd"
+        assert updates["embeds"] == ["new", "old"]
+        assert updates["files"] == [{"id": "2"}, {"id": "1"}]
+        assert updates["statusHistory"] == [{"done": True}]
+        assert "sources" not in updates
+
+    def test_apply_ops_skips_appends_for_missing_message(self):
+        updates = MessageEventBuffer.apply_ops(
+            {}, [("content", "x"), ("status", {"done": True})]
+        )
+
+        assert updates == {}
@@ -0,0 +1,124 @@
+import json
+import queue
+import threading
+import time
+
+import pytest
+
+from open_webui import config as config_module
+from open_webui.config import AppConfig, PersistentConfig
+
+
+class FakeRedis:
+    """Just enough of a Redis server for AppConfig, shared by its instances"""
+
+    def __init__(self):
+        self.values = {}
+        self.gets = []
+        self.subscribers = []
+
+    def get(self, key):
+        self.gets.append(key)
+        return self.values.get(key)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def publish(self, channel, message):
+        for pubsub in self.subscribers:
+            pubsub.messages.put({"type": "message", "data": message})
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.messages = queue.Queue()
+
+    def subscribe(self, channel):
+        self.redis.subscribers.append(self)
+        self.messages.put({"type": "subscribe", "data": 1})
+
+    def listen(self):
+        while True:
+            yield self.messages.get()
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(
+        config_module, "get_redis_connection", lambda *args, **kwargs: redis
+    )
+    monkeypatch.setattr(config_module, "ENABLE_PERSISTENT_CONFIG", True)
+    # Keep test values out of the shared config table
+    monkeypatch.setattr(config_module, "CONFIG_DATA", {})
+    monkeypatch.setattr(config_module, "save_to_db", lambda data: None)
+    return redis
+
+
+def create_config(redis) -> AppConfig:
+    subscribers = len(redis.subscribers)
+    app_config = AppConfig(redis_url="redis://test", redis_key_prefix="test")
+    app_config.TEST_VALUE = PersistentConfig("TEST_VALUE", "test.value", "default")
+
+    # Wait for the listener to subscribe
+    deadline = time.monotonic() + 5
+    while len(redis.subscribers) == subscribers and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return app_config
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_first_read_syncs_from_redis(redis):
+    # Written by another instance while this one was not running
+    redis.values["test:config:TEST_VALUE"] = json.dumps("from redis")
+    app_config = create_config(redis)
+
+    assert app_config.TEST_VALUE == "from redis"
+    assert app_config.TEST_VALUE == "from redis"
+    assert redis.gets.count("test:config:TEST_VALUE") == 1
+    assert app_config.stats["refreshes"] == 1
+
+
+def test_published_updates_refresh_other_instances(redis):
+    writer = create_config(redis)
+    reader = create_config(redis)
+    assert reader.TEST_VALUE == "default"
+    version = reader.stats["version"]
+
+    writer.TEST_VALUE = "updated"
+
+    assert redis.values["test:config:TEST_VALUE"] == json.dumps("updated")
+    assert wait_for(lambda: reader.stats["version"] == version + 1)
+    assert reader.TEST_VALUE == "updated"
+
+    # The writer ignores its own announcement and keeps its value
+    assert writer.TEST_VALUE == "updated"
+    assert writer.stats["refreshes"] == 0
+
+
+def test_read_counter_across_threads(redis):
+    app_config = create_config(redis)
+    app_config.TEST_VALUE
+
+    def read():
+        for _ in range(2000):
+            app_config.TEST_VALUE
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Reads are counted without a lock, concurrent increments may be lost
+    assert 2000 <= app_config.stats["reads"] <= 1 + 8 * 2000
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from open_webui.constants import TASKS
+from open_webui.models.chats import ChatForm, Chats
+from open_webui.tasks import (
+    background_task_slots,
+    enqueue_background_task,
+    run_background_task,
+)
+from open_webui.utils import middleware
+
+
+def completion(content: dict) -> dict:
+    return {"choices": [{"message": {"content": json.dumps(content)}}]}
+
+
+@pytest.mark.asyncio
+async def test_title_tags_and_follow_ups_run_together(monkeypatch):
+    messages = {
+        "m1": {"id": "m1", "role": "user", "content": "What is BM25?"},
+        "m2": {
+            "id": "m2",
+            "parentId": "m1",
+            "role": "assistant",
+            "model": "model",
+            "content": "<details>thinking</details>A ranking function.",
+        },
+    }
+    chat = Chats.insert_new_chat(
+        "user-1",
+        ChatForm(
+            chat={
+                "title": "New Chat",
+                "history": {"currentId": "m2", "messages": messages},
+            }
+        ),
+    )
+
+    async def generate(result, delay=0.1):
+        await asyncio.sleep(delay)
+        return completion(result)
+
+    seen_messages = []
+
+    async def generate_title(request, form_data, user):
+        seen_messages.append(form_data["messages"])
+        return await generate({"title": "BM25"})
+
+    monkeypatch.setattr(middleware, "generate_title", generate_title)
+    monkeypatch.setattr(
+        middleware,
+        "generate_follow_ups",
+        lambda *args: generate({"follow_ups": ["And TF-IDF?"]}),
+    )
+    monkeypatch.setattr(
+        middleware, "generate_chat_tags", lambda *args: generate({"tags": ["search"]})
+    )
+
+    writes = []
+    update = Chats.update_chat_title_and_message_by_id
+    monkeypatch.setattr(
+        Chats,
+        "update_chat_title_and_message_by_id",
+        lambda *args, **kwargs: writes.append(kwargs) or update(*args, **kwargs),
+    )
+
+    events = []
+
+    async def event_emitter(event):
+        events.append(event["type"])
+
+    try:
+        start = asyncio.get_running_loop().time()
+        await middleware.background_tasks_handler(
+            {
+                "request": SimpleNamespace(),
+                "form_data": {},
+                "user": SimpleNamespace(id="user-1"),
+                "metadata": {"chat_id": chat.id, "message_id": "m2"},
+                "tasks": {
+                    TASKS.TITLE_GENERATION: True,
+                    TASKS.TAGS_GENERATION: True,
+                    TASKS.FOLLOW_UP_GENERATION: True,
+                },
+                "event_emitter": event_emitter,
+            }
+        )
+        assert asyncio.get_running_loop().time() - start < 0.25
+
+        assert seen_messages[0][1]["content"] == "A ranking function."
+        assert events == ["chat:message:follow_ups", "chat:title", "chat:tags"]
+        assert len(writes) == 1
+
+        chat = Chats.get_chat_by_id(chat.id)
+        assert chat.title == "BM25"
+        assert chat.chat["history"]["currentId"] == "m2"
+        assert chat.chat["history"]["messages"]["m2"]["followUps"] == ["And TF-IDF?"]
+        assert [
+            tag.name for tag in Chats.get_chat_tags_by_id_and_user_id(chat.id, "user-1")
+        ] == ["search"]
+    finally:
+        Chats.delete_chat_by_id(chat.id)
+
+
+@pytest.mark.asyncio
+async def test_enqueued_work_waits_for_a_slot_without_blocking_the_caller():
+    held = 0
+    while not background_task_slots.locked():
+        await background_task_slots.acquire()
+        held += 1
+
+    ran = []
+
+    async def handler():
+        await run_background_task(asyncio.sleep(0))
+        ran.append(1)
+
+    try:
+        task = enqueue_background_task(handler())
+        await asyncio.sleep(0.01)
+        assert ran == [] and not task.done()
+    finally:
+        for _ in range(held):
+            background_task_slots.release()
+
+    await task
+    assert ran == [1]
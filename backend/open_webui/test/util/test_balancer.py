@@ -0,0 +1,61 @@
+from open_webui.utils.balancer import UpstreamBalancer
+
+NODES = {0: "http://gpu-a:11434", 1: "http://gpu-b:11434", 2: "http://gpu-c:11434"}
+
+
+def test_least_outstanding_spreads_long_requests():
+    balancer = UpstreamBalancer(strategy="least_outstanding", cold_model_penalty=0)
+
+    in_flight = []
+    for _ in range(6):
+        idx = balancer.choose(NODES, model="llama3")
+        in_flight.append(balancer.track(NODES[idx], "llama3"))
+
+    assert [stats["outstanding"] for stats in balancer.get_stats().values()] == [
+        2,
+        2,
+        2,
+    ]
+
+    # Finishing requests on one node makes it the preferred one
+    for request in in_flight:
+        if request.url == NODES[1]:
+            request.respond(True)
+            request.done()
+    assert balancer.choose(NODES, model="llama3") == 1
+
+    # Weights scale the share of load a node takes
+    assert balancer.choose(NODES, weights={0: 10}) == 0
+
+
+def test_model_affinity_and_ewma_latency():
+    balancer = UpstreamBalancer(strategy="ewma", cold_model_penalty=2)
+    balancer.set_loaded_models(NODES[2], {"llama3"})
+
+    assert balancer.choose(NODES, model="llama3") == 2
+
+    # A slow node loses to fast ones once the model is loaded everywhere
+    for idx, latency in ((0, 0.1), (1, 0.2), (2, 5.0)):
+        balancer.record(NODES[idx], "llama3", True, latency)
+    assert balancer.choose(NODES, model="llama3") == 0
+
+
+def test_failing_node_is_ejected_until_it_recovers():
+    balancer = UpstreamBalancer(
+        strategy="least_outstanding", max_failures=2, ejection_time=60
+    )
+
+    for _ in range(2):
+        request = balancer.track(NODES[0])
+        request.respond(False)
+        request.done()
+
+    assert balancer.is_ejected(NODES[0])
+    assert balancer.get_stats()[NODES[0]]["errors"] == 2
+    assert all(balancer.choose(NODES) != 0 for _ in range(20))
+
+    # Ejected nodes are still used when nothing else is left
+    assert balancer.choose({0: NODES[0]}) == 0
+
+    balancer.record(NODES[0], None, True, 0.1)
+    assert not balancer.is_ejected(NODES[0])
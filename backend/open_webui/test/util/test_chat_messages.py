@@ -0,0 +1,150 @@
+import shutil
+import types
+import uuid
+
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+from fastapi import HTTPException
+
+import open_webui.env
+from open_webui.env import DATABASE_URL, OPEN_WEBUI_DIR
+from open_webui.internal.db import get_db
+from open_webui.models import chats as chats_module
+from open_webui.models.chat_messages import ChatMessage, ChatMessages
+from open_webui.models.chats import ChatForm, Chats
+from open_webui.routers.chats import get_chat_messages_by_id
+
+# Two branches off the same question; the user is looking at the second answer
+HISTORY = {
+    "currentId": "a2",
+    "messages": {
+        "q": {"id": "q", "parentId": None, "role": "user", "content": "hi"},
+        "a1": {"id": "a1", "parentId": "q", "role": "assistant", "content": "one"},
+        "a2": {"id": "a2", "parentId": "q", "role": "assistant", "content": "two"},
+        "pending": {"id": "pending", "parentId": "a2", "content": ""},
+    },
+}
+
+
+def create_chat(user_id: str) -> str:
+    chat = Chats.insert_new_chat(
+        user_id, ChatForm(chat={"title": "Test", "history": HISTORY})
+    )
+    return chat.id
+
+
+def get_rows(chat_id: str) -> dict:
+    with get_db() as db:
+        return {
+            row.id: row.updated_at
+            for row in db.query(ChatMessage).filter_by(chat_id=chat_id)
+        }
+
+
+def test_migration_upgrade_and_downgrade(tmp_path, monkeypatch):
+    if not DATABASE_URL.startswith("sqlite:///"):
+        pytest.skip("runs against a copy of the SQLite test database")
+
+    # Work on a copy of the migrated test database
+    path = tmp_path / "webui.db"
+    shutil.copyfile(DATABASE_URL.removeprefix("sqlite:///"), path)
+    url = f"sqlite:///{path}"
+    monkeypatch.setattr(open_webui.env, "DATABASE_URL", url)
+
+    config = Config(OPEN_WEBUI_DIR / "alembic.ini")
+    config.set_main_option("script_location", str(OPEN_WEBUI_DIR / "migrations"))
+
+    def columns():
+        engine = sa.create_engine(url)
+        try:
+            return {c["name"] for c in sa.inspect(engine).get_columns("chat_message")}
+        finally:
+            engine.dispose()
+
+    command.downgrade(config, "b2c3d4e5f6a7")
+    assert "data" not in columns()
+    assert "content" in columns()
+
+    command.upgrade(config, "d4e5f6a7b8c9")
+    assert "data" in columns()
+
+
+def test_backfill_is_idempotent():
+    chat_id = create_chat("user-backfill")
+    with get_db() as db:
+        db.query(ChatMessage).filter_by(chat_id=chat_id).delete()
+        db.commit()
+
+    Chats.backfill_chat_messages(batch_size=2)
+    rows = get_rows(chat_id)
+    assert set(rows) == {f"{chat_id}-{id}" for id in HISTORY["messages"]}
+
+    # A second run finds every message in sync and rewrites nothing
+    writes = []
+    upsert_message = ChatMessages.upsert_message
+
+    def counting_upsert(*args, **kwargs):
+        writes.append(kwargs["message_id"])
+        return upsert_message(*args, **kwargs)
+
+    ChatMessages.upsert_message = counting_upsert
+    try:
+        Chats.backfill_chat_messages(batch_size=2)
+    finally:
+        del ChatMessages.upsert_message
+
+    assert writes == []
+    assert get_rows(chat_id) == rows
+
+
+def test_table_reads_match_chat_document(monkeypatch):
+    chat_id = create_chat("user-reads")
+    document = Chats.get_chat_by_id_and_user_id(chat_id, "user-reads")
+
+    monkeypatch.setattr(chats_module, "ENABLE_CHAT_MESSAGE_TABLE_READS", True)
+    from_table = Chats.get_chat_by_id_and_user_id(chat_id, "user-reads")
+
+    assert from_table.chat == document.chat
+    assert Chats.get_messages_map_by_chat_id(chat_id) == HISTORY["messages"]
+    assert (
+        Chats.get_message_by_id_and_message_id(chat_id, "pending")
+        == HISTORY["messages"]["pending"]
+    )
+
+    # Updates keep the table in sync, including removed messages
+    chat = from_table.chat
+    del chat["history"]["messages"]["a1"]
+    chat["history"]["messages"]["a2"]["content"] = "edited"
+    Chats.update_chat_by_id(chat_id, chat)
+
+    assert Chats.get_chat_by_id_and_user_id(chat_id, "user-reads").chat == chat
+    assert f"{chat_id}-a1" not in get_rows(chat_id)
+
+
+@pytest.mark.asyncio
+async def test_messages_endpoint_returns_current_branch():
+    chat_id = create_chat("user-endpoint")
+    user = types.SimpleNamespace(id="user-endpoint")
+
+    with get_db() as db:
+        branch = await get_chat_messages_by_id(
+            chat_id, message_id=None, skip=0, limit=50, user=user, db=db
+        )
+        assert [message["id"] for message in branch] == ["q", "a2"]
+
+        branch = await get_chat_messages_by_id(
+            chat_id, message_id="pending", skip=1, limit=1, user=user, db=db
+        )
+        assert [message["id"] for message in branch] == ["a2"]
+
+        with pytest.raises(HTTPException):
+            await get_chat_messages_by_id(
+                chat_id,
+                message_id=None,
+                skip=0,
+                limit=50,
+                user=types.SimpleNamespace(id=str(uuid.uuid4())),
+                db=db,
+            )
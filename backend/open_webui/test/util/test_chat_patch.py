@@ -0,0 +1,134 @@
+import pytest
+
+from open_webui.internal.db import get_db
+from open_webui.models.chat_messages import ChatMessages
+from open_webui.models.chats import ChatForm, Chats
+
+
+def create_chat(messages: dict) -> str:
+    chat = Chats.insert_new_chat(
+        "user-patch",
+        ChatForm(
+            chat={
+                "title": "Patch",
+                "models": ["model"],
+                "history": {"currentId": None, "messages": messages},
+            }
+        ),
+    )
+    return chat.id
+
+
+def get_history(chat_id: str) -> dict:
+    return Chats.get_chat_by_id(chat_id).chat["history"]
+
+
+def test_patch_merges_into_existing_message():
+    chat_id = create_chat(
+        {
+            "m1": {"id": "m1", "role": "user", "content": "hi"},
+            "m2": {"id": "m2", "role": "assistant", "content": "", "done": False},
+        }
+    )
+
+    merged = Chats.patch_message_by_id_and_message_id(
+        chat_id, "m2", {"content": "hello\x00", "done": True}
+    )
+
+    expected = {"id": "m2", "role": "assistant", "content": "hello", "done": True}
+    assert merged == expected
+    history = get_history(chat_id)
+    assert history["currentId"] == "m2"
+    assert history["messages"]["m2"] == expected
+    assert history["messages"]["m1"] == {"id": "m1", "role": "user", "content": "hi"}
+
+    # Everything outside the message path is left alone
+    chat = Chats.get_chat_by_id(chat_id)
+    assert chat.title == "Patch" and chat.chat["models"] == ["model"]
+
+
+def test_patch_missing_message_or_chat():
+    chat_id = create_chat({"m1": {"id": "m1", "role": "user", "content": "hi"}})
+
+    message = {"id": "m2", "role": "assistant", "content": "new"}
+    assert Chats.patch_message_by_id_and_message_id(chat_id, "m2", message) == message
+    assert get_history(chat_id)["messages"]["m2"] == message
+    assert Chats.get_message_by_id_and_message_id(chat_id, "m2") == message
+
+    assert Chats.patch_message_by_id_and_message_id("missing", "m1", {}) is None
+
+    # A chat without history.messages gets it created
+    chat = Chats.insert_new_chat("user-patch", ChatForm(chat={"title": "Empty"}))
+    assert Chats.patch_message_by_id_and_message_id(chat.id, "m1", message) == message
+    assert get_history(chat.id) == {"currentId": "m1", "messages": {"m1": message}}
+
+
+def test_patch_replaces_nested_values():
+    chat_id = create_chat(
+        {
+            "m1": {
+                "id": "m1",
+                "role": "assistant",
+                "info": {"usage": {"prompt_tokens": 1}, "model": "a"},
+                "sources": [{"id": "s1"}],
+            }
+        }
+    )
+
+    Chats.patch_message_by_id_and_message_id(
+        chat_id,
+        "m1",
+        {"info": {"usage": {"prompt_tokens": 2}}, "statusHistory": [{"done": True}]},
+    )
+
+    # Top-level keys are merged, nested objects are stored as objects and
+    # replaced whole, like the full-document write
+    assert get_history(chat_id)["messages"]["m1"] == {
+        "id": "m1",
+        "role": "assistant",
+        "info": {"usage": {"prompt_tokens": 2}},
+        "sources": [{"id": "s1"}],
+        "statusHistory": [{"done": True}],
+    }
+
+
+@pytest.mark.parametrize(
+    "message_id", ["with.dot", 'with"quote', "with'apostrophe", "$.history"]
+)
+def test_patch_message_ids_with_path_characters(message_id):
+    other = {"id": "other", "role": "user", "content": "keep"}
+    chat_id = create_chat(
+        {message_id: {"id": message_id, "content": "a"}, "other": other}
+    )
+
+    Chats.patch_message_by_id_and_message_id(chat_id, message_id, {"content": "b"})
+
+    history = get_history(chat_id)
+    assert history["messages"] == {
+        message_id: {"id": message_id, "content": "b"},
+        "other": other,
+    }
+    assert history["currentId"] == message_id
+    assert Chats.get_message_by_id_and_message_id(chat_id, message_id) == {
+        "id": message_id,
+        "content": "b",
+    }
+
+
+def test_patch_writes_through_to_chat_message_table():
+    chat_id = create_chat({"m1": {"id": "m1", "role": "user", "content": "hi"}})
+
+    Chats.patch_message_by_id_and_message_id(
+        chat_id, "m1", {"content": "edited", "files": [{"id": "f1"}]}
+    )
+    Chats.patch_message_by_id_and_message_id(
+        chat_id, "m2", {"id": "m2", "parentId": "m1", "role": "assistant"}
+    )
+
+    with get_db() as db:
+        assert ChatMessages.get_message_data_by_chat_id_and_message_id(
+            chat_id, "m1", db=db
+        ) == {"id": "m1", "role": "user", "content": "edited", "files": [{"id": "f1"}]}
+        assert ChatMessages.get_message_data_by_chat_id_and_message_id(
+            chat_id, "m2", db=db
+        ) == {"id": "m2", "parentId": "m1", "role": "assistant"}
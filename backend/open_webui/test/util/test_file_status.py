@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import uuid
+
+import pytest
+
+from open_webui.models.files import FileForm, Files, FileStatusBus, FILE_STATUS_BUS
+
+
+@pytest.mark.asyncio
+async def test_publish_from_worker_thread():
+    bus = FileStatusBus()
+    listened = []
+
+    async def listener(event):
+        listened.append(event)
+
+    bus.add_listener(listener)
+
+    with bus.subscribe("file-1") as queue, bus.subscribe("file-2") as other:
+        thread = threading.Thread(
+            target=bus.publish, args=("file-1", "user-1", {"status": "completed"})
+        )
+        thread.start()
+        thread.join()
+
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+        assert event["status"] == "completed"
+        assert event["user_id"] == "user-1"
+        assert other.empty()
+
+    await asyncio.sleep(0)
+    assert [event["file_id"] for event in listened] == ["file-1"]
+    assert bus._subscribers == {}
+
+
+@pytest.mark.asyncio
+async def test_update_file_data_publishes_status():
+    id = str(uuid.uuid4())
+    Files.insert_new_file(
+        "user-1",
+        FileForm(
+            id=id, filename="test.txt", path="", data={"status": "pending"}, meta={}
+        ),
+    )
+
+    try:
+        with FILE_STATUS_BUS.subscribe(id) as queue:
+            # Non-status updates are not published
+            await asyncio.to_thread(Files.update_file_data_by_id, id, {"content": "x"})
+            await asyncio.to_thread(
+                Files.update_file_data_by_id,
+                id,
+                {"status": "failed", "error": "boom"},
+            )
+
+            event = await asyncio.wait_for(queue.get(), timeout=1)
+            assert event["status"] == "failed"
+            assert event["error"] == "boom"
+            assert queue.empty()
+    finally:
+        Files.delete_file_by_id(id)
@@ -0,0 +1,84 @@
+import time
+
+from open_webui.models.groups import GroupMembershipCache
+
+
+class Loader:
+    def __init__(self, groups):
+        self.groups = groups
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return list(self.groups)
+
+
+def test_memberships_are_loaded_once_per_user():
+    cache = GroupMembershipCache(ttl=60)
+    load = Loader(["group-a", "group-b"])
+
+    for _ in range(800):
+        assert cache.get_groups("user-1", load) == ["group-a", "group-b"]
+
+    assert load.calls == 1
+
+
+def test_invalidate_user_and_all():
+    cache = GroupMembershipCache(ttl=60)
+    load_1, load_2 = Loader(["a"]), Loader(["b"])
+    cache.get_groups("user-1", load_1)
+    cache.get_groups("user-2", load_2)
+
+    cache.invalidate(["user-1"])
+    cache.get_groups("user-1", load_1)
+    cache.get_groups("user-2", load_2)
+    assert (load_1.calls, load_2.calls) == (2, 1)
+
+    cache.invalidate()
+    cache.get_groups("user-2", load_2)
+    assert load_2.calls == 2
+
+
+def test_entries_expire_after_ttl():
+    cache = GroupMembershipCache(ttl=0.01)
+    load = Loader(["a"])
+    cache.get_groups("user-1", load)
+    time.sleep(0.02)
+    cache.get_groups("user-1", load)
+    assert load.calls == 2
+
+
+def test_stale_load_is_not_cached():
+    cache = GroupMembershipCache(ttl=60)
+
+    def load():
+        # Memberships change while the old value is being read
+        cache.invalidate(["user-1"])
+        return ["stale"]
+
+    assert cache.get_groups("user-1", load) == ["stale"]
+    assert cache.get_groups("user-1", Loader(["fresh"])) == ["fresh"]
+
+
+def test_derived_values_follow_source_and_memberships():
+    cache = GroupMembershipCache(ttl=60)
+    cache.get_groups("user-1", Loader(["a"]))
+    defaults = {"chat": {"delete": True}}
+    computed = []
+
+    def compute():
+        computed.append(1)
+        return {"merged": True}
+
+    cache.get_derived("user-1", "permissions", defaults, compute)
+    cache.get_derived("user-1", "permissions", defaults, compute)
+    assert len(computed) == 1
+
+    # Replacing the defaults object recomputes
+    cache.get_derived("user-1", "permissions", dict(defaults), compute)
+    assert len(computed) == 2
+
+    cache.invalidate(["user-1"])
+    cache.get_groups("user-1", Loader(["a"]))
+    cache.get_derived("user-1", "permissions", defaults, compute)
+    assert len(computed) == 3
@@ -0,0 +1,84 @@
+import base64
+import io
+
+import pytest
+from PIL import Image
+
+from open_webui.utils import files
+from open_webui.utils.middleware import convert_url_images_to_base64
+
+
+def make_png(size: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (size, size), "red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_remote_images_are_fetched_once_and_revalidated(monkeypatch):
+    requests_made = []
+
+    def fake_get(url, headers=None, timeout=None):
+        requests_made.append((url, headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(
+            200, make_png(64), {"Content-Type": "image/png", "ETag": '"v1"'}
+        )
+
+    monkeypatch.setattr(files, "INLINE_IMAGE_CACHE", files.InlineImageCache())
+    monkeypatch.setattr(files, "validate_url", lambda url: None)
+    monkeypatch.setattr(files.requests, "get", fake_get)
+
+    url = "https://example.com/cat.png"
+    form_data = {
+        "messages": [
+            {
+                "role": "user",
+                "content": [{"type": "image_url", "image_url": {"url": url}}],
+            },
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "again"},
+                    {"type": "image_url", "image_url": {"url": url}},
+                ],
+            },
+        ]
+    }
+    model = {"info": {"meta": {"image_max_dimension": 16}}}
+
+    form_data = await convert_url_images_to_base64(form_data, model)
+    data_url = form_data["messages"][1]["content"][1]["image_url"]["url"]
+    assert len(requests_made) == 1
+    assert form_data["messages"][0]["content"][0]["image_url"]["url"] == data_url
+
+    image = Image.open(io.BytesIO(base64.b64decode(data_url.split(",", 1)[1])))
+    assert image.size == (16, 16)
+
+    # Stale entries are revalidated with their ETag instead of refetched
+    monkeypatch.setattr(files, "IMAGE_INLINE_CACHE_TTL", 0)
+    assert files.get_inline_image(url, 16) == data_url
+    assert requests_made[-1][1] == {"If-None-Match": '"v1"'}
+
+
+def test_cache_is_bounded_by_size():
+    cache = files.InlineImageCache(max_size=10)
+    cache.set("a", files.InlineImage("x" * 6))
+    cache.set("b", files.InlineImage("y" * 6))
+    cache.set("c", files.InlineImage("z" * 11))
+
+    assert cache.get("a") is None
+    assert cache.get("b").data_url == "y" * 6
+    assert cache.get("c") is None
+    assert cache.size == 6
@@ -0,0 +1,97 @@
+import asyncio
+import contextlib
+import io
+import json
+import uuid
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from open_webui.utils.code_interpreter import JupyterKernelPool
+
+
+def make_jupyter_app(kernels: dict) -> web.Application:
+    """Stand-in Jupyter server running each kernel's code in its own namespace"""
+
+    async def start_kernel(request):
+        kernel_id = uuid.uuid4().hex
+        kernels[kernel_id] = {}
+        return web.json_response({"id": kernel_id}, status=201)
+
+    async def delete_kernel(request):
+        kernels.pop(request.match_info["id"], None)
+        return web.Response(status=204)
+
+    async def restart_kernel(request):
+        kernels[request.match_info["id"]] = {}
+        return web.json_response({"id": request.match_info["id"]})
+
+    async def channels(request):
+        namespace = kernels.get(request.match_info["id"])
+        if namespace is None:
+            raise web.HTTPNotFound()
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for message in ws:
+            data = json.loads(message.data)
+            parent = {"msg_id": data["header"]["msg_id"]}
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                exec(data["content"]["code"], namespace)
+            for msg_type, content in (
+                ("stream", {"name": "stdout", "text": stdout.getvalue()}),
+                ("status", {"execution_state": "idle"}),
+            ):
+                await ws.send_json(
+                    {"parent_header": parent, "msg_type": msg_type, "content": content}
+                )
+        return ws
+
+    app = web.Application()
+    app.router.add_post("/api/kernels", start_kernel)
+    app.router.add_delete("/api/kernels/{id}", delete_kernel)
+    app.router.add_post("/api/kernels/{id}/restart", restart_kernel)
+    app.router.add_get("/api/kernels/{id}/channels", channels)
+    return app
+
+
+async def settle(pool: JupyterKernelPool):
+    while pool._tasks:
+        await asyncio.gather(*pool._tasks)
+
+
+@pytest.mark.asyncio
+async def test_kernels_are_warm_sticky_and_reset():
+    kernels = {}
+    pool = JupyterKernelPool(size=1, max_lifetime=3600, sticky=True)
+
+    async with TestServer(make_jupyter_app(kernels)) as server:
+        url = str(server.make_url(""))
+
+        result = await pool.execute(url, "x = 41\nprint(x + 1)", chat_id="chat")
+        assert result["stdout"] == "42"
+        await settle(pool)
+        assert pool.get_stats()["idle"] == 1
+
+        # The chat keeps its state, other code gets the warm kernel
+        assert (await pool.execute(url, "print(x)", chat_id="chat"))["stdout"] == "41"
+        result = await pool.execute(url, "print('x' in globals())")
+        assert result["stdout"] == "False"
+        await settle(pool)
+
+        stats = pool.get_stats()
+        assert stats["cold_starts"] == 1
+        assert stats["warm_hits"] == 1
+        assert stats["sticky_hits"] == 1
+        assert stats["sticky"] == 1
+
+        # A warm kernel culled by the server is replaced transparently
+        kernels.clear()
+        pool.sticky = False
+        assert (await pool.execute(url, "print(1)"))["stdout"] == "1"
+
+        await settle(pool)
+        await pool.close()
+        assert kernels == {}
@@ -0,0 +1,129 @@
+import asyncio
+
+import anyio
+import pytest
+from mcp import types
+
+from open_webui.utils.mcp import client as mcp_client
+from open_webui.utils.mcp.client import MCPSessionPool
+
+
+class FakeServer:
+    def __init__(self):
+        self.connects = []
+        self.closed = 0
+        self.list_calls = 0
+        self.tool_calls = 0
+        self.down = False
+        self.unsent = False
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeServer()
+
+    class FakeSession:
+        async def send_ping(self):
+            if server.down:
+                raise ConnectionError("gone")
+
+    async def connect(self, url, headers=None, message_handler=None):
+        server.connects.append(headers)
+        server.down = server.unsent = False
+        self.session = FakeSession()
+        self.message_handler = message_handler
+
+    async def list_tool_specs(self):
+        server.list_calls += 1
+        return [{"name": "search", "description": "", "parameters": {}}]
+
+    async def call_tool(self, function_name, function_args):
+        if server.unsent:
+            raise anyio.ClosedResourceError()
+        server.tool_calls += 1
+        if server.down:
+            raise ConnectionError("gone")
+        return [{"type": "text", "text": function_args["q"]}]
+
+    async def disconnect(self):
+        server.closed += 1
+
+    for name, fn in (
+        ("connect", connect),
+        ("list_tool_specs", list_tool_specs),
+        ("call_tool", call_tool),
+        ("disconnect", disconnect),
+    ):
+        monkeypatch.setattr(mcp_client.MCPClient, name, fn)
+    return server
+
+
+@pytest.mark.asyncio
+async def test_sessions_and_tool_specs_are_reused(server):
+    pool = MCPSessionPool(idle_timeout=60, health_check_interval=60, tool_specs_ttl=60)
+    headers = {"Authorization": "Bearer a"}
+
+    first = await pool.acquire("http://mcp", headers)
+    await first.list_tool_specs()
+    await first.disconnect()
+
+    second = await pool.acquire("http://mcp", headers)
+    await second.list_tool_specs()
+    assert len(server.connects) == 1
+    assert server.list_calls == 1
+
+    # tools/list_changed drops the cached specs
+    await second.session.client.message_handler(
+        types.ServerNotification(
+            types.ToolListChangedNotification(method="notifications/tools/list_changed")
+        )
+    )
+    await second.list_tool_specs()
+    assert server.list_calls == 2
+
+    # Other credentials get their own session
+    other = await pool.acquire("http://mcp", {"Authorization": "Bearer b"})
+    assert other.session is not second.session
+    assert pool.get_stats()["sessions"] == 2
+
+    # Unpooled sessions close on release
+    single = await pool.acquire("http://mcp", headers, pooled=False)
+    await single.disconnect()
+    await asyncio.sleep(0)
+    assert server.closed == 1
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_dead_session_is_replaced_and_call_retried(server):
+    pool = MCPSessionPool(idle_timeout=60, health_check_interval=0, tool_specs_ttl=60)
+
+    lease = await pool.acquire("http://mcp")
+    session = lease.session
+
+    # Closed before the request was sent: safe to retry on a new session
+    server.unsent = True
+    assert await lease.call_tool("search", {"q": "hi"}) == [
+        {"type": "text", "text": "hi"}
+    ]
+    assert lease.session is not session
+    assert server.tool_calls == 1
+    assert pool.get_stats()["reconnects"] == 1
+
+    # Failed after the request was sent: the server may have run the tool,
+    # so the error is surfaced instead of calling it again
+    server.down = True
+    with pytest.raises(ConnectionError):
+        await lease.call_tool("search", {"q": "hi"})
+    assert server.tool_calls == 2
+    assert pool.get_stats()["reconnects"] == 1
+    await lease.disconnect()
+
+    # Failed health checks reconnect before the session is handed out
+    server.down = True
+    lease = await pool.acquire("http://mcp")
+    assert len(server.connects) == 3
+
+    await lease.disconnect()
+    await pool.close()
@@ -0,0 +1,154 @@
+"""
+Seeds N base models, N custom models and M action/filter functions into the
+configured database and counts the queries get_all_models makes for a full
+catalog build and for a cached call. Override the sizes with
+MODELS_BENCHMARK_N / MODELS_BENCHMARK_M to measure how the build scales.
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from open_webui.internal.db import engine
+from open_webui.models.functions import FunctionForm, FunctionMeta, Functions
+from open_webui.models.models import ModelForm, ModelMeta, ModelParams, Models
+from open_webui.utils.models import get_all_models
+
+N = int(os.environ.get("MODELS_BENCHMARK_N", "200"))
+M = int(os.environ.get("MODELS_BENCHMARK_M", "10"))
+
+PREFIX = "test-models-"
+
+ACTION_CONTENT = """
+class Action:
+    async def action(self, body: dict):
+        return body
+"""
+
+FILTER_CONTENT = """
+class Filter:
+    def __init__(self):
+        self.toggle = True
+
+    def inlet(self, body: dict) -> dict:
+        return body
+"""
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(engine, "before_cursor_execute", self)
+
+
+def make_request(base_models):
+    config = SimpleNamespace(
+        ENABLE_BASE_MODELS_CACHE=True,
+        ENABLE_EVALUATION_ARENA_MODELS=False,
+        EVALUATION_ARENA_MODELS=[],
+    )
+    state = SimpleNamespace(config=config, BASE_MODELS=base_models, MODELS={"_": {}})
+    return SimpleNamespace(app=SimpleNamespace(state=state))
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    functions = []
+    for idx in range(M):
+        type = "action" if idx % 2 == 0 else "filter"
+        function = Functions.insert_new_function(
+            "test",
+            type,
+            FunctionForm(
+                id=f"{PREFIX}{type}{idx}".replace("-", "_"),
+                name=f"{type} {idx}",
+                content=ACTION_CONTENT if type == "action" else FILTER_CONTENT,
+                meta=FunctionMeta(description=f"{type} {idx}"),
+            ),
+        )
+        Functions.update_function_by_id(
+            function.id, {"is_active": True, "is_global": idx < 2}
+        )
+        functions.append(function)
+
+    base_models = [
+        {
+            "id": f"{PREFIX}base-{idx}",
+            "name": f"Base {idx}",
+            "object": "model",
+            "owned_by": "openai",
+        }
+        for idx in range(N)
+    ]
+
+    function_ids = [function.id for function in functions]
+    for idx in range(N):
+        Models.insert_new_model(
+            ModelForm(
+                id=f"{PREFIX}custom-{idx}",
+                base_model_id=f"{PREFIX}base-{idx}",
+                name=f"Custom {idx}",
+                meta=ModelMeta(
+                    actionIds=function_ids[0::2][:3], filterIds=function_ids[1::2][:3]
+                ),
+                params=ModelParams(),
+            ),
+            "test",
+        )
+
+    yield base_models
+
+    for idx in range(N):
+        Models.delete_model_by_id(f"{PREFIX}custom-{idx}")
+    for function in functions:
+        Functions.delete_function_by_id(function.id)
+
+
+@pytest.mark.asyncio
+async def test_get_all_models_queries(seeded):
+    request = make_request(seeded)
+
+    with QueryCounter() as build_queries:
+        models = await get_all_models(request)
+
+    with QueryCounter() as cached_queries:
+        cached = await get_all_models(request)
+
+    custom = {model["id"]: model for model in models if model.get("preset")}
+    assert len(custom) >= N
+    assert custom[f"{PREFIX}custom-0"]["owned_by"] == "openai"
+    assert custom[f"{PREFIX}custom-0"]["actions"]
+    assert custom[f"{PREFIX}custom-0"]["filters"]
+    assert "params" not in custom[f"{PREFIX}custom-0"]["info"]
+
+    assert [model["id"] for model in cached] == [model["id"] for model in models]
+    # Build queries must not grow with N; cached calls only check versions
+    assert build_queries.count < M + 10
+    assert cached_queries.count <= 3
+
+
+@pytest.mark.asyncio
+async def test_get_all_models_rebuilds_on_change(seeded):
+    request = make_request(seeded)
+    await get_all_models(request)
+
+    Models.toggle_model_by_id(f"{PREFIX}custom-1")
+    try:
+        models = await get_all_models(request)
+        assert f"{PREFIX}custom-1" not in {model["id"] for model in models}
+    finally:
+        Models.toggle_model_by_id(f"{PREFIX}custom-1")
+
+    models = await get_all_models(request)
+    assert f"{PREFIX}custom-1" in {model["id"] for model in models}
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from open_webui.utils import session_pool
+from open_webui.utils.session_pool import ClientSessionRegistry
+
+
+@pytest.fixture(autouse=True)
+def enable_pool(monkeypatch):
+    monkeypatch.setattr(session_pool, "ENABLE_AIOHTTP_CLIENT_SESSION_POOL", True)
+
+
+def make_app(peers: list) -> web.Application:
+    async def handler(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused_per_upstream():
+    registry = ClientSessionRegistry(max_upstreams=2)
+    registry.start()
+    peers_a, peers_b = [], []
+
+    async with TestServer(make_app(peers_a)) as a, TestServer(make_app(peers_b)) as b:
+        url_a = str(a.make_url("/"))
+        url_b = str(b.make_url("/"))
+
+        for path in ("/one", "/two"):
+            async with registry.get_session(url_a) as session:
+                async with session.get(str(a.make_url(path))) as response:
+                    assert await response.text() == "ok"
+        async with registry.get_session(url_b) as session:
+            async with session.get(url_b) as response:
+                await response.read()
+
+        # Requests to one upstream share a session and its kept-alive connection
+        assert len(peers_a) == 2 and len(set(peers_a)) == 1
+        assert (
+            registry.get_session(url_a)._session
+            is registry.get_session(str(a.make_url("/other")))._session
+        )
+        assert (
+            registry.get_session(url_a)._session
+            is not registry.get_session(url_b)._session
+        )
+        assert (
+            registry.get_session(url_a)._session
+            is not registry.get_session(url_a, trust_env=False)._session
+        )
+
+        # Upstreams past the limit share the default pool
+        assert (
+            registry.get_session("http://c.invalid")._session
+            is registry.get_session("http://d.invalid")._session
+            is registry.get_session(None)._session
+        )
+        assert set(registry.get_stats()) == {
+            url_a.rstrip("/"),
+            url_b.rstrip("/"),
+            session_pool.DEFAULT_POOL,
+        }
+
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_callers_do_not_close_shared_sessions():
+    registry = ClientSessionRegistry()
+    registry.start()
+
+    async with registry.get_session("http://a.invalid") as view:
+        shared = view._session
+    await view.close()
+    assert not shared.closed
+    assert registry.get_session("http://a.invalid")._session is shared
+
+    # Without a started registry each caller gets a private session, closed
+    # with the view as before
+    other = ClientSessionRegistry()
+    async with other.get_session("http://a.invalid") as view:
+        private = view._session
+        assert private is not shared
+    assert private.closed
+
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_sessions_close_on_shutdown():
+    registry = ClientSessionRegistry()
+    registry.start()
+    shared = registry.get_session("http://a.invalid")._session
+
+    await registry.close()
+    assert shared.closed
+    assert registry.get_stats() == {}
+
+    # After shutdown callers fall back to private sessions
+    view = registry.get_session("http://a.invalid")
+    assert view._session is not shared
+    await view.close()
+    assert view.closed
+
+
+@pytest.mark.asyncio
+async def test_sessions_close_on_loop_change():
+    registry = ClientSessionRegistry()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+
+    async def start():
+        registry.start()
+        return registry.get_session("http://a.invalid")._session
+
+    try:
+        old = asyncio.run_coroutine_threadsafe(start(), loop).result(5)
+
+        # Callers on another loop get private sessions
+        view = registry.get_session("http://a.invalid")
+        assert view._session is not old
+        await view.close()
+
+        # Restarting on this loop closes the old loop's sessions there
+        registry.start()
+        new = registry.get_session("http://a.invalid")._session
+        assert new is not old
+        for _ in range(100):
+            if old.closed:
+                break
+            await asyncio.sleep(0.01)
+        assert old.closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    await registry.close()
+    assert new.closed
@@ -0,0 +1,146 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from open_webui.retrieval import utils as retrieval_utils
+from open_webui.retrieval.utils import RetrievalCache, query_collection
+from open_webui.retrieval.vector.main import SearchResult, VectorDBBase
+from open_webui.utils import middleware
+
+
+def make_request():
+    config = SimpleNamespace(
+        TOP_K=3,
+        TOP_K_RERANKER=3,
+        RELEVANCE_THRESHOLD=0.0,
+        HYBRID_BM25_WEIGHT=0.5,
+        ENABLE_RAG_HYBRID_SEARCH=False,
+        RAG_FULL_CONTEXT=False,
+    )
+    return SimpleNamespace(
+        app=SimpleNamespace(
+            state=SimpleNamespace(
+                config=config, EMBEDDING_FUNCTION=None, RERANKING_FUNCTION=None
+            )
+        )
+    )
+
+
+async def run_handler(monkeypatch, generation_delay, timeout):
+    retrievals = []
+
+    async def generate_queries(request, form_data, user):
+        await asyncio.sleep(generation_delay)
+        content = json.dumps({"queries": ["generated"]})
+        return {"choices": [{"message": {"content": content}}]}
+
+    async def get_sources_from_items(queries, **kwargs):
+        retrievals.append(queries)
+        await asyncio.sleep(0.05)
+        return [{"document": [queries[0]], "metadata": [{}], "source": {"id": "f"}}]
+
+    async def event_emitter(event):
+        pass
+
+    monkeypatch.setattr(middleware, "generate_queries", generate_queries)
+    monkeypatch.setattr(middleware, "get_sources_from_items", get_sources_from_items)
+    monkeypatch.setattr(middleware, "ENABLE_SPECULATIVE_RETRIEVAL", True)
+    monkeypatch.setattr(middleware, "RETRIEVAL_QUERY_GENERATION_TIMEOUT", timeout)
+
+    body = {
+        "model": "model",
+        "messages": [{"role": "user", "content": "raw question"}],
+        "metadata": {"files": [{"type": "file", "id": "f"}]},
+    }
+    _, result = await middleware.chat_completion_files_handler(
+        make_request(), body, {"__event_emitter__": event_emitter}, None
+    )
+    return result["sources"][0]["document"], retrievals
+
+
+@pytest.mark.asyncio
+async def test_generated_queries_win_when_in_time(monkeypatch):
+    documents, retrievals = await run_handler(monkeypatch, 0.01, timeout=1)
+    assert documents == ["generated"]
+    assert retrievals == [["raw question"], ["generated"]]
+
+
+@pytest.mark.asyncio
+async def test_speculative_results_used_after_deadline(monkeypatch):
+    start = asyncio.get_running_loop().time()
+    documents, retrievals = await run_handler(monkeypatch, 5, timeout=0.1)
+
+    assert documents == ["raw question"]
+    assert retrievals == [["raw question"]]
+    assert asyncio.get_running_loop().time() - start < 1
+
+
+class RecordingVectorDB(VectorDBBase):
+    def __init__(self):
+        self.searches = []
+
+    def search(self, collection_name, vectors, filter=None, limit=10):
+        self.searches.append([vector[0] for vector in vectors])
+        return SearchResult(
+            ids=[[f"{collection_name}-{vector[0]}"] for vector in vectors],
+            documents=[[f"{collection_name} {vector[0]}"] for vector in vectors],
+            metadatas=[[{}] for _ in vectors],
+            distances=[[vector[0] / 100] for vector in vectors],
+        )
+
+    has_collection = delete_collection = insert = upsert = get = None
+    query = delete = reset = None
+
+
+@pytest.mark.asyncio
+async def test_generated_queries_reuse_speculative_searches(monkeypatch):
+    db = RecordingVectorDB()
+    monkeypatch.setattr(retrieval_utils, "VECTOR_DB_CLIENT", db)
+    embedded = []
+
+    async def embedding_function(queries, prefix=None):
+        embedded.append(queries)
+        return [[float(len(query))] for query in queries]
+
+    queries = ["raw question", "generated"]
+    expected = await query_collection(["c1", "c2"], queries, embedding_function, k=3)
+    embedded.clear()
+    db.searches.clear()
+
+    cache = RetrievalCache()
+    await query_collection(["c1", "c2"], queries[:1], embedding_function, 3, cache)
+    result = await query_collection(["c1", "c2"], queries, embedding_function, 3, cache)
+    cache.close()
+
+    # Only the new query is embedded and searched on the second pass
+    assert embedded == [["raw question"], ["generated"]]
+    assert db.searches == [[12.0], [12.0], [9.0], [9.0]]
+    assert result == expected
+
+
+class SingleVectorDB(RecordingVectorDB):
+    MULTI_VECTOR_SEARCH = False
+
+
+@pytest.mark.asyncio
+async def test_single_vector_backends_map_results_to_queries(monkeypatch):
+    db = SingleVectorDB()
+    monkeypatch.setattr(retrieval_utils, "VECTOR_DB_CLIENT", db)
+
+    async def embedding_function(queries, prefix=None):
+        return [[float(len(query))] for query in queries]
+
+    result = await query_collection(
+        ["c1", "c2"], ["raw question", "generated"], embedding_function, k=4
+    )
+
+    # One search per collection and query vector, each with a one-row result
+    assert sorted(db.searches) == [[9.0], [9.0], [12.0], [12.0]]
+    assert sorted(result["documents"][0]) == [
+        "c1 12.0",
+        "c1 9.0",
+        "c2 12.0",
+        "c2 9.0",
+    ]
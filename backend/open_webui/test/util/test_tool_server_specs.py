@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from open_webui.utils import tools
+
+SPEC = {
+    "openapi": "3.1.0",
+    "info": {"title": "Weather"},
+    "paths": {
+        "/forecast": {
+            "post": {
+                "operationId": "get_forecast",
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Query"}
+                        }
+                    }
+                },
+            }
+        }
+    },
+    "components": {
+        "schemas": {
+            "Query": {"type": "object", "properties": {"city": {"type": "string"}}}
+        }
+    },
+}
+
+
+@pytest.mark.asyncio
+async def test_specs_are_revalidated_and_payloads_reused(monkeypatch):
+    requests_seen = []
+
+    async def openapi(request):
+        requests_seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response(SPEC, headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/openapi.json", openapi)
+
+    monkeypatch.setattr(tools, "TOOL_SERVER_SPEC_CACHE", tools.ToolServerSpecCache())
+    cache = tools.TOOL_SERVER_SPEC_CACHE
+
+    async with TestServer(app) as server:
+        connections = [
+            {
+                "url": str(server.make_url("")).rstrip("/"),
+                "path": "openapi.json",
+                "auth_type": "none",
+                "config": {"enable": True},
+                "info": {"id": "weather", "name": "Weather API"},
+            },
+            {
+                "type": "openapi",
+                "spec_type": "json",
+                "spec": json.dumps(SPEC),
+                "config": {"enable": True},
+                "info": {"id": "inline"},
+            },
+        ]
+
+        first = await tools.get_tool_servers_data(connections)
+        second = await tools.get_tool_servers_data(connections)
+
+    assert requests_seen == [None, '"v1"']
+    assert cache.get_stats()["not_modified"] == 1
+    assert second[0]["specs"] == first[0]["specs"]
+    assert second[0]["specs"][0]["parameters"]["properties"] == {
+        "city": {"type": "string"}
+    }
+
+    # Identical specs are converted once, and connection info stays out of
+    # the cache
+    assert cache.get_stats()["conversions"] == 1
+    assert second[0]["openapi"]["info"]["title"] == "Weather API"
+    assert next(iter(cache.specs.values()))["spec"]["info"]["title"] == "Weather"
@@ -170,7 +170,7 @@ async def search_web(
         # Use admin-configured result count if configured, falling back to model-provided count of provided, else default to 5
         count = __request__.app.state.config.WEB_SEARCH_RESULT_COUNT or count
 
-        results = await asyncio.to_thread(_search_web, __request__, engine, query, user)
+        results = await _search_web(__request__, engine, query, user)
 
         # Limit results
         results = results[:count] if results else []
@@ -457,6 +457,7 @@ async def execute_code(
                     else None
                 ),
                 __request__.app.state.config.CODE_INTERPRETER_JUPYTER_TIMEOUT,
+                chat_id=__metadata__.get("chat_id") if __metadata__ else None,
             )
 
             stdout = output.get("stdout", "")
@@ -1,10 +1,10 @@
+import copy
 from typing import Optional, Set, Union, List, Dict, Any
 from open_webui.models.users import Users, UserModel
-from open_webui.models.groups import Groups
+from open_webui.models.groups import GROUP_MEMBERSHIPS, Groups
 
 
 from open_webui.config import DEFAULT_USER_PERMISSIONS
-import json
 
 
 def fill_missing_permissions(
@@ -56,17 +56,22 @@ def get_permissions(
 
     user_groups = Groups.get_groups_by_member_id(user_id, db=db)
 
-    # Deep copy default permissions to avoid modifying the original dict
-    permissions = json.loads(json.dumps(default_permissions))
+    def merge_permissions() -> Dict[str, Any]:
+        # Deep copy default permissions to avoid modifying the original dict
+        permissions = copy.deepcopy(default_permissions)
 
-    # Combine permissions from all user groups
-    for group in user_groups:
-        permissions = combine_permissions(permissions, group.permissions or {})
+        # Combine permissions from all user groups
+        for group in user_groups:
+            permissions = combine_permissions(permissions, group.permissions or {})
 
-    # Ensure all fields from default_permissions are present and filled in
-    permissions = fill_missing_permissions(permissions, default_permissions)
+        # Ensure all fields from default_permissions are present and filled in
+        return fill_missing_permissions(permissions, default_permissions)
 
-    return permissions
+    # The merged tree is cached with the user's groups until their
+    # memberships change or the default permissions are replaced
+    return GROUP_MEMBERSHIPS.get_derived(
+        user_id, "permissions", default_permissions, merge_permissions
+    )
 
 
 def has_permission(
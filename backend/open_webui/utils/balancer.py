@@ -0,0 +1,203 @@
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from open_webui.env import (
+    OLLAMA_COLD_MODEL_PENALTY,
+    OLLAMA_LOAD_BALANCING_STRATEGY,
+    OLLAMA_NODE_EJECTION_TIME,
+    OLLAMA_NODE_MAX_FAILURES,
+)
+
+log = logging.getLogger(__name__)
+
+# Weight of the newest sample in the response latency moving average
+EWMA_ALPHA = 0.3
+
+
+@dataclass
+class NodeStats:
+    outstanding: int = 0
+    latency: Optional[float] = None
+    requests: int = 0
+    errors: int = 0
+    failures: int = 0
+    ejected_until: float = 0.0
+    loaded_models: set = field(default_factory=set)
+
+
+class UpstreamRequest:
+    """
+    One in-flight request to a node, counted as outstanding until done().
+
+    respond() records the outcome once response headers arrive (or the
+    connection fails): the time to headers feeds the latency average, and
+    connection errors or 5xx responses count towards ejection.
+    """
+
+    def __init__(self, balancer: "UpstreamBalancer", url: str, model: Optional[str]):
+        self.balancer = balancer
+        self.url = url
+        self.model = model
+        self.start = time.monotonic()
+        self._responded = False
+        self._done = False
+
+        stats = balancer.get_node(url)
+        stats.outstanding += 1
+        stats.requests += 1
+
+    def respond(self, ok: bool):
+        if self._responded:
+            return
+        self._responded = True
+        self.balancer.record(self.url, self.model, ok, time.monotonic() - self.start)
+
+    def done(self):
+        if self._done:
+            return
+        self._done = True
+        stats = self.balancer.get_node(self.url)
+        stats.outstanding = max(stats.outstanding - 1, 0)
+
+
+class UpstreamBalancer:
+    """
+    Picks which base URL serves a request among the nodes that have the model.
+
+    Strategies:
+    * random: uniform choice, the previous behaviour
+    * least_outstanding: fewest in-flight requests, divided by node weight
+    * ewma: in-flight requests scaled by the node's response latency average
+    * weighted: random choice proportional to node weight
+
+    Nodes where the model is not loaded (per /api/ps and recent requests) are
+    charged OLLAMA_COLD_MODEL_PENALTY extra requests, and nodes that fail
+    OLLAMA_NODE_MAX_FAILURES times in a row are skipped for
+    OLLAMA_NODE_EJECTION_TIME seconds unless no other node is left.
+    """
+
+    def __init__(
+        self,
+        strategy: str = OLLAMA_LOAD_BALANCING_STRATEGY,
+        cold_model_penalty: float = OLLAMA_COLD_MODEL_PENALTY,
+        max_failures: int = OLLAMA_NODE_MAX_FAILURES,
+        ejection_time: float = OLLAMA_NODE_EJECTION_TIME,
+    ):
+        self.strategy = strategy
+        self.cold_model_penalty = cold_model_penalty
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+
+        self._nodes: dict[str, NodeStats] = {}
+
+    def get_node(self, url: str) -> NodeStats:
+        stats = self._nodes.get(url)
+        if stats is None:
+            stats = self._nodes[url] = NodeStats()
+        return stats
+
+    def set_loaded_models(self, url: str, models: set[str]):
+        self.get_node(url).loaded_models = set(models)
+
+    def is_ejected(self, url: str, now: Optional[float] = None) -> bool:
+        return self.get_node(url).ejected_until > (now or time.monotonic())
+
+    def record(self, url: str, model: Optional[str], ok: bool, latency: float):
+        stats = self.get_node(url)
+        if not ok:
+            stats.errors += 1
+            stats.failures += 1
+            if self.max_failures > 0 and stats.failures >= self.max_failures:
+                if not self.is_ejected(url):
+                    log.warning(
+                        f"Ejecting {url} for {self.ejection_time}s after {stats.failures} failed requests"
+                    )
+                stats.ejected_until = time.monotonic() + self.ejection_time
+            return
+
+        stats.failures = 0
+        stats.ejected_until = 0.0
+        stats.latency = (
+            latency
+            if stats.latency is None
+            else EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * stats.latency
+        )
+        if model:
+            # The node has loaded the model to serve this request
+            stats.loaded_models.add(model)
+
+    def track(self, url: str, model: Optional[str] = None) -> UpstreamRequest:
+        return UpstreamRequest(self, url, model)
+
+    def choose(
+        self,
+        nodes: dict[int, str],
+        model: Optional[str] = None,
+        weights: Optional[dict[int, float]] = None,
+    ) -> int:
+        """Return the index of the node in `nodes` ({url_idx: url}) to use."""
+        weights = weights or {}
+        now = time.monotonic()
+
+        candidates = [
+            idx for idx, url in nodes.items() if not self.is_ejected(url, now)
+        ] or list(nodes)
+
+        if len(candidates) == 1 or self.strategy == "random":
+            return random.choice(candidates)
+
+        def get_weight(idx: int) -> float:
+            try:
+                return max(float(weights.get(idx, 1)), 1e-6)
+            except (TypeError, ValueError):
+                return 1.0
+
+        def get_penalty(idx: int) -> float:
+            if model and model not in self.get_node(nodes[idx]).loaded_models:
+                return self.cold_model_penalty
+            return 0.0
+
+        if self.strategy == "weighted":
+            return random.choices(
+                candidates,
+                weights=[
+                    get_weight(idx) / (1 + get_penalty(idx)) for idx in candidates
+                ],
+            )[0]
+
+        latencies = [
+            self.get_node(nodes[idx]).latency
+            for idx in candidates
+            if self.get_node(nodes[idx]).latency is not None
+        ]
+        # Nodes without samples yet are assumed to be as fast as the average
+        default_latency = sum(latencies) / len(latencies) if latencies else 1.0
+
+        def get_score(idx: int) -> float:
+            stats = self.get_node(nodes[idx])
+            score = (stats.outstanding + 1 + get_penalty(idx)) / get_weight(idx)
+            if self.strategy == "ewma":
+                score *= stats.latency if stats.latency is not None else default_latency
+            return score
+
+        # Random tie-break so idle nodes share the load
+        return min(candidates, key=lambda idx: (get_score(idx), random.random()))
+
+    def get_stats(self) -> dict[str, dict]:
+        now = time.monotonic()
+        return {
+            url: {
+                "outstanding": stats.outstanding,
+                "latency": stats.latency or 0.0,
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "ejected": int(stats.ejected_until > now),
+            }
+            for url, stats in list(self._nodes.items())
+        }
+
+
+OLLAMA_BALANCER = UpstreamBalancer()
@@ -1,13 +1,22 @@
 import asyncio
 import json
 import logging
+import time
 import uuid
+from dataclasses import dataclass, field
 from typing import Optional
 
 import aiohttp
 import websockets
 from pydantic import BaseModel
 
+from open_webui.env import (
+    ENABLE_JUPYTER_KERNEL_STICKY_SESSIONS,
+    JUPYTER_KERNEL_MAX_LIFETIME,
+    JUPYTER_KERNEL_POOL_SIZE,
+    JUPYTER_KERNEL_STICKY_TIMEOUT,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +42,8 @@ class JupyterCodeExecuter:
         token: str = "",
         password: str = "",
         timeout: int = 60,
+        session: Optional[aiohttp.ClientSession] = None,
+        kernel_id: str = "",
     ):
         """
         :param base_url: Jupyter server URL (e.g., "http://localhost:8888")
@@ -40,24 +51,32 @@ class JupyterCodeExecuter:
         :param token: Jupyter authentication token (optional)
         :param password: Jupyter password (optional)
         :param timeout: WebSocket timeout in seconds (default: 60s)
+        :param session: Signed in session to reuse, left open on exit (optional)
+        :param kernel_id: Running kernel to execute in, left running on exit (optional)
         """
         self.base_url = base_url
         self.code = code
         self.token = token
         self.password = password
         self.timeout = timeout
-        self.kernel_id = ""
+        self.kernel_id = kernel_id
+        self.owns_kernel = not kernel_id
         if self.base_url[-1] != "/":
             self.base_url += "/"
-        self.session = aiohttp.ClientSession(trust_env=True, base_url=self.base_url)
-        self.params = {}
+        self.owns_session = session is None
+        self.session = session or aiohttp.ClientSession(
+            trust_env=True, base_url=self.base_url
+        )
+        self.params = {"token": self.token} if self.token else {}
         self.result = ResultModel()
+        self.connected = False
+        self.timed_out = False
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.kernel_id:
+        if self.kernel_id and self.owns_kernel:
             try:
                 async with self.session.delete(
                     f"api/kernels/{self.kernel_id}", params=self.params
@@ -65,12 +84,14 @@ class JupyterCodeExecuter:
                     response.raise_for_status()
             except Exception as err:
                 logger.exception("close kernel failed, %s", err)
-        await self.session.close()
+        if self.owns_session:
+            await self.session.close()
 
     async def run(self) -> ResultModel:
         try:
-            await self.sign_in()
-            await self.init_kernel()
+            if self.owns_kernel:
+                await self.sign_in()
+                await self.init_kernel()
             await self.execute_code()
         except Exception as err:
             logger.exception("execute code failed, %s", err)
@@ -129,6 +150,7 @@ class JupyterCodeExecuter:
         async with websockets.connect(
             websocket_url, additional_headers=ws_headers
         ) as ws:
+            self.connected = True
             await self.execute_in_jupyter(ws)
 
     async def execute_in_jupyter(self, ws) -> None:
@@ -191,13 +213,307 @@ class JupyterCodeExecuter:
 
             except asyncio.TimeoutError:
                 stderr += "\nExecution timed out."
+                self.timed_out = True
                 break
         self.result.stdout = stdout.strip()
         self.result.stderr = stderr.strip()
         self.result.result = "\n".join(result).strip() if result else ""
 
 
-async def execute_code_jupyter(
+@dataclass
+class PooledKernel:
+    id: str
+    started_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class JupyterEndpoint:
+    """Signed in session and kernels of one Jupyter server and credentials"""
+
+    def __init__(self, base_url: str, token: str = "", password: str = ""):
+        self.base_url = base_url
+        self.token = token
+        self.password = password
+        self.client = JupyterCodeExecuter(base_url, "", token, password)
+        self.signed_in = False
+        self.sign_in_lock = asyncio.Lock()
+
+        self.idle: list[PooledKernel] = []
+        self.sticky: dict[str, PooledKernel] = {}
+        self.leased = 0
+        self.starting = 0
+
+    async def sign_in(self):
+        async with self.sign_in_lock:
+            if not self.signed_in:
+                await self.client.sign_in()
+                self.signed_in = True
+
+    async def start_kernel(self) -> PooledKernel:
+        await self.sign_in()
+        try:
+            async with self.client.session.post(
+                "api/kernels", params=self.client.params
+            ) as response:
+                response.raise_for_status()
+                kernel_data = await response.json()
+        except Exception:
+            # Signed out sessions sign in again on the next attempt
+            self.signed_in = False
+            raise
+        return PooledKernel(id=kernel_data["id"])
+
+    async def restart_kernel(self, kernel: PooledKernel):
+        async with self.client.session.post(
+            f"api/kernels/{kernel.id}/restart", params=self.client.params
+        ) as response:
+            response.raise_for_status()
+
+    async def delete_kernel(self, kernel: PooledKernel):
+        try:
+            async with self.client.session.delete(
+                f"api/kernels/{kernel.id}", params=self.client.params
+            ) as response:
+                response.raise_for_status()
+        except Exception as err:
+            logger.warning("close kernel failed, %s", err)
+
+    async def close(self):
+        kernels = self.idle + list(self.sticky.values())
+        self.idle, self.sticky = [], {}
+        await asyncio.gather(*(self.delete_kernel(kernel) for kernel in kernels))
+        await self.client.session.close()
+
+
+class JupyterKernelPool:
+    """
+    Pre-started Jupyter kernels per server, so code runs without waiting for
+    a kernel to start.
+
+    Each endpoint keeps JUPYTER_KERNEL_POOL_SIZE idle kernels warm. A kernel
+    leased for a code block is restarted in the background when it comes
+    back, so no state (including patched builtins or modules) carries over
+    to another chat, and kernels older than JUPYTER_KERNEL_MAX_LIFETIME are
+    shut down instead. With ENABLE_JUPYTER_KERNEL_STICKY_SESSIONS a chat
+    keeps its kernel, and its variables, across turns until it has been
+    unused for JUPYTER_KERNEL_STICKY_TIMEOUT.
+
+    The pool is bound to the event loop that first uses it; calls from any
+    other loop start and delete their own kernel as before.
+    """
+
+    def __init__(
+        self,
+        size: int = JUPYTER_KERNEL_POOL_SIZE,
+        max_lifetime: float = JUPYTER_KERNEL_MAX_LIFETIME,
+        sticky: bool = ENABLE_JUPYTER_KERNEL_STICKY_SESSIONS,
+        sticky_timeout: float = JUPYTER_KERNEL_STICKY_TIMEOUT,
+    ):
+        self.size = size
+        self.max_lifetime = max_lifetime
+        self.sticky = sticky
+        self.sticky_timeout = sticky_timeout
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._endpoints: dict[tuple, JupyterEndpoint] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        self.stats = {
+            "started": 0,
+            "warm_hits": 0,
+            "sticky_hits": 0,
+            "cold_starts": 0,
+            "restarts": 0,
+            "recycled": 0,
+        }
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> bool:
+        if self._loop is None or self._loop.is_closed():
+            self._loop = loop
+            self._endpoints.clear()
+            self._tasks.clear()
+        return self._loop is loop
+
+    def _spawn(self, coroutine):
+        task = self._loop.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _expired(self, kernel: PooledKernel) -> bool:
+        return time.monotonic() - kernel.started_at > self.max_lifetime
+
+    def _get_endpoint(self, base_url: str, token: str, password: str):
+        key = (base_url, token or "", password or "")
+        if key not in self._endpoints:
+            self._endpoints[key] = JupyterEndpoint(base_url, token, password)
+        return self._endpoints[key]
+
+    async def _start(self, endpoint: JupyterEndpoint) -> PooledKernel:
+        endpoint.starting += 1
+        try:
+            kernel = await endpoint.start_kernel()
+            self.stats["started"] += 1
+            return kernel
+        finally:
+            endpoint.starting -= 1
+
+    async def _fill(self, endpoint: JupyterEndpoint):
+        while len(endpoint.idle) + endpoint.starting < self.size:
+            try:
+                kernel = await self._start(endpoint)
+            except Exception as err:
+                logger.warning("warm kernel start failed, %s", err)
+                return
+            endpoint.idle.append(kernel)
+
+    async def _recycle(self, endpoint: JupyterEndpoint, kernel: PooledKernel):
+        # Kernels only go back to the pool after a restart wiped their state
+        if len(endpoint.idle) + endpoint.starting >= self.size or self._expired(kernel):
+            self.stats["recycled"] += 1
+            await endpoint.delete_kernel(kernel)
+            return
+        try:
+            await endpoint.restart_kernel(kernel)
+            self.stats["restarts"] += 1
+        except Exception as err:
+            logger.warning("kernel restart failed, %s", err)
+            await endpoint.delete_kernel(kernel)
+            return
+        kernel.last_used = time.monotonic()
+        endpoint.idle.append(kernel)
+
+    def _release_idle_sticky(self, endpoint: JupyterEndpoint):
+        now = time.monotonic()
+        for chat_id, kernel in list(endpoint.sticky.items()):
+            if not kernel.lock.locked() and (
+                now - kernel.last_used > self.sticky_timeout or self._expired(kernel)
+            ):
+                del endpoint.sticky[chat_id]
+                self._spawn(self._recycle(endpoint, kernel))
+
+    async def acquire(
+        self, endpoint: JupyterEndpoint, chat_id: Optional[str] = None
+    ) -> tuple[PooledKernel, bool]:
+        """Returns a kernel and whether it was already running"""
+        self._release_idle_sticky(endpoint)
+
+        if self.sticky and chat_id and chat_id in endpoint.sticky:
+            self.stats["sticky_hits"] += 1
+            return endpoint.sticky[chat_id], True
+
+        while endpoint.idle:
+            kernel = endpoint.idle.pop(0)
+            if self._expired(kernel):
+                self.stats["recycled"] += 1
+                self._spawn(endpoint.delete_kernel(kernel))
+                continue
+            self.stats["warm_hits"] += 1
+            self._spawn(self._fill(endpoint))
+            warm = True
+            break
+        else:
+            self.stats["cold_starts"] += 1
+            kernel = await self._start(endpoint)
+            self._spawn(self._fill(endpoint))
+            warm = False
+
+        if self.sticky and chat_id:
+            endpoint.sticky[chat_id] = kernel
+        return kernel, warm
+
+    def release(
+        self,
+        endpoint: JupyterEndpoint,
+        kernel: PooledKernel,
+        chat_id: Optional[str] = None,
+        failed: bool = False,
+    ):
+        kernel.last_used = time.monotonic()
+        sticky = self.sticky and chat_id and endpoint.sticky.get(chat_id) is kernel
+        if failed:
+            if sticky:
+                del endpoint.sticky[chat_id]
+            self._spawn(endpoint.delete_kernel(kernel))
+        elif not sticky:
+            self._spawn(self._recycle(endpoint, kernel))
+
+    async def execute(
+        self,
+        base_url: str,
+        code: str,
+        token: str = "",
+        password: str = "",
+        timeout: int = 60,
+        chat_id: Optional[str] = None,
+    ) -> dict:
+        if not self._bind(asyncio.get_running_loop()):
+            return await execute_code_in_new_kernel(
+                base_url, code, token, password, timeout
+            )
+
+        endpoint = self._get_endpoint(base_url, token, password)
+
+        # A warm kernel may have been culled by the server; code that never
+        # reached it is retried once on a new kernel
+        for attempt in range(2):
+            try:
+                kernel, warm = await self.acquire(endpoint, chat_id)
+            except Exception as err:
+                logger.exception("execute code failed, %s", err)
+                return ResultModel(stderr=f"Error: {err}").model_dump()
+
+            endpoint.leased += 1
+            executor = JupyterCodeExecuter(
+                endpoint.base_url,
+                code,
+                token,
+                password,
+                timeout,
+                session=endpoint.client.session,
+                kernel_id=kernel.id,
+            )
+            failed = True
+            try:
+                async with kernel.lock:
+                    await executor.execute_code()
+                # Timed out kernels may still be busy with the code
+                failed = executor.timed_out
+                return executor.result.model_dump()
+            except Exception as err:
+                if warm and not executor.connected and attempt == 0:
+                    logger.info("kernel %s unavailable, retrying", kernel.id)
+                    continue
+                logger.exception("execute code failed, %s", err)
+                executor.result.stderr = f"Error: {err}"
+                return executor.result.model_dump()
+            finally:
+                endpoint.leased -= 1
+                self.release(endpoint, kernel, chat_id, failed)
+
+    async def close(self):
+        endpoints = list(self._endpoints.values())
+        self._endpoints.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(
+            *(endpoint.close() for endpoint in endpoints), return_exceptions=True
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        endpoints = self._endpoints.values()
+        return {
+            **self.stats,
+            "idle": sum(len(endpoint.idle) for endpoint in endpoints),
+            "sticky": sum(len(endpoint.sticky) for endpoint in endpoints),
+            "leased": sum(endpoint.leased for endpoint in endpoints),
+        }
+
+
+JUPYTER_KERNEL_POOL = JupyterKernelPool()
+
+
+async def execute_code_in_new_kernel(
     base_url: str, code: str, token: str = "", password: str = "", timeout: int = 60
 ) -> dict:
     async with JupyterCodeExecuter(
@@ -205,3 +521,18 @@ async def execute_code_jupyter(
     ) as executor:
         result = await executor.run()
         return result.model_dump()
+
+
+async def execute_code_jupyter(
+    base_url: str,
+    code: str,
+    token: str = "",
+    password: str = "",
+    timeout: int = 60,
+    chat_id: Optional[str] = None,
+) -> dict:
+    if JUPYTER_KERNEL_POOL.size > 0:
+        return await JUPYTER_KERNEL_POOL.execute(
+            base_url, code, token, password, timeout, chat_id=chat_id
+        )
+    return await execute_code_in_new_kernel(base_url, code, token, password, timeout)
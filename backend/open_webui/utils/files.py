@@ -22,10 +22,25 @@ from open_webui.retrieval.web.utils import validate_url
 
 import mimetypes
 import base64
+import hashlib
 import io
+import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 
 import requests
+from PIL import Image
+
+from open_webui.env import (
+    AIOHTTP_CLIENT_TIMEOUT,
+    IMAGE_INLINE_CACHE_SIZE,
+    IMAGE_INLINE_CACHE_TTL,
+)
+
+log = logging.getLogger(__name__)
 
 BASE64_IMAGE_URL_PREFIX = re.compile(r"data:image/\w+;base64,", re.IGNORECASE)
 MARKDOWN_IMAGE_URL_PATTERN = re.compile(r"!\[(.*?)\]\((.+?)\)", re.IGNORECASE)
@@ -64,6 +79,154 @@ def get_image_base64_from_url(url: str) -> Optional[str]:
         return None
 
 
+@dataclass
+class InlineImage:
+    data_url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+
+
+class InlineImageCache:
+    """
+    LRU of images already converted to data URLs, bounded by their total size.
+
+    Remote images are keyed by URL and revalidated with their ETag or
+    Last-Modified once older than IMAGE_INLINE_CACHE_TTL; uploaded files are
+    keyed by their content hash.
+    """
+
+    def __init__(self, max_size: int = IMAGE_INLINE_CACHE_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._entries: OrderedDict[str, InlineImage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[InlineImage]:
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+            return image
+
+    def set(self, key: str, image: InlineImage):
+        if len(image.data_url) > self.max_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous.data_url)
+            self._entries[key] = image
+            self.size += len(image.data_url)
+            while self.size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.data_url)
+
+
+INLINE_IMAGE_CACHE = InlineImageCache()
+
+
+def downscale_image_data_url(data_url: str, max_dimension: int) -> str:
+    """Shrink an image data URL to fit max_dimension, keeping its format."""
+    try:
+        header, encoded = data_url.split(",", 1)
+        image = Image.open(io.BytesIO(base64.b64decode(encoded)))
+        if max(image.size) <= max_dimension or getattr(image, "is_animated", False):
+            return data_url
+
+        image_format = image.format if image.format in ("JPEG", "WEBP") else "PNG"
+        image.thumbnail((max_dimension, max_dimension))
+        if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_format)
+        encoded = base64.b64encode(buffer.getvalue()).decode("utf-8")
+        return f"data:{Image.MIME[image_format]};base64,{encoded}"
+    except Exception as e:
+        log.debug(f"Error downscaling image: {e}")
+        return data_url
+
+
+def fetch_remote_image(
+    url: str, cached: Optional[InlineImage] = None, max_dimension: int = 0
+) -> InlineImage:
+    # Validate URL to prevent SSRF attacks against local/private networks
+    validate_url(url)
+
+    headers = {}
+    if cached is not None and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached is not None and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+
+    response = requests.get(url, headers=headers, timeout=AIOHTTP_CLIENT_TIMEOUT)
+    if response.status_code == 304 and cached is not None:
+        return replace(cached, fetched_at=time.time())
+    response.raise_for_status()
+
+    content_type = response.headers.get("Content-Type", "image/png")
+    encoded_string = base64.b64encode(response.content).decode("utf-8")
+    data_url = f"data:{content_type};base64,{encoded_string}"
+    if max_dimension > 0:
+        data_url = downscale_image_data_url(data_url, max_dimension)
+
+    return InlineImage(
+        data_url=data_url,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        fetched_at=time.time(),
+    )
+
+
+def get_inline_image(url: str, max_dimension: int = 0) -> Optional[str]:
+    """
+    Return a remote image URL, uploaded file id or data URL as a data URL
+    downscaled to max_dimension, reusing previously inlined images.
+    """
+    suffix = f"@{max_dimension}" if max_dimension > 0 else ""
+
+    if url.startswith("data:"):
+        if not suffix:
+            return url
+        key = f"data:{hashlib.sha256(url.encode()).hexdigest()}{suffix}"
+        cached = INLINE_IMAGE_CACHE.get(key)
+        if cached is None:
+            cached = InlineImage(downscale_image_data_url(url, max_dimension))
+            INLINE_IMAGE_CACHE.set(key, cached)
+        return cached.data_url
+
+    if url.startswith("http"):
+        key = f"{url}{suffix}"
+        cached = INLINE_IMAGE_CACHE.get(key)
+        if (
+            cached is not None
+            and time.time() - cached.fetched_at < IMAGE_INLINE_CACHE_TTL
+        ):
+            return cached.data_url
+
+        image = fetch_remote_image(url, cached, max_dimension)
+        INLINE_IMAGE_CACHE.set(key, image)
+        return image.data_url
+
+    file = Files.get_file_by_id(url)
+    if not file:
+        return None
+
+    key = f"file:{file.hash or f'{file.id}:{file.updated_at}'}{suffix}"
+    cached = INLINE_IMAGE_CACHE.get(key)
+    if cached is not None:
+        return cached.data_url
+
+    data_url = get_image_base64_from_url(url)
+    if data_url is None:
+        return None
+    if suffix:
+        data_url = downscale_image_data_url(data_url, max_dimension)
+    INLINE_IMAGE_CACHE.set(key, InlineImage(data_url))
+    return data_url
+
+
 def get_image_url_from_base64(request, base64_image_string, metadata, user):
     if BASE64_IMAGE_URL_PREFIX.match(base64_image_string):
         image_url = ""
@@ -1,16 +1,30 @@
 import asyncio
+import hashlib
+import json
+import logging
+import time
 from typing import Optional
 from contextlib import AsyncExitStack
 
 import anyio
 
-from mcp import ClientSession
+from mcp import ClientSession, types
 from mcp.client.auth import OAuthClientProvider, TokenStorage
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.shared.auth import OAuthClientInformationFull, OAuthClientMetadata, OAuthToken
 import httpx
 from mcp.shared._httpx_utils import create_mcp_http_client
-from open_webui.env import AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL
+from open_webui.env import (
+    AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
+    MCP_SESSION_HEALTH_CHECK_INTERVAL,
+    MCP_SESSION_IDLE_TIMEOUT,
+    MCP_TOOL_SPECS_CACHE_TTL,
+)
+
+log = logging.getLogger(__name__)
+
+# Seconds a health check ping may take before the session is replaced
+MCP_PING_TIMEOUT = 5
 
 
 def create_insecure_httpx_client(headers=None, timeout=None, auth=None):
@@ -24,7 +38,9 @@ class MCPClient:
         self.session: Optional[ClientSession] = None
         self.exit_stack = None
 
-    async def connect(self, url: str, headers: Optional[dict] = None):
+    async def connect(
+        self, url: str, headers: Optional[dict] = None, message_handler=None
+    ):
         async with AsyncExitStack() as exit_stack:
             try:
                 if AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL:
@@ -40,7 +56,7 @@ class MCPClient:
                 read_stream, write_stream, _ = transport
 
                 self._session_context = ClientSession(
-                    read_stream, write_stream
+                    read_stream, write_stream, message_handler=message_handler
                 )  # pylint: disable=W0201
 
                 self.session = await exit_stack.enter_async_context(
@@ -120,7 +136,9 @@ class MCPClient:
 
     async def disconnect(self):
         # Clean up and close the session
-        await self.exit_stack.aclose()
+        if self.exit_stack is not None:
+            exit_stack, self.exit_stack = self.exit_stack, None
+            await exit_stack.aclose()
 
     async def __aenter__(self):
         await self.exit_stack.__aenter__()
@@ -129,3 +147,280 @@ class MCPClient:
     async def __aexit__(self, exc_type, exc_value, traceback):
         await self.exit_stack.__aexit__(exc_type, exc_value, traceback)
         await self.disconnect()
+
+
+class PooledMCPSession:
+    """
+    An MCP session kept open by its own task.
+
+    The transport and session contexts use anyio cancel scopes, which must be
+    entered and exited in the same task, so a long-lived task owns them and
+    requests from any chat are sent over the session's streams.
+    """
+
+    def __init__(self, url: str, headers: Optional[dict] = None):
+        self.url = url
+        self.headers = headers
+        self.client = MCPClient()
+
+        self.tool_specs: Optional[list] = None
+        self.tool_specs_at = 0.0
+        self.leases = 0
+        self.last_used = time.monotonic()
+        self.last_checked = time.monotonic()
+
+        self._closing: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def alive(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _handle_message(self, message):
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            self.tool_specs = None
+
+    async def _run(self, ready: asyncio.Future):
+        try:
+            await self.client.connect(
+                self.url, self.headers, message_handler=self._handle_message
+            )
+        except BaseException as e:
+            if not ready.done():
+                if isinstance(e, Exception):
+                    ready.set_exception(e)
+                    return
+                ready.cancel()
+            raise
+
+        if not ready.done():
+            ready.set_result(None)
+        try:
+            await self._closing.wait()
+        finally:
+            try:
+                await self.client.disconnect()
+            except Exception as e:
+                log.debug(f"Error closing MCP session for {self.url}: {e}")
+
+    async def start(self):
+        self._closing = asyncio.Event()
+        ready = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(ready))
+        # Transport failures end the task on their own; retrieve them here
+        self._task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        await ready
+
+    async def check(self, interval: float) -> bool:
+        if not self.alive:
+            return False
+        now = time.monotonic()
+        if now - self.last_checked < interval:
+            return True
+        try:
+            with anyio.fail_after(MCP_PING_TIMEOUT):
+                await self.client.session.send_ping()
+        except Exception as e:
+            log.debug(f"MCP session for {self.url} failed health check: {e}")
+            return False
+        self.last_checked = now
+        return True
+
+    async def list_tool_specs(self, ttl: float) -> list:
+        if self.tool_specs is None or time.monotonic() - self.tool_specs_at > ttl:
+            self.tool_specs_at = time.monotonic()
+            self.tool_specs = await self.client.list_tool_specs()
+        return self.tool_specs
+
+    async def close(self):
+        if self._task is None:
+            return
+        self._closing.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), MCP_PING_TIMEOUT)
+        except BaseException:
+            self._task.cancel()
+
+
+class MCPSessionLease:
+    """
+    A chat request's handle on a pooled MCP session, used like an MCPClient.
+    disconnect() hands the session back to the pool, which only closes it
+    for sessions that were not pooled.
+    """
+
+    def __init__(self, pool: "MCPSessionPool", session: PooledMCPSession, key):
+        self.pool = pool
+        self.session = session
+        self.key = key
+        self.released = False
+
+    async def list_tool_specs(self) -> list:
+        return await self.session.list_tool_specs(self.pool.tool_specs_ttl)
+
+    async def call_tool(
+        self, function_name: str, function_args: dict
+    ) -> Optional[dict]:
+        # Tool calls may have side effects, so a call is only retried when it
+        # provably never reached the server
+        if not self.session.alive:
+            await self.pool.reconnect(self)
+        try:
+            return await self.session.client.call_tool(function_name, function_args)
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            # The session's streams were closed before the request was sent
+            await self.pool.reconnect(self)
+            return await self.session.client.call_tool(function_name, function_args)
+
+    async def list_resources(self, cursor: Optional[str] = None) -> Optional[dict]:
+        return await self.session.client.list_resources(cursor=cursor)
+
+    async def read_resource(self, uri: str) -> Optional[dict]:
+        return await self.session.client.read_resource(uri)
+
+    async def disconnect(self):
+        if not self.released:
+            self.released = True
+            await self.pool.release(self)
+
+
+class MCPSessionPool:
+    """
+    MCP sessions shared between chat requests, one per server URL and set of
+    request headers (and so per credential). Sessions idle for
+    MCP_SESSION_IDLE_TIMEOUT are closed, sessions idle for longer than
+    MCP_SESSION_HEALTH_CHECK_INTERVAL are pinged before reuse, and
+    tools/list results are reused for MCP_TOOL_SPECS_CACHE_TTL or until the
+    server sends tools/list_changed.
+
+    Sessions belong to the event loop that opened them; acquiring from
+    another loop starts over with an empty pool.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = MCP_SESSION_IDLE_TIMEOUT,
+        health_check_interval: float = MCP_SESSION_HEALTH_CHECK_INTERVAL,
+        tool_specs_ttl: float = MCP_TOOL_SPECS_CACHE_TTL,
+    ):
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.tool_specs_ttl = tool_specs_ttl
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sessions: dict[str, PooledMCPSession] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+        self.stats = {"connects": 0, "reuses": 0, "reconnects": 0, "evictions": 0}
+
+    @staticmethod
+    def get_key(url: str, headers: Optional[dict]) -> str:
+        return hashlib.sha256(
+            json.dumps([url, sorted((headers or {}).items())]).encode("utf-8")
+        ).hexdigest()
+
+    def _bind(self, loop: asyncio.AbstractEventLoop):
+        if self._loop is not loop:
+            self._loop = loop
+            self._sessions.clear()
+            self._locks.clear()
+            self._tasks.clear()
+
+    def _close_later(self, session: PooledMCPSession):
+        task = asyncio.create_task(session.close())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        for key, session in list(self._sessions.items()):
+            if session.leases == 0 and (
+                not session.alive or now - session.last_used > self.idle_timeout
+            ):
+                del self._sessions[key]
+                self.stats["evictions"] += 1
+                self._close_later(session)
+
+    async def _connect(self, url: str, headers: Optional[dict]) -> PooledMCPSession:
+        session = PooledMCPSession(url, headers)
+        await session.start()
+        self.stats["connects"] += 1
+        return session
+
+    async def acquire(
+        self, url: str, headers: Optional[dict] = None, pooled: bool = True
+    ) -> MCPSessionLease:
+        self._bind(asyncio.get_running_loop())
+        self._evict_idle()
+
+        if not pooled:
+            return MCPSessionLease(self, await self._connect(url, headers), None)
+
+        key = self.get_key(url, headers)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            session = self._sessions.get(key)
+            if session is not None and not await session.check(
+                self.health_check_interval
+            ):
+                del self._sessions[key]
+                self._close_later(session)
+                session = None
+
+            if session is None:
+                session = self._sessions[key] = await self._connect(url, headers)
+            else:
+                self.stats["reuses"] += 1
+
+            session.leases += 1
+            session.last_used = time.monotonic()
+        return MCPSessionLease(self, session, key)
+
+    async def reconnect(self, lease: MCPSessionLease):
+        old = lease.session
+        self.stats["reconnects"] += 1
+        if lease.key is None:
+            lease.session = await self._connect(old.url, old.headers)
+            self._close_later(old)
+            return
+
+        async with self._locks.setdefault(lease.key, asyncio.Lock()):
+            session = self._sessions.get(lease.key)
+            if session is old or session is None or not session.alive:
+                session = self._sessions[lease.key] = await self._connect(
+                    old.url, old.headers
+                )
+                # Keep cached specs, the server is the same
+                session.tool_specs = old.tool_specs
+                session.tool_specs_at = old.tool_specs_at
+            old.leases -= 1
+            session.leases += 1
+            lease.session = session
+        if old.leases <= 0:
+            self._close_later(old)
+
+    async def release(self, lease: MCPSessionLease):
+        session = lease.session
+        if lease.key is None:
+            await session.close()
+            return
+        session.leases -= 1
+        session.last_used = time.monotonic()
+        if self._sessions.get(lease.key) is not session and session.leases <= 0:
+            await session.close()
+
+    async def close(self):
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(
+            *(session.close() for session in sessions), return_exceptions=True
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        return {**self.stats, "sessions": len(self._sessions)}
+
+
+MCP_SESSION_POOL = MCPSessionPool()
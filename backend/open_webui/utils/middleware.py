@@ -27,11 +27,13 @@ from starlette.responses import Response, StreamingResponse, JSONResponse
 from open_webui.utils.misc import is_string_allowed
 from open_webui.models.oauth_sessions import OAuthSessions
 from open_webui.models.chats import Chats
+from open_webui.tasks import enqueue_background_task, run_background_task
 from open_webui.models.folders import Folders
 from open_webui.models.users import Users
 from open_webui.socket.main import (
     get_event_call,
     get_event_emitter,
+    flush_message_events,
 )
 from open_webui.routers.tasks import (
     generate_queries,
@@ -61,7 +63,7 @@ from open_webui.utils.webhook import post_webhook
 from open_webui.utils.files import (
     convert_markdown_base64_images,
     get_file_url_from_base64,
-    get_image_base64_from_url,
+    get_inline_image,
     get_image_url_from_base64,
 )
 
@@ -70,7 +72,7 @@ from open_webui.models.users import UserModel
 from open_webui.models.functions import Functions
 from open_webui.models.models import Models
 
-from open_webui.retrieval.utils import get_sources_from_items
+from open_webui.retrieval.utils import RetrievalCache, get_sources_from_items
 
 
 from open_webui.utils.sanitize import sanitize_code
@@ -108,7 +110,7 @@ from open_webui.utils.filter import (
 from open_webui.utils.code_interpreter import execute_code_jupyter
 from open_webui.utils.payload import apply_system_prompt_to_body
 from open_webui.utils.response import normalize_usage
-from open_webui.utils.mcp.client import MCPClient
+from open_webui.utils.mcp.client import MCP_SESSION_POOL
 
 
 from open_webui.config import (
@@ -117,6 +119,8 @@ from open_webui.config import (
     DEFAULT_TOOLS_FUNCTION_CALLING_PROMPT_TEMPLATE,
     DEFAULT_CODE_INTERPRETER_PROMPT,
     CODE_INTERPRETER_BLOCKED_MODULES,
+    ENABLE_SPECULATIVE_RETRIEVAL,
+    RETRIEVAL_QUERY_GENERATION_TIMEOUT,
 )
 from open_webui.env import (
     GLOBAL_LOG_LEVEL,
@@ -130,6 +134,9 @@ from open_webui.env import (
     ENABLE_FORWARD_USER_INFO_HEADERS,
     FORWARD_SESSION_INFO_HEADER_CHAT_ID,
     FORWARD_SESSION_INFO_HEADER_MESSAGE_ID,
+    IMAGE_INLINE_CONCURRENCY,
+    IMAGE_INLINE_MAX_DIMENSION,
+    ENABLE_MCP_SESSION_POOL,
 )
 from open_webui.utils.headers import include_user_info_headers
 from open_webui.constants import TASKS
@@ -149,6 +156,11 @@ DEFAULT_REASONING_TAGS = [
     ("◁think▷", "◁/think▷"),
 ]
 DEFAULT_SOLUTION_TAGS = [("<|begin_of_solution|>", "<|end_of_solution|>")]
+
+# <details> blocks and markdown images, stripped before background tasks
+DETAILS_AND_IMAGES_PATTERN = re.compile(
+    r"<details\b[^>]*>.*?<\/details>|!\[.*?\]\(.*?\)", flags=re.S | re.I
+)
 DEFAULT_CODE_INTERPRETER_TAGS = [("<code_interpreter>", "</code_interpreter>")]
 
 
@@ -1708,6 +1720,39 @@ async def chat_image_generation_handler(
     return form_data
 
 
+async def generate_retrieval_queries(
+    request: Request, body: dict, user: UserModel
+) -> list[str]:
+    try:
+        queries_response = await generate_queries(
+            request,
+            {
+                "model": body["model"],
+                "messages": body["messages"],
+                "type": "retrieval",
+                "chat_id": body.get("metadata", {}).get("chat_id"),
+            },
+            user,
+        )
+        queries_response = queries_response["choices"][0]["message"]["content"]
+
+        try:
+            bracket_start = queries_response.find("{")
+            bracket_end = queries_response.rfind("}") + 1
+
+            if bracket_start == -1 or bracket_end == -1:
+                raise Exception("No JSON object found in the response")
+
+            queries_response = queries_response[bracket_start:bracket_end]
+            queries_response = json.loads(queries_response)
+        except Exception as e:
+            queries_response = {"queries": [queries_response]}
+
+        return queries_response.get("queries", [])
+    except:
+        return []
+
+
 async def chat_completion_files_handler(
     request: Request, body: dict, extra_params: dict, user: UserModel
 ) -> tuple[dict, dict[str, list]]:
@@ -1718,54 +1763,13 @@ async def chat_completion_files_handler(
         # Check if all files are in full context mode
         all_full_context = all(item.get("context") == "full" for item in files)
 
-        queries = []
-        if not all_full_context:
-            try:
-                queries_response = await generate_queries(
-                    request,
-                    {
-                        "model": body["model"],
-                        "messages": body["messages"],
-                        "type": "retrieval",
-                        "chat_id": body.get("metadata", {}).get("chat_id"),
-                    },
-                    user,
-                )
-                queries_response = queries_response["choices"][0]["message"]["content"]
-
-                try:
-                    bracket_start = queries_response.find("{")
-                    bracket_end = queries_response.rfind("}") + 1
-
-                    if bracket_start == -1 or bracket_end == -1:
-                        raise Exception("No JSON object found in the response")
-
-                    queries_response = queries_response[bracket_start:bracket_end]
-                    queries_response = json.loads(queries_response)
-                except Exception as e:
-                    queries_response = {"queries": [queries_response]}
-
-                queries = queries_response.get("queries", [])
-            except:
-                pass
+        # Shared by the speculative and generated-query passes, so the latter
+        # reuses fetched collections and every query the former already ran
+        retrieval_cache = RetrievalCache()
 
-            await __event_emitter__(
-                {
-                    "type": "status",
-                    "data": {
-                        "action": "queries_generated",
-                        "queries": queries,
-                        "done": False,
-                    },
-                }
-            )
-
-        if len(queries) == 0:
-            queries = [get_last_user_message(body["messages"])]
-
-        try:
+        async def retrieve(queries: list[str]) -> list[dict]:
             # Directly await async get_sources_from_items (no thread needed - fully async now)
-            sources = await get_sources_from_items(
+            return await get_sources_from_items(
                 request=request,
                 items=files,
                 queries=queries,
@@ -1789,9 +1793,56 @@ async def chat_completion_files_handler(
                 full_context=all_full_context
                 or request.app.state.config.RAG_FULL_CONTEXT,
                 user=user,
+                cache=retrieval_cache,
             )
+
+        user_message = get_last_user_message(body["messages"])
+
+        queries = []
+        speculative = None
+        if not all_full_context:
+            if ENABLE_SPECULATIVE_RETRIEVAL:
+                # Retrieval with the raw message overlaps the query generation
+                # round-trip: it is the result whenever it would be the fallback,
+                # and otherwise has already fetched what the generated queries need
+                speculative = asyncio.create_task(retrieve([user_message]))
+
+            try:
+                queries = await asyncio.wait_for(
+                    generate_retrieval_queries(request, body, user),
+                    timeout=RETRIEVAL_QUERY_GENERATION_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                log.info(
+                    f"Retrieval query generation exceeded {RETRIEVAL_QUERY_GENERATION_TIMEOUT}s, using the last user message"
+                )
+
+            await __event_emitter__(
+                {
+                    "type": "status",
+                    "data": {
+                        "action": "queries_generated",
+                        "queries": queries,
+                        "done": False,
+                    },
+                }
+            )
+
+        if len(queries) == 0:
+            queries = [user_message]
+
+        try:
+            if speculative is not None and queries == [user_message]:
+                sources = await speculative
+            else:
+                sources = await retrieve(queries)
         except Exception as e:
             log.exception(e)
+        finally:
+            # Generated queries replace the speculative results
+            if speculative is not None:
+                speculative.cancel()
+            retrieval_cache.close()
 
         log.debug(f"rag_contexts:sources: {sources}")
 
@@ -1879,41 +1930,66 @@ def apply_params_to_form_data(form_data, model):
     return form_data
 
 
-async def convert_url_images_to_base64(form_data):
-    messages = form_data.get("messages", [])
+async def convert_url_images_to_base64(form_data, model=None):
+    max_dimension = IMAGE_INLINE_MAX_DIMENSION
+    if model:
+        try:
+            max_dimension = int(
+                model.get("info", {}).get("meta", {}).get("image_max_dimension")
+                or max_dimension
+            )
+        except (TypeError, ValueError):
+            pass
 
-    for message in messages:
+    images = []
+    for message in form_data.get("messages", []):
         content = message.get("content")
         if not isinstance(content, list):
             continue
 
-        new_content = []
-
-        for item in content:
+        # Replaced in a copy so the caller's message objects stay untouched
+        content = message["content"] = list(content)
+        for idx, item in enumerate(content):
             if not isinstance(item, dict) or item.get("type") != "image_url":
-                new_content.append(item)
                 continue
 
             image_url = item.get("image_url", {}).get("url", "")
-            if image_url.startswith("data:image/"):
-                new_content.append(item)
+            if image_url.startswith("data:image/") and max_dimension <= 0:
                 continue
+            images.append((content, idx, image_url))
 
-            try:
-                base64_data = await asyncio.to_thread(
-                    get_image_base64_from_url, image_url
-                )
-                new_content.append(
-                    {
-                        "type": "image_url",
-                        "image_url": {"url": base64_data},
-                    }
-                )
-            except Exception as e:
-                log.debug(f"Error converting image URL to base64: {e}")
-                new_content.append(item)
+    if not images:
+        return form_data
+
+    # Fetch each distinct image once, a few at a time; history images are
+    # usually served from the inline image cache
+    semaphore = asyncio.Semaphore(IMAGE_INLINE_CONCURRENCY)
+
+    async def inline_image(url):
+        async with semaphore:
+            return await asyncio.to_thread(get_inline_image, url, max_dimension)
+
+    urls = list(dict.fromkeys(url for _, _, url in images))
+    results = dict(
+        zip(
+            urls,
+            await asyncio.gather(
+                *[inline_image(url) for url in urls], return_exceptions=True
+            ),
+        )
+    )
+
+    for content, idx, image_url in images:
+        result = results[image_url]
+        if isinstance(result, Exception) or not result:
+            if isinstance(result, Exception):
+                log.debug(f"Error converting image URL to base64: {result}")
+            continue
 
-        message["content"] = new_content
+        content[idx] = {
+            "type": "image_url",
+            "image_url": {"url": result},
+        }
 
     return form_data
 
@@ -1962,7 +2038,7 @@ async def process_chat_payload(request, form_data, user, metadata, model):
         except:
             pass
 
-    form_data = await convert_url_images_to_base64(form_data)
+    form_data = await convert_url_images_to_base64(form_data, model)
 
     event_emitter = get_event_emitter(metadata)
     event_caller = get_event_call(metadata)
@@ -2209,147 +2285,161 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     mcp_clients = {}
     mcp_tools_dict = {}
 
-    if tool_ids:
-        for tool_id in tool_ids:
-            if tool_id.startswith("server:mcp:"):
-                try:
-                    server_id = tool_id[len("server:mcp:") :]
+    async def load_mcp_server_tools(server_id):
+        mcp_server_connection = None
+        for server_connection in request.app.state.config.TOOL_SERVER_CONNECTIONS:
+            if (
+                server_connection.get("type", "") == "mcp"
+                and server_connection.get("info", {}).get("id") == server_id
+            ):
+                mcp_server_connection = server_connection
+                break
+
+        if not mcp_server_connection:
+            log.error(f"MCP server with id {server_id} not found")
+            return None
+
+        # Check access control for MCP server
+        if not has_tool_server_access(user, mcp_server_connection):
+            log.warning(f"Access denied to MCP server {server_id} for user {user.id}")
+            return None
+
+        auth_type = mcp_server_connection.get("auth_type", "")
+        headers = {}
+        if auth_type == "bearer":
+            headers["Authorization"] = f"Bearer {mcp_server_connection.get('key', '')}"
+        elif auth_type == "none":
+            # No authentication
+            pass
+        elif auth_type == "session":
+            headers["Authorization"] = f"Bearer {request.state.token.credentials}"
+        elif auth_type == "system_oauth":
+            oauth_token = extra_params.get("__oauth_token__", None)
+            if oauth_token:
+                headers["Authorization"] = (
+                    f"Bearer {oauth_token.get('access_token', '')}"
+                )
+        elif auth_type == "oauth_2.1":
+            try:
+                splits = server_id.split(":")
+                server_id = splits[-1] if len(splits) > 1 else server_id
 
-                    mcp_server_connection = None
-                    for (
-                        server_connection
-                    ) in request.app.state.config.TOOL_SERVER_CONNECTIONS:
-                        if (
-                            server_connection.get("type", "") == "mcp"
-                            and server_connection.get("info", {}).get("id") == server_id
-                        ):
-                            mcp_server_connection = server_connection
-                            break
+                oauth_token = (
+                    await request.app.state.oauth_client_manager.get_oauth_token(
+                        user.id, f"mcp:{server_id}"
+                    )
+                )
 
-                    if not mcp_server_connection:
-                        log.error(f"MCP server with id {server_id} not found")
-                        continue
+                if oauth_token:
+                    headers["Authorization"] = (
+                        f"Bearer {oauth_token.get('access_token', '')}"
+                    )
+            except Exception as e:
+                log.error(f"Error getting OAuth token: {e}")
+                oauth_token = None
+
+        connection_headers = mcp_server_connection.get("headers", None)
+        if connection_headers and isinstance(connection_headers, dict):
+            for key, value in connection_headers.items():
+                headers[key] = value
+
+        # Per-message headers make a session single-use, so it is not pooled
+        pooled = ENABLE_MCP_SESSION_POOL
+
+        # Add user info headers if enabled
+        if ENABLE_FORWARD_USER_INFO_HEADERS and user:
+            headers = include_user_info_headers(headers, user)
+            if metadata and metadata.get("chat_id"):
+                headers[FORWARD_SESSION_INFO_HEADER_CHAT_ID] = metadata.get("chat_id")
+                pooled = False
+            if metadata and metadata.get("message_id"):
+                headers[FORWARD_SESSION_INFO_HEADER_MESSAGE_ID] = metadata.get(
+                    "message_id"
+                )
+                pooled = False
 
-                    # Check access control for MCP server
-                    if not has_tool_server_access(user, mcp_server_connection):
-                        log.warning(
-                            f"Access denied to MCP server {server_id} for user {user.id}"
-                        )
-                        continue
+        client = await MCP_SESSION_POOL.acquire(
+            mcp_server_connection.get("url", ""),
+            headers=headers if headers else None,
+            pooled=pooled,
+        )
+        try:
+            function_name_filter_list = mcp_server_connection.get("config", {}).get(
+                "function_name_filter_list", ""
+            )
 
-                    auth_type = mcp_server_connection.get("auth_type", "")
-                    headers = {}
-                    if auth_type == "bearer":
-                        headers["Authorization"] = (
-                            f"Bearer {mcp_server_connection.get('key', '')}"
-                        )
-                    elif auth_type == "none":
-                        # No authentication
-                        pass
-                    elif auth_type == "session":
-                        headers["Authorization"] = (
-                            f"Bearer {request.state.token.credentials}"
-                        )
-                    elif auth_type == "system_oauth":
-                        oauth_token = extra_params.get("__oauth_token__", None)
-                        if oauth_token:
-                            headers["Authorization"] = (
-                                f"Bearer {oauth_token.get('access_token', '')}"
-                            )
-                    elif auth_type == "oauth_2.1":
-                        try:
-                            splits = server_id.split(":")
-                            server_id = splits[-1] if len(splits) > 1 else server_id
+            if isinstance(function_name_filter_list, str):
+                function_name_filter_list = function_name_filter_list.split(",")
 
-                            oauth_token = await request.app.state.oauth_client_manager.get_oauth_token(
-                                user.id, f"mcp:{server_id}"
-                            )
+            tool_specs = await client.list_tool_specs()
+        except Exception:
+            await client.disconnect()
+            raise
 
-                            if oauth_token:
-                                headers["Authorization"] = (
-                                    f"Bearer {oauth_token.get('access_token', '')}"
-                                )
-                        except Exception as e:
-                            log.error(f"Error getting OAuth token: {e}")
-                            oauth_token = None
-
-                    connection_headers = mcp_server_connection.get("headers", None)
-                    if connection_headers and isinstance(connection_headers, dict):
-                        for key, value in connection_headers.items():
-                            headers[key] = value
-
-                    # Add user info headers if enabled
-                    if ENABLE_FORWARD_USER_INFO_HEADERS and user:
-                        headers = include_user_info_headers(headers, user)
-                        if metadata and metadata.get("chat_id"):
-                            headers[FORWARD_SESSION_INFO_HEADER_CHAT_ID] = metadata.get(
-                                "chat_id"
-                            )
-                        if metadata and metadata.get("message_id"):
-                            headers[FORWARD_SESSION_INFO_HEADER_MESSAGE_ID] = (
-                                metadata.get("message_id")
-                            )
+        server_tools = {}
+        for tool_spec in tool_specs:
 
-                    mcp_clients[server_id] = MCPClient()
-                    await mcp_clients[server_id].connect(
-                        url=mcp_server_connection.get("url", ""),
-                        headers=headers if headers else None,
+            def make_tool_function(client, function_name):
+                async def tool_function(**kwargs):
+                    return await client.call_tool(
+                        function_name,
+                        function_args=kwargs,
                     )
 
-                    function_name_filter_list = mcp_server_connection.get(
-                        "config", {}
-                    ).get("function_name_filter_list", "")
-
-                    if isinstance(function_name_filter_list, str):
-                        function_name_filter_list = function_name_filter_list.split(",")
+                return tool_function
 
-                    tool_specs = await mcp_clients[server_id].list_tool_specs()
-                    for tool_spec in tool_specs:
-
-                        def make_tool_function(client, function_name):
-                            async def tool_function(**kwargs):
-                                return await client.call_tool(
-                                    function_name,
-                                    function_args=kwargs,
-                                )
+            if function_name_filter_list:
+                if not is_string_allowed(tool_spec["name"], function_name_filter_list):
+                    # Skip this function
+                    continue
 
-                            return tool_function
+            tool_function = make_tool_function(client, tool_spec["name"])
 
-                        if function_name_filter_list:
-                            if not is_string_allowed(
-                                tool_spec["name"], function_name_filter_list
-                            ):
-                                # Skip this function
-                                continue
+            server_tools[f"{server_id}_{tool_spec['name']}"] = {
+                "spec": {
+                    **tool_spec,
+                    "name": f"{server_id}_{tool_spec['name']}",
+                },
+                "callable": tool_function,
+                "type": "mcp",
+                "client": client,
+                "direct": False,
+            }
 
-                        tool_function = make_tool_function(
-                            mcp_clients[server_id], tool_spec["name"]
-                        )
+        return server_id, client, server_tools
 
-                        mcp_tools_dict[f"{server_id}_{tool_spec['name']}"] = {
-                            "spec": {
-                                **tool_spec,
-                                "name": f"{server_id}_{tool_spec['name']}",
+    if tool_ids:
+        mcp_server_ids = [
+            tool_id[len("server:mcp:") :]
+            for tool_id in tool_ids
+            if tool_id.startswith("server:mcp:")
+        ]
+        # Servers are connected concurrently
+        results = await asyncio.gather(
+            *(load_mcp_server_tools(server_id) for server_id in mcp_server_ids),
+            return_exceptions=True,
+        )
+        for server_id, result in zip(mcp_server_ids, results):
+            if isinstance(result, BaseException):
+                log.debug(result)
+                if event_emitter:
+                    await event_emitter(
+                        {
+                            "type": "chat:message:error",
+                            "data": {
+                                "error": {
+                                    "content": f"Failed to connect to MCP server '{server_id}'"
+                                }
                             },
-                            "callable": tool_function,
-                            "type": "mcp",
-                            "client": mcp_clients[server_id],
-                            "direct": False,
                         }
-                except Exception as e:
-                    log.debug(e)
-                    if event_emitter:
-                        await event_emitter(
-                            {
-                                "type": "chat:message:error",
-                                "data": {
-                                    "error": {
-                                        "content": f"Failed to connect to MCP server '{server_id}'"
-                                    }
-                                },
-                            }
-                        )
-                    continue
+                    )
+                continue
+            if result is None:
+                continue
+
+            server_id, client, server_tools = result
+            mcp_clients[server_id] = client
+            mcp_tools_dict.update(server_tools)
 
         tools_dict = await get_tools(
             request,
@@ -2600,12 +2690,10 @@ async def background_tasks_handler(ctx):
                         break
 
             if isinstance(content, str):
-                content = re.sub(
-                    r"<details\b[^>]*>.*?<\/details>|!\[.*?\]\(.*?\)",
-                    "",
-                    content,
-                    flags=re.S | re.I,
-                ).strip()
+                # Skip the regex for the common case of plain text
+                if "<details" in content.lower() or "![" in content:
+                    content = DETAILS_AND_IMAGES_PATTERN.sub("", content)
+                content = content.strip()
 
             messages.append(
                 {
@@ -2623,172 +2711,146 @@ async def background_tasks_handler(ctx):
         if message:
             message["model"] = form_data.get("model")
 
-    if message and "model" in message:
-        if tasks and messages:
-            if (
-                TASKS.FOLLOW_UP_GENERATION in tasks
-                and tasks[TASKS.FOLLOW_UP_GENERATION]
-            ):
-                res = await generate_follow_ups(
-                    request,
-                    {
-                        "model": message["model"],
-                        "messages": messages,
-                        "message_id": metadata["message_id"],
-                        "chat_id": metadata["chat_id"],
-                    },
-                    user,
-                )
-
-                if res and isinstance(res, dict):
-                    if len(res.get("choices", [])) == 1:
-                        response_message = res.get("choices", [])[0].get("message", {})
+    if not (message and "model" in message and tasks and messages):
+        return
 
-                        follow_ups_string = response_message.get(
-                            "content"
-                        ) or response_message.get("reasoning_content", "")
-                    else:
-                        follow_ups_string = ""
+    chat_id = metadata.get("chat_id", "")
+    temporary_chat = chat_id.startswith("local:")
 
-                    follow_ups_string = follow_ups_string[
-                        follow_ups_string.find("{") : follow_ups_string.rfind("}") + 1
-                    ]
-
-                    try:
-                        follow_ups = json.loads(follow_ups_string).get("follow_ups", [])
-                        await event_emitter(
-                            {
-                                "type": "chat:message:follow_ups",
-                                "data": {
-                                    "follow_ups": follow_ups,
-                                },
-                            }
-                        )
-
-                        if not metadata.get("chat_id", "").startswith("local:"):
-                            Chats.upsert_message_to_chat_by_id_and_message_id(
-                                metadata["chat_id"],
-                                metadata["message_id"],
-                                {
-                                    "followUps": follow_ups,
-                                },
-                            )
-
-                    except Exception as e:
-                        pass
-
-            if not metadata.get("chat_id", "").startswith(
-                "local:"
-            ):  # Only update titles and tags for non-temp chats
-                if TASKS.TITLE_GENERATION in tasks:
-                    user_message = get_last_user_message(messages)
-                    if user_message and len(user_message) > 100:
-                        user_message = user_message[:100] + "..."
-
-                    title = None
-                    if tasks[TASKS.TITLE_GENERATION]:
-                        res = await generate_title(
-                            request,
-                            {
-                                "model": message["model"],
-                                "messages": messages,
-                                "chat_id": metadata["chat_id"],
-                            },
-                            user,
-                        )
-
-                        if res and isinstance(res, dict):
-                            if len(res.get("choices", [])) == 1:
-                                response_message = res.get("choices", [])[0].get(
-                                    "message", {}
-                                )
-
-                                title_string = (
-                                    response_message.get("content")
-                                    or response_message.get(
-                                        "reasoning_content",
-                                    )
-                                    or message.get("content", user_message)
-                                )
-                            else:
-                                title_string = ""
-
-                            title_string = title_string[
-                                title_string.find("{") : title_string.rfind("}") + 1
-                            ]
-
-                            try:
-                                title = json.loads(title_string).get(
-                                    "title", user_message
-                                )
-                            except Exception as e:
-                                title = ""
+    user_message = get_last_user_message(messages)
+    if user_message and len(user_message) > 100:
+        user_message = user_message[:100] + "..."
+
+    def get_response_content(res, fallback=""):
+        if len(res.get("choices", [])) != 1:
+            return ""
+        response_message = res.get("choices", [])[0].get("message", {})
+        return (
+            response_message.get("content")
+            or response_message.get("reasoning_content")
+            or fallback
+        )
 
-                            if not title:
-                                title = messages[0].get("content", user_message)
+    def get_json_object(content: str) -> dict:
+        return json.loads(content[content.find("{") : content.rfind("}") + 1])
 
-                            Chats.update_chat_title_by_id(metadata["chat_id"], title)
+    async def run_follow_ups():
+        res = await generate_follow_ups(
+            request,
+            {
+                "model": message["model"],
+                "messages": messages,
+                "message_id": metadata["message_id"],
+                "chat_id": chat_id,
+            },
+            user,
+        )
+        if res and isinstance(res, dict):
+            return get_json_object(get_response_content(res)).get("follow_ups", [])
 
-                            await event_emitter(
-                                {
-                                    "type": "chat:title",
-                                    "data": title,
-                                }
-                            )
+    async def run_title():
+        res = await generate_title(
+            request,
+            {
+                "model": message["model"],
+                "messages": messages,
+                "chat_id": chat_id,
+            },
+            user,
+        )
+        if not (res and isinstance(res, dict)):
+            return None
 
-                    if title == None and len(messages) == 2:
-                        title = messages[0].get("content", user_message)
+        try:
+            title = get_json_object(
+                get_response_content(res, message.get("content", user_message))
+            ).get("title", user_message)
+        except Exception as e:
+            title = ""
+        return title or messages[0].get("content", user_message)
 
-                        Chats.update_chat_title_by_id(metadata["chat_id"], title)
+    async def run_tags():
+        res = await generate_chat_tags(
+            request,
+            {
+                "model": message["model"],
+                "messages": messages,
+                "chat_id": chat_id,
+            },
+            user,
+        )
+        if res and isinstance(res, dict):
+            return get_json_object(get_response_content(res)).get("tags", [])
+
+    jobs = {}
+    if tasks.get(TASKS.FOLLOW_UP_GENERATION):
+        jobs["follow_ups"] = run_follow_ups
+    # Only update titles and tags for non-temp chats
+    if not temporary_chat:
+        if tasks.get(TASKS.TITLE_GENERATION):
+            jobs["title"] = run_title
+        if tasks.get(TASKS.TAGS_GENERATION):
+            jobs["tags"] = run_tags
+
+    results = {}
+    if jobs:
+        # The task model calls are independent, so they run together once the
+        # chat gets a background slot
+        async def run_jobs():
+            return await asyncio.gather(
+                *[job() for job in jobs.values()], return_exceptions=True
+            )
 
-                        await event_emitter(
-                            {
-                                "type": "chat:title",
-                                "data": message.get("content", user_message),
-                            }
-                        )
+        for name, result in zip(jobs, await run_background_task(run_jobs())):
+            if isinstance(result, Exception):
+                log.debug(f"Background task {name} failed: {result}")
+            elif result is not None:
+                results[name] = result
 
-                if TASKS.TAGS_GENERATION in tasks and tasks[TASKS.TAGS_GENERATION]:
-                    res = await generate_chat_tags(
-                        request,
-                        {
-                            "model": message["model"],
-                            "messages": messages,
-                            "chat_id": metadata["chat_id"],
-                        },
-                        user,
-                    )
+    follow_ups = results.get("follow_ups")
+    if follow_ups is not None:
+        await event_emitter(
+            {
+                "type": "chat:message:follow_ups",
+                "data": {
+                    "follow_ups": follow_ups,
+                },
+            }
+        )
 
-                    if res and isinstance(res, dict):
-                        if len(res.get("choices", [])) == 1:
-                            response_message = res.get("choices", [])[0].get(
-                                "message", {}
-                            )
+    if temporary_chat:
+        return
 
-                            tags_string = response_message.get(
-                                "content"
-                            ) or response_message.get("reasoning_content", "")
-                        else:
-                            tags_string = ""
+    title = results.get("title")
+    if title is None and TASKS.TITLE_GENERATION in tasks and len(messages) == 2:
+        title = messages[0].get("content", user_message)
 
-                        tags_string = tags_string[
-                            tags_string.find("{") : tags_string.rfind("}") + 1
-                        ]
+    # Title and follow-ups are persisted together in one chat write
+    if title is not None or follow_ups is not None:
+        Chats.update_chat_title_and_message_by_id(
+            chat_id,
+            metadata["message_id"],
+            title=title,
+            message={"followUps": follow_ups} if follow_ups is not None else None,
+        )
 
-                        try:
-                            tags = json.loads(tags_string).get("tags", [])
-                            Chats.update_chat_tags_by_id(
-                                metadata["chat_id"], tags, user
-                            )
+    if title is not None:
+        await event_emitter(
+            {
+                "type": "chat:title",
+                "data": title,
+            }
+        )
 
-                            await event_emitter(
-                                {
-                                    "type": "chat:tags",
-                                    "data": tags,
-                                }
-                            )
-                        except Exception as e:
-                            pass
+    tags = results.get("tags")
+    if tags is not None:
+        Chats.update_chat_tags_by_id(chat_id, tags, user)
+        await event_emitter(
+            {
+                "type": "chat:tags",
+                "data": tags,
+            }
+        )
 
 
 async def non_streaming_chat_response_handler(response, ctx):
@@ -2814,7 +2876,7 @@ async def non_streaming_chat_response_handler(response, ctx):
                 else:
                     error = str(error)
 
-                Chats.upsert_message_to_chat_by_id_and_message_id(
+                Chats.patch_message_by_id_and_message_id(
                     metadata["chat_id"],
                     metadata["message_id"],
                     {
@@ -2830,7 +2892,7 @@ async def non_streaming_chat_response_handler(response, ctx):
                     )
 
             if "selected_model_id" in response_data:
-                Chats.upsert_message_to_chat_by_id_and_message_id(
+                Chats.patch_message_by_id_and_message_id(
                     metadata["chat_id"],
                     metadata["message_id"],
                     {
@@ -2878,8 +2940,10 @@ async def non_streaming_chat_response_handler(response, ctx):
                         }
                     )
 
+                    flush_message_events(metadata["chat_id"], metadata["message_id"])
+
                     # Save message in the database
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
+                    Chats.patch_message_by_id_and_message_id(
                         metadata["chat_id"],
                         metadata["message_id"],
                         {
@@ -2905,7 +2969,7 @@ async def non_streaming_chat_response_handler(response, ctx):
                                 },
                             )
 
-                    await background_tasks_handler(ctx)
+                    enqueue_background_task(background_tasks_handler(ctx))
 
             response = build_response_object(
                 response, merge_events_into_response(response_data, events)
@@ -3282,7 +3346,7 @@ async def streaming_chat_response_handler(response, ctx):
                     )
 
                     # Save message in the database
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
+                    Chats.patch_message_by_id_and_message_id(
                         metadata["chat_id"],
                         metadata["message_id"],
                         {
@@ -3359,7 +3423,7 @@ async def streaming_chat_response_handler(response, ctx):
 
                                 if "selected_model_id" in data:
                                     model_id = data["selected_model_id"]
-                                    Chats.upsert_message_to_chat_by_id_and_message_id(
+                                    Chats.patch_message_by_id_and_message_id(
                                         metadata["chat_id"],
                                         metadata["message_id"],
                                         {
@@ -3807,7 +3871,7 @@ async def streaming_chat_response_handler(response, ctx):
 
                                         if ENABLE_REALTIME_CHAT_SAVE:
                                             # Save message in the database
-                                            Chats.upsert_message_to_chat_by_id_and_message_id(
+                                            Chats.patch_message_by_id_and_message_id(
                                                 metadata["chat_id"],
                                                 metadata["message_id"],
                                                 {
@@ -4253,6 +4317,7 @@ async def streaming_chat_response_handler(response, ctx):
                                             else None
                                         ),
                                         request.app.state.config.CODE_INTERPRETER_JUPYTER_TIMEOUT,
+                                        chat_id=metadata.get("chat_id"),
                                     )
                                 else:
                                     ci_output = {
@@ -4363,9 +4428,11 @@ async def streaming_chat_response_handler(response, ctx):
                     "title": title,
                 }
 
+                flush_message_events(metadata["chat_id"], metadata["message_id"])
+
                 if not ENABLE_REALTIME_CHAT_SAVE:
                     # Save message in the database
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
+                    Chats.patch_message_by_id_and_message_id(
                         metadata["chat_id"],
                         metadata["message_id"],
                         {
@@ -4375,7 +4442,7 @@ async def streaming_chat_response_handler(response, ctx):
                         },
                     )
                 elif usage:
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
+                    Chats.patch_message_by_id_and_message_id(
                         metadata["chat_id"],
                         metadata["message_id"],
                         {"usage": usage},
@@ -4404,14 +4471,16 @@ async def streaming_chat_response_handler(response, ctx):
                     }
                 )
 
-                await background_tasks_handler(ctx)
+                enqueue_background_task(background_tasks_handler(ctx))
             except asyncio.CancelledError:
                 log.warning("Task was cancelled!")
                 await event_emitter({"type": "chat:tasks:cancel"})
 
+                flush_message_events(metadata["chat_id"], metadata["message_id"])
+
                 if not ENABLE_REALTIME_CHAT_SAVE:
                     # Save message in the database
-                    Chats.upsert_message_to_chat_by_id_and_message_id(
+                    Chats.patch_message_by_id_and_message_id(
                         metadata["chat_id"],
                         metadata["message_id"],
                         {
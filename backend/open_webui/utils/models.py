@@ -2,8 +2,11 @@ import time
 import logging
 import asyncio
 import sys
+from itertools import chain
 
 from aiocache import cached
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from fastapi import Request
 
 from open_webui.socket.utils import RedisDict
@@ -11,9 +14,9 @@ from open_webui.routers import openai, ollama
 from open_webui.functions import get_function_models
 
 
-from open_webui.models.functions import Functions
-from open_webui.models.models import Models
-from open_webui.models.access_grants import AccessGrants
+from open_webui.models.functions import Function, Functions
+from open_webui.models.models import Model, Models
+from open_webui.models.access_grants import AccessGrant, AccessGrants
 from open_webui.models.groups import Groups
 
 
@@ -78,263 +81,341 @@ async def get_all_base_models(request: Request, user: UserModel = None):
     return function_models + openai_models + ollama_models
 
 
-async def get_all_models(request, refresh: bool = False, user: UserModel = None):
-    if (
-        request.app.state.MODELS
-        and request.app.state.BASE_MODELS
-        and (request.app.state.config.ENABLE_BASE_MODELS_CACHE and not refresh)
-    ):
-        base_models = request.app.state.BASE_MODELS
+def get_arena_models(request) -> list[dict]:
+    if len(request.app.state.config.EVALUATION_ARENA_MODELS) > 0:
+        return [
+            {
+                "id": model["id"],
+                "name": model["name"],
+                "info": {
+                    "meta": model["meta"],
+                },
+                "object": "model",
+                "created": int(time.time()),
+                "owned_by": "arena",
+                "arena": True,
+            }
+            for model in request.app.state.config.EVALUATION_ARENA_MODELS
+        ]
     else:
-        base_models = await get_all_base_models(request, user=user)
-        request.app.state.BASE_MODELS = base_models
-
-    # deep copy the base models to avoid modifying the original list
-    models = [model.copy() for model in base_models]
-
-    # If there are no models, return an empty list
-    if len(models) == 0:
-        return []
-
-    # Add arena models
-    if request.app.state.config.ENABLE_EVALUATION_ARENA_MODELS:
-        arena_models = []
-        if len(request.app.state.config.EVALUATION_ARENA_MODELS) > 0:
-            arena_models = [
-                {
-                    "id": model["id"],
-                    "name": model["name"],
-                    "info": {
-                        "meta": model["meta"],
-                    },
-                    "object": "model",
-                    "created": int(time.time()),
-                    "owned_by": "arena",
-                    "arena": True,
-                }
-                for model in request.app.state.config.EVALUATION_ARENA_MODELS
-            ]
-        else:
-            # Add default arena model
-            arena_models = [
-                {
-                    "id": DEFAULT_ARENA_MODEL["id"],
-                    "name": DEFAULT_ARENA_MODEL["name"],
-                    "info": {
-                        "meta": DEFAULT_ARENA_MODEL["meta"],
-                    },
-                    "object": "model",
-                    "created": int(time.time()),
-                    "owned_by": "arena",
-                    "arena": True,
-                }
-            ]
-        models = models + arena_models
-
-    global_action_ids = [
-        function.id for function in Functions.get_global_action_functions()
-    ]
-    enabled_action_ids = [
-        function.id
-        for function in Functions.get_functions_by_type("action", active_only=True)
-    ]
-
-    global_filter_ids = [
-        function.id for function in Functions.get_global_filter_functions()
-    ]
-    enabled_filter_ids = [
-        function.id
-        for function in Functions.get_functions_by_type("filter", active_only=True)
-    ]
-
-    custom_models = Models.get_all_models()
-    for custom_model in custom_models:
-        if custom_model.base_model_id is None:
-            # Applied directly to a base model
-            for model in models:
-                if custom_model.id == model["id"] or (
-                    model.get("owned_by") == "ollama"
-                    and custom_model.id
-                    == model["id"].split(":")[
-                        0
-                    ]  # Ollama may return model ids in different formats (e.g., 'llama3' vs. 'llama3:7b')
-                ):
-                    if custom_model.is_active:
-                        model["name"] = custom_model.name
-                        model["info"] = custom_model.model_dump()
-
-                        # Set action_ids and filter_ids
-                        action_ids = []
-                        filter_ids = []
-
-                        if "info" in model:
-                            if "meta" in model["info"]:
-                                action_ids.extend(
-                                    model["info"]["meta"].get("actionIds", [])
-                                )
-                                filter_ids.extend(
-                                    model["info"]["meta"].get("filterIds", [])
-                                )
-
-                            if "params" in model["info"]:
-                                # Remove params to avoid exposing sensitive info
-                                del model["info"]["params"]
-
-                        model["action_ids"] = action_ids
-                        model["filter_ids"] = filter_ids
-                    else:
-                        models.remove(model)
-
-        elif custom_model.is_active and (
-            custom_model.id not in [model["id"] for model in models]
-        ):
-            # Custom model based on a base model
-            owned_by = "openai"
-            connection_type = None
-
-            pipe = None
-
-            for m in models:
-                if (
-                    custom_model.base_model_id == m["id"]
-                    or custom_model.base_model_id == m["id"].split(":")[0]
-                ):
-                    owned_by = m.get("owned_by", "unknown")
-                    if "pipe" in m:
-                        pipe = m["pipe"]
-
-                    connection_type = m.get("connection_type", None)
-                    break
-
-            model = {
-                "id": f"{custom_model.id}",
-                "name": custom_model.name,
+        # Add default arena model
+        return [
+            {
+                "id": DEFAULT_ARENA_MODEL["id"],
+                "name": DEFAULT_ARENA_MODEL["name"],
+                "info": {
+                    "meta": DEFAULT_ARENA_MODEL["meta"],
+                },
                 "object": "model",
-                "created": custom_model.created_at,
-                "owned_by": owned_by,
-                "connection_type": connection_type,
-                "preset": True,
-                **({"pipe": pipe} if pipe is not None else {}),
+                "created": int(time.time()),
+                "owned_by": "arena",
+                "arena": True,
             }
+        ]
 
-            info = custom_model.model_dump()
-            if "params" in info:
-                # Remove params to avoid exposing sensitive info
-                del info["params"]
-
-            model["info"] = info
 
-            action_ids = []
-            filter_ids = []
+def get_function_icon(function, module):
+    return (
+        function.meta.manifest.get("icon_url", None)
+        or getattr(module, "icon_url", None)
+        or getattr(module, "icon", None)
+    )
 
-            if custom_model.meta:
-                meta = custom_model.meta.model_dump()
 
-                if "actionIds" in meta:
-                    action_ids.extend(meta["actionIds"])
+def get_function_items(request, function) -> list[dict]:
+    """
+    Resolve the action/filter items a function contributes to a model.
 
-                if "filterIds" in meta:
-                    filter_ids.extend(meta["filterIds"])
+    Items only depend on the function itself, so they are resolved once per
+    function version and shared by every model instead of being looked up
+    per model.
+    """
+    if not hasattr(request.app.state, "FUNCTION_ITEMS"):
+        request.app.state.FUNCTION_ITEMS = {}
 
-            model["action_ids"] = action_ids
-            model["filter_ids"] = filter_ids
+    cached = request.app.state.FUNCTION_ITEMS.get(function.id)
+    if cached and cached[0] == function.updated_at:
+        return cached[1]
 
-            models.append(model)
+    module, _, _ = get_function_module_from_cache(request, function.id)
 
-    # Process action_ids to get the actions
-    def get_action_items_from_module(function, module):
-        actions = []
+    if function.type == "action":
         if hasattr(module, "actions"):
-            actions = module.actions
-            return [
+            items = [
                 {
                     "id": f"{function.id}.{action['id']}",
                     "name": action.get("name", f"{function.name} ({action['id']})"),
                     "description": function.meta.description,
-                    "icon": action.get(
-                        "icon_url",
-                        function.meta.manifest.get("icon_url", None)
-                        or getattr(module, "icon_url", None)
-                        or getattr(module, "icon", None),
-                    ),
+                    "icon": action.get("icon_url", get_function_icon(function, module)),
                 }
-                for action in actions
+                for action in module.actions
             ]
         else:
-            return [
+            items = [
                 {
                     "id": function.id,
                     "name": function.name,
                     "description": function.meta.description,
-                    "icon": function.meta.manifest.get("icon_url", None)
-                    or getattr(module, "icon_url", None)
-                    or getattr(module, "icon", None),
+                    "icon": get_function_icon(function, module),
                 }
             ]
-
-    # Process filter_ids to get the filters
-    def get_filter_items_from_module(function, module):
-        return [
+    elif getattr(module, "toggle", None):
+        items = [
             {
                 "id": function.id,
                 "name": function.name,
                 "description": function.meta.description,
-                "icon": function.meta.manifest.get("icon_url", None)
-                or getattr(module, "icon_url", None)
-                or getattr(module, "icon", None),
+                "icon": get_function_icon(function, module),
                 "has_user_valves": hasattr(module, "UserValves"),
             }
         ]
+    else:
+        items = []
+
+    request.app.state.FUNCTION_ITEMS[function.id] = (function.updated_at, items)
+    return items
+
+
+def get_custom_model_ids(custom_model) -> tuple[list[str], list[str]]:
+    action_ids = []
+    filter_ids = []
+
+    if custom_model.meta:
+        meta = custom_model.meta.model_dump()
+
+        if "actionIds" in meta:
+            action_ids.extend(meta["actionIds"])
+
+        if "filterIds" in meta:
+            filter_ids.extend(meta["filterIds"])
+
+    return action_ids, filter_ids
+
+
+def build_models(request, base_models: list[dict]) -> list[dict]:
+    # copy the base models to avoid modifying the original list
+    models = [model.copy() for model in base_models]
+
+    # Add arena models
+    if request.app.state.config.ENABLE_EVALUATION_ARENA_MODELS:
+        models = models + get_arena_models(request)
+
+    action_functions = {
+        function.id: function
+        for function in Functions.get_functions_by_type("action", active_only=True)
+    }
+    filter_functions = {
+        function.id: function
+        for function in Functions.get_functions_by_type("filter", active_only=True)
+    }
 
-    def get_function_module_by_id(function_id):
-        function_module, _, _ = get_function_module_from_cache(request, function_id)
-        return function_module
+    global_action_ids = [
+        function.id for function in action_functions.values() if function.is_global
+    ]
+    global_filter_ids = [
+        function.id for function in filter_functions.values() if function.is_global
+    ]
 
+    # Index models by id, and Ollama models by name without tag, since Ollama
+    # may return model ids in different formats (e.g., 'llama3' vs. 'llama3:7b')
+    models_by_id = {}
     for model in models:
-        action_ids = [
-            action_id
-            for action_id in list(set(model.pop("action_ids", []) + global_action_ids))
-            if action_id in enabled_action_ids
-        ]
-        filter_ids = [
-            filter_id
-            for filter_id in list(set(model.pop("filter_ids", []) + global_filter_ids))
-            if filter_id in enabled_filter_ids
-        ]
+        models_by_id.setdefault(model["id"], []).append(model)
+        if model.get("owned_by") == "ollama":
+            name = model["id"].split(":")[0]
+            if name != model["id"]:
+                models_by_id.setdefault(name, []).append(model)
+
+    custom_models = Models.get_all_models()
+
+    # Apply custom models that directly override a base model
+    removed = set()
+    for custom_model in custom_models:
+        if custom_model.base_model_id is not None:
+            continue
+
+        for model in models_by_id.get(custom_model.id, []):
+            if custom_model.is_active:
+                model["name"] = custom_model.name
+                model["info"] = custom_model.model_dump()
+
+                # Set action_ids and filter_ids
+                meta = model["info"].get("meta") or {}
+                model["action_ids"] = list(meta.get("actionIds", []))
+                model["filter_ids"] = list(meta.get("filterIds", []))
+
+                # Remove params to avoid exposing sensitive info
+                model["info"].pop("params", None)
+            else:
+                removed.add(id(model))
+
+    if removed:
+        models = [model for model in models if id(model) not in removed]
+
+    # Add custom models based on a base model
+    model_ids = {model["id"] for model in models}
+    base_lookup = {}
+    for model in models:
+        base_lookup.setdefault(model["id"], model)
+        base_lookup.setdefault(model["id"].split(":")[0], model)
+
+    for custom_model in custom_models:
+        if custom_model.base_model_id is None or not custom_model.is_active:
+            continue
+
+        if custom_model.id in model_ids:
+            continue
+
+        base_model = base_lookup.get(custom_model.base_model_id)
+
+        owned_by = "openai"
+        connection_type = None
+        pipe = None
+
+        if base_model is not None:
+            owned_by = base_model.get("owned_by", "unknown")
+            if "pipe" in base_model:
+                pipe = base_model["pipe"]
+            connection_type = base_model.get("connection_type", None)
+
+        model = {
+            "id": f"{custom_model.id}",
+            "name": custom_model.name,
+            "object": "model",
+            "created": custom_model.created_at,
+            "owned_by": owned_by,
+            "connection_type": connection_type,
+            "preset": True,
+            **({"pipe": pipe} if pipe is not None else {}),
+        }
+
+        info = custom_model.model_dump()
+        # Remove params to avoid exposing sensitive info
+        info.pop("params", None)
+        model["info"] = info
+
+        model["action_ids"], model["filter_ids"] = get_custom_model_ids(custom_model)
+
+        models.append(model)
+        model_ids.add(model["id"])
+        base_lookup.setdefault(model["id"], model)
+        base_lookup.setdefault(model["id"].split(":")[0], model)
+
+    for model in models:
+        action_ids = dict.fromkeys(model.pop("action_ids", []) + global_action_ids)
+        filter_ids = dict.fromkeys(model.pop("filter_ids", []) + global_filter_ids)
 
         model["actions"] = []
         for action_id in action_ids:
-            action_function = Functions.get_function_by_id(action_id)
-            if action_function is None:
-                raise Exception(f"Action not found: {action_id}")
-
-            function_module = get_function_module_by_id(action_id)
-            model["actions"].extend(
-                get_action_items_from_module(action_function, function_module)
-            )
+            if action_id in action_functions:
+                model["actions"].extend(
+                    get_function_items(request, action_functions[action_id])
+                )
 
         model["filters"] = []
         for filter_id in filter_ids:
-            filter_function = Functions.get_function_by_id(filter_id)
-            if filter_function is None:
-                raise Exception(f"Filter not found: {filter_id}")
-
-            function_module = get_function_module_by_id(filter_id)
-
-            if getattr(function_module, "toggle", None):
+            if filter_id in filter_functions:
                 model["filters"].extend(
-                    get_filter_items_from_module(filter_function, function_module)
+                    get_function_items(request, filter_functions[filter_id])
                 )
 
+    return models
+
+
+# In-process counter of committed writes to the tables the catalog is built
+# from. It complements the DB fingerprints below, which can miss several
+# writes to the same row within one second.
+MODELS_GENERATION = 0
+
+CATALOG_TABLES = (Model, Function, AccessGrant)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_catalog_flush(session, flush_context):
+    if any(
+        isinstance(obj, CATALOG_TABLES)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info["models_catalog_dirty"] = True
+
+
+@event.listens_for(Session, "after_bulk_update")
+@event.listens_for(Session, "after_bulk_delete")
+def _track_catalog_bulk_write(context):
+    if context.mapper.class_ in CATALOG_TABLES:
+        context.session.info["models_catalog_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_catalog_generation(session):
+    global MODELS_GENERATION
+    if session.info.pop("models_catalog_dirty", False):
+        MODELS_GENERATION += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _reset_catalog_dirty(session):
+    session.info.pop("models_catalog_dirty", None)
+
+
+def get_models_version(request) -> tuple:
+    return (
+        MODELS_GENERATION,
+        Models.get_models_version(),
+        Functions.get_functions_version(),
+        request.app.state.config.ENABLE_EVALUATION_ARENA_MODELS,
+        request.app.state.config.EVALUATION_ARENA_MODELS,
+    )
+
+
+async def get_all_models(request, refresh: bool = False, user: UserModel = None):
+    if (
+        request.app.state.MODELS
+        and request.app.state.BASE_MODELS
+        and (request.app.state.config.ENABLE_BASE_MODELS_CACHE and not refresh)
+    ):
+        base_models = request.app.state.BASE_MODELS
+    else:
+        base_models = await get_all_base_models(request, user=user)
+        request.app.state.BASE_MODELS = base_models
+
+    # If there are no models, return an empty list
+    if len(base_models) == 0:
+        return []
+
+    # Reuse the assembled models while the base models, custom models,
+    # functions and arena settings they were built from are unchanged
+    version = get_models_version(request)
+    catalog = getattr(request.app.state, "MODELS_CATALOG", None)
+
+    if (
+        catalog
+        and not refresh
+        and catalog["base_models"] is base_models
+        and catalog["version"] == version
+    ):
+        models = catalog["models"]
+        rebuilt = False
+    else:
+        models = build_models(request, base_models)
+        request.app.state.MODELS_CATALOG = {
+            "base_models": base_models,
+            "version": version,
+            "models": models,
+        }
+        rebuilt = True
+
     log.debug(f"get_all_models() returned {len(models)} models")
 
     models_dict = {model["id"]: model for model in models}
     if isinstance(request.app.state.MODELS, RedisDict):
-        request.app.state.MODELS.set(models_dict)
+        if rebuilt or not request.app.state.MODELS:
+            request.app.state.MODELS.set(models_dict)
     else:
         request.app.state.MODELS = models_dict
 
-    return models
+    # Callers may annotate the returned models, keep the cached ones intact
+    return [model.copy() for model in models]
 
 
 def check_model_access(user, model, db=None):
@@ -156,7 +156,7 @@ def parse_redis_service_url(redis_url):
     }
 
 
-def get_redis_client(async_mode=False):
+def get_redis_client(async_mode=False, decode_responses=True):
     try:
         return get_redis_connection(
             redis_url=REDIS_URL,
@@ -165,6 +165,7 @@ def get_redis_client(async_mode=False):
             ),
             redis_cluster=REDIS_CLUSTER,
             async_mode=async_mode,
+            decode_responses=decode_responses,
         )
     except Exception as e:
         log.debug(f"Failed to get Redis client: {e}")
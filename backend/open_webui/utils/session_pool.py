@@ -0,0 +1,224 @@
+import asyncio
+import logging
+from typing import Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from open_webui.env import (
+    AIOHTTP_CLIENT_DNS_CACHE_TTL,
+    AIOHTTP_CLIENT_KEEPALIVE_TIMEOUT,
+    AIOHTTP_CLIENT_POOL_LIMIT_PER_UPSTREAM,
+    AIOHTTP_CLIENT_POOL_MAX_UPSTREAMS,
+    ENABLE_AIOHTTP_CLIENT_SESSION_POOL,
+)
+
+log = logging.getLogger(__name__)
+
+DEFAULT_POOL = "default"
+
+
+class PooledClientSession:
+    """
+    Per-call view over a shared aiohttp.ClientSession.
+
+    Exposes the request helpers callers already use and applies the caller's
+    timeout per request. close() and `async with` exit are no-ops unless the
+    view owns its session, so existing cleanup code can stay unchanged.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        owned: bool = False,
+    ):
+        self._session = session
+        self._timeout = timeout
+        self._owned = owned
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    def request(self, method: str, url, **kwargs):
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        return self._session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def options(self, url, **kwargs):
+        return self.request("OPTIONS", url, **kwargs)
+
+    async def close(self):
+        if self._owned:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class ClientSessionRegistry:
+    """
+    App-lifetime aiohttp sessions, one connection pool per upstream origin.
+
+    Each pool keeps connections alive between requests and caches DNS, so
+    requests to the same model or tool server skip connection setup. Origins
+    beyond AIOHTTP_CLIENT_POOL_MAX_UPSTREAMS share the default pool.
+
+    Sessions are bound to the event loop that called start(); callers on any
+    other loop (e.g. code run through asyncio.run in a worker thread) get a
+    private session that is closed with the view, as before.
+    """
+
+    def __init__(
+        self,
+        limit_per_upstream: int = AIOHTTP_CLIENT_POOL_LIMIT_PER_UPSTREAM,
+        max_upstreams: int = AIOHTTP_CLIENT_POOL_MAX_UPSTREAMS,
+        keepalive_timeout: float = AIOHTTP_CLIENT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = AIOHTTP_CLIENT_DNS_CACHE_TTL,
+    ):
+        self.limit_per_upstream = limit_per_upstream
+        self.max_upstreams = max_upstreams
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sessions: dict[tuple[str, bool], aiohttp.ClientSession] = {}
+
+    def start(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not None and self._loop is not loop:
+            self._discard_sessions()
+        self._loop = loop
+
+    def _discard_sessions(self):
+        # Sessions of a previous loop cannot be used or awaited from this one;
+        # close them on their own loop if it is still running, otherwise their
+        # connections went away with it
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        if self._loop.is_running() and not self._loop.is_closed():
+            for session in sessions:
+                asyncio.run_coroutine_threadsafe(session.close(), self._loop)
+
+    async def close(self):
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        self._loop = None
+
+        for session in sessions:
+            try:
+                await session.close()
+            except Exception as e:
+                log.warning(f"Error closing pooled client session: {e}")
+
+    def _get_pool_name(self, url: Optional[str]) -> str:
+        if not url:
+            return DEFAULT_POOL
+
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            return DEFAULT_POOL
+
+        return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+    def _create_session(self, limit: int, limit_per_host: int, trust_env: bool):
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            ),
+            # Sessions are shared across users, never persist response cookies
+            cookie_jar=aiohttp.DummyCookieJar(),
+            trust_env=trust_env,
+        )
+
+    def get_session(
+        self,
+        url: Optional[str] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        trust_env: bool = True,
+    ) -> PooledClientSession:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if (
+            not ENABLE_AIOHTTP_CLIENT_SESSION_POOL
+            or self._loop is None
+            or loop is not self._loop
+        ):
+            return PooledClientSession(
+                aiohttp.ClientSession(trust_env=trust_env),
+                timeout=timeout,
+                owned=True,
+            )
+
+        pool = self._get_pool_name(url)
+        upstreams = {name for name, _ in self._sessions if name != DEFAULT_POOL}
+        if pool not in upstreams and len(upstreams) >= self.max_upstreams:
+            pool = DEFAULT_POOL
+
+        key = (pool, trust_env)
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            if pool == DEFAULT_POOL:
+                # Arbitrary hosts (e.g. web loaders): cap per host, not overall
+                session = self._create_session(0, self.limit_per_upstream, trust_env)
+            else:
+                session = self._create_session(
+                    self.limit_per_upstream, self.limit_per_upstream, trust_env
+                )
+            self._sessions[key] = session
+
+        return PooledClientSession(session, timeout=timeout)
+
+    def get_stats(self) -> dict[str, dict]:
+        stats = {}
+        for (pool, _), session in list(self._sessions.items()):
+            connector = session.connector
+            if connector is None or session.closed:
+                continue
+
+            pool_stats = stats.setdefault(pool, {"limit": 0, "in_use": 0, "waiting": 0})
+            pool_stats["limit"] += connector.limit
+            pool_stats["in_use"] += len(getattr(connector, "_acquired", ()))
+            pool_stats["waiting"] += sum(
+                len(waiters) for waiters in getattr(connector, "_waiters", {}).values()
+            )
+        return stats
+
+
+CLIENT_SESSIONS = ClientSessionRegistry()
+
+
+def get_client_session(
+    url: Optional[str] = None,
+    timeout: Optional[aiohttp.ClientTimeout] = None,
+    trust_env: bool = True,
+) -> PooledClientSession:
+    return CLIENT_SESSIONS.get_session(url, timeout=timeout, trust_env=trust_env)
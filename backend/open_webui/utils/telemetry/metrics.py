@@ -8,6 +8,16 @@ Metrics collected:
 
 * http.server.requests (counter)
 * http.server.duration (histogram, milliseconds)
+* webui.config.reads / webui.config.refreshes (counters)
+* webui.http.pool.* (gauges per upstream connection pool)
+* webui.ollama.node.* (load, latency and health per Ollama base URL)
+* webui.embedding.cache.* (hits per tier, misses and entries)
+* webui.embedding.dispatcher.* (coalesced batches, texts and queue depth)
+* webui.rerank.* (score cache hits/misses and local predict batches)
+* webui.mcp.sessions.* (pooled MCP session connects, reuses and open sessions)
+* webui.jupyter.kernels.* (warm/sticky/cold kernel leases, restarts and pool size)
+* webui.web.cache.* (web search result and page cache hits/misses per level)
+* webui.web.search.* (search engine API requests, retries and rate limiting per engine)
 
 Attributes used: http.method, http.route, http.status_code
 
@@ -46,6 +56,15 @@ from open_webui.env import (
     OTEL_METRICS_EXPORTER_OTLP_INSECURE,
 )
 from open_webui.models.users import Users
+from open_webui.retrieval.embedding_cache import EMBEDDING_CACHE
+from open_webui.retrieval.embedding_dispatcher import EMBEDDING_DISPATCHER
+from open_webui.retrieval.reranker import RERANKER_POOL
+from open_webui.retrieval.web.cache import WEB_CACHE
+from open_webui.retrieval.web.client import WEB_SEARCH_CLIENT
+from open_webui.utils.balancer import OLLAMA_BALANCER
+from open_webui.utils.code_interpreter import JUPYTER_KERNEL_POOL
+from open_webui.utils.mcp.client import MCP_SESSION_POOL
+from open_webui.utils.session_pool import CLIENT_SESSIONS
 
 _EXPORT_INTERVAL_MILLIS = 10_000  # 10 seconds
 
@@ -101,6 +120,44 @@ def _build_meter_provider(resource: Resource) -> MeterProvider:
         View(
             instrument_name="webui.users.active.today",
         ),
+        View(
+            instrument_name="webui.config.reads",
+        ),
+        View(
+            instrument_name="webui.config.refreshes",
+        ),
+        View(
+            instrument_name="webui.http.pool.*",
+            attribute_keys=["upstream"],
+        ),
+        View(
+            instrument_name="webui.ollama.node.*",
+            attribute_keys=["upstream"],
+        ),
+        View(
+            instrument_name="webui.embedding.cache.*",
+            attribute_keys=["tier"],
+        ),
+        View(
+            instrument_name="webui.embedding.dispatcher.*",
+        ),
+        View(
+            instrument_name="webui.rerank.*",
+        ),
+        View(
+            instrument_name="webui.mcp.sessions.*",
+        ),
+        View(
+            instrument_name="webui.jupyter.kernels.*",
+        ),
+        View(
+            instrument_name="webui.web.cache.*",
+            attribute_keys=["level", "result"],
+        ),
+        View(
+            instrument_name="webui.web.search.*",
+            attribute_keys=["engine"],
+        ),
     ]
 
     provider = MeterProvider(
@@ -176,6 +233,383 @@ def setup_metrics(app: FastAPI, resource: Resource) -> None:
         callbacks=[observe_users_active_today],
     )
 
+    # Config snapshot reads vs. values refreshed from other instances via Redis
+    def observe_config_reads(
+        options: metrics.CallbackOptions,
+    ) -> Sequence[metrics.Observation]:
+        return [metrics.Observation(value=app.state.config.stats["reads"])]
+
+    def observe_config_refreshes(
+        options: metrics.CallbackOptions,
+    ) -> Sequence[metrics.Observation]:
+        return [metrics.Observation(value=app.state.config.stats["refreshes"])]
+
+    meter.create_observable_counter(
+        name="webui.config.reads",
+        description="Number of app config reads served from the local snapshot",
+        unit="1",
+        callbacks=[observe_config_reads],
+    )
+
+    meter.create_observable_counter(
+        name="webui.config.refreshes",
+        description="Number of app config values refreshed from Redis",
+        unit="1",
+        callbacks=[observe_config_refreshes],
+    )
+
+    # Upstream connection pool saturation (in use vs. limit, queued acquires)
+    def observe_pool_stat(name: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            return [
+                metrics.Observation(
+                    value=pool_stats[name], attributes={"upstream": pool}
+                )
+                for pool, pool_stats in CLIENT_SESSIONS.get_stats().items()
+            ]
+
+        return callback
+
+    meter.create_observable_gauge(
+        name="webui.http.pool.in_use",
+        description="Connections currently acquired from the upstream pool",
+        unit="connections",
+        callbacks=[observe_pool_stat("in_use")],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.http.pool.limit",
+        description="Connection limit of the upstream pool (0 = unlimited)",
+        unit="connections",
+        callbacks=[observe_pool_stat("limit")],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.http.pool.waiting",
+        description="Requests waiting for a free connection in the upstream pool",
+        unit="requests",
+        callbacks=[observe_pool_stat("waiting")],
+    )
+
+    # Ollama load balancer state per base URL
+    def observe_ollama_node_stat(name: str, scale: float = 1):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            return [
+                metrics.Observation(
+                    value=node_stats[name] * scale, attributes={"upstream": url}
+                )
+                for url, node_stats in OLLAMA_BALANCER.get_stats().items()
+            ]
+
+        return callback
+
+    meter.create_observable_gauge(
+        name="webui.ollama.node.outstanding",
+        description="Requests in flight on the Ollama node",
+        unit="requests",
+        callbacks=[observe_ollama_node_stat("outstanding")],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.ollama.node.latency",
+        description="Moving average of the Ollama node's time to response headers",
+        unit="ms",
+        callbacks=[observe_ollama_node_stat("latency", 1000)],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.ollama.node.ejected",
+        description="Whether the Ollama node is ejected after repeated failures",
+        unit="1",
+        callbacks=[observe_ollama_node_stat("ejected")],
+    )
+
+    meter.create_observable_counter(
+        name="webui.ollama.node.requests",
+        description="Requests routed to the Ollama node",
+        unit="1",
+        callbacks=[observe_ollama_node_stat("requests")],
+    )
+
+    meter.create_observable_counter(
+        name="webui.ollama.node.errors",
+        description="Connection errors and 5xx responses from the Ollama node",
+        unit="1",
+        callbacks=[observe_ollama_node_stat("errors")],
+    )
+
+    # Embedding cache effectiveness; the store tier is Redis or disk if enabled
+    if EMBEDDING_CACHE is not None:
+
+        def observe_embedding_cache_hits(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            stats = EMBEDDING_CACHE.get_stats()
+            observations = [
+                metrics.Observation(
+                    value=stats["memory_hits"], attributes={"tier": "memory"}
+                )
+            ]
+            if EMBEDDING_CACHE.store is not None:
+                observations.append(
+                    metrics.Observation(
+                        value=stats["store_hits"],
+                        attributes={"tier": EMBEDDING_CACHE.store.name},
+                    )
+                )
+            return observations
+
+        def observe_embedding_cache_stat(name: str):
+            def callback(
+                options: metrics.CallbackOptions,
+            ) -> Sequence[metrics.Observation]:
+                return [metrics.Observation(value=EMBEDDING_CACHE.get_stats()[name])]
+
+            return callback
+
+        meter.create_observable_counter(
+            name="webui.embedding.cache.hits",
+            description="Embeddings served from the cache instead of the model",
+            unit="1",
+            callbacks=[observe_embedding_cache_hits],
+        )
+
+        meter.create_observable_counter(
+            name="webui.embedding.cache.misses",
+            description="Embeddings that had to be computed by the model",
+            unit="1",
+            callbacks=[observe_embedding_cache_stat("misses")],
+        )
+
+        meter.create_observable_gauge(
+            name="webui.embedding.cache.entries",
+            description="Embeddings held in the local cache",
+            unit="1",
+            callbacks=[observe_embedding_cache_stat("entries")],
+        )
+
+    # Embedding requests coalesced across callers; texts / batches is the
+    # average batch size
+    def observe_embedding_dispatcher_stat(name: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            return [metrics.Observation(value=EMBEDDING_DISPATCHER.get_stats()[name])]
+
+        return callback
+
+    meter.create_observable_counter(
+        name="webui.embedding.dispatcher.batches",
+        description="Embedding batches sent upstream",
+        unit="1",
+        callbacks=[observe_embedding_dispatcher_stat("batches")],
+    )
+
+    meter.create_observable_counter(
+        name="webui.embedding.dispatcher.texts",
+        description="Texts sent upstream in embedding batches",
+        unit="1",
+        callbacks=[observe_embedding_dispatcher_stat("texts")],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.embedding.dispatcher.pending",
+        description="Texts queued for an embedding batch",
+        unit="1",
+        callbacks=[observe_embedding_dispatcher_stat("pending")],
+    )
+
+    # Reranking work saved by the score cache and merged into shared batches
+    def observe_rerank_stat(name: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            return [metrics.Observation(value=RERANKER_POOL.get_stats()[name])]
+
+        return callback
+
+    meter.create_observable_counter(
+        name="webui.rerank.cache.hits",
+        description="Chunk relevance scores served from the rerank cache",
+        unit="1",
+        callbacks=[observe_rerank_stat("hits")],
+    )
+
+    meter.create_observable_counter(
+        name="webui.rerank.cache.misses",
+        description="Chunk relevance scores computed by the reranker",
+        unit="1",
+        callbacks=[observe_rerank_stat("misses")],
+    )
+
+    meter.create_observable_counter(
+        name="webui.rerank.batches",
+        description="Predict calls made to local reranking models",
+        unit="1",
+        callbacks=[observe_rerank_stat("batches")],
+    )
+
+    # MCP connections saved by reusing pooled sessions across chat requests
+    def observe_mcp_session_stat(name: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            return [metrics.Observation(value=MCP_SESSION_POOL.get_stats()[name])]
+
+        return callback
+
+    for name, description in (
+        ("connects", "MCP sessions opened"),
+        ("reuses", "Chat requests served by an already open MCP session"),
+        ("reconnects", "MCP sessions replaced after a failure"),
+    ):
+        meter.create_observable_counter(
+            name=f"webui.mcp.sessions.{name}",
+            description=description,
+            unit="1",
+            callbacks=[observe_mcp_session_stat(name)],
+        )
+
+    meter.create_observable_gauge(
+        name="webui.mcp.sessions.open",
+        description="MCP sessions currently kept in the pool",
+        unit="1",
+        callbacks=[observe_mcp_session_stat("sessions")],
+    )
+
+    # Web search results and loaded pages served from the web cache
+    if WEB_CACHE is not None:
+
+        def observe_web_cache_hits(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            stats = WEB_CACHE.get_stats()
+            return [
+                metrics.Observation(
+                    value=stats["search_hits"], attributes={"level": "search"}
+                ),
+                metrics.Observation(
+                    value=stats["page_hits"],
+                    attributes={"level": "page", "result": "fresh"},
+                ),
+                metrics.Observation(
+                    value=stats["page_revalidated"],
+                    attributes={"level": "page", "result": "not_modified"},
+                ),
+            ]
+
+        def observe_web_cache_misses(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            stats = WEB_CACHE.get_stats()
+            return [
+                metrics.Observation(
+                    value=stats["search_misses"], attributes={"level": "search"}
+                ),
+                metrics.Observation(
+                    value=stats["page_misses"], attributes={"level": "page"}
+                ),
+            ]
+
+        def observe_web_cache_entries(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            stats = WEB_CACHE.get_stats()
+            return [
+                metrics.Observation(
+                    value=stats["search_entries"], attributes={"level": "search"}
+                ),
+                metrics.Observation(
+                    value=stats["page_entries"], attributes={"level": "page"}
+                ),
+            ]
+
+        meter.create_observable_counter(
+            name="webui.web.cache.hits",
+            description="Search results and pages served from the web cache",
+            unit="1",
+            callbacks=[observe_web_cache_hits],
+        )
+
+        meter.create_observable_counter(
+            name="webui.web.cache.misses",
+            description="Searches run and pages loaded because they were not cached",
+            unit="1",
+            callbacks=[observe_web_cache_misses],
+        )
+
+        meter.create_observable_gauge(
+            name="webui.web.cache.entries",
+            description="Search results and pages held in the local web cache",
+            unit="1",
+            callbacks=[observe_web_cache_entries],
+        )
+
+    # Requests sent to search engine APIs by the shared web search client
+    def observe_web_search_stat(name: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            return [
+                metrics.Observation(value=stats[name], attributes={"engine": engine})
+                for engine, stats in WEB_SEARCH_CLIENT.get_stats().items()
+            ]
+
+        return callback
+
+    for name, description in (
+        ("requests", "Requests sent to search engine APIs, retries included"),
+        ("retries", "Search engine requests retried after 429s and 5xx errors"),
+        ("rate_limited", "Search engine requests answered with 429"),
+        ("errors", "Search engine requests that failed after all retries"),
+    ):
+        meter.create_observable_counter(
+            name=f"webui.web.search.{name}",
+            description=description,
+            unit="1",
+            callbacks=[observe_web_search_stat(name)],
+        )
+
+    # Code blocks served by pre-started Jupyter kernels
+    def observe_jupyter_kernel_stat(name: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            return [metrics.Observation(value=JUPYTER_KERNEL_POOL.get_stats()[name])]
+
+        return callback
+
+    for name, description in (
+        ("started", "Jupyter kernels started"),
+        ("warm_hits", "Code blocks run on a pre-started kernel"),
+        ("sticky_hits", "Code blocks run on their chat's kernel"),
+        ("cold_starts", "Code blocks that waited for a kernel to start"),
+        ("restarts", "Kernels restarted before going back to the pool"),
+        ("recycled", "Kernels shut down for age or pool size"),
+    ):
+        meter.create_observable_counter(
+            name=f"webui.jupyter.kernels.{name}",
+            description=description,
+            unit="1",
+            callbacks=[observe_jupyter_kernel_stat(name)],
+        )
+
+    for name, description in (
+        ("idle", "Started kernels waiting in the pool"),
+        ("sticky", "Kernels kept for a chat"),
+        ("leased", "Kernels running code"),
+    ):
+        meter.create_observable_gauge(
+            name=f"webui.jupyter.kernels.{name}",
+            description=description,
+            unit="1",
+            callbacks=[observe_jupyter_kernel_stat(name)],
+        )
+
     # FastAPI middleware
     @app.middleware("http")
     async def _metrics_middleware(request: Request, call_next):
@@ -2,6 +2,8 @@ import inspect
 import logging
 import re
 import inspect
+import hashlib
+import time
 import aiohttp
 import asyncio
 import yaml
@@ -47,10 +49,12 @@ from open_webui.env import (
     AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA,
     AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
     ENABLE_FORWARD_USER_INFO_HEADERS,
+    TOOL_SERVER_SPEC_CACHE_TTL,
     FORWARD_SESSION_INFO_HEADER_CHAT_ID,
     FORWARD_SESSION_INFO_HEADER_MESSAGE_ID,
 )
 from open_webui.utils.headers import include_user_info_headers
+from open_webui.utils.session_pool import get_client_session
 from open_webui.tools.builtin import (
     search_web,
     fetch_url,
@@ -788,10 +792,59 @@ def convert_openapi_to_tool_payload(openapi_spec):
     return tool_payload
 
 
+class ToolServerSpecCache:
+    """
+    OpenAPI tool server specs and the tool payloads converted from them.
+
+    Fetched specs are kept per URL and headers with their ETag/Last-Modified
+    validators, so refreshes send conditional requests and unchanged specs
+    come back as 304s. Converted payloads are kept per spec hash, so
+    `$ref` resolution only runs again when a spec actually changes.
+    """
+
+    def __init__(self):
+        self.specs: dict[str, dict] = {}
+        self.payloads: dict[str, list] = {}
+        self.stats = {"fetches": 0, "not_modified": 0, "conversions": 0}
+
+    @staticmethod
+    def get_key(url: str, headers: Optional[dict]) -> str:
+        return hashlib.sha256(
+            json.dumps([url, sorted((headers or {}).items())]).encode("utf-8")
+        ).hexdigest()
+
+    def get_payload(self, spec: dict, spec_hash: Optional[str] = None) -> list:
+        if spec_hash is None:
+            spec_hash = hashlib.sha256(
+                json.dumps(spec, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+        payload = self.payloads.get(spec_hash)
+        if payload is None:
+            self.stats["conversions"] += 1
+            payload = self.payloads[spec_hash] = convert_openapi_to_tool_payload(spec)
+        return payload
+
+    def retain(self, spec_hashes: set[str]):
+        # Drop payloads of specs no configured server serves anymore
+        for spec_hash in list(self.payloads):
+            if spec_hash not in spec_hashes:
+                del self.payloads[spec_hash]
+
+    def get_stats(self) -> dict[str, int]:
+        return {**self.stats, "specs": len(self.specs), "payloads": len(self.payloads)}
+
+
+TOOL_SERVER_SPEC_CACHE = ToolServerSpecCache()
+
+# Background refresh of app.state.TOOL_SERVERS, at most one at a time
+tool_servers_refresh: Optional[asyncio.Task] = None
+
+
 async def set_tool_servers(request: Request):
     request.app.state.TOOL_SERVERS = await get_tool_servers_data(
         request.app.state.config.TOOL_SERVER_CONNECTIONS
     )
+    request.app.state.TOOL_SERVERS_UPDATED_AT = time.monotonic()
 
     if request.app.state.redis is not None:
         await request.app.state.redis.set(
@@ -801,6 +854,21 @@ async def set_tool_servers(request: Request):
     return request.app.state.TOOL_SERVERS
 
 
+def refresh_tool_servers(request: Request):
+    global tool_servers_refresh
+
+    if tool_servers_refresh is not None and not tool_servers_refresh.done():
+        return
+
+    async def refresh():
+        try:
+            await set_tool_servers(request)
+        except Exception as e:
+            log.error(f"Error refreshing tool servers: {e}")
+
+    tool_servers_refresh = asyncio.create_task(refresh())
+
+
 async def get_tool_servers(request: Request):
     tool_servers = []
     if request.app.state.redis is not None:
@@ -809,14 +877,24 @@ async def get_tool_servers(request: Request):
             request.app.state.TOOL_SERVERS = tool_servers
         except Exception as e:
             log.error(f"Error fetching tool_servers from Redis: {e}")
+    else:
+        tool_servers = request.app.state.TOOL_SERVERS
 
-    if not tool_servers:
+    updated_at = getattr(request.app.state, "TOOL_SERVERS_UPDATED_AT", None)
+    if not tool_servers and updated_at is None:
         tool_servers = await set_tool_servers(request)
+    elif (
+        updated_at is None or time.monotonic() - updated_at > TOOL_SERVER_SPEC_CACHE_TTL
+    ):
+        # Serve the current specs and revalidate them in the background
+        refresh_tool_servers(request)
 
     return tool_servers
 
 
-async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, Any]:
+async def get_tool_server_data(
+    url: str, headers: Optional[dict], spec_hash: bool = False
+) -> Union[Dict[str, Any], Tuple[Dict[str, Any], str]]:
     _headers = {
         "Accept": "application/json",
         "Content-Type": "application/json",
@@ -825,13 +903,30 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
     if headers:
         _headers.update(headers)
 
+    key = TOOL_SERVER_SPEC_CACHE.get_key(url, headers)
+    cached = TOOL_SERVER_SPEC_CACHE.specs.get(key)
+    if cached:
+        if cached.get("etag"):
+            _headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            _headers["If-Modified-Since"] = cached["last_modified"]
+
     error = None
     try:
         timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA)
-        async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
+        async with get_client_session(url, timeout=timeout) as session:
             async with session.get(
                 url, headers=_headers, ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL
             ) as response:
+                if response.status == 304 and cached:
+                    TOOL_SERVER_SPEC_CACHE.stats["not_modified"] += 1
+                    log.debug(f"Tool server spec at {url} not modified")
+                    return (
+                        (cached["spec"], cached["hash"])
+                        if spec_hash
+                        else cached["spec"]
+                    )
+
                 if response.status != 200:
                     error_body = await response.json()
                     raise Exception(error_body)
@@ -853,6 +948,20 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
                     except Exception as e:
                         raise e
 
+                TOOL_SERVER_SPEC_CACHE.stats["fetches"] += 1
+                text_hash = hashlib.sha256(text_content.encode("utf-8")).hexdigest()
+                if response.headers.get("ETag") or response.headers.get(
+                    "Last-Modified"
+                ):
+                    TOOL_SERVER_SPEC_CACHE.specs[key] = {
+                        "spec": res,
+                        "hash": text_hash,
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                    }
+                else:
+                    TOOL_SERVER_SPEC_CACHE.specs.pop(key, None)
+
     except Exception as err:
         log.exception(f"Could not fetch tool server spec from {url}")
         if isinstance(err, dict) and "detail" in err:
@@ -862,7 +971,7 @@ async def get_tool_server_data(url: str, headers: Optional[dict]) -> Dict[str, A
         raise Exception(error)
 
     log.debug(f"Fetched data: {res}")
-    return res
+    return (res, text_hash) if spec_hash else res
 
 
 async def get_tool_servers_data(servers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -903,6 +1012,7 @@ async def get_tool_servers_data(servers: List[Dict[str, Any]]) -> List[Dict[str,
                 task = get_tool_server_data(
                     spec_url,
                     {"Authorization": f"Bearer {token}"} if token else None,
+                    spec_hash=True,
                 )
             elif spec_type == "json" and server.get("spec", ""):
                 # Use provided JSON spec
@@ -915,7 +1025,12 @@ async def get_tool_servers_data(servers: List[Dict[str, Any]]) -> List[Dict[str,
                 if spec_json:
                     task = asyncio.sleep(
                         0,
-                        result=spec_json,
+                        result=(
+                            spec_json,
+                            hashlib.sha256(
+                                server.get("spec", "").encode("utf-8")
+                            ).hexdigest(),
+                        ),
                     )
 
             if task:
@@ -927,20 +1042,24 @@ async def get_tool_servers_data(servers: List[Dict[str, Any]]) -> List[Dict[str,
 
     # Build final results with index and server metadata
     results = []
+    spec_hashes = set()
     for (id, idx, server, url, info, _), response in zip(server_entries, responses):
         if isinstance(response, Exception):
             log.error(f"Failed to connect to {url} OpenAPI tool server")
             continue
 
+        response, spec_hash = response
+        spec_hashes.add(spec_hash)
         response = {
-            "openapi": response,
+            # Copied so connection info does not leak into the cached spec
+            "openapi": {**response},
             "info": response.get("info", {}),
-            "specs": convert_openapi_to_tool_payload(response),
+            "specs": TOOL_SERVER_SPEC_CACHE.get_payload(response, spec_hash),
         }
 
         openapi_data = response.get("openapi", {})
         if info and isinstance(openapi_data, dict):
-            openapi_data["info"] = openapi_data.get("info", {})
+            openapi_data["info"] = {**openapi_data.get("info", {})}
 
             if "name" in info:
                 openapi_data["info"]["title"] = info.get("name", "Tool Server")
@@ -959,6 +1078,7 @@ async def get_tool_servers_data(servers: List[Dict[str, Any]]) -> List[Dict[str,
             }
         )
 
+    TOOL_SERVER_SPEC_CACHE.retain(spec_hashes)
     return results
 
 
@@ -1027,8 +1147,8 @@ async def execute_tool_server(
             if params:
                 body_params = params
 
-        async with aiohttp.ClientSession(
-            trust_env=True, timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
+        async with get_client_session(
+            url, timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
         ) as session:
             request_method = getattr(session, http_method.lower())
 